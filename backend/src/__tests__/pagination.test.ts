@@ -0,0 +1,182 @@
+import request from 'supertest';
+import express from 'express';
+import jwt from 'jsonwebtoken';
+import dotenv from 'dotenv';
+
+import studioRoutes from '../routes/studios';
+import reviewRoutes from '../routes/reviews';
+import { errorHandler } from '../middleware/errorHandler';
+import { closeDatabase } from '../config/database';
+import { runMigrations } from '../config/migrations';
+import { testPool } from './setup';
+
+// Load test environment
+dotenv.config({ path: '.env.test' });
+process.env.JWT_SECRET = process.env.JWT_SECRET || 'test-secret';
+
+// Create test app
+const app = express();
+app.use(express.json());
+app.use('/api/studios', studioRoutes);
+app.use('/api/reviews', reviewRoutes);
+app.use(errorHandler);
+
+const STUDIO_COUNT = 5000;
+
+async function createUser(email: string, userType: 'rapper' | 'studio'): Promise<number> {
+  const result = await testPool.query(
+    `INSERT INTO users (email, password_hash, user_type) VALUES ($1, 'hash', $2) RETURNING id`,
+    [email, userType]
+  );
+  return result.rows[0].id;
+}
+
+// Follow nextCursor from the first page to the last, timing each request
+async function walk(path: string): Promise<{ items: any[]; times: number[] }> {
+  const items: any[] = [];
+  const times: number[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const started = Date.now();
+    const response: any = await request(app)
+      .get(path + (cursor ? `&cursor=${cursor}` : ''))
+      .expect(200);
+    times.push(Date.now() - started);
+
+    const { pagination } = response.body.data;
+    items.push(...(response.body.data.studios || response.body.data.reviews));
+    cursor = pagination.nextCursor;
+    expect(pagination.hasMore).toBe(cursor !== null);
+  } while (cursor);
+
+  return { items, times };
+}
+
+describe('Keyset pagination and review aggregates', () => {
+  let ownerId: number;
+
+  beforeAll(async () => {
+    await runMigrations(testPool);
+  });
+
+  beforeEach(async () => {
+    ownerId = await createUser('owner@example.com', 'studio');
+  });
+
+  afterAll(async () => {
+    await closeDatabase();
+  });
+
+  it('walks every active studio once, in rating order, with deep pages as fast as the first', async () => {
+    // Ratings repeat every 50 studios, so most pages end inside a run of ties
+    await testPool.query(`
+      INSERT INTO studios (user_id, name, city, state, rating, is_active)
+      SELECT $1, 'Studio ' || i, 'Atlanta', 'GA', (i % 50) / 10.0, i % 10 <> 0
+      FROM generate_series(1, $2) AS i
+    `, [ownerId, STUDIO_COUNT]);
+    await testPool.query('ANALYZE studios');
+
+    const { items, times } = await walk('/api/studios?limit=100&sortBy=rating&order=desc');
+
+    const ids = items.map(studio => studio.id);
+    expect(ids.length).toBe(STUDIO_COUNT * 0.9);
+    expect(new Set(ids).size).toBe(ids.length);
+    for (let i = 1; i < items.length; i++) {
+      expect(items[i].rating).toBeLessThanOrEqual(items[i - 1].rating);
+    }
+
+    // Each page starts from its cursor, so the last page costs the same as the second
+    const deepest = Math.max(...times.slice(-5));
+    expect(deepest).toBeLessThan(Math.max(times[1] * 5, 250));
+  });
+
+  it('pages through reviews written in the same instant without repeats', async () => {
+    const studioResult = await testPool.query(
+      `INSERT INTO studios (user_id, name, city, state) VALUES ($1, 'Studio', 'Atlanta', 'GA') RETURNING id`,
+      [ownerId]
+    );
+    const studioId = studioResult.rows[0].id;
+    const rapperId = await createUser('rapper@example.com', 'rapper');
+
+    // One statement, so every review shares a created_at and only the id orders them
+    await testPool.query(`
+      INSERT INTO reviews (user_id, studio_id, rating, title)
+      SELECT $1, $2, (i % 5) + 1, 'Review ' || i
+      FROM generate_series(1, 230) AS i
+    `, [rapperId, studioId]);
+
+    const { items } = await walk(`/api/reviews/studio/${studioId}?limit=50`);
+
+    const ids = items.map(review => review.id);
+    expect(ids.length).toBe(230);
+    expect(ids).toEqual([...ids].sort((a, b) => b - a));
+  });
+
+  it('keeps studio rating and review count in step with review writes', async () => {
+    const studioResult = await testPool.query(
+      `INSERT INTO studios (user_id, name, city, state) VALUES ($1, 'Studio', 'Atlanta', 'GA') RETURNING id`,
+      [ownerId]
+    );
+    const studioId = studioResult.rows[0].id;
+    const roomResult = await testPool.query(
+      `INSERT INTO studio_rooms (studio_id, name, hourly_rate) VALUES ($1, 'Room A', 50) RETURNING id`,
+      [studioId]
+    );
+    const rapperId = await createUser('rapper@example.com', 'rapper');
+    const token = jwt.sign({ id: rapperId, email: 'rapper@example.com', userType: 'rapper' }, process.env.JWT_SECRET!);
+
+    const bookingIds: number[] = [];
+    for (const date of ['2025-01-10', '2025-01-11']) {
+      const booking = await testPool.query(`
+        INSERT INTO bookings (user_id, studio_id, room_id, booking_date, start_time, end_time,
+          total_hours, hourly_rate, total_amount, status)
+        VALUES ($1, $2, $3, $4, '10:00', '12:00', 2, 50, 100, 'completed')
+        RETURNING id
+      `, [rapperId, studioId, roomResult.rows[0].id, date]);
+      bookingIds.push(booking.rows[0].id);
+    }
+
+    const studioTotals = async () => {
+      const result = await testPool.query('SELECT rating, review_count FROM studios WHERE id = $1', [studioId]);
+      return { rating: parseFloat(result.rows[0].rating), reviewCount: result.rows[0].review_count };
+    };
+
+    const first = await request(app)
+      .post('/api/reviews')
+      .set('Authorization', `Bearer ${token}`)
+      .send({ studioId, bookingId: bookingIds[0], rating: 4 })
+      .expect(201);
+    const second = await request(app)
+      .post('/api/reviews')
+      .set('Authorization', `Bearer ${token}`)
+      .send({ studioId, bookingId: bookingIds[1], rating: 1 })
+      .expect(201);
+    expect(await studioTotals()).toEqual({ rating: 2.5, reviewCount: 2 });
+
+    // The first page carries the star histogram; cursor pages only the stored average and count
+    const firstPage = await request(app).get(`/api/reviews/studio/${studioId}?limit=1`).expect(200);
+    expect(firstPage.body.data.summary).toEqual({
+      averageRating: 2.5,
+      totalReviews: 2,
+      distribution: { 5: 0, 4: 1, 3: 0, 2: 0, 1: 1 }
+    });
+    const nextPage = await request(app)
+      .get(`/api/reviews/studio/${studioId}?limit=1&cursor=${firstPage.body.data.pagination.nextCursor}`)
+      .expect(200);
+    expect(nextPage.body.data.summary).toEqual({ averageRating: 2.5, totalReviews: 2 });
+
+    await request(app)
+      .put(`/api/reviews/${first.body.data.review.id}`)
+      .set('Authorization', `Bearer ${token}`)
+      .send({ rating: 5 })
+      .expect(200);
+    expect(await studioTotals()).toEqual({ rating: 3, reviewCount: 2 });
+
+    await request(app)
+      .delete(`/api/reviews/${second.body.data.review.id}`)
+      .set('Authorization', `Bearer ${token}`)
+      .expect(200);
+    expect(await studioTotals()).toEqual({ rating: 5, reviewCount: 1 });
+  });
+});
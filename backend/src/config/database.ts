@@ -1,15 +1,24 @@
-import { Pool } from 'pg';
+import { Pool, QueryConfig } from 'pg';
+import { createHash } from 'crypto';
 import dotenv from 'dotenv';
+import { runMigrations } from './migrations';
 
-dotenv.config();
+// Under Jest (NODE_ENV=test) the routes use the same TEST_DB_* database the test setup seeds
+const isTest = process.env.NODE_ENV === 'test';
+
+dotenv.config(isTest ? { path: '.env.test' } : undefined);
+
+function dbEnv(name: string): string | undefined {
+  return process.env[isTest ? `TEST_${name}` : name];
+}
 
 // Database connection pool
 export const pool = new Pool({
-  user: process.env.DB_USER || 'postgres',
-  host: process.env.DB_HOST || 'localhost',
-  database: process.env.DB_NAME || 'hitconnector',
-  password: process.env.DB_PASSWORD || 'password',
-  port: parseInt(process.env.DB_PORT || '5432'),
+  user: dbEnv('DB_USER') || 'postgres',
+  host: dbEnv('DB_HOST') || 'localhost',
+  database: dbEnv('DB_NAME') || (isTest ? 'hitconnector_test' : 'hitconnector'),
+  password: dbEnv('DB_PASSWORD') || 'password',
+  port: parseInt(dbEnv('DB_PORT') || '5432'),
   max: 20,
   idleTimeoutMillis: 30000,
   connectionTimeoutMillis: 2000,
@@ -26,6 +35,9 @@ export async function initDatabase(): Promise<void> {
     // Create tables if they don't exist
     await createTables();
     console.log('Database tables ensured');
+
+    await runMigrations(pool);
+    console.log('Database migrations applied');
   } catch (error) {
     console.error('Database initialization error:', error);
     throw error;
@@ -159,6 +171,7 @@ async function createTables(): Promise<void> {
       CREATE INDEX IF NOT EXISTS idx_studios_rating ON studios(rating);
       CREATE INDEX IF NOT EXISTS idx_bookings_date ON bookings(booking_date);
       CREATE INDEX IF NOT EXISTS idx_bookings_status ON bookings(status);
+      CREATE INDEX IF NOT EXISTS idx_bookings_room_date ON bookings(room_id, booking_date, start_time);
       CREATE INDEX IF NOT EXISTS idx_reviews_studio ON reviews(studio_id);
     `);
 
@@ -173,6 +186,17 @@ async function createTables(): Promise<void> {
   }
 }
 
+/**
+ * A named statement, which pg prepares once per connection and then reuses.
+ * Routes that build their SQL from filters produce a few shapes of query under
+ * one name, and pg requires each name to stand for a single text, so the name
+ * carries a hash of the text.
+ */
+export function prepared(name: string, text: string, values: any[] = []): QueryConfig {
+  const hash = createHash('sha1').update(text).digest('hex').slice(0, 12);
+  return { name: `${name}-${hash}`, text, values };
+}
+
 // Graceful shutdown
 export async function closeDatabase(): Promise<void> {
   await pool.end();
@@ -0,0 +1,107 @@
+import { Pool } from 'pg';
+
+// Schema changes made after the base tables, applied once each in order.
+// Never edit a migration that has shipped; add a new one instead.
+interface Migration {
+  id: number;
+  name: string;
+  statements: string[];
+}
+
+// Arbitrary key for the advisory lock that stops two servers starting at once
+// from applying the same migration twice
+const MIGRATION_LOCK_KEY = 727001;
+
+export const migrations: Migration[] = [
+  {
+    id: 1,
+    name: 'studio_search_indexes',
+    statements: [
+      // A trigram index serves the substring city search (LIKE '%x%'),
+      // which a plain btree can't
+      'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+      'CREATE INDEX IF NOT EXISTS idx_studios_city_trgm ON studios USING GIN (LOWER(city) gin_trgm_ops)',
+      // Serves the amenities overlap filter (amenities && $n)
+      'CREATE INDEX IF NOT EXISTS idx_studios_amenities ON studios USING GIN (amenities)'
+    ]
+  },
+  {
+    id: 2,
+    name: 'keyset_list_indexes',
+    statements: [
+      // Match the ORDER BY of each list endpoint, so a page is an index range scan
+      // starting at its cursor however deep it is
+      'CREATE INDEX IF NOT EXISTS idx_studios_active_rating ON studios ((COALESCE(rating, 0)) DESC, id DESC) WHERE is_active = true',
+      'CREATE INDEX IF NOT EXISTS idx_studios_active_created ON studios (created_at DESC, id DESC) WHERE is_active = true',
+      'CREATE INDEX IF NOT EXISTS idx_studios_user ON studios (user_id)',
+      'CREATE INDEX IF NOT EXISTS idx_bookings_studio_date ON bookings (studio_id, booking_date, id)',
+      'CREATE INDEX IF NOT EXISTS idx_bookings_user_date ON bookings (user_id, booking_date, id)',
+      'CREATE INDEX IF NOT EXISTS idx_reviews_studio_created ON reviews (studio_id, created_at, id)'
+    ]
+  },
+  {
+    id: 3,
+    name: 'studio_rating_totals',
+    statements: [
+      // The sum of a studio's review ratings, kept alongside review_count so each
+      // review write can update the average without re-reading every review
+      'ALTER TABLE studios ADD COLUMN IF NOT EXISTS rating_total INTEGER NOT NULL DEFAULT 0',
+      `UPDATE studios s SET
+        rating_total = r.total,
+        review_count = r.count,
+        rating = CASE WHEN r.count > 0 THEN ROUND(r.total::numeric / r.count, 2) ELSE 0 END
+      FROM (
+        SELECT st.id, COALESCE(SUM(rv.rating), 0) AS total, COUNT(rv.id) AS count
+        FROM studios st
+        LEFT JOIN reviews rv ON rv.studio_id = st.id
+        GROUP BY st.id
+      ) r
+      WHERE r.id = s.id`
+    ]
+  }
+];
+
+/**
+ * Apply any migrations the database hasn't seen yet. Each runs in its own
+ * transaction and is recorded in schema_migrations.
+ */
+export async function runMigrations(db: Pool): Promise<void> {
+  const client = await db.connect();
+
+  try {
+    await client.query(`
+      CREATE TABLE IF NOT EXISTS schema_migrations (
+        id INTEGER PRIMARY KEY,
+        name VARCHAR(100) NOT NULL,
+        applied_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+      )
+    `);
+
+    for (const migration of migrations) {
+      try {
+        await client.query('BEGIN');
+        await client.query('SELECT pg_advisory_xact_lock($1)', [MIGRATION_LOCK_KEY]);
+
+        const applied = await client.query('SELECT 1 FROM schema_migrations WHERE id = $1', [migration.id]);
+        if (applied.rows.length === 0) {
+          for (const statement of migration.statements) {
+            await client.query(statement);
+          }
+          await client.query(
+            'INSERT INTO schema_migrations (id, name) VALUES ($1, $2)',
+            [migration.id, migration.name]
+          );
+          console.log(`Applied migration ${migration.id}_${migration.name}`);
+        }
+
+        await client.query('COMMIT');
+      } catch (error) {
+        await client.query('ROLLBACK');
+        console.error(`Migration ${migration.id}_${migration.name} failed:`, error);
+        throw error;
+      }
+    }
+  } finally {
+    client.release();
+  }
+}
@@ -1,6 +1,6 @@
 import { Request, Response, NextFunction } from 'express';
 import jwt from 'jsonwebtoken';
-import { pool } from '../config/database';
+import { pool, prepared } from '../config/database';
 import { AppError } from './errorHandler';
 
 export interface AuthenticatedRequest extends Request {
@@ -33,10 +33,11 @@ export const authenticate = async (
     const decoded = jwt.verify(token, JWT_SECRET) as any;
 
     // Get user from database to ensure they still exist
-    const result = await pool.query(
+    const result = await pool.query(prepared(
+      'auth-user',
       'SELECT id, email, user_type, first_name, last_name FROM users WHERE id = $1',
       [decoded.id]
-    );
+    ));
 
     if (result.rows.length === 0) {
       throw new AppError('Invalid token. User not found.', 401);
@@ -82,10 +83,11 @@ export const optionalAuth = async (
     const decoded = jwt.verify(token, JWT_SECRET) as any;
 
     // Get user from database to ensure they still exist
-    const result = await pool.query(
+    const result = await pool.query(prepared(
+      'auth-user',
       'SELECT id, email, user_type, first_name, last_name FROM users WHERE id = $1',
       [decoded.id]
-    );
+    ));
 
     if (result.rows.length > 0) {
       const user = result.rows[0];
@@ -1,5 +1,16 @@
 import { Request, Response, NextFunction } from 'express';
 
+type LogLevel = 'debug' | 'info' | 'warn' | 'error' | 'silent';
+
+const LEVELS: Record<LogLevel, number> = { debug: 10, info: 20, warn: 30, error: 40, silent: 50 };
+
+// LOG_LEVEL=debug adds each request's start line and body; the default (info)
+// logs one line per request, warn only failed requests
+export function isLogEnabled(level: Exclude<LogLevel, 'silent'>): boolean {
+  const configured = LEVELS[(process.env.LOG_LEVEL || '').toLowerCase() as LogLevel] ?? LEVELS.info;
+  return LEVELS[level] >= configured;
+}
+
 export const requestLogger = (req: Request, res: Response, next: NextFunction): void => {
   const start = Date.now();
   const timestamp = new Date().toISOString();
@@ -9,10 +20,12 @@ export const requestLogger = (req: Request, res: Response, next: NextFunction):
     return next();
   }
 
-  console.log(`[${timestamp}] ${req.method} ${req.path} - Start`);
+  if (isLogEnabled('debug')) {
+    console.log(`[${timestamp}] ${req.method} ${req.path} - Start`);
+  }
 
   // Log request body for non-GET requests (excluding sensitive data)
-  if (req.method !== 'GET' && req.body) {
+  if (isLogEnabled('debug') && req.method !== 'GET' && req.body) {
     const sanitizedBody = { ...req.body };
     
     // Remove sensitive fields
@@ -30,10 +43,12 @@ export const requestLogger = (req: Request, res: Response, next: NextFunction):
     const duration = Date.now() - start;
     const endTimestamp = new Date().toISOString();
     
-    console.log(`[${endTimestamp}] ${req.method} ${req.path} - ${res.statusCode} (${duration}ms)`);
+    if (isLogEnabled('info')) {
+      console.log(`[${endTimestamp}] ${req.method} ${req.path} - ${res.statusCode} (${duration}ms)`);
+    }
     
     // Log error responses
-    if (res.statusCode >= 400) {
+    if (res.statusCode >= 400 && isLogEnabled('warn')) {
       console.warn(`[${endTimestamp}] Error response for ${req.method} ${req.path}:`, {
         statusCode: res.statusCode,
         userAgent: req.get('User-Agent'),
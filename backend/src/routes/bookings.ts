@@ -1,23 +1,33 @@
 import { Router, Request, Response } from 'express';
-import { pool } from '../config/database';
+import { pool, prepared } from '../config/database';
 import { AppError, asyncHandler } from '../middleware/errorHandler';
+import { decodeCursor, keysetCondition, keysetPage, parseLimit } from '../utils/pagination';
 import { authenticate, AuthenticatedRequest, requireRapper, requireStudio } from '../middleware/auth';
 
 const router = Router();
 
+// Sort expressions the booking list accepts
+const BOOKING_SORTS: Record<string, string> = {
+  booking_date: 'b.booking_date',
+  created_at: 'b.created_at',
+  total_amount: 'b.total_amount'
+};
+
 // GET /api/bookings - Get user bookings
+// Pages with ?cursor= (the nextCursor of the previous page); ?page= still works but reads every skipped row
 router.get('/', authenticate, asyncHandler(async (req: AuthenticatedRequest, res: Response) => {
   const userId = req.user!.id;
   const userType = req.user!.userType;
   const {
     status,
     page = 1,
-    limit = 10,
+    cursor,
     sortBy = 'booking_date',
     order = 'desc'
   } = req.query;
 
-  const offset = (Number(page) - 1) * Number(limit);
+  const limit = parseLimit(req.query.limit);
+  const keyset = decodeCursor(cursor);
   let whereClause = '';
   const queryParams: any[] = [userId];
   let paramCount = 1;
@@ -37,18 +47,26 @@ router.get('/', authenticate, asyncHandler(async (req: AuthenticatedRequest, res
   }
 
   // Validate sort options
-  const validSortColumns = ['booking_date', 'created_at', 'total_amount'];
   const validOrders = ['asc', 'desc'];
-  
-  const sortColumn = validSortColumns.includes(sortBy as string) ? sortBy : 'booking_date';
+  const sortExpression = BOOKING_SORTS[sortBy as string] || BOOKING_SORTS.booking_date;
   const sortOrder = validOrders.includes(order as string) ? (order as string) : 'desc';
 
-  // Add pagination parameters
+  // Only the first (or an offset) page reports a total; cursor pages skip the count
+  const filterParams = [...queryParams];
+  let pageClause = whereClause;
+  if (keyset) {
+    pageClause += ` AND ${keysetCondition(sortExpression, 'b.id', sortOrder === 'desc', paramCount + 1)}`;
+    queryParams.push(keyset.value, keyset.id);
+    paramCount += 2;
+  }
+
+  // Add pagination parameters, fetching one extra row to tell if there is another page
+  const offset = keyset ? 0 : (Math.max(Number(page) || 1, 1) - 1) * limit;
   paramCount++;
   const limitParam = paramCount;
   paramCount++;
   const offsetParam = paramCount;
-  queryParams.push(Number(limit), offset);
+  queryParams.push(limit + 1, offset);
 
   const query = `
     SELECT 
@@ -61,19 +79,35 @@ router.get('/', authenticate, asyncHandler(async (req: AuthenticatedRequest, res
       u.first_name as rapper_first_name,
       u.last_name as rapper_last_name,
       u.email as rapper_email,
-      COUNT(*) OVER() as total_count
+      (${sortExpression})::text as sort_key
     FROM bookings b
     JOIN studios s ON b.studio_id = s.id
     JOIN studio_rooms sr ON b.room_id = sr.id
     JOIN users u ON b.user_id = u.id
-    ${whereClause}
-    ORDER BY b.${sortColumn} ${sortOrder.toUpperCase()}
+    ${pageClause}
+    ORDER BY ${sortExpression} ${sortOrder.toUpperCase()}, b.id ${sortOrder.toUpperCase()}
     LIMIT $${limitParam} OFFSET $${offsetParam}
   `;
 
-  const result = await pool.query(query, queryParams);
-  const bookings = result.rows;
-  const totalCount = bookings.length > 0 ? bookings[0].total_count : 0;
+  const result = await pool.query(prepared('user-bookings', query, queryParams));
+  const { rows: bookings, pageInfo } = keysetPage(result.rows, limit);
+
+  let pagination: Record<string, any> = pageInfo;
+  if (!keyset) {
+    const countResult = await pool.query(prepared('user-bookings-count', `
+      SELECT COUNT(*) as total_count
+      FROM bookings b
+      JOIN studios s ON b.studio_id = s.id
+      ${whereClause}
+    `, filterParams));
+    const totalCount = Number(countResult.rows[0].total_count);
+    pagination = {
+      page: Math.max(Number(page) || 1, 1),
+      total: totalCount,
+      pages: Math.ceil(totalCount / limit),
+      ...pageInfo
+    };
+  }
 
   res.json({
     success: true,
@@ -109,12 +143,7 @@ router.get('/', authenticate, asyncHandler(async (req: AuthenticatedRequest, res
         createdAt: booking.created_at,
         updatedAt: booking.updated_at
       })),
-      pagination: {
-        page: Number(page),
-        limit: Number(limit),
-        total: Number(totalCount),
-        pages: Math.ceil(Number(totalCount) / Number(limit))
-      }
+      pagination
     }
   });
 }));
@@ -263,43 +292,58 @@ router.post('/', authenticate, requireRapper, asyncHandler(async (req: Authentic
   const hourlyRate = parseFloat(room.hourly_rate);
   const totalAmount = totalHours * hourlyRate;
 
-  // Check for booking conflicts
-  const conflictCheck = await pool.query(`
-    SELECT id FROM bookings
-    WHERE room_id = $1 
-    AND booking_date = $2 
-    AND status IN ('pending', 'confirmed')
-    AND (
-      (start_time <= $3 AND end_time > $3) OR
-      (start_time < $4 AND end_time >= $4) OR
-      (start_time >= $3 AND end_time <= $4)
-    )
-  `, [roomId, bookingDate, startTime, endTime]);
-
-  if (conflictCheck.rows.length > 0) {
-    throw new AppError('Time slot is already booked', 409);
-  }
+  // Check for conflicts and insert in one transaction, holding a per-room lock so
+  // two overlapping requests can't both pass the check before either is inserted
+  const client = await pool.connect();
+  let result;
+
+  try {
+    await client.query('BEGIN');
+    await client.query('SELECT pg_advisory_xact_lock($1)', [Number(roomId)]);
+
+    // Two slots overlap when each starts before the other ends
+    const conflictCheck = await client.query(prepared('booking-conflicts', `
+      SELECT id FROM bookings
+      WHERE room_id = $1
+      AND booking_date = $2
+      AND status IN ('pending', 'confirmed')
+      AND start_time < $4
+      AND end_time > $3
+      LIMIT 1
+    `, [roomId, bookingDate, startTime, endTime]));
+
+    if (conflictCheck.rows.length > 0) {
+      throw new AppError('Time slot is already booked', 409);
+    }
 
-  // Create booking
-  const result = await pool.query(`
-    INSERT INTO bookings (
-      user_id, studio_id, room_id, booking_date, start_time, end_time,
-      total_hours, hourly_rate, total_amount, special_requests, status
-    )
-    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, 'pending')
-    RETURNING *
-  `, [
-    userId,
-    studioId,
-    roomId,
-    bookingDate,
-    startTime,
-    endTime,
-    totalHours,
-    hourlyRate,
-    totalAmount,
-    specialRequests
-  ]);
+    // Create booking
+    result = await client.query(`
+      INSERT INTO bookings (
+        user_id, studio_id, room_id, booking_date, start_time, end_time,
+        total_hours, hourly_rate, total_amount, special_requests, status
+      )
+      VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, 'pending')
+      RETURNING *
+    `, [
+      userId,
+      studioId,
+      roomId,
+      bookingDate,
+      startTime,
+      endTime,
+      totalHours,
+      hourlyRate,
+      totalAmount,
+      specialRequests
+    ]);
+
+    await client.query('COMMIT');
+  } catch (error) {
+    await client.query('ROLLBACK');
+    throw error;
+  } finally {
+    client.release();
+  }
 
   const booking = result.rows[0];
 
@@ -1,22 +1,34 @@
 import { Router, Request, Response } from 'express';
-import { pool } from '../config/database';
+import { PoolClient } from 'pg';
+import { pool, prepared } from '../config/database';
 import { AppError, asyncHandler } from '../middleware/errorHandler';
+import { decodeCursor, keysetCondition, keysetPage, parseLimit } from '../utils/pagination';
 import { authenticate, AuthenticatedRequest, requireRapper, optionalAuth } from '../middleware/auth';
 
 const router = Router();
 
+// Sort expressions the review list accepts, coalesced so every row has a
+// sort value for the keyset cursor to compare against
+const REVIEW_SORTS: Record<string, string> = {
+  created_at: 'r.created_at',
+  rating: 'r.rating',
+  title: "COALESCE(r.title, '')"
+};
+
 // GET /api/reviews/studio/:studioId - Get reviews for a studio
+// Pages with ?cursor= (the nextCursor of the previous page); ?page= still works but reads every skipped row
 router.get('/studio/:studioId', optionalAuth, asyncHandler(async (req: AuthenticatedRequest, res: Response) => {
   const { studioId } = req.params;
   const {
     page = 1,
-    limit = 10,
+    cursor,
     rating,
     sortBy = 'created_at',
     order = 'desc'
   } = req.query;
 
-  const offset = (Number(page) - 1) * Number(limit);
+  const limit = parseLimit(req.query.limit);
+  const keyset = decodeCursor(cursor);
   let whereClause = 'WHERE r.studio_id = $1';
   const queryParams: any[] = [studioId];
   let paramCount = 1;
@@ -29,18 +41,23 @@ router.get('/studio/:studioId', optionalAuth, asyncHandler(async (req: Authentic
   }
 
   // Validate sort options
-  const validSortColumns = ['created_at', 'rating', 'title'];
   const validOrders = ['asc', 'desc'];
-  
-  const sortColumn = validSortColumns.includes(sortBy as string) ? sortBy : 'created_at';
+  const sortExpression = REVIEW_SORTS[sortBy as string] || REVIEW_SORTS.created_at;
   const sortOrder = validOrders.includes(order as string) ? (order as string) : 'desc';
 
-  // Add pagination parameters
+  if (keyset) {
+    whereClause += ` AND ${keysetCondition(sortExpression, 'r.id', sortOrder === 'desc', paramCount + 1)}`;
+    queryParams.push(keyset.value, keyset.id);
+    paramCount += 2;
+  }
+
+  // Add pagination parameters, fetching one extra row to tell if there is another page
+  const offset = keyset ? 0 : (Math.max(Number(page) || 1, 1) - 1) * limit;
   paramCount++;
   const limitParam = paramCount;
   paramCount++;
   const offsetParam = paramCount;
-  queryParams.push(Number(limit), offset);
+  queryParams.push(limit + 1, offset);
 
   const query = `
     SELECT 
@@ -49,34 +66,49 @@ router.get('/studio/:studioId', optionalAuth, asyncHandler(async (req: Authentic
       u.last_name as reviewer_last_name,
       u.avatar_url as reviewer_avatar,
       s.name as studio_name,
-      COUNT(*) OVER() as total_count
+      (${sortExpression})::text as sort_key
     FROM reviews r
     JOIN users u ON r.user_id = u.id
     JOIN studios s ON r.studio_id = s.id
     ${whereClause}
-    ORDER BY r.${sortColumn} ${sortOrder.toUpperCase()}
+    ORDER BY ${sortExpression} ${sortOrder.toUpperCase()}, r.id ${sortOrder.toUpperCase()}
     LIMIT $${limitParam} OFFSET $${offsetParam}
   `;
 
-  const result = await pool.query(query, queryParams);
-  const reviews = result.rows;
-  const totalCount = reviews.length > 0 ? reviews[0].total_count : 0;
+  const result = await pool.query(prepared('studio-reviews', query, queryParams));
+  const { rows: reviews, pageInfo } = keysetPage(result.rows, limit);
 
-  // Get studio rating summary
-  const summaryResult = await pool.query(`
-    SELECT 
-      AVG(rating) as average_rating,
-      COUNT(*) as total_reviews,
-      COUNT(CASE WHEN rating = 5 THEN 1 END) as five_star,
-      COUNT(CASE WHEN rating = 4 THEN 1 END) as four_star,
-      COUNT(CASE WHEN rating = 3 THEN 1 END) as three_star,
-      COUNT(CASE WHEN rating = 2 THEN 1 END) as two_star,
-      COUNT(CASE WHEN rating = 1 THEN 1 END) as one_star
-    FROM reviews 
-    WHERE studio_id = $1
-  `, [studioId]);
-
-  const summary = summaryResult.rows[0];
+  // Average and count come from the columns review writes keep up to date
+  const studioResult = await pool.query(prepared('studio-review-totals', `
+    SELECT rating, review_count FROM studios WHERE id = $1
+  `, [studioId]));
+  const studio = studioResult.rows[0];
+  const totalReviews = Number(studio?.review_count ?? 0);
+
+  // The star histogram scans the studio's reviews, so only the first (or an offset) page includes it
+  let distribution: Record<number, number> | undefined;
+  let pagination: Record<string, any> = pageInfo;
+  if (!keyset) {
+    const histogramResult = await pool.query(prepared('studio-review-histogram', `
+      SELECT rating, COUNT(*) as count
+      FROM reviews
+      WHERE studio_id = $1
+      GROUP BY rating
+    `, [studioId]));
+
+    distribution = { 5: 0, 4: 0, 3: 0, 2: 0, 1: 0 };
+    histogramResult.rows.forEach(row => {
+      distribution![row.rating] = Number(row.count);
+    });
+
+    const total = rating ? distribution[Number(rating)] ?? 0 : totalReviews;
+    pagination = {
+      page: Math.max(Number(page) || 1, 1),
+      total,
+      pages: Math.ceil(total / limit),
+      ...pageInfo
+    };
+  }
 
   res.json({
     success: true,
@@ -95,22 +127,11 @@ router.get('/studio/:studioId', optionalAuth, asyncHandler(async (req: Authentic
         updatedAt: review.updated_at
       })),
       summary: {
-        averageRating: parseFloat(summary.average_rating) || 0,
-        totalReviews: Number(summary.total_reviews),
-        distribution: {
-          5: Number(summary.five_star),
-          4: Number(summary.four_star),
-          3: Number(summary.three_star),
-          2: Number(summary.two_star),
-          1: Number(summary.one_star)
-        }
+        averageRating: parseFloat(studio?.rating) || 0,
+        totalReviews,
+        ...(distribution && { distribution })
       },
-      pagination: {
-        page: Number(page),
-        limit: Number(limit),
-        total: Number(totalCount),
-        pages: Math.ceil(Number(totalCount) / Number(limit))
-      }
+      pagination
     }
   });
 }));
@@ -248,17 +269,30 @@ router.post('/', authenticate, requireRapper, asyncHandler(async (req: Authentic
 
   const studio = studioResult.rows[0];
 
-  // Create review
-  const result = await pool.query(`
-    INSERT INTO reviews (user_id, studio_id, booking_id, rating, title, comment)
-    VALUES ($1, $2, $3, $4, $5, $6)
-    RETURNING *
-  `, [userId, studioId, bookingId || null, rating, title, comment]);
+  // Create review and fold it into the studio's rating in one transaction
+  const client = await pool.connect();
+  let result;
 
-  const review = result.rows[0];
+  try {
+    await client.query('BEGIN');
 
-  // Update studio rating and review count
-  await updateStudioRating(studioId);
+    result = await client.query(`
+      INSERT INTO reviews (user_id, studio_id, booking_id, rating, title, comment)
+      VALUES ($1, $2, $3, $4, $5, $6)
+      RETURNING *
+    `, [userId, studioId, bookingId || null, rating, title, comment]);
+
+    await adjustStudioRating(client, studioId, rating, 1);
+
+    await client.query('COMMIT');
+  } catch (error) {
+    await client.query('ROLLBACK');
+    throw error;
+  } finally {
+    client.release();
+  }
+
+  const review = result.rows[0];
 
   res.status(201).json({
     success: true,
@@ -286,41 +320,56 @@ router.put('/:id', authenticate, requireRapper, asyncHandler(async (req: Authent
   const userId = req.user!.id;
   const { rating, title, comment } = req.body;
 
-  // Check if review exists and belongs to user
-  const reviewResult = await pool.query(
-    'SELECT * FROM reviews WHERE id = $1 AND user_id = $2',
-    [id, userId]
-  );
-
-  if (reviewResult.rows.length === 0) {
-    throw new AppError('Review not found or access denied', 404);
-  }
-
-  const existingReview = reviewResult.rows[0];
-
   // Validate rating if provided
   if (rating && (!Number.isInteger(rating) || rating < 1 || rating > 5)) {
     throw new AppError('Rating must be an integer between 1 and 5', 400);
   }
 
-  // Update review
-  const result = await pool.query(`
-    UPDATE reviews SET
-      rating = COALESCE($1, rating),
-      title = COALESCE($2, title),
-      comment = COALESCE($3, comment),
-      updated_at = NOW()
-    WHERE id = $4 AND user_id = $5
-    RETURNING *
-  `, [rating, title, comment, id, userId]);
+  const client = await pool.connect();
+  let result;
 
-  const review = result.rows[0];
+  try {
+    await client.query('BEGIN');
+
+    // Check if review exists and belongs to user, locking it so the rating
+    // change applied to the studio is against the rating actually replaced
+    const reviewResult = await client.query(
+      'SELECT * FROM reviews WHERE id = $1 AND user_id = $2 FOR UPDATE',
+      [id, userId]
+    );
 
-  // Update studio rating if rating changed
-  if (rating && rating !== existingReview.rating) {
-    await updateStudioRating(existingReview.studio_id);
+    if (reviewResult.rows.length === 0) {
+      throw new AppError('Review not found or access denied', 404);
+    }
+
+    const existingReview = reviewResult.rows[0];
+
+    // Update review
+    result = await client.query(`
+      UPDATE reviews SET
+        rating = COALESCE($1, rating),
+        title = COALESCE($2, title),
+        comment = COALESCE($3, comment),
+        updated_at = NOW()
+      WHERE id = $4 AND user_id = $5
+      RETURNING *
+    `, [rating, title, comment, id, userId]);
+
+    // Update studio rating if rating changed
+    if (rating && rating !== existingReview.rating) {
+      await adjustStudioRating(client, existingReview.studio_id, rating - existingReview.rating, 0);
+    }
+
+    await client.query('COMMIT');
+  } catch (error) {
+    await client.query('ROLLBACK');
+    throw error;
+  } finally {
+    client.release();
   }
 
+  const review = result.rows[0];
+
   res.json({
     success: true,
     message: 'Review updated successfully',
@@ -341,23 +390,33 @@ router.delete('/:id', authenticate, requireRapper, asyncHandler(async (req: Auth
   const { id } = req.params;
   const userId = req.user!.id;
 
-  // Check if review exists and belongs to user
-  const reviewResult = await pool.query(
-    'SELECT studio_id FROM reviews WHERE id = $1 AND user_id = $2',
-    [id, userId]
-  );
+  const client = await pool.connect();
 
-  if (reviewResult.rows.length === 0) {
-    throw new AppError('Review not found or access denied', 404);
-  }
+  try {
+    await client.query('BEGIN');
 
-  const review = reviewResult.rows[0];
+    // Delete the review if it exists and belongs to user
+    const reviewResult = await client.query(
+      'DELETE FROM reviews WHERE id = $1 AND user_id = $2 RETURNING studio_id, rating',
+      [id, userId]
+    );
+
+    if (reviewResult.rows.length === 0) {
+      throw new AppError('Review not found or access denied', 404);
+    }
 
-  // Delete review
-  await pool.query('DELETE FROM reviews WHERE id = $1', [id]);
+    const review = reviewResult.rows[0];
 
-  // Update studio rating
-  await updateStudioRating(review.studio_id);
+    // Update studio rating
+    await adjustStudioRating(client, review.studio_id, -review.rating, -1);
+
+    await client.query('COMMIT');
+  } catch (error) {
+    await client.query('ROLLBACK');
+    throw error;
+  } finally {
+    client.release();
+  }
 
   res.json({
     success: true,
@@ -365,27 +424,27 @@ router.delete('/:id', authenticate, requireRapper, asyncHandler(async (req: Auth
   });
 }));
 
-// Helper function to update studio rating
-async function updateStudioRating(studioId: number): Promise<void> {
-  const result = await pool.query(`
-    SELECT 
-      AVG(rating) as avg_rating,
-      COUNT(*) as review_count
-    FROM reviews 
-    WHERE studio_id = $1
-  `, [studioId]);
-
-  const { avg_rating, review_count } = result.rows[0];
-
-  await pool.query(`
-    UPDATE studios 
-    SET rating = $1, review_count = $2, updated_at = NOW()
+// Helper function to update studio rating: applies a change in the studio's
+// rating total and review count within the caller's transaction. The UPDATE
+// locks the studio row, so concurrent reviews of one studio apply in turn and
+// the stored average never has to be recomputed from every review.
+async function adjustStudioRating(
+  client: PoolClient,
+  studioId: number,
+  ratingChange: number,
+  countChange: number
+): Promise<void> {
+  await client.query(prepared('adjust-studio-rating', `
+    UPDATE studios SET
+      rating_total = rating_total + $1,
+      review_count = review_count + $2,
+      rating = CASE
+        WHEN review_count + $2 > 0 THEN ROUND((rating_total + $1)::numeric / (review_count + $2), 2)
+        ELSE 0
+      END,
+      updated_at = NOW()
     WHERE id = $3
-  `, [
-    avg_rating ? parseFloat(avg_rating) : 0,
-    Number(review_count),
-    studioId
-  ]);
+  `, [ratingChange, countChange, studioId]));
 }
 
 export default router; 
\ No newline at end of file
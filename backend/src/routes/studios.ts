@@ -1,11 +1,22 @@
 import { Router, Request, Response } from 'express';
-import { pool } from '../config/database';
+import { pool, prepared } from '../config/database';
 import { AppError, asyncHandler } from '../middleware/errorHandler';
+import { decodeCursor, keysetCondition, keysetPage, parseLimit } from '../utils/pagination';
 import { authenticate, AuthenticatedRequest, requireStudio, optionalAuth } from '../middleware/auth';
 
 const router = Router();
 
+// Sort expressions the studio list accepts. Nullable columns are coalesced so
+// every row has a sort value for the keyset cursor to compare against.
+const STUDIO_SORTS: Record<string, string> = {
+  rating: 'COALESCE(s.rating, 0)',
+  hourly_rate_min: 'COALESCE(s.hourly_rate_min, 0)',
+  created_at: 's.created_at',
+  name: 's.name'
+};
+
 // GET /api/studios - Search and list studios
+// Pages with ?cursor= (the nextCursor of the previous page); ?page= still works but reads every skipped row
 router.get('/', optionalAuth, asyncHandler(async (req: AuthenticatedRequest, res: Response) => {
   const {
     city,
@@ -15,12 +26,13 @@ router.get('/', optionalAuth, asyncHandler(async (req: AuthenticatedRequest, res
     rating,
     amenities,
     page = 1,
-    limit = 10,
+    cursor,
     sortBy = 'rating',
     order = 'desc'
   } = req.query;
 
-  const offset = (Number(page) - 1) * Number(limit);
+  const limit = parseLimit(req.query.limit);
+  const keyset = decodeCursor(cursor);
   let whereClause = 'WHERE s.is_active = true';
   const queryParams: any[] = [];
   let paramCount = 0;
@@ -65,18 +77,26 @@ router.get('/', optionalAuth, asyncHandler(async (req: AuthenticatedRequest, res
   }
 
   // Validate sort options
-  const validSortColumns = ['rating', 'hourly_rate_min', 'created_at', 'name'];
   const validOrders = ['asc', 'desc'];
-  
-  const sortColumn = validSortColumns.includes(sortBy as string) ? sortBy : 'rating';
+  const sortExpression = STUDIO_SORTS[sortBy as string] || STUDIO_SORTS.rating;
   const sortOrder = validOrders.includes(order as string) ? (order as string) : 'desc';
 
-  // Add pagination parameters
+  // Only the first (or an offset) page reports a total; cursor pages skip the count
+  const filterParams = [...queryParams];
+  let pageClause = whereClause;
+  if (keyset) {
+    pageClause += ` AND ${keysetCondition(sortExpression, 's.id', sortOrder === 'desc', paramCount + 1)}`;
+    queryParams.push(keyset.value, keyset.id);
+    paramCount += 2;
+  }
+
+  // Add pagination parameters, fetching one extra row to tell if there is another page
+  const offset = keyset ? 0 : (Math.max(Number(page) || 1, 1) - 1) * limit;
   paramCount++;
   const limitParam = paramCount;
   paramCount++;
   const offsetParam = paramCount;
-  queryParams.push(Number(limit), offset);
+  queryParams.push(limit + 1, offset);
 
   const query = `
     SELECT 
@@ -92,16 +112,31 @@ router.get('/', optionalAuth, asyncHandler(async (req: AuthenticatedRequest, res
       s.amenities,
       s.image_urls,
       s.created_at,
-      COUNT(*) OVER() as total_count
+      (${sortExpression})::text as sort_key
     FROM studios s
-    ${whereClause}
-    ORDER BY s.${sortColumn} ${sortOrder.toUpperCase()}
+    ${pageClause}
+    ORDER BY ${sortExpression} ${sortOrder.toUpperCase()}, s.id ${sortOrder.toUpperCase()}
     LIMIT $${limitParam} OFFSET $${offsetParam}
   `;
 
-  const result = await pool.query(query, queryParams);
-  const studios = result.rows;
-  const totalCount = studios.length > 0 ? studios[0].total_count : 0;
+  const result = await pool.query(prepared('studios-search', query, queryParams));
+  const { rows: studios, pageInfo } = keysetPage(result.rows, limit);
+
+  let pagination: Record<string, any> = pageInfo;
+  if (!keyset) {
+    const countResult = await pool.query(prepared(
+      'studios-search-count',
+      `SELECT COUNT(*) as total_count FROM studios s ${whereClause}`,
+      filterParams
+    ));
+    const totalCount = Number(countResult.rows[0].total_count);
+    pagination = {
+      page: Math.max(Number(page) || 1, 1),
+      total: totalCount,
+      pages: Math.ceil(totalCount / limit),
+      ...pageInfo
+    };
+  }
 
   res.json({
     success: true,
@@ -122,12 +157,7 @@ router.get('/', optionalAuth, asyncHandler(async (req: AuthenticatedRequest, res
         images: studio.image_urls || [],
         createdAt: studio.created_at
       })),
-      pagination: {
-        page: Number(page),
-        limit: Number(limit),
-        total: Number(totalCount),
-        pages: Math.ceil(Number(totalCount) / Number(limit))
-      }
+      pagination
     }
   });
 }));
@@ -136,7 +166,7 @@ router.get('/', optionalAuth, asyncHandler(async (req: AuthenticatedRequest, res
 router.get('/:id', optionalAuth, asyncHandler(async (req: AuthenticatedRequest, res: Response) => {
   const { id } = req.params;
 
-  const result = await pool.query(`
+  const result = await pool.query(prepared('studio-detail', `
     SELECT 
       s.*,
       u.email as owner_email,
@@ -160,7 +190,7 @@ router.get('/:id', optionalAuth, asyncHandler(async (req: AuthenticatedRequest,
     LEFT JOIN studio_rooms sr ON s.id = sr.studio_id AND sr.is_active = true
     WHERE s.id = $1 AND s.is_active = true
     GROUP BY s.id, u.email
-  `, [id]);
+  `, [id]));
 
   if (result.rows.length === 0) {
     throw new AppError('Studio not found', 404);
@@ -0,0 +1,73 @@
+import { AppError } from '../middleware/errorHandler';
+
+export const DEFAULT_PAGE_SIZE = 10;
+export const MAX_PAGE_SIZE = 100;
+
+// Where the previous page stopped: its last row's sort value and id
+export interface Keyset {
+  value: string;
+  id: number;
+}
+
+export interface PageInfo {
+  limit: number;
+  hasMore: boolean;
+  nextCursor: string | null;
+}
+
+export function parseLimit(limit: unknown): number {
+  const parsed = Math.floor(Number(limit));
+  if (!Number.isFinite(parsed) || parsed < 1) return DEFAULT_PAGE_SIZE;
+  return Math.min(parsed, MAX_PAGE_SIZE);
+}
+
+export function encodeCursor(keyset: Keyset): string {
+  return Buffer.from(JSON.stringify([keyset.value, keyset.id])).toString('base64url');
+}
+
+/**
+ * The keyset in a `cursor` query param, or null when there isn't one
+ */
+export function decodeCursor(cursor: unknown): Keyset | null {
+  if (cursor === undefined || cursor === '') return null;
+
+  try {
+    const [value, id] = JSON.parse(Buffer.from(String(cursor), 'base64url').toString('utf8'));
+    if (typeof value === 'string' && Number.isInteger(id)) {
+      return { value, id };
+    }
+  } catch {
+    // Fall through to the error below
+  }
+  throw new AppError('Invalid cursor', 400);
+}
+
+/**
+ * Build the WHERE condition that starts a page after `keyset`. Rows are
+ * ordered by (sort expression, id) in one direction, so the rest of the list
+ * is everything on the far side of the last row seen, which an index on the
+ * same columns reads as a range however deep the page is.
+ */
+export function keysetCondition(sortExpression: string, idColumn: string, descending: boolean, valueParam: number): string {
+  return `(${sortExpression}, ${idColumn}) ${descending ? '<' : '>'} ($${valueParam}, $${valueParam + 1})`;
+}
+
+/**
+ * Trim a page fetched with `limit + 1` rows. Rows must carry the `sort_key`
+ * (the sort value as text, so timestamps keep their full precision) and `id`
+ * the next cursor is built from.
+ */
+export function keysetPage<T extends { sort_key: string; id: number }>(rows: T[], limit: number): { rows: T[]; pageInfo: PageInfo } {
+  const hasMore = rows.length > limit;
+  const page = hasMore ? rows.slice(0, limit) : rows;
+  const last = page[page.length - 1];
+
+  return {
+    rows: page,
+    pageInfo: {
+      limit,
+      hasMore,
+      nextCursor: hasMore && last ? encodeCursor({ value: last.sort_key, id: last.id }) : null
+    }
+  };
+}
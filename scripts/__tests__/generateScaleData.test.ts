@@ -0,0 +1,67 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { execSync } from 'child_process';
+
+describe('Scale Data Generator', () => {
+  let tmpDir: string;
+
+  beforeAll(() => {
+    tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'scale-data-'));
+    fs.writeFileSync(path.join(tmpDir, 'bookings.json'), JSON.stringify({ bookings: [{ id: 'old' }] }));
+    fs.writeFileSync(path.join(tmpDir, 'bookings.json.log'), '{"op":"put"}\n');
+
+    execSync(
+      `npm run data:scale -- --dir=${tmpDir} --studios=20 --artists=40 --messages=500 --bookings=300 --booking-requests=30 --follows=100`,
+      { stdio: 'pipe' }
+    );
+  });
+
+  afterAll(() => {
+    fs.rmSync(tmpDir, { recursive: true, force: true });
+  });
+
+  const read = (file: string) => JSON.parse(fs.readFileSync(path.join(tmpDir, file), 'utf8'));
+
+  test('writes each collection in the shape the API reads', () => {
+    const { studios } = read('studios.json');
+    const users = read('users.json');
+    const { bookings } = read('bookings.json');
+    const { bookingRequests } = read('booking-requests.json');
+    const { messages, conversations } = read('messages.json');
+    const follows = read('follows.json');
+
+    expect(studios).toHaveLength(20);
+    expect(studios[0].rooms.length).toBeGreaterThan(0);
+    expect(users).toHaveLength(60);
+    expect(users.filter((user: any) => user.role === 'studio').every((user: any) => user.studioId)).toBe(true);
+    expect(bookings).toHaveLength(300);
+    expect(bookingRequests).toHaveLength(30);
+    expect(messages).toHaveLength(500);
+    expect(follows).toHaveLength(100);
+
+    const conversation = conversations[0];
+    expect(conversation.lastMessage.conversationId).toBe(conversation.id);
+    const unread = messages.filter((message: any) => message.conversationId === conversation.id && !message.read).length;
+    expect(Object.values(conversation.unreadCount).reduce((sum: number, n: any) => sum + n, 0)).toBe(unread);
+  });
+
+  test('never books a room slot twice', () => {
+    const { bookings } = read('bookings.json');
+    const { bookingRequests } = read('booking-requests.json');
+    const slots = [...bookings, ...bookingRequests].map(booking => `${booking.roomId}|${booking.date}|${booking.startTime}`);
+
+    expect(new Set(slots).size).toBe(slots.length);
+  });
+
+  test('backs up replaced files, drops their logs and writes load test fixtures', () => {
+    const files = fs.readdirSync(tmpDir);
+    const fixtures = read('load-test-fixtures.json');
+
+    expect(files.some(file => file.startsWith('bookings.json.backup.'))).toBe(true);
+    expect(files).not.toContain('bookings.json.log');
+    expect(fixtures.password).toBe('loadtest-password');
+    expect(fixtures.artists.length).toBeGreaterThan(0);
+    expect(fixtures.studios[0].id).toMatch(/^studio_scale_/);
+  });
+});
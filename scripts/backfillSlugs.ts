@@ -1,5 +1,6 @@
 import fs from 'fs';
 import path from 'path';
+import { compactCollection } from '../src/lib/data-store';
 
 // Define the slugify function (same as in utils.ts)
 function slugify(text: string): string {
@@ -27,6 +28,9 @@ const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
 
 function getUsers(): User[] {
   try {
+    // Fold any logged changes into users.json before reading it directly
+    compactCollection('users');
+
     if (fs.existsSync(USERS_FILE)) {
       const data = fs.readFileSync(USERS_FILE, 'utf8');
       return JSON.parse(data);
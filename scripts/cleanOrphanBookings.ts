@@ -2,6 +2,7 @@
 
 import fs from 'fs';
 import path from 'path';
+import { compactCollection } from '../src/lib/data-store';
 
 interface Booking {
   id: string;
@@ -57,6 +58,11 @@ export async function cleanOrphanBookings(): Promise<void> {
   console.log('🧹 Starting orphan booking cleanup...');
   
   try {
+    // Fold any logged changes into the JSON files before reading them directly
+    compactCollection('bookings');
+    compactCollection('users');
+    compactCollection('studios');
+
     // Load data files
     const bookingsData: BookingData = JSON.parse(fs.readFileSync(BOOKINGS_FILE, 'utf8'));
     const users: User[] = JSON.parse(fs.readFileSync(USERS_FILE, 'utf8'));
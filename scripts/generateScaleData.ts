@@ -0,0 +1,429 @@
+import fs from 'fs';
+import path from 'path';
+import bcrypt from 'bcrypt';
+
+/**
+ * Fill the data files with synthetic records at production scale, in the
+ * shapes the API routes write, so load tests and profiling see realistic file
+ * sizes and index fan-out. Output is deterministic for a given seed.
+ *
+ *   npx ts-node scripts/generateScaleData.ts --studios=10000 --messages=1000000 --bookings=100000
+ *
+ * Every generated user logs in with LOAD_TEST_PASSWORD. A sample of ids and
+ * credentials is written to load-test-fixtures.json for scripts/loadTest.ts.
+ */
+
+export const LOAD_TEST_PASSWORD = 'loadtest-password';
+export const FIXTURES_FILE = 'load-test-fixtures.json';
+
+export interface ScaleOptions {
+  dir: string;
+  studios: number;
+  artists: number;
+  messages: number;
+  messagesPerConversation: number;
+  bookings: number;
+  bookingRequests: number;
+  follows: number;
+  seed: number;
+}
+
+const DEFAULT_OPTIONS: ScaleOptions = {
+  dir: path.join(process.cwd(), 'data'),
+  studios: 10000,
+  artists: 20000,
+  messages: 1000000,
+  messagesPerConversation: 50,
+  bookings: 100000,
+  bookingRequests: 10000,
+  follows: 100000,
+  seed: 1
+};
+
+// Same cost as user-store, so login benchmarks measure the real bcrypt work
+const SALT_ROUNDS = 12;
+// Ids and emails of this many users of each kind go into the fixtures file
+const FIXTURE_SAMPLE = 200;
+// Buffered output is written once it passes this many characters
+const WRITE_CHUNK = 1 << 20;
+
+const CITIES = [
+  { name: 'Los Angeles, CA', lat: 34.05, lng: -118.24 },
+  { name: 'Atlanta, GA', lat: 33.75, lng: -84.39 },
+  { name: 'New York, NY', lat: 40.71, lng: -74.01 },
+  { name: 'Houston, TX', lat: 29.76, lng: -95.37 },
+  { name: 'Chicago, IL', lat: 41.88, lng: -87.63 },
+  { name: 'Miami, FL', lat: 25.76, lng: -80.19 },
+  { name: 'Nashville, TN', lat: 36.16, lng: -86.78 },
+  { name: 'Detroit, MI', lat: 42.33, lng: -83.05 },
+  { name: 'Oakland, CA', lat: 37.8, lng: -122.27 },
+  { name: 'Memphis, TN', lat: 35.15, lng: -90.05 }
+];
+const STUDIO_WORDS = ['Sound', 'Lab', 'Booth', 'Wave', 'Echo', 'Vault', 'Dojo', 'Factory', 'Room', 'House', 'Tone', 'Signal'];
+const AMENITIES = ['Vocal Booth', 'Mixing', 'Mastering', 'Parking', 'Lounge', 'WiFi', 'Kitchen', 'Live Room', 'Engineer Included'];
+const GENRES = ['Hip Hop', 'R&B', 'Pop', 'Rock', 'Trap', 'Drill', 'Soul', 'Afrobeats'];
+const STREETS = ['Main St', 'Sunset Blvd', 'Peachtree St', 'Broadway', 'Elm Ave', 'Roebling Ave'];
+const DAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'];
+const MESSAGE_TEXTS = ['hey', 'Is the booth free Friday?', 'Sent the stems over', 'Can we push to 3pm?', 'Thanks, sounds great!', 'yo'];
+
+// Two-hour sessions from 10:00, six per room per day
+const SESSION_STARTS = ['10:00', '12:00', '14:00', '16:00', '18:00', '20:00'];
+const FIRST_SESSION_DAY = Date.parse('2025-01-06T00:00:00Z');
+const DAY_MS = 24 * 60 * 60 * 1000;
+const BASE_TIME = Date.parse('2025-01-01T00:00:00Z');
+
+// mulberry32: small, fast and repeatable
+function createRandom(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/**
+ * Writes a JSON document record by record, so a million messages never have
+ * to exist as one string
+ */
+class JsonFileWriter {
+  private fullPath: string;
+  private fd: number;
+  private chunks: string[] = [];
+  private buffered = 0;
+
+  constructor(fullPath: string) {
+    this.fullPath = fullPath;
+    this.fd = fs.openSync(`${fullPath}.tmp`, 'w');
+  }
+
+  write(text: string): void {
+    this.chunks.push(text);
+    this.buffered += text.length;
+    if (this.buffered >= WRITE_CHUNK) this.flush();
+  }
+
+  array(count: number, make: (index: number) => any): void {
+    this.write('[');
+    for (let i = 0; i < count; i++) {
+      this.write(`${i === 0 ? '' : ','}\n  ${JSON.stringify(make(i))}`);
+    }
+    this.write(count === 0 ? ']' : '\n]');
+  }
+
+  // Move the finished file into place and drop its operation log, which described the old file
+  close(): void {
+    this.flush();
+    fs.closeSync(this.fd);
+    fs.renameSync(`${this.fullPath}.tmp`, this.fullPath);
+    fs.rmSync(`${this.fullPath}.log`, { force: true });
+  }
+
+  private flush(): void {
+    if (this.chunks.length === 0) return;
+    fs.writeSync(this.fd, this.chunks.join(''));
+    this.chunks = [];
+    this.buffered = 0;
+  }
+}
+
+function backup(fullPath: string): void {
+  if (!fs.existsSync(fullPath) || fs.statSync(fullPath).size === 0) return;
+  const backupFile = `${fullPath}.backup.${Date.now()}`;
+  fs.copyFileSync(fullPath, backupFile);
+  console.log(`💾 Created backup: ${path.basename(backupFile)}`);
+}
+
+function iso(time: number): string {
+  return new Date(time).toISOString();
+}
+
+export function parseArgs(argv: string[]): Partial<ScaleOptions> {
+  const options: Record<string, string | number> = {};
+  for (let i = 0; i < argv.length; i++) {
+    const match = argv[i].match(/^--([a-z-]+)(?:=(.*))?$/);
+    if (!match) continue;
+    // --booking-requests=500 sets bookingRequests
+    const key = match[1].replace(/-([a-z])/g, (_, letter) => letter.toUpperCase());
+    const value = match[2] ?? argv[++i];
+    options[key] = key === 'dir' ? path.resolve(value) : Number(value);
+  }
+  return options as Partial<ScaleOptions>;
+}
+
+async function generateScaleData(overrides: Partial<ScaleOptions> = {}): Promise<ScaleOptions> {
+  const options = { ...DEFAULT_OPTIONS, ...overrides };
+  const random = createRandom(options.seed);
+  const pick = <T>(items: T[]): T => items[Math.floor(random() * items.length)];
+  const between = (min: number, max: number) => min + Math.floor(random() * (max - min + 1));
+
+  console.log('🏗️ Generating scale data:', options);
+  fs.mkdirSync(options.dir, { recursive: true });
+  const output = (file: string) => {
+    const fullPath = path.join(options.dir, file);
+    backup(fullPath);
+    return new JsonFileWriter(fullPath);
+  };
+
+  const passwordHash = await bcrypt.hash(LOAD_TEST_PASSWORD, SALT_ROUNDS);
+  const artistId = (i: number) => `user_scale_artist_${i}`;
+  const ownerId = (i: number) => `user_scale_studio_${i}`;
+  const studioId = (i: number) => `studio_scale_${i}`;
+  const artistName = (i: number) => `Artist ${i}`;
+  const studioName = (i: number) => `${STUDIO_WORDS[i % STUDIO_WORDS.length]} ${STUDIO_WORDS[(i >> 4) % STUDIO_WORDS.length]} ${i}`;
+  const artistEmail = (i: number) => `artist${i}@loadtest.hitconnector.dev`;
+  const ownerEmail = (i: number) => `studio${i}@loadtest.hitconnector.dev`;
+
+  // Studios first: bookings need their rooms and rates
+  const studioRooms: { id: string; name: string; hourlyRate: number }[][] = [];
+  const studioFile = output('studios.json');
+  studioFile.write('{"studios":');
+  studioFile.array(options.studios, i => {
+    const city = pick(CITIES);
+    const hourlyRate = between(25, 150);
+    const rooms = Array.from({ length: between(1, 3) }, (_, r) => ({
+      id: `room_scale_${i}_${r}`,
+      name: `Studio ${String.fromCharCode(65 + r)}`,
+      description: 'Treated live room with a vocal booth',
+      hourlyRate: hourlyRate + r * 15,
+      capacity: between(2, 10),
+      equipment: ['Neumann U87', 'Pro Tools', 'SSL Console'].slice(0, between(1, 3)),
+      images: []
+    }));
+    studioRooms.push(rooms.map(({ id, name, hourlyRate }) => ({ id, name, hourlyRate })));
+    const created = BASE_TIME - between(0, 365) * DAY_MS;
+
+    return {
+      id: studioId(i),
+      slug: studioName(i).toLowerCase().replace(/\s+/g, '-'),
+      name: studioName(i),
+      location: city.name,
+      address: `${between(100, 9999)} ${pick(STREETS)}`,
+      latitude: city.lat + (random() - 0.5) * 0.4,
+      longitude: city.lng + (random() - 0.5) * 0.4,
+      phone: `555${String(i).padStart(7, '0')}`,
+      email: ownerEmail(i),
+      website: '',
+      profileImage: '',
+      coverImage: '',
+      description: `${studioName(i)} records, mixes and masters in ${city.name}.`,
+      hourlyRate,
+      rating: Math.round((3 + random() * 2) * 10) / 10,
+      reviewCount: between(0, 200),
+      amenities: AMENITIES.filter(() => random() < 0.4),
+      specialties: GENRES.filter(() => random() < 0.3),
+      images: [],
+      rooms,
+      staff: [],
+      operatingHours: Object.fromEntries(DAYS.map(day => [day, { open: '10:00', close: '22:00', closed: day === 'sunday' }])),
+      owner: ownerEmail(i),
+      createdAt: iso(created),
+      updatedAt: iso(created + between(0, 30) * DAY_MS)
+    };
+  });
+  studioFile.write('}');
+  studioFile.close();
+  console.log(`✅ studios.json: ${options.studios} studios`);
+
+  const usersFile = output('users.json');
+  usersFile.array(options.artists + options.studios, i => {
+    const isArtist = i < options.artists;
+    const n = isArtist ? i : i - options.artists;
+    return {
+      id: isArtist ? artistId(n) : ownerId(n),
+      email: isArtist ? artistEmail(n) : ownerEmail(n),
+      passwordHash,
+      name: isArtist ? artistName(n) : studioName(n),
+      role: isArtist ? 'rapper' : 'studio',
+      createdAt: iso(BASE_TIME - n * 60000),
+      slug: isArtist ? `artist-${n}` : `studio-owner-${n}`,
+      ...(!isArtist && { studioId: studioId(n) })
+    };
+  });
+  usersFile.close();
+
+  const profilesFile = output('user-profiles.json');
+  profilesFile.array(options.artists, i => ({
+    id: artistId(i),
+    name: artistName(i),
+    email: artistEmail(i),
+    role: 'rapper',
+    slug: `artist-${i}`,
+    bio: 'Writing every day.',
+    location: pick(CITIES).name,
+    website: '',
+    trackUrl: '',
+    profileImage: '',
+    bannerImage: '',
+    projectHighlights: [],
+    socialMedia: { instagram: `@artist${i}`, twitter: '', youtube: '', spotify: '' },
+    genres: GENRES.filter(() => random() < 0.3),
+    experience: pick(['beginner', 'intermediate', 'professional']),
+    createdAt: iso(BASE_TIME - i * 60000)
+  }));
+  profilesFile.close();
+  console.log(`✅ users.json and user-profiles.json: ${options.artists} artists, ${options.studios} studio owners`);
+
+  // Each room's sessions fill consecutive two-hour slots, so no two bookings overlap
+  const slotsTaken = new Map<string, number>();
+  const makeBooking = (id: string, status: string) => {
+    const studio = between(0, options.studios - 1);
+    const room = pick(studioRooms[studio]);
+    const artist = between(0, options.artists - 1);
+    const slot = slotsTaken.get(room.id) ?? 0;
+    slotsTaken.set(room.id, slot + 1);
+    const date = iso(FIRST_SESSION_DAY + Math.floor(slot / SESSION_STARTS.length) * DAY_MS).slice(0, 10);
+    const startTime = SESSION_STARTS[slot % SESSION_STARTS.length];
+    const endTime = `${String(Number(startTime.slice(0, 2)) + 2).padStart(2, '0')}:00`;
+    const baseAmount = room.hourlyRate * 2;
+    const companyFee = Math.round(baseAmount * 0.03 * 100) / 100;
+    const createdAt = iso(Date.parse(`${date}T00:00:00Z`) - between(1, 14) * DAY_MS);
+
+    return {
+      id,
+      studioId: studioId(studio),
+      studioName: studioName(studio),
+      roomId: room.id,
+      roomName: room.name,
+      userId: artistId(artist),
+      userName: artistName(artist),
+      userEmail: artistEmail(artist),
+      date,
+      startTime,
+      endTime,
+      duration: 2,
+      hourlyRate: room.hourlyRate,
+      totalCost: baseAmount,
+      baseAmount,
+      companyFee,
+      totalAmount: baseAmount + companyFee,
+      message: '',
+      staffId: null,
+      staffName: null,
+      status,
+      paymentIntentId: `pi_scale_${id}`,
+      paymentStatus: status === 'cancelled' ? 'canceled' : status === 'pending' ? 'requires_capture' : 'captured',
+      createdAt,
+      updatedAt: createdAt
+    };
+  };
+
+  const bookingsFile = output('bookings.json');
+  bookingsFile.write('{"bookings":');
+  bookingsFile.array(options.bookings, i => {
+    const roll = random();
+    const status = roll < 0.5 ? 'completed' : roll < 0.7 ? 'confirmed' : roll < 0.85 ? 'pending' : 'cancelled';
+    return makeBooking(`booking_scale_${i}`, status);
+  });
+  bookingsFile.write('}');
+  bookingsFile.close();
+
+  const requestsFile = output('booking-requests.json');
+  requestsFile.write('{"bookingRequests":');
+  requestsFile.array(options.bookingRequests, i => makeBooking(`booking_request_scale_${i}`, random() < 0.8 ? 'pending' : 'rejected'));
+  requestsFile.write('}');
+  requestsFile.close();
+  console.log(`✅ bookings.json and booking-requests.json: ${options.bookings} bookings, ${options.bookingRequests} requests`);
+
+  // Messages stream out conversation by conversation; each conversation is
+  // written after them, once its last message and unread counts are known
+  const conversationCount = Math.ceil(options.messages / Math.max(1, options.messagesPerConversation));
+  const conversations: any[] = [];
+  const messagesFile = output('messages.json');
+  messagesFile.write('{"messages":[');
+  let written = 0;
+  for (let c = 0; c < conversationCount && written < options.messages; c++) {
+    const id = `conv_scale_${c}`;
+    const artist = artistId(c % options.artists);
+    const owner = ownerId((c * 7919) % options.studios);
+    const count = Math.min(options.messagesPerConversation, options.messages - written);
+    const unreadCount: Record<string, number> = { [artist]: 0, [owner]: 0 };
+    let lastMessage: any = null;
+
+    for (let m = 0; m < count; m++) {
+      const fromArtist = random() < 0.5;
+      lastMessage = {
+        id: `msg_scale_${written}`,
+        conversationId: id,
+        senderId: fromArtist ? artist : owner,
+        receiverId: fromArtist ? owner : artist,
+        text: pick(MESSAGE_TEXTS),
+        timestamp: iso(BASE_TIME + c * 60000 + m * 1000),
+        // The last few messages of a conversation are still unread
+        read: m < count - 3,
+        type: 'text'
+      };
+      if (!lastMessage.read) unreadCount[lastMessage.receiverId]++;
+      messagesFile.write(`${written === 0 ? '' : ','}\n  ${JSON.stringify(lastMessage)}`);
+      written++;
+    }
+
+    conversations.push({
+      id,
+      participants: [artist, owner],
+      updatedAt: lastMessage.timestamp,
+      unreadCount,
+      lastMessage,
+      lastReadAt: {}
+    });
+  }
+  messagesFile.write('\n],"conversations":');
+  messagesFile.array(conversations.length, i => conversations[i]);
+  messagesFile.write('}');
+  messagesFile.close();
+  console.log(`✅ messages.json: ${written} messages in ${conversations.length} conversations`);
+
+  // Artist i follows a run of consecutive studios starting at an offset of its
+  // own, so pairs never repeat. Offsets are skewed toward low ids, so a few
+  // studios collect most followers as in real use
+  const followsFile = output('follows.json');
+  const followsPerArtist = Math.min(options.studios, Math.ceil(options.follows / Math.max(1, options.artists)));
+  const followCount = Math.min(options.follows, options.artists * followsPerArtist);
+  const followOffsets = Array.from({ length: options.artists }, () => Math.floor(options.studios * Math.pow(random(), 3)));
+  followsFile.array(followCount, i => {
+    const artist = i % options.artists;
+    const nth = Math.floor(i / options.artists);
+    return {
+      followerId: artistId(artist),
+      followingId: studioId((followOffsets[artist] + nth) % options.studios),
+      createdAt: iso(BASE_TIME + i * 1000)
+    };
+  });
+  followsFile.close();
+  console.log(`✅ follows.json: ${followCount} follows`);
+
+  const sample = (count: number) => Array.from({ length: Math.min(count, FIXTURE_SAMPLE) }, (_, i) => Math.floor((i * count) / Math.min(count, FIXTURE_SAMPLE)));
+  const fixtures = {
+    generatedAt: new Date().toISOString(),
+    options: { ...options, dir: undefined },
+    password: LOAD_TEST_PASSWORD,
+    artists: sample(options.artists).map(i => ({ id: artistId(i), email: artistEmail(i) })),
+    studios: sample(options.studios).map(i => ({ id: studioId(i), ownerId: ownerId(i), email: ownerEmail(i) })),
+    locations: CITIES.map(city => city.name.split(',')[0]),
+    amenities: AMENITIES
+  };
+  fs.writeFileSync(path.join(options.dir, FIXTURES_FILE), JSON.stringify(fixtures, null, 2));
+  console.log(`📋 Wrote ${FIXTURES_FILE}`);
+
+  console.log('🎉 Scale data generated');
+  return options;
+}
+
+// Run the generator if this script is executed directly
+if (import.meta.url === `file://${process.argv[1]}`) {
+  if (process.env.NODE_ENV === 'production') {
+    console.error('❌ Scale data generator cannot run in production environment');
+    process.exit(1);
+  }
+
+  generateScaleData(parseArgs(process.argv.slice(2)))
+    .then(() => process.exit(0))
+    .catch(error => {
+      console.error('❌ Scale data generation failed:', error);
+      process.exit(1);
+    });
+}
+
+export { generateScaleData };
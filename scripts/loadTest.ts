@@ -0,0 +1,253 @@
+import fs from 'fs';
+import path from 'path';
+
+/**
+ * Drive the hot API routes of a running server with concurrent requests and
+ * report latency percentiles, throughput and the Server-Timing phase split.
+ *
+ *   npx ts-node scripts/generateScaleData.ts
+ *   npm run dev   (or npm run build && npm start for production numbers)
+ *   npx ts-node scripts/loadTest.ts --duration=30 --concurrency=20
+ *
+ * --max-p95=studios:200 fails the run (exit 1) if a scenario's p95 is over
+ * the given milliseconds, so the harness can gate CI.
+ */
+
+interface Fixtures {
+  password: string;
+  artists: { id: string; email: string }[];
+  studios: { id: string; ownerId: string; email: string }[];
+  locations: string[];
+  amenities: string[];
+}
+
+interface LoadOptions {
+  baseUrl: string;
+  duration: number;
+  concurrency: number;
+  scenarios: string[];
+  fixtures: string;
+  out?: string;
+  maxP95: Record<string, number>;
+}
+
+interface Scenario {
+  name: string;
+  request: (fixtures: Fixtures, n: number) => { path: string; init?: RequestInit };
+}
+
+interface ScenarioReport {
+  requests: number;
+  errors: number;
+  rps: number;
+  mean: number;
+  p50: number;
+  p95: number;
+  p99: number;
+  max: number;
+  // Mean milliseconds per Server-Timing phase (io, parse, lookup, serialize, total)
+  phases: Record<string, number>;
+}
+
+const pickFrom = <T>(items: T[], n: number): T => items[n % items.length];
+
+const SCENARIOS: Scenario[] = [
+  {
+    name: 'login',
+    request: (fixtures, n) => {
+      const artist = pickFrom(fixtures.artists, n);
+      return {
+        path: '/api/auth/login',
+        init: {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({ email: artist.email, password: fixtures.password, role: 'rapper' })
+        }
+      };
+    }
+  },
+  {
+    name: 'studios',
+    request: (fixtures, n) => {
+      const params = new URLSearchParams({ location: pickFrom(fixtures.locations, n), limit: '20' });
+      if (n % 3 === 0) params.set('amenities', pickFrom(fixtures.amenities, n));
+      if (n % 4 === 0) params.set('sort', 'rating');
+      return { path: `/api/studios?${params}` };
+    }
+  },
+  {
+    name: 'conversations',
+    request: (fixtures, n) => ({ path: `/api/conversations?userId=${pickFrom(fixtures.artists, n).id}` })
+  },
+  {
+    name: 'booking-requests',
+    request: (fixtures, n) => ({ path: `/api/booking-requests?studioId=${pickFrom(fixtures.studios, n).id}` })
+  },
+  {
+    name: 'follow-status',
+    request: (fixtures, n) => {
+      const targetIds = Array.from({ length: 20 }, (_, i) => pickFrom(fixtures.studios, n + i).id);
+      return { path: `/api/follow/status?followerId=${pickFrom(fixtures.artists, n).id}&targetIds=${targetIds.join(',')}` };
+    }
+  }
+];
+
+const DEFAULT_OPTIONS: LoadOptions = {
+  baseUrl: 'http://localhost:3000',
+  duration: 20,
+  concurrency: 10,
+  scenarios: SCENARIOS.map(scenario => scenario.name),
+  fixtures: path.join(process.cwd(), 'data', 'load-test-fixtures.json'),
+  maxP95: {}
+};
+
+export function parseArgs(argv: string[]): LoadOptions {
+  const options: LoadOptions = { ...DEFAULT_OPTIONS, maxP95: {} };
+  for (const arg of argv) {
+    const match = arg.match(/^--([a-z0-9-]+)=(.*)$/);
+    if (!match) continue;
+    const [, key, value] = match;
+    if (key === 'base-url') options.baseUrl = value.replace(/\/$/, '');
+    else if (key === 'duration') options.duration = Number(value);
+    else if (key === 'concurrency') options.concurrency = Number(value);
+    else if (key === 'scenarios') options.scenarios = value.split(',').map(name => name.trim()).filter(Boolean);
+    else if (key === 'fixtures') options.fixtures = path.resolve(value);
+    else if (key === 'out') options.out = path.resolve(value);
+    else if (key === 'max-p95') {
+      // --max-p95=studios:200,conversations:100
+      for (const limit of value.split(',')) {
+        const [name, ms] = limit.split(':');
+        options.maxP95[name] = Number(ms);
+      }
+    }
+  }
+  return options;
+}
+
+// Exact percentile of an ascending list (nearest rank)
+export function percentile(sorted: number[], q: number): number {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.min(sorted.length - 1, Math.max(0, Math.ceil(q * sorted.length) - 1))];
+}
+
+// "io;dur=1.2, parse;dur=3.4" -> { io: 1.2, parse: 3.4 }
+export function parseServerTiming(header: string | null): Record<string, number> {
+  const phases: Record<string, number> = {};
+  for (const entry of (header || '').split(',')) {
+    const match = entry.trim().match(/^([\w-]+);dur=([\d.]+)/);
+    if (match) phases[match[1]] = Number(match[2]);
+  }
+  return phases;
+}
+
+const round = (ms: number) => Math.round(ms * 100) / 100;
+
+async function runScenario(scenario: Scenario, fixtures: Fixtures, options: LoadOptions): Promise<ScenarioReport> {
+  const latencies: number[] = [];
+  const phaseTotals: Record<string, number> = {};
+  let errors = 0;
+  let sent = 0;
+  const started = performance.now();
+  const deadline = started + options.duration * 1000;
+
+  // Each worker sends its next request as soon as the previous one answers
+  const worker = async () => {
+    while (performance.now() < deadline) {
+      const { path: requestPath, init } = scenario.request(fixtures, sent++);
+      const requestStarted = performance.now();
+      try {
+        const response = await fetch(`${options.baseUrl}${requestPath}`, init);
+        await response.arrayBuffer();
+        latencies.push(performance.now() - requestStarted);
+        if (!response.ok) errors++;
+        for (const [phase, ms] of Object.entries(parseServerTiming(response.headers.get('server-timing')))) {
+          phaseTotals[phase] = (phaseTotals[phase] || 0) + ms;
+        }
+      } catch {
+        latencies.push(performance.now() - requestStarted);
+        errors++;
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: options.concurrency }, worker));
+
+  const elapsedSeconds = (performance.now() - started) / 1000;
+  const sorted = [...latencies].sort((a, b) => a - b);
+  return {
+    requests: sorted.length,
+    errors,
+    rps: round(sorted.length / elapsedSeconds),
+    mean: round(sorted.reduce((sum, ms) => sum + ms, 0) / Math.max(1, sorted.length)),
+    p50: round(percentile(sorted, 0.5)),
+    p95: round(percentile(sorted, 0.95)),
+    p99: round(percentile(sorted, 0.99)),
+    max: round(sorted[sorted.length - 1] || 0),
+    phases: Object.fromEntries(Object.entries(phaseTotals).map(([phase, ms]) => [phase, round(ms / Math.max(1, sorted.length))]))
+  };
+}
+
+async function loadTest(options: LoadOptions = DEFAULT_OPTIONS): Promise<Record<string, ScenarioReport>> {
+  if (!fs.existsSync(options.fixtures)) {
+    throw new Error(`${options.fixtures} not found - run scripts/generateScaleData.ts first`);
+  }
+  const fixtures: Fixtures = JSON.parse(fs.readFileSync(options.fixtures, 'utf8'));
+
+  const unknown = options.scenarios.filter(name => !SCENARIOS.some(scenario => scenario.name === name));
+  if (unknown.length > 0) {
+    throw new Error(`Unknown scenarios: ${unknown.join(', ')} (available: ${SCENARIOS.map(s => s.name).join(', ')})`);
+  }
+
+  console.log(`🚀 Load testing ${options.baseUrl}: ${options.duration}s per scenario, ${options.concurrency} concurrent`);
+  const reports: Record<string, ScenarioReport> = {};
+  for (const scenario of SCENARIOS.filter(s => options.scenarios.includes(s.name))) {
+    console.log(`⏱️ ${scenario.name}...`);
+    reports[scenario.name] = await runScenario(scenario, fixtures, options);
+  }
+
+  console.table(Object.fromEntries(Object.entries(reports).map(([name, report]) => [name, {
+    requests: report.requests,
+    errors: report.errors,
+    'req/s': report.rps,
+    'p50 ms': report.p50,
+    'p95 ms': report.p95,
+    'p99 ms': report.p99,
+    'max ms': report.max
+  }])));
+  console.log('📊 Mean server time per phase (ms, from Server-Timing):');
+  console.table(Object.fromEntries(Object.entries(reports).map(([name, report]) => [name, report.phases])));
+
+  if (options.out) {
+    fs.writeFileSync(options.out, JSON.stringify({ options, reports, timestamp: new Date().toISOString() }, null, 2));
+    console.log(`💾 Wrote ${options.out}`);
+  }
+
+  return reports;
+}
+
+// Scenarios whose p95 is over its --max-p95 limit
+export function thresholdFailures(reports: Record<string, ScenarioReport>, maxP95: Record<string, number>): string[] {
+  return Object.entries(maxP95)
+    .filter(([name, limit]) => reports[name] && reports[name].p95 > limit)
+    .map(([name, limit]) => `${name}: p95 ${reports[name].p95}ms > ${limit}ms`);
+}
+
+// Run the load test if this script is executed directly
+if (import.meta.url === `file://${process.argv[1]}`) {
+  const options = parseArgs(process.argv.slice(2));
+
+  loadTest(options)
+    .then(reports => {
+      const failures = thresholdFailures(reports, options.maxP95);
+      if (failures.length > 0) {
+        console.error('❌ Latency thresholds exceeded:\n' + failures.join('\n'));
+        process.exit(1);
+      }
+      process.exit(0);
+    })
+    .catch(error => {
+      console.error('❌ Load test failed:', error);
+      process.exit(1);
+    });
+}
+
+export { loadTest };
@@ -0,0 +1,69 @@
+import fs from 'fs';
+import path from 'path';
+import { compactCollection, getCollection, saveCollection, type CollectionName } from '../src/lib/data-store';
+import { externalizeInlineImages } from '../src/lib/images/blob-store';
+
+// Collections whose records may hold base64 images pasted in by the dashboards
+const COLLECTIONS: { name: CollectionName; file: string }[] = [
+  { name: 'studios', file: 'studios.json' },
+  { name: 'users', file: 'users.json' },
+  { name: 'profiles', file: 'user-profiles.json' }
+];
+
+/**
+ * Move inline base64 images out of the JSON data files into the blob store,
+ * leaving blob URLs in their place. Idempotent: records that hold no inline
+ * images are left untouched, and identical images are stored once.
+ */
+async function migrateInlineImages(): Promise<number> {
+  console.log('🖼️ Starting inline image migration...');
+
+  // One cache across collections so the same image becomes the same URL
+  const seen = new Map<string, string>();
+  let totalMoved = 0;
+
+  for (const { name, file } of COLLECTIONS) {
+    const fullPath = path.join(process.cwd(), 'data', file);
+    if (!fs.existsSync(fullPath)) {
+      console.log(`ℹ️ No ${file} found, skipping`);
+      continue;
+    }
+
+    // Fold any logged changes into the file before backing it up
+    compactCollection(name);
+
+    const records = JSON.parse(JSON.stringify(getCollection(name)));
+    let moved = 0;
+    for (const record of records) {
+      moved += await externalizeInlineImages(record, seen);
+    }
+
+    if (moved === 0) {
+      console.log(`✅ ${file}: no inline images`);
+      continue;
+    }
+
+    const backupFile = `${fullPath}.backup.${Date.now()}`;
+    fs.copyFileSync(fullPath, backupFile);
+    console.log(`💾 Created backup: ${path.basename(backupFile)}`);
+
+    saveCollection(name, records);
+    const before = fs.statSync(backupFile).size;
+    const after = fs.statSync(fullPath).size;
+    console.log(`✅ ${file}: moved ${moved} images to blob storage (${before} → ${after} bytes)`);
+    totalMoved += moved;
+  }
+
+  console.log(`\n🎉 Migration complete: ${totalMoved} inline images moved, ${seen.size} unique blobs`);
+  return totalMoved;
+}
+
+// Run the migration if this script is executed directly
+if (import.meta.url === `file://${process.argv[1]}`) {
+  migrateInlineImages().catch(error => {
+    console.error('❌ Inline image migration failed:', error);
+    process.exit(1);
+  });
+}
+
+export { migrateInlineImages };
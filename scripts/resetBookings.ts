@@ -1,5 +1,6 @@
 import fs from 'fs';
 import path from 'path';
+import { compactCollection } from '../src/lib/data-store';
 
 const BOOKINGS_FILE = path.join(process.cwd(), 'data', 'bookings.json');
 
@@ -24,6 +25,9 @@ function resetStudioBookings(): void {
   console.log('🔄 Starting booking reset process...');
 
   try {
+    // Fold any logged changes into bookings.json before reading it directly
+    compactCollection('bookings');
+
     // Check if bookings file exists
     if (!fs.existsSync(BOOKINGS_FILE)) {
       console.log('ℹ️ No bookings file found, nothing to reset');
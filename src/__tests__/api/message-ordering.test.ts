@@ -174,6 +174,37 @@ describe('Message Ordering API Tests', () => {
     expect(data2.messages[0].id).toBe('msg_1')
   })
 
+  test('should page through messages sharing a timestamp using beforeId', async () => {
+    const fs = require('fs')
+    const sameTime = '2024-01-01T12:00:00.000Z'
+    fs.readFileSync.mockImplementation((filePath: string) => {
+      if (filePath.includes('messages.json')) {
+        return JSON.stringify({
+          ...mockMessagesData,
+          messages: [
+            ...mockMessagesData.messages,
+            { ...mockMessagesData.messages[2], id: 'msg_4', text: 'Same instant', timestamp: sameTime }
+          ]
+        })
+      }
+      if (filePath.includes('users.json')) {
+        return JSON.stringify(mockUsersData)
+      }
+      return JSON.stringify([])
+    })
+
+    const url1 = new URL('http://localhost:3000/api/conversations/conv_123/messages?userId=user_1&limit=1')
+    const data1 = await (await GET(new NextRequest(url1), { params: Promise.resolve({ id: 'conv_123' }) })).json()
+    expect(data1.messages[0].id).toBe('msg_4')
+    expect(data1.pagination.nextCursor).toBe(sameTime)
+    expect(data1.pagination.nextCursorId).toBe('msg_4')
+
+    const url2 = new URL(`http://localhost:3000/api/conversations/conv_123/messages?userId=user_1&limit=1&before=${sameTime}&beforeId=msg_4`)
+    const data2 = await (await GET(new NextRequest(url2), { params: Promise.resolve({ id: 'conv_123' }) })).json()
+    expect(data2.messages[0].id).toBe('msg_3') // Same timestamp, not skipped
+    expect(data2.pagination.hasMore).toBe(true)
+  })
+
   test('should respect limit parameter', async () => {
     const url = new URL('http://localhost:3000/api/conversations/conv_123/messages?userId=user_1&limit=1')
     const request = new NextRequest(url)
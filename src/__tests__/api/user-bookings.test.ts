@@ -1,5 +1,6 @@
 import { NextRequest } from 'next/server';
 import { GET } from '@/app/api/users/[id]/bookings/route';
+import { invalidateCollection } from '@/lib/data-store';
 
 // Mock file system
 jest.mock('fs');
@@ -63,11 +64,14 @@ const path = require('path');
 
 fs.existsSync = jest.fn();
 fs.readFileSync = jest.fn();
+fs.statSync = jest.fn();
 path.join = jest.fn((...args) => args.join('/'));
 
 describe('/api/users/[id]/bookings', () => {
   beforeEach(() => {
     jest.clearAllMocks();
+    // Each test serves its own file contents, so drop whatever the store cached
+    invalidateCollection();
     
     // Mock path.join calls
     path.join.mockImplementation((...args) => args.join('/'));
@@ -77,7 +81,14 @@ describe('/api/users/[id]/bookings', () => {
       return filePath.includes('bookings.json') || filePath.includes('studios.json');
     });
     
+    // The data store checks file identity before reading and caching
+    fs.statSync.mockReturnValue({ mtimeMs: 1, size: 1, ino: 1 });
+    
     fs.readFileSync.mockImplementation((filePath) => {
+      // No operation logs
+      if (filePath.endsWith('.log')) {
+        throw Object.assign(new Error('ENOENT'), { code: 'ENOENT' });
+      }
       if (filePath.includes('bookings.json')) {
         return JSON.stringify(mockBookingsData);
       }
@@ -108,7 +108,8 @@ describe('FindStudios Debug Elements Removal', () => {
     await screen.findByText('Find Recording Studios')
     
     // Verify fetch was called for studios (not through debug button)
-    expect(fetch).toHaveBeenCalledWith('/api/studios')
+    // First page of the default search, not the full studio list
+    expect(fetch).toHaveBeenCalledWith('/api/studios?sort=rating&limit=12')
     expect(fetch).toHaveBeenCalledWith('/api/health')
   })
 }) 
\ No newline at end of file
@@ -0,0 +1,99 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { Readable } from 'stream';
+import {
+  externalizeInlineImages,
+  findBlobFile,
+  storeBlob,
+  UploadTooLargeError
+} from '@/lib/images/blob-store';
+import { imageVariantUrl } from '@/lib/images/variants';
+
+// 1x1 transparent PNG
+const PNG_BASE64 = 'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg==';
+
+describe('blob-store', () => {
+  let tmpDir: string;
+
+  beforeEach(() => {
+    tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'blob-store-'));
+    jest.spyOn(process, 'cwd').mockReturnValue(tmpDir);
+    jest.spyOn(console, 'warn').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+    fs.rmSync(tmpDir, { recursive: true, force: true });
+  });
+
+  it('stores content under its hash once and returns variant URLs for images', async () => {
+    const bytes = Buffer.from(PNG_BASE64, 'base64');
+
+    const first = await storeBlob(Readable.from([bytes]), { contentType: 'image/png' });
+    const second = await storeBlob(Readable.from([bytes]), { contentType: 'image/png' });
+
+    expect(second.hash).toBe(first.hash);
+    expect(first.hash).toMatch(/^[a-f0-9]{64}$/);
+    expect(first.size).toBe(bytes.length);
+    expect(first.url).toBe(`/api/blobs/${first.hash}/original`);
+    expect(first.variants).toEqual({
+      thumb: `/api/blobs/${first.hash}/thumb`,
+      card: `/api/blobs/${first.hash}/card`,
+      full: `/api/blobs/${first.hash}/full`
+    });
+
+    const folder = path.join(tmpDir, 'data', 'blobs', first.hash.slice(0, 2), first.hash);
+    expect(fs.readdirSync(folder).map(name => name.split('.')[0]).sort()).toEqual(['card', 'full', 'original', 'thumb']);
+    expect(fs.readdirSync(path.join(tmpDir, 'data', 'blobs', 'tmp'))).toEqual([]);
+  });
+
+  it('does not make variants for non-image attachments', async () => {
+    const stored = await storeBlob(Readable.from([Buffer.from('hello')]), { contentType: 'text/plain' });
+
+    expect(stored.variants).toBeUndefined();
+    expect(await findBlobFile(stored.hash, 'original')).toMatchObject({ size: 5, contentType: 'text/plain' });
+    expect(await findBlobFile(stored.hash, 'thumb')).toBeNull();
+  });
+
+  it('rejects uploads over the size limit without keeping any bytes', async () => {
+    const chunks = [Buffer.alloc(600), Buffer.alloc(600)];
+
+    await expect(
+      storeBlob(Readable.from(chunks), { contentType: 'image/png', maxBytes: 1000 })
+    ).rejects.toBeInstanceOf(UploadTooLargeError);
+    expect(fs.readdirSync(path.join(tmpDir, 'data', 'blobs', 'tmp'))).toEqual([]);
+  });
+
+  it('refuses to look up malformed hashes and variants', async () => {
+    expect(await findBlobFile('../../users', 'original')).toBeNull();
+    expect(await findBlobFile('a'.repeat(64), 'huge')).toBeNull();
+  });
+
+  it('replaces inline base64 images with blob URLs', async () => {
+    const dataUrl = `data:image/png;base64,${PNG_BASE64}`;
+    const studio = {
+      id: 'studio_1',
+      profileImage: dataUrl,
+      coverImage: '/uploads/banners/banner.jpg',
+      images: [dataUrl],
+      staff: [{ name: 'Engineer', image: dataUrl }]
+    };
+
+    const moved = await externalizeInlineImages(studio);
+
+    expect(moved).toBe(3);
+    expect(studio.profileImage).toMatch(/^\/api\/blobs\/[a-f0-9]{64}\/full$/);
+    expect(studio.images[0]).toBe(studio.profileImage);
+    expect(studio.staff[0].image).toBe(studio.profileImage);
+    expect(studio.coverImage).toBe('/uploads/banners/banner.jpg');
+  });
+
+  it('points blob URLs at other variants and leaves other URLs alone', () => {
+    const hash = 'b'.repeat(64);
+
+    expect(imageVariantUrl(`/api/blobs/${hash}/full`, 'thumb')).toBe(`/api/blobs/${hash}/thumb`);
+    expect(imageVariantUrl('/uploads/avatars/avatar.png', 'thumb')).toBe('/uploads/avatars/avatar.png');
+    expect(imageVariantUrl(undefined, 'card')).toBeUndefined();
+  });
+});
@@ -0,0 +1,128 @@
+import { putRecords, removeRecords } from '@/lib/data-store';
+import { claimSlot, datesBetween, daySpan, findConflicts, isValidDate, roomAvailability } from '@/lib/bookings/availability';
+import { useTempDataDir } from '@/test-utils/temp-data-dir';
+
+describe('room availability', () => {
+  const dataDir = useTempDataDir('availability');
+
+  const booking = (id: string, fields: Record<string, any>) => ({
+    id,
+    studioId: 'studio_1',
+    roomId: 'room_a',
+    date: '2025-07-14',
+    status: 'confirmed',
+    ...fields
+  });
+
+  const slot = (startTime: string, endTime: string, fields: Record<string, any> = {}) => ({
+    studioId: 'studio_1',
+    roomId: 'room_a',
+    date: '2025-07-14',
+    startTime,
+    endTime,
+    ...fields
+  });
+
+  const conflictIds = (...args: Parameters<typeof findConflicts>) =>
+    findConflicts(...args).map(conflict => conflict.id).sort();
+
+  // Open 09:00-18:00 on Monday and Tuesday and closed on Saturday; no hours set for other days
+  const studio = {
+    id: 'studio_1',
+    operatingHours: {
+      monday: { open: '09:00', close: '18:00', closed: false },
+      tuesday: { open: '09:00', close: '18:00', closed: false },
+      saturday: { open: '09:00', close: '18:00', closed: true }
+    }
+  };
+
+  beforeEach(() => {
+    const bookings = [
+      booking('morning', { startTime: '10:00', endTime: '12:00' }),
+      booking('afternoon', { startTime: '14:00', endTime: '15:30', status: 'PENDING' }),
+      booking('cancelled', { startTime: '12:00', endTime: '14:00', status: 'cancelled' }),
+      booking('other-room', { roomId: 'room_b', startTime: '12:00', endTime: '14:00' }),
+      booking('next-day', { date: '2025-07-15', startTime: '09:00', endTime: '10:00' })
+    ];
+    const bookingRequests = [
+      booking('request', { startTime: '16:00', endTime: '17:00', status: 'pending' }),
+      booking('rejected', { startTime: '12:00', endTime: '13:00', status: 'rejected' })
+    ];
+    dataDir.write('bookings.json', { bookings });
+    dataDir.write('booking-requests.json', { bookingRequests });
+  });
+
+  it('finds pending and confirmed bookings that overlap a slot in the same room', () => {
+    expect(conflictIds(slot('11:00', '14:30'))).toEqual(['afternoon', 'morning']);
+    expect(conflictIds(slot('15:00', '16:30'))).toEqual(['afternoon', 'request']);
+    // Back to back is fine, and cancelled, rejected, other rooms and other days don't count
+    expect(conflictIds(slot('12:00', '14:00'))).toEqual([]);
+    expect(conflictIds(slot('09:00', '10:00'))).toEqual([]);
+    expect(conflictIds(slot('10:00', '12:00'), { ignoreId: 'morning' })).toEqual([]);
+    expect(conflictIds(slot('14:00', '17:00'), { confirmedOnly: true })).toEqual([]);
+  });
+
+  it('frees and takes time as bookings are cancelled, declined, confirmed and created', async () => {
+    await putRecords({ bookings: [booking('morning', { startTime: '10:00', endTime: '12:00', status: 'cancelled' })] });
+    await putRecords({ bookingRequests: [booking('request', { startTime: '16:00', endTime: '17:00', status: 'rejected' })] });
+    expect(conflictIds(slot('09:00', '18:00'))).toEqual(['afternoon']);
+
+    await putRecords({ bookings: [booking('rejected', { startTime: '12:00', endTime: '13:00', status: 'confirmed' })] });
+    await removeRecords({ bookingRequests: [{ id: 'rejected' }] });
+    await putRecords({ bookings: [booking('late', { startTime: '17:00', endTime: '18:00', status: 'PENDING' })] });
+    expect(conflictIds(slot('09:00', '18:00'))).toEqual(['afternoon', 'late', 'rejected']);
+  });
+
+  it('lets only one of two overlapping claims through until it is released', () => {
+    const first = claimSlot(slot('12:00', '14:00'), 'new_1');
+    expect(first).not.toBeNull();
+    expect(claimSlot(slot('13:00', '14:00'), 'new_2')).toBeNull();
+    // Confirming an existing request only competes with other confirmations
+    const confirm = claimSlot(slot('16:00', '17:00'), 'request', { confirmed: true });
+    expect(confirm).not.toBeNull();
+    expect(claimSlot(slot('16:30', '17:00'), 'other', { confirmed: true })).toBeNull();
+
+    first!.release();
+    confirm!.release();
+    const second = claimSlot(slot('13:00', '14:00'), 'new_2');
+    expect(second).not.toBeNull();
+    second!.release();
+  });
+
+  it('lists free time within opening hours for each day in the range', () => {
+    const days = roomAvailability(studio, 'room_a', '2025-07-14', '2025-07-19');
+
+    expect(days.map(day => day.date)).toEqual([
+      '2025-07-14', '2025-07-15', '2025-07-16', '2025-07-17', '2025-07-18', '2025-07-19'
+    ]);
+    expect(days[0].open).toEqual({ startTime: '09:00', endTime: '18:00' });
+    expect(days[0].booked.map(range => `${range.startTime}-${range.endTime} ${range.status}`)).toEqual([
+      '10:00-12:00 confirmed', '14:00-15:30 pending', '16:00-17:00 pending'
+    ]);
+    expect(days[0].free).toEqual([
+      { startTime: '09:00', endTime: '10:00' },
+      { startTime: '12:00', endTime: '14:00' },
+      { startTime: '15:30', endTime: '16:00' },
+      { startTime: '17:00', endTime: '18:00' }
+    ]);
+    expect(days[1].free).toEqual([{ startTime: '10:00', endTime: '18:00' }]);
+    // No hours set for Wednesday: open all day
+    expect(days[2].free).toEqual([{ startTime: '00:00', endTime: '24:00' }]);
+    // Closed on Saturday
+    expect(days[5]).toMatchObject({ open: null, free: [] });
+  });
+
+  it('counts the days in a range without listing them', () => {
+    expect(daySpan('2025-07-14', '2025-07-14')).toBe(1);
+    expect(daySpan('2025-02-27', '2025-03-02')).toBe(datesBetween('2025-02-27', '2025-03-02').length);
+    expect(daySpan('2025-01-01', '9999-12-31')).toBeGreaterThan(2_900_000);
+  });
+
+  it('rejects dates that do not exist', () => {
+    expect(isValidDate('2024-02-29')).toBe(true);
+    expect(isValidDate('2024-02-30')).toBe(false);
+    expect(isValidDate('2025-02-29')).toBe(false);
+    expect(isValidDate('2025-04-31')).toBe(false);
+    expect(isValidDate('2025-13-01')).toBe(false);
+  });
+});
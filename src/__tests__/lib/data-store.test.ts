@@ -0,0 +1,282 @@
+import fs from 'fs';
+import {
+  ALL,
+  compactCollection,
+  countOf,
+  findById,
+  findMany,
+  findOne,
+  findPage,
+  findRange,
+  getCollection,
+  invalidateCollection,
+  putRecords,
+  readSnapshot,
+  removeRecords,
+  saveCollection,
+  saveCollections,
+  timelineKey
+} from '@/lib/data-store';
+import { useTempDataDir } from '@/test-utils/temp-data-dir';
+
+describe('data-store', () => {
+  const dataDir = useTempDataDir('data-store');
+  const writeData = dataDir.write;
+  const readData = dataDir.read;
+
+  beforeEach(() => {
+    writeData('users.json', [
+      { id: 'user_1', email: 'Artist@Example.com', name: 'Artist', role: 'rapper', slug: 'artist' },
+      { id: 'user_2', email: 'studio@example.com', name: 'Owner', role: 'studio', studioId: 'studio_1' }
+    ]);
+    writeData('messages.json', {
+      messages: [
+        { id: 'msg_1', conversationId: 'conv_1', senderId: 'user_1', receiverId: 'user_2' },
+        { id: 'msg_2', conversationId: 'conv_1', senderId: 'user_2', receiverId: 'user_1' }
+      ],
+      conversations: [
+        { id: 'conv_1', participants: ['user_1', 'user_2'], unreadCount: {} }
+      ]
+    });
+  });
+
+  it('looks up records by primary and secondary indexes', () => {
+    expect(findById('users', 'user_1')?.name).toBe('Artist');
+    expect(findOne('users', 'email', 'artist@example.COM')?.id).toBe('user_1');
+    expect(findOne('users', 'studioId', 'studio_1')?.id).toBe('user_2');
+    expect(findMany('messages', 'conversationId', 'conv_1')).toHaveLength(2);
+    expect(findMany('conversations', 'userId', 'user_2').map(c => c.id)).toEqual(['conv_1']);
+    expect(findById('users', 'missing')).toBeNull();
+  });
+
+  it('parses each file once while it is unchanged', () => {
+    const readSpy = jest.spyOn(fs, 'readFileSync');
+
+    findById('users', 'user_1');
+    findOne('users', 'email', 'studio@example.com');
+    getCollection('users');
+
+    const userReads = readSpy.mock.calls.filter(([file]) => String(file).endsWith('users.json'));
+    expect(userReads).toHaveLength(1);
+  });
+
+  it('reloads when the file changes on disk', () => {
+    expect(findById('users', 'user_3')).toBeNull();
+
+    writeData('users.json', [{ id: 'user_3', email: 'new@example.com', name: 'New', role: 'rapper' }]);
+    // Make sure the mtime moves even on coarse-grained filesystems
+    const future = new Date(Date.now() + 5000);
+    fs.utimesSync(dataDir.path('users.json'), future, future);
+
+    expect(findById('users', 'user_3')?.name).toBe('New');
+  });
+
+  it('updates indexes after saving and keeps sibling collections in the same file', () => {
+    const messages = getCollection('messages');
+    messages.push({ id: 'msg_3', conversationId: 'conv_2', senderId: 'user_1', receiverId: 'user_2' });
+    saveCollection('messages', messages);
+
+    expect(findMany('messages', 'conversationId', 'conv_2')).toHaveLength(1);
+    expect(getCollection('conversations')).toHaveLength(1);
+
+    const onDisk = readData('messages.json');
+    expect(onDisk.messages).toHaveLength(3);
+    expect(onDisk.conversations).toHaveLength(1);
+  });
+
+  it('writes collections that share a file together', () => {
+    saveCollections({ messages: [], conversations: [] });
+
+    const onDisk = readData('messages.json');
+    expect(onDisk).toEqual({ messages: [], conversations: [] });
+  });
+
+  it('returns empty collections for missing files', () => {
+    expect(getCollection('bookings')).toEqual([]);
+    expect(findMany('bookings', 'studioId', 'studio_1')).toEqual([]);
+  });
+
+  it('applies record writes immediately and appends them to the log instead of rewriting the file', async () => {
+    const before = fs.readFileSync(dataDir.path('users.json'), 'utf8');
+
+    const commit = putRecords({ users: [{ id: 'user_3', email: 'third@example.com', name: 'Third', role: 'rapper' }] });
+    expect(findOne('users', 'email', 'third@example.com')?.id).toBe('user_3');
+    await commit;
+
+    expect(fs.readFileSync(dataDir.path('users.json'), 'utf8')).toBe(before);
+    expect(fs.existsSync(dataDir.path('users.json.log'))).toBe(true);
+
+    // A fresh load replays the log over the file
+    invalidateCollection();
+    expect(findById('users', 'user_3')?.name).toBe('Third');
+    expect(getCollection('users')).toHaveLength(3);
+  });
+
+  it('moves updated records between index buckets and removes deleted ones', async () => {
+    const user = findById('users', 'user_2');
+    await putRecords({ users: [{ ...user, studioId: 'studio_2' }] });
+
+    expect(findOne('users', 'studioId', 'studio_1')).toBeNull();
+    expect(findOne('users', 'studioId', 'studio_2')?.id).toBe('user_2');
+    expect(getCollection('users').map((u: any) => u.id)).toEqual(['user_1', 'user_2']);
+
+    await removeRecords({ users: [user] });
+    invalidateCollection();
+    expect(findById('users', 'user_2')).toBeNull();
+    expect(findOne('users', 'studioId', 'studio_2')).toBeNull();
+  });
+
+  it('commits messages and conversations together', async () => {
+    const conversation = findById('conversations', 'conv_1');
+    const message = { id: 'msg_3', conversationId: 'conv_1', senderId: 'user_1', receiverId: 'user_2' };
+    await putRecords({ messages: [message], conversations: [{ ...conversation, lastMessage: message }] });
+
+    const log = fs.readFileSync(dataDir.path('messages.json.log'), 'utf8').trim().split('\n');
+    // Header plus a single batch holding both ops
+    expect(log).toHaveLength(2);
+    expect(JSON.parse(log[1]).ops.map((op: any) => op.collection)).toEqual(['messages', 'conversations']);
+  });
+
+  it('groups concurrent commits into a single write', async () => {
+    await putRecords({ users: [{ id: 'user_3', email: 'a@example.com', name: 'A', role: 'rapper' }] });
+    const writeSpy = jest.spyOn(fs, 'writeSync');
+
+    await Promise.all([
+      putRecords({ users: [{ id: 'user_4', email: 'b@example.com', name: 'B', role: 'rapper' }] }),
+      putRecords({ users: [{ id: 'user_5', email: 'c@example.com', name: 'C', role: 'rapper' }] })
+    ]);
+
+    expect(writeSpy).toHaveBeenCalledTimes(1);
+    invalidateCollection();
+    expect(getCollection('users')).toHaveLength(5);
+  });
+
+  it('ignores a torn final log line and keeps appending after it', async () => {
+    await putRecords({ users: [{ id: 'user_3', email: 'a@example.com', name: 'A', role: 'rapper' }] });
+    fs.appendFileSync(dataDir.path('users.json.log'), '{"ops":[{"collection":"us');
+
+    invalidateCollection();
+    expect(findById('users', 'user_3')).not.toBeNull();
+
+    await putRecords({ users: [{ id: 'user_4', email: 'b@example.com', name: 'B', role: 'rapper' }] });
+    invalidateCollection();
+    expect(findById('users', 'user_4')).not.toBeNull();
+  });
+
+  it('keeps batches another process appended to the log before our write', async () => {
+    await putRecords({ users: [{ id: 'user_3', email: 'a@example.com', name: 'A', role: 'rapper' }] });
+
+    const write = putRecords({ users: [{ id: 'user_4', email: 'b@example.com', name: 'B', role: 'rapper' }] });
+    // A script appends a whole batch after our commit was applied but before it is flushed
+    const other = { id: 'user_5', email: 'c@example.com', name: 'C', role: 'rapper' };
+    fs.appendFileSync(dataDir.path('users.json.log'), JSON.stringify({ ops: [{ collection: 'users', op: 'put', record: other }] }) + '\n');
+    await write;
+
+    expect(findById('users', 'user_5')).not.toBeNull();
+    invalidateCollection();
+    expect(['user_3', 'user_4', 'user_5'].every(id => findById('users', id))).toBe(true);
+  });
+
+  it('discards the log when the file is rewritten out of band', async () => {
+    await putRecords({ users: [{ id: 'user_3', email: 'a@example.com', name: 'A', role: 'rapper' }] });
+
+    writeData('users.json', [{ id: 'user_9', email: 'z@example.com', name: 'Z', role: 'rapper' }]);
+    const future = new Date(Date.now() + 5000);
+    fs.utimesSync(dataDir.path('users.json'), future, future);
+
+    expect(getCollection('users').map((u: any) => u.id)).toEqual(['user_9']);
+  });
+
+  it('pages a sorted index by timestamp and id without skipping ties', async () => {
+    const at = (minute: number) => `2024-01-01T10:0${minute}:00.000Z`;
+    await putRecords({
+      messages: [
+        { id: 'msg_b', conversationId: 'conv_2', timestamp: at(1) },
+        { id: 'msg_a', conversationId: 'conv_2', timestamp: at(1) },
+        { id: 'msg_c', conversationId: 'conv_2', timestamp: at(2) },
+        { id: 'msg_0', conversationId: 'conv_2', timestamp: at(0) }
+      ]
+    });
+
+    const first = findPage('messages', 'timeline', 'conv_2', { limit: 2 });
+    expect(first.records.map(m => m.id)).toEqual(['msg_c', 'msg_b']);
+    expect(first.hasMore).toBe(true);
+
+    const last = first.records[1];
+    const second = findPage('messages', 'timeline', 'conv_2', { before: timelineKey(last.timestamp, last.id), limit: 2 });
+    expect(second.records.map(m => m.id)).toEqual(['msg_a', 'msg_0']);
+    expect(second.hasMore).toBe(false);
+
+    // A timestamp-only cursor skips everything at that instant
+    const legacy = findPage('messages', 'timeline', 'conv_2', { before: timelineKey(at(1)), limit: 10 });
+    expect(legacy.records.map(m => m.id)).toEqual(['msg_0']);
+
+    // Moving a record re-files it in order
+    await putRecords({ messages: [{ ...findById('messages', 'msg_0'), timestamp: at(3) }] });
+    expect(findPage('messages', 'timeline', 'conv_2', { limit: 1 }).records[0].id).toBe('msg_0');
+  });
+
+  it('keeps unread counts in step with message writes', async () => {
+    await putRecords({ messages: getCollection('messages').map(m => ({ ...m, read: true })) });
+    expect(countOf('messages', 'unreadByReceiver', 'user_2')).toBe(0);
+
+    await putRecords({
+      messages: [
+        { id: 'msg_3', conversationId: 'conv_1', senderId: 'user_1', receiverId: 'user_2', read: false },
+        { id: 'msg_4', conversationId: 'conv_2', senderId: 'user_1', receiverId: 'user_2', read: false }
+      ]
+    });
+    expect(countOf('messages', 'unreadByReceiver', 'user_2')).toBe(2);
+    expect(countOf('messages', 'unreadByConversation', 'user_2:conv_1')).toBe(1);
+
+    // Records edited in place and then saved still leave the unread buckets
+    const unread = findMany('messages', 'unreadByConversation', 'user_2:conv_1');
+    unread.forEach(message => { message.read = true; });
+    await putRecords({ messages: unread });
+
+    expect(countOf('messages', 'unreadByConversation', 'user_2:conv_1')).toBe(0);
+    expect(countOf('messages', 'unreadByReceiver', 'user_2')).toBe(1);
+  });
+
+  it('scans a sorted index between keys and from a cursor', async () => {
+    await putRecords({
+      studios: [10, 40, 25, 40, 90].map((hourlyRate, i) => ({ id: `studio_${i}`, name: `Studio ${i}`, hourlyRate }))
+    });
+    const rates = (result: { records: any[] }) => result.records.map(studio => studio.hourlyRate);
+
+    expect(rates(findRange('studios', 'priceLow', ALL, {}))).toEqual([10, 25, 40, 40, 90]);
+
+    const firstPage = findRange('studios', 'priceLow', ALL, { from: '0000000025.00', to: '0000000090.00', limit: 2 });
+    expect(rates(firstPage)).toEqual([25, 40]);
+    expect(firstPage.hasMore).toBe(true);
+
+    const rest = findRange('studios', 'priceLow', ALL, { after: '0000000040.00|studio_1', to: '0000000090.00' });
+    expect(rest.records.map(studio => studio.id)).toEqual(['studio_3']);
+    expect(rest.hasMore).toBe(false);
+  });
+
+  it('checks files against disk once per snapshot read', () => {
+    const seen = readSnapshot(() => {
+      findById('users', 'user_1');
+      writeData('users.json', [{ id: 'user_3', email: 'new@example.com', name: 'New', role: 'rapper' }]);
+      const future = new Date(Date.now() + 5000);
+      fs.utimesSync(dataDir.path('users.json'), future, future);
+      return findById('users', 'user_3');
+    });
+
+    expect(seen).toBeNull();
+    expect(findById('users', 'user_3')?.name).toBe('New');
+  });
+
+  it('folds the log back into the file when compacting', async () => {
+    writeData('follows.json', []);
+    await putRecords({ follows: [{ followerId: 'user_1', followingId: 'user_2', createdAt: '2024-01-01T00:00:00.000Z' }] });
+    compactCollection('follows');
+
+    expect(readData('follows.json')).toEqual([
+      { followerId: 'user_1', followingId: 'user_2', createdAt: '2024-01-01T00:00:00.000Z' }
+    ]);
+    invalidateCollection();
+    expect(findMany('follows', 'followingId', 'user_2')).toHaveLength(1);
+  });
+});
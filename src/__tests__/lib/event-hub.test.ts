@@ -0,0 +1,110 @@
+import { connectionCount, publish, subscribe } from '@/lib/realtime/event-hub';
+
+const decoder = new TextDecoder();
+
+interface Frame {
+  id?: string;
+  event?: string;
+  data?: any;
+}
+
+// Read whatever the stream has queued so far and parse it into SSE frames
+async function readFrames(reader: ReadableStreamDefaultReader<Uint8Array>, count: number): Promise<Frame[]> {
+  let text = '';
+  const frames: Frame[] = [];
+  while (frames.length < count) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    text += decoder.decode(value);
+    const blocks = text.split('\n\n');
+    text = blocks.pop() || '';
+    for (const block of blocks) {
+      const frame: Frame = {};
+      for (const line of block.split('\n')) {
+        const [field, ...rest] = line.split(': ');
+        const value = rest.join(': ');
+        if (field === 'id') frame.id = value;
+        if (field === 'event') frame.event = value;
+        if (field === 'data') frame.data = JSON.parse(value);
+      }
+      // Skip the retry hint
+      if (frame.event) frames.push(frame);
+    }
+  }
+  return frames;
+}
+
+describe('event-hub', () => {
+  let userCounter = 0;
+  let userId: string;
+  const readers: ReadableStreamDefaultReader<Uint8Array>[] = [];
+
+  const open = (id: string, lastEventId?: string) => {
+    const reader = subscribe(id, { lastEventId }).getReader();
+    readers.push(reader);
+    return reader;
+  };
+
+  beforeEach(() => {
+    userId = `user_${++userCounter}_${Date.now()}`;
+  });
+
+  afterEach(async () => {
+    // Cancelling stops each stream's heartbeat timer
+    await Promise.all(readers.splice(0).map(reader => reader.cancel()));
+  });
+
+  it('delivers events only to the users they are addressed to', async () => {
+    const mine = open(userId);
+    const other = open(`${userId}_other`);
+
+    publish([userId, userId], { type: 'message_created', conversationId: 'c1', data: { id: 'm1' } });
+    publish([`${userId}_other`], { type: 'message_created', conversationId: 'c2', data: { id: 'm2' } });
+
+    const [frame] = await readFrames(mine, 1);
+    expect(frame.event).toBe('message_created');
+    expect(frame.data).toEqual({ type: 'message_created', conversationId: 'c1', data: { id: 'm1' } });
+    expect(frame.id).toMatch(/^[a-f0-9]+:1$/);
+
+    const [otherFrame] = await readFrames(other, 1);
+    expect(otherFrame.data.data.id).toBe('m2');
+  });
+
+  it('replays events missed since the last event id on reconnect', async () => {
+    const first = open(userId);
+    publish([userId], { type: 'message_created', data: { id: 'm1' } });
+    const [seen] = await readFrames(first, 1);
+    await first.cancel();
+    expect(connectionCount(userId)).toBe(0);
+
+    publish([userId], { type: 'message_read', data: { messageIds: ['m1'] } });
+    publish([userId], { type: 'booking_status_changed', data: { id: 'b1', status: 'confirmed' } });
+
+    const replayed = await readFrames(open(userId, seen.id), 2);
+    expect(replayed.map(frame => frame.event)).toEqual(['message_read', 'booking_status_changed']);
+  });
+
+  it('asks the client to resync when its cursor cannot be served', async () => {
+    open(userId);
+    publish([userId], { type: 'message_created', data: { id: 'm1' } });
+
+    const [frame] = await readFrames(open(userId, 'someotherserver:1'), 1);
+    expect(frame.event).toBe('resync');
+  });
+
+  it('does not buffer or number typing notices', async () => {
+    const live = open(userId);
+    publish([userId], { type: 'user_typing', conversationId: 'c1', data: { userId: 'u2', isTyping: true } });
+    publish([userId], { type: 'message_created', conversationId: 'c1', data: { id: 'm1' } });
+
+    const frames = await readFrames(live, 2);
+    expect(frames[0].event).toBe('user_typing');
+    expect(frames[0].id).toBeUndefined();
+    expect(frames[1].id).toMatch(/:1$/);
+
+    // Reconnecting from before the message replays the message but not the typing notice
+    const [cursorEpoch] = frames[1].id!.split(':');
+    const replayed = await readFrames(open(userId, `${cursorEpoch}:0`), 1);
+    expect(replayed.map(frame => frame.event)).toEqual(['message_created']);
+  });
+});
@@ -0,0 +1,75 @@
+import { putRecords, removeRecords } from '@/lib/data-store';
+import {
+  follow,
+  followerIds,
+  followingIds,
+  followStatuses,
+  isFollowing,
+  topFollowedStudioIds,
+  unfollow
+} from '@/lib/follows/follow-graph';
+import { useTempDataDir } from '@/test-utils/temp-data-dir';
+
+describe('follow graph', () => {
+  const dataDir = useTempDataDir('follow-graph');
+
+  const studio = (id: string, rating: number) => ({ id, slug: id, name: id, location: 'Atlanta', rating });
+
+  beforeEach(() => {
+    const studios = [studio('a', 4), studio('b', 5), studio('c', 3), studio('d', 4.5), { id: 'hidden', name: 'Hidden', rating: 5 }];
+    const follows = [
+      { followerId: 'u1', followingId: 'a', createdAt: '2024-01-01' },
+      { followerId: 'u2', followingId: 'a', createdAt: '2024-01-01' },
+      // Legacy records name the target followedId
+      { followerId: 'u1', followedId: 'b', createdAt: '2024-01-01' },
+      { followerId: 'u3', followingId: 'hidden', createdAt: '2024-01-01' },
+      { followerId: 'a', followingId: 'u1', createdAt: '2024-01-01' }
+    ];
+    dataDir.write('studios.json', { studios });
+    dataDir.write('follows.json', follows);
+  });
+
+  it('answers follow checks and counts for many targets at once', () => {
+    expect(followStatuses('u1', ['a', 'b', 'c', 'u1'])).toEqual({
+      a: { isFollowing: true, followersCount: 2, followingCount: 1 },
+      b: { isFollowing: true, followersCount: 1, followingCount: 0 },
+      c: { isFollowing: false, followersCount: 0, followingCount: 0 },
+      u1: { isFollowing: false, followersCount: 1, followingCount: 2 }
+    });
+    expect(followerIds('a')).toEqual(['u1', 'u2']);
+    expect(followingIds('u1')).toEqual(['a', 'b']);
+  });
+
+  it('keeps the leaderboard in order as studios are followed and unfollowed', async () => {
+    // Studios without a location are never listed; unfollowed studios fill in by rating
+    expect(topFollowedStudioIds(4)).toEqual(['a', 'b', 'd', 'c']);
+
+    await follow('u4', 'b');
+    await follow('u5', 'b');
+    expect(topFollowedStudioIds(2)).toEqual(['b', 'a']);
+
+    await follow('u1', 'c');
+    await unfollow('u1', 'a');
+    await unfollow('u2', 'a');
+    expect(isFollowing('u1', 'a')).toBe(false);
+    expect(topFollowedStudioIds(4)).toEqual(['b', 'c', 'd', 'a']);
+  });
+
+  it('picks up follow and studio changes made outside the graph', async () => {
+    expect(topFollowedStudioIds(1)).toEqual(['a']);
+
+    await putRecords({ follows: [{ followerId: 'u9', followingId: 'b', createdAt: '2024-01-02' }] });
+    // Tied on followers, so the higher rating wins
+    expect(topFollowedStudioIds(1)).toEqual(['b']);
+
+    await putRecords({ studios: [studio('b', 1)] });
+    expect(topFollowedStudioIds(2)).toEqual(['a', 'b']);
+
+    await removeRecords({ studios: [{ id: 'a' }] });
+    expect(topFollowedStudioIds(2)).toEqual(['b', 'd']);
+
+    // A studio that already had a follower joins the ranking once it is listed
+    await putRecords({ studios: [{ ...studio('hidden', 1), name: 'Hidden' }] });
+    expect(topFollowedStudioIds(2)).toEqual(['b', 'hidden']);
+  });
+});
@@ -0,0 +1,40 @@
+import { assertSessionSecret, createSessionToken, sessionUserId, verifySessionToken } from '@/lib/session-token';
+
+describe('session-token', () => {
+  it('returns the user a token was issued to', () => {
+    expect(verifySessionToken(createSessionToken('user_1'))).toBe('user_1');
+  });
+
+  it('rejects forged, re-targeted and expired tokens', () => {
+    const token = createSessionToken('user_1');
+    const [, signature] = token.split('.');
+    const otherPayload = Buffer.from(JSON.stringify({ userId: 'user_2', issuedAt: Date.now() })).toString('base64url');
+
+    expect(verifySessionToken(`${otherPayload}.${signature}`)).toBeNull();
+    expect(verifySessionToken(`${token}x`)).toBeNull();
+    expect(verifySessionToken('token_user_1_1700000000000')).toBeNull();
+    expect(verifySessionToken(createSessionToken('user_1', Date.now() - 31 * 24 * 60 * 60 * 1000))).toBeNull();
+  });
+
+  it('reads the token from the Authorization header or the token query parameter', () => {
+    const token = createSessionToken('user_1');
+
+    expect(sessionUserId(new Request('http://localhost/api/events', { headers: { Authorization: `Bearer ${token}` } }))).toBe('user_1');
+    expect(sessionUserId(new Request(`http://localhost/api/events?token=${token}`))).toBe('user_1');
+    expect(sessionUserId(new Request('http://localhost/api/events?userId=user_1'))).toBeNull();
+  });
+
+  it('refuses to run in production without SESSION_SECRET', () => {
+    const env = { ...process.env };
+    try {
+      Object.assign(process.env, { NODE_ENV: 'production' });
+      delete process.env.SESSION_SECRET;
+      expect(() => assertSessionSecret()).toThrow('SESSION_SECRET');
+
+      process.env.SESSION_SECRET = 'configured';
+      expect(() => assertSessionSecret()).not.toThrow();
+    } finally {
+      process.env = env;
+    }
+  });
+});
@@ -1,6 +1,7 @@
 import fs from 'fs';
 import path from 'path';
 import { getTopFollowedStudios } from '@/lib/studios/getTopFollowedStudios';
+import { invalidateCollection } from '@/lib/data-store';
 
 // Mock fs module
 jest.mock('fs');
@@ -54,6 +55,10 @@ describe('getTopFollowedStudios', () => {
 
   beforeEach(() => {
     jest.clearAllMocks();
+    // Each test serves its own file contents, so drop whatever the store cached
+    invalidateCollection();
+    // The data store checks file identity before reading and caching
+    mockedFs.statSync.mockReturnValue({ mtimeMs: 1, size: 1, ino: 1 } as fs.Stats);
   });
 
   it('should return top studios sorted by followers count', async () => {
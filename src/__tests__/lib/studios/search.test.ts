@@ -0,0 +1,98 @@
+import { putRecords, removeRecords } from '@/lib/data-store';
+import { searchStudios, type StudioSearchParams } from '@/lib/studios/search';
+import { useTempDataDir } from '@/test-utils/temp-data-dir';
+
+describe('studio search', () => {
+  const dataDir = useTempDataDir('studio-search');
+
+  const studio = (id: string, fields: Record<string, any>) => ({
+    id,
+    slug: id,
+    name: id,
+    createdAt: '2024-01-01T00:00:00.000Z',
+    updatedAt: '2024-01-01T00:00:00.000Z',
+    ...fields
+  });
+
+  const search = (params: Partial<StudioSearchParams> = {}) =>
+    searchStudios({ sort: 'rating', limit: 10, ...params });
+
+  const ids = (params: Partial<StudioSearchParams> = {}) => search(params).studios.map(card => card.id);
+
+  beforeEach(() => {
+    const studios = [
+      studio('dojo', {
+        name: 'The Dojo', location: 'Los Angeles, CA', hourlyRate: 50, rating: 4.8,
+        amenities: ['Vocal Booth', 'Parking'], latitude: 34.05, longitude: -118.24,
+        createdAt: '2024-03-01T00:00:00.000Z'
+      }),
+      studio('sound-lab', {
+        name: 'Sound Lab', address: '12 Broadway, New York', hourlyRate: 120, rating: 4.2,
+        amenities: ['Vocal Booth'], latitude: 40.71, longitude: -74.0,
+        createdAt: '2024-02-01T00:00:00.000Z'
+      }),
+      studio('blackbird', {
+        name: 'Blackbird Café', location: 'Nashville', rating: 5,
+        rooms: [{ id: 'room_a', hourlyRate: 200 }, { id: 'room_b', hourlyRate: 180 }],
+        latitude: 36.16, longitude: -86.78
+      }),
+      studio('echo', { name: 'Echo Room', location: 'Los Angeles', rating: 3.5, hourlyRate: 75 }),
+      // An older copy saved under the same slug as echo
+      { ...studio('echo-old', { name: 'Echo Room (old)', location: 'Los Angeles', rating: 4.9 }), slug: 'echo', updatedAt: '2023-01-01T00:00:00.000Z' }
+    ];
+    dataDir.write('studios.json', { studios });
+  });
+
+  it('returns card DTOs sorted by rating, listing each slug once', () => {
+    const { studios, hasMore, nextCursor } = search();
+
+    expect(studios.map(card => card.id)).toEqual(['blackbird', 'dojo', 'sound-lab', 'echo']);
+    expect(hasMore).toBe(false);
+    expect(nextCursor).toBeNull();
+    expect(studios[0]).toMatchObject({ name: 'Blackbird Café', location: 'Nashville', hourlyRate: 180 });
+    expect(studios[0]).not.toHaveProperty('rooms');
+  });
+
+  it('pages with a cursor without skipping or repeating studios', () => {
+    const first = search({ sort: 'price-low', limit: 2 });
+    const second = search({ sort: 'price-low', limit: 2, cursor: first.nextCursor });
+
+    expect(first.studios.map(card => card.id)).toEqual(['dojo', 'echo']);
+    expect(first.hasMore).toBe(true);
+    expect(second.studios.map(card => card.id)).toEqual(['sound-lab', 'blackbird']);
+    expect(second.hasMore).toBe(false);
+  });
+
+  it('matches word prefixes across name, location, address and amenities', () => {
+    expect(ids({ q: 'cafe' })).toEqual(['blackbird']);
+    expect(ids({ q: 'broad' })).toEqual(['sound-lab']);
+    expect(ids({ q: 'vocal los' })).toEqual(['dojo']);
+    expect(ids({ location: 'los angeles', sort: 'newest' })).toEqual(['dojo', 'echo']);
+    expect(ids({ amenities: ['vocal booth', 'parking'] })).toEqual(['dojo']);
+  });
+
+  it('filters by price and rating ranges', () => {
+    expect(ids({ minRate: 75, maxRate: 150 })).toEqual(['sound-lab', 'echo']);
+    expect(ids({ sort: 'price-high', maxRate: 120 })).toEqual(['sound-lab', 'echo', 'dojo']);
+    expect(ids({ sort: 'newest', minRating: 4.5 })).toEqual(['dojo', 'blackbird']);
+  });
+
+  it('finds studios near a point', () => {
+    const nearby = search({ lat: 34.1, lng: -118.3, radiusKm: 25, sort: 'distance' });
+
+    expect(nearby.studios.map(card => card.id)).toEqual(['dojo']);
+    expect(nearby.studios[0].distanceKm).toBeLessThan(10);
+    expect(ids({ lat: 37, lng: -82, radiusKm: 500, sort: 'distance' })).toEqual(['blackbird']);
+    // Studios without coordinates are never near anything
+    expect(ids({ lat: 34.1, lng: -118.3, radiusKm: 500, sort: 'rating' })).toEqual(['dojo']);
+  });
+
+  it('reflects studio changes without a rebuild', async () => {
+    await putRecords({ studios: [studio('new-place', { name: 'New Place', location: 'Miami', hourlyRate: 10, rating: 4.9 })] });
+    await removeRecords({ studios: [{ id: 'blackbird' }] });
+
+    expect(ids({ q: 'miami' })).toEqual(['new-place']);
+    expect(ids({ sort: 'price-low', limit: 2 })).toEqual(['new-place', 'dojo']);
+    expect(ids()).not.toContain('blackbird');
+  });
+});
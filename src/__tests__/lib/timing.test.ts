@@ -0,0 +1,67 @@
+import { resetRouteTimings, routeTimings, serverTimingHeader, timed, withTiming } from '@/lib/timing';
+
+// Burn wall-clock time synchronously, the way a readFileSync or JSON.parse would
+function busy(ms: number): void {
+  const end = performance.now() + ms;
+  while (performance.now() < end) {}
+}
+
+describe('timing', () => {
+  beforeEach(() => {
+    resetRouteTimings();
+  });
+
+  it('charges nested phases only their own time and reports them in Server-Timing', async () => {
+    const handler = withTiming('GET /api/test', async () => {
+      timed('lookup', () => {
+        busy(5);
+        // A file load inside a lookup counts as io and parse, not lookup
+        timed('io', () => busy(10));
+        timed('parse', () => busy(10));
+      });
+      return timed('serialize', () => new Response(JSON.stringify({ ok: true })));
+    });
+
+    const response = await handler();
+    const header = response.headers.get('Server-Timing')!;
+    const phases = Object.fromEntries(header.split(', ').map(entry => {
+      const [name, duration] = entry.split(';dur=');
+      return [name, Number(duration)];
+    }));
+
+    expect(Object.keys(phases)).toEqual(['io', 'parse', 'lookup', 'serialize', 'total']);
+    expect(phases.io).toBeGreaterThanOrEqual(10);
+    expect(phases.parse).toBeGreaterThanOrEqual(10);
+    expect(phases.lookup).toBeGreaterThanOrEqual(5);
+    expect(phases.lookup).toBeLessThan(10);
+    expect(phases.total).toBeGreaterThanOrEqual(phases.io + phases.parse + phases.lookup);
+  });
+
+  it('keeps per-route histograms and percentiles', async () => {
+    const fast = withTiming('GET /api/fast', async () => new Response('{}'));
+    const slow = withTiming('GET /api/slow', async () => {
+      timed('io', () => busy(3));
+      return new Response('{}');
+    });
+
+    for (let i = 0; i < 20; i++) await fast();
+    await slow();
+
+    const timings = routeTimings();
+    expect(timings['GET /api/fast'].total.count).toBe(20);
+    expect(timings['GET /api/fast'].io.p99).toBe(0);
+    expect(timings['GET /api/slow'].io.count).toBe(1);
+    expect(timings['GET /api/slow'].io.p50).toBeGreaterThanOrEqual(2.5);
+    expect(timings['GET /api/slow'].io.p50).toBeLessThanOrEqual(timings['GET /api/slow'].io.max);
+
+    resetRouteTimings();
+    expect(routeTimings()).toEqual({});
+  });
+
+  it('runs timed work untouched outside a request', () => {
+    expect(timed('lookup', () => 42)).toBe(42);
+    expect(serverTimingHeader({ io: 1.23456, parse: 0, lookup: 2, serialize: 0.5 }, 4)).toBe(
+      'io;dur=1.235, parse;dur=0, lookup;dur=2, serialize;dur=0.5, total;dur=4'
+    );
+  });
+});
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { getUsers, saveUsers, findUserByEmail } from '@/lib/user-store';
+import { saveUsers, findUserByEmail } from '@/lib/user-store';
+import { findById } from '@/lib/data-store';
 import fs from 'fs';
 import path from 'path';
 
@@ -34,18 +35,17 @@ export async function PUT(request: NextRequest) {
     }
 
     // Update user email in users.json
-    const users = getUsers();
-    const userIndex = users.findIndex(u => u.id === userId);
+    const user = findById('users', userId);
     
-    if (userIndex === -1) {
+    if (!user) {
       return NextResponse.json(
         { error: 'User not found' },
         { status: 404 }
       );
     }
 
-    users[userIndex].email = newEmail.toLowerCase();
-    saveUsers(users);
+    const updatedUser = { ...user, email: newEmail.toLowerCase() };
+    await saveUsers([updatedUser]);
 
     // Also update email in extended profiles if exists
     const profilesPath = path.join(process.cwd(), 'data', 'rappers.json');
@@ -63,10 +63,10 @@ export async function PUT(request: NextRequest) {
       success: true,
       message: 'Email updated successfully',
       user: {
-        id: users[userIndex].id,
-        name: users[userIndex].name,
-        email: users[userIndex].email,
-        role: users[userIndex].role
+        id: updatedUser.id,
+        name: updatedUser.name,
+        email: updatedUser.email,
+        role: updatedUser.role
       }
     });
 
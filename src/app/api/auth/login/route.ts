@@ -1,8 +1,13 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { verifyUser, findUserByEmail } from '@/lib/user-store';
 import bcrypt from 'bcrypt';
+import { log } from '@/lib/log';
+import { timed, withTiming } from '@/lib/timing';
+import { createSessionToken } from '@/lib/session-token';
 
-export async function POST(request: NextRequest) {
+export const POST = withTiming('POST /api/auth/login', login);
+
+async function login(request: NextRequest) {
   try {
     const body = await request.json();
     const { email, password, role } = body;
@@ -53,10 +58,10 @@ export async function POST(request: NextRequest) {
     }
 
     // At this point, authentication is successful
-    console.log(`✅ Successful login for user: ${user.email} (${user.role})`);
+    log.debug(`✅ Successful login for user: ${user.email} (${user.role})`);
 
-    // Generate mock token (in production, use proper JWT)
-    const token = `token_${user.id}_${Date.now()}`;
+    // Signed session token, sent back on requests that need to know the caller
+    const token = createSessionToken(user.id);
 
     // Return user data (excluding password hash)
     const responseData = {
@@ -71,7 +76,7 @@ export async function POST(request: NextRequest) {
       studioId: user.studioId
     };
 
-    return NextResponse.json(responseData, { status: 200 });
+    return timed('serialize', () => NextResponse.json(responseData, { status: 200 }));
 
   } catch (error) {
     console.error('❌ Login error:', error);
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { createUser, UserCreateData } from '@/lib/user-store';
+import { createSessionToken } from '@/lib/session-token';
 
 export async function POST(request: NextRequest) {
   try {
@@ -59,8 +60,8 @@ export async function POST(request: NextRequest) {
     // Create user
     const newUser = await createUser(userData);
 
-    // Generate mock token (in production, use proper JWT)
-    const token = `token_${newUser.id}_${Date.now()}`;
+    // Signed session token, sent back on requests that need to know the caller
+    const token = createSessionToken(newUser.id);
 
     // Return user data (excluding password hash)
     const responseData = {
@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { log } from '@/lib/log';
 
 export async function GET(request: NextRequest) {
   try {
@@ -29,7 +30,7 @@ export async function GET(request: NextRequest) {
         const data = await paymentMethodsResponse.json();
         paymentMethods = data.paymentMethods || [];
       } else {
-        console.log('⚠️ [Billing Info] Could not fetch payment methods:', paymentMethodsResponse.status);
+        log.warn('⚠️ [Billing Info] Could not fetch payment methods:', paymentMethodsResponse.status);
       }
 
       return NextResponse.json({
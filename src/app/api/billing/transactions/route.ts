@@ -1,33 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const BOOKINGS_FILE = path.join(process.cwd(), 'data', 'bookings.json');
-
-// Ensure data directory exists
-function ensureDataDir() {
-  const dataDir = path.dirname(BOOKINGS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-}
-
-// Read bookings from file
-function getBookings(): any[] {
-  ensureDataDir();
-  try {
-    if (!fs.existsSync(BOOKINGS_FILE)) {
-      fs.writeFileSync(BOOKINGS_FILE, JSON.stringify({ bookings: [] }, null, 2));
-      return [];
-    }
-    const data = fs.readFileSync(BOOKINGS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    return parsed.bookings || [];
-  } catch (error) {
-    console.error('Error reading bookings file:', error);
-    return [];
-  }
-}
+import { findMany } from '@/lib/data-store';
 
 export async function GET(request: NextRequest) {
   try {
@@ -42,12 +14,11 @@ export async function GET(request: NextRequest) {
     }
 
     // Get all bookings for this user
-    const allBookings = getBookings();
+    const userBookings = findMany('bookings', 'userId', userId);
     
     // Filter bookings for this user that have been confirmed and payment captured
-    const userTransactions = allBookings
+    const userTransactions = userBookings
       .filter((booking: any) => 
-        booking.userId === userId && 
         booking.status === 'confirmed' &&
         booking.paymentStatus === 'captured'
       )
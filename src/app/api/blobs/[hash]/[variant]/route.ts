@@ -0,0 +1,43 @@
+import { NextRequest, NextResponse } from 'next/server';
+import fs from 'fs';
+import { Readable } from 'stream';
+import { findBlobFile, IMMUTABLE_CACHE_CONTROL } from '@/lib/images/blob-store';
+
+export async function GET(
+  request: NextRequest,
+  { params }: { params: Promise<{ hash: string; variant: string }> }
+) {
+  try {
+    const { hash, variant } = await params;
+    const blob = await findBlobFile(hash, variant);
+
+    if (!blob) {
+      return NextResponse.json({ error: 'Not found' }, { status: 404 });
+    }
+
+    // Content-addressed: the same URL always means the same bytes
+    const etag = `"${hash}-${variant}"`;
+    const headers = {
+      'Cache-Control': IMMUTABLE_CACHE_CONTROL,
+      'ETag': etag
+    };
+
+    if (request.headers.get('if-none-match') === etag) {
+      return new NextResponse(null, { status: 304, headers });
+    }
+
+    const stream = Readable.toWeb(fs.createReadStream(blob.path)) as ReadableStream<Uint8Array>;
+    return new NextResponse(stream, {
+      headers: {
+        ...headers,
+        'Content-Type': blob.contentType,
+        'Content-Length': String(blob.size),
+        // The content type was declared by the uploader; don't let browsers guess another
+        'X-Content-Type-Options': 'nosniff'
+      }
+    });
+  } catch (error) {
+    console.error('Error serving blob:', error);
+    return NextResponse.json({ error: 'Failed to load file' }, { status: 500 });
+  }
+}
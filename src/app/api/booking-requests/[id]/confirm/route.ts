@@ -1,68 +1,23 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
 import { stripe } from '@/lib/stripe';
-
-const BOOKING_REQUESTS_FILE = path.join(process.cwd(), 'data', 'booking-requests.json');
-const BOOKINGS_FILE = path.join(process.cwd(), 'data', 'bookings.json');
-
-// Helper functions to read/write data
-function getBookingRequests(): any[] {
-  try {
-    if (fs.existsSync(BOOKING_REQUESTS_FILE)) {
-      const data = fs.readFileSync(BOOKING_REQUESTS_FILE, 'utf8');
-      const parsed = JSON.parse(data);
-      return parsed.bookingRequests || [];
-    }
-  } catch (error) {
-    console.error('Error reading booking requests file:', error);
-  }
-  return [];
-}
-
-function saveBookingRequests(bookingRequests: any[]): void {
-  const dataDir = path.dirname(BOOKING_REQUESTS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-  fs.writeFileSync(BOOKING_REQUESTS_FILE, JSON.stringify({ bookingRequests }, null, 2));
-}
-
-function getBookings(): any[] {
-  try {
-    if (fs.existsSync(BOOKINGS_FILE)) {
-      const data = fs.readFileSync(BOOKINGS_FILE, 'utf8');
-      const parsed = JSON.parse(data);
-      return parsed.bookings || [];
-    }
-  } catch (error) {
-    console.error('Error reading bookings file:', error);
-  }
-  return [];
-}
-
-function saveBookings(bookings: any[]): void {
-  const dataDir = path.dirname(BOOKINGS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-  fs.writeFileSync(BOOKINGS_FILE, JSON.stringify({ bookings }, null, 2));
-}
+import { findById, putRecords, removeRecords } from '@/lib/data-store';
+import { claimSlot, slotInterval } from '@/lib/bookings/availability';
+import { notifyBookingStatus } from '@/lib/realtime/notifications';
+import { log } from '@/lib/log';
 
 export async function POST(request: NextRequest, { params }: { params: Promise<{ id: string }> }) {
+  // Claimed before the payment is captured and released once the booking is written,
+  // so two overlapping requests can't both be confirmed
+  let claim: { release: () => void } | null = null;
   try {
     const { id } = await params;
-    const bookingRequests = getBookingRequests();
-    
-    const requestIndex = bookingRequests.findIndex(req => req.id === id);
-    if (requestIndex === -1) {
+    const bookingRequest = findById('bookingRequests', id);
+    if (!bookingRequest) {
       return NextResponse.json(
         { error: 'Booking request not found' },
         { status: 404 }
       );
     }
-
-    const bookingRequest = bookingRequests[requestIndex];
     
     // Check if already confirmed
     if (bookingRequest.status === 'confirmed') {
@@ -72,21 +27,30 @@ export async function POST(request: NextRequest, { params }: { params: Promise<{
       );
     }
 
+    // Requests without a valid time range can't overlap anything
+    claim = claimSlot(bookingRequest, id, { confirmed: true });
+    if (!claim && slotInterval(bookingRequest)) {
+      return NextResponse.json(
+        { error: 'This time slot is already booked' },
+        { status: 409 }
+      );
+    }
+
     // Capture the payment if PaymentIntent exists
+    let paymentStatus = bookingRequest.paymentStatus;
     if (bookingRequest.paymentIntentId) {
       try {
-        console.log('💳 Capturing payment:', bookingRequest.paymentIntentId);
+        log.debug('💳 Capturing payment:', bookingRequest.paymentIntentId);
         
         const paymentIntent = await stripe.paymentIntents.capture(bookingRequest.paymentIntentId);
         
-        console.log('✅ Payment captured successfully:', {
+        log.info('✅ Payment captured successfully:', {
           id: paymentIntent.id,
           amount: paymentIntent.amount,
           status: paymentIntent.status
         });
         
-        // Update payment status
-        bookingRequest.paymentStatus = 'captured';
+        paymentStatus = 'captured';
         
       } catch (stripeError) {
         console.error('❌ Error capturing payment:', stripeError);
@@ -97,28 +61,24 @@ export async function POST(request: NextRequest, { params }: { params: Promise<{
       }
     }
 
-    // Update booking request status
-    bookingRequest.status = 'confirmed';
-    bookingRequest.updatedAt = new Date().toISOString();
-    bookingRequest.confirmedAt = new Date().toISOString();
-
-    // Move to confirmed bookings
-    const bookings = getBookings();
+    // Move to confirmed bookings. The cached request is copied rather than
+    // edited in place so the store's indexes stay in step with it
+    const confirmedAt = new Date().toISOString();
     const confirmedBooking = {
       ...bookingRequest,
-      confirmedAt: new Date().toISOString()
+      paymentStatus,
+      status: 'confirmed',
+      updatedAt: confirmedAt,
+      confirmedAt
     };
-    
-    bookings.push(confirmedBooking);
-
-    // Remove from booking requests
-    bookingRequests.splice(requestIndex, 1);
 
-    // Save both files
-    saveBookingRequests(bookingRequests);
-    saveBookings(bookings);
+    // Only the moved record is written, so changes made to other requests
+    // while the payment was being captured are kept
+    await putRecords({ bookings: [confirmedBooking] });
+    await removeRecords({ bookingRequests: [bookingRequest] });
 
-    console.log('✅ Booking confirmed and moved to bookings:', id);
+    log.info('✅ Booking confirmed and moved to bookings:', id);
+    notifyBookingStatus(confirmedBooking, 'confirmed');
 
     return NextResponse.json({
       success: true,
@@ -132,5 +92,7 @@ export async function POST(request: NextRequest, { params }: { params: Promise<{
       { error: 'Failed to confirm booking' },
       { status: 500 }
     );
+  } finally {
+    claim?.release();
   }
 } 
\ No newline at end of file
@@ -1,49 +1,23 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
 import { stripe } from '@/lib/stripe';
-
-const BOOKING_REQUESTS_FILE = path.join(process.cwd(), 'data', 'booking-requests.json');
-
-// Helper functions to read/write data
-function getBookingRequests(): any[] {
-  try {
-    if (fs.existsSync(BOOKING_REQUESTS_FILE)) {
-      const data = fs.readFileSync(BOOKING_REQUESTS_FILE, 'utf8');
-      const parsed = JSON.parse(data);
-      return parsed.bookingRequests || [];
-    }
-  } catch (error) {
-    console.error('Error reading booking requests file:', error);
-  }
-  return [];
-}
-
-function saveBookingRequests(bookingRequests: any[]): void {
-  const dataDir = path.dirname(BOOKING_REQUESTS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-  fs.writeFileSync(BOOKING_REQUESTS_FILE, JSON.stringify({ bookingRequests }, null, 2));
-}
+import { findById, putRecords } from '@/lib/data-store';
+import { notifyBookingStatus } from '@/lib/realtime/notifications';
+import { log } from '@/lib/log';
 
 export async function POST(request: NextRequest, { params }: { params: Promise<{ id: string }> }) {
   try {
     const { id } = await params;
     const { reason } = await request.json();
     
-    const bookingRequests = getBookingRequests();
-    const requestIndex = bookingRequests.findIndex(req => req.id === id);
+    const bookingRequest = findById('bookingRequests', id);
     
-    if (requestIndex === -1) {
+    if (!bookingRequest) {
       return NextResponse.json(
         { error: 'Booking request not found' },
         { status: 404 }
       );
     }
 
-    const bookingRequest = bookingRequests[requestIndex];
-    
     // Check if already processed
     if (bookingRequest.status !== 'pending') {
       return NextResponse.json(
@@ -55,11 +29,11 @@ export async function POST(request: NextRequest, { params }: { params: Promise<{
     // Cancel the PaymentIntent if it exists
     if (bookingRequest.paymentIntentId) {
       try {
-        console.log('❌ Canceling payment intent:', bookingRequest.paymentIntentId);
+        log.debug('❌ Canceling payment intent:', bookingRequest.paymentIntentId);
         
         await stripe.paymentIntents.cancel(bookingRequest.paymentIntentId);
         
-        console.log('✅ Payment intent canceled successfully');
+        log.info('✅ Payment intent canceled successfully');
         
         // Update payment status
         bookingRequest.paymentStatus = 'canceled';
@@ -72,7 +46,7 @@ export async function POST(request: NextRequest, { params }: { params: Promise<{
     }
 
     // Update booking request status
-    bookingRequests[requestIndex] = {
+    const declinedRequest = {
       ...bookingRequest,
       status: 'rejected',
       rejectionReason: reason || 'No reason provided',
@@ -80,13 +54,14 @@ export async function POST(request: NextRequest, { params }: { params: Promise<{
       updatedAt: new Date().toISOString()
     };
     
-    saveBookingRequests(bookingRequests);
+    await putRecords({ bookingRequests: [declinedRequest] });
 
-    console.log('❌ Booking declined:', id);
+    log.info('❌ Booking declined:', id);
+    notifyBookingStatus(declinedRequest, 'rejected');
 
     return NextResponse.json({
       success: true,
-      bookingRequest: bookingRequests[requestIndex],
+      bookingRequest: declinedRequest,
       message: 'Booking request declined successfully'
     });
 
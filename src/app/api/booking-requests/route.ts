@@ -1,8 +1,11 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
 import { findUserById } from '@/lib/user-store';
+import { findById, findMany, getCollection, putRecords } from '@/lib/data-store';
 import { artistBriefSelect, type ArtistBrief } from '@/lib/bookings/activeBookings';
+import { claimSlot, slotInterval } from '@/lib/bookings/availability';
+import { notifyBookingStatus } from '@/lib/realtime/notifications';
+import { log } from '@/lib/log';
+import { timed, withTiming } from '@/lib/timing';
 
 // Import Stripe functions with error handling
 let stripe: any = null;
@@ -19,10 +22,6 @@ try {
   // Don't throw here - handle in the actual API call
 }
 
-const BOOKINGS_FILE = path.join(process.cwd(), 'data', 'bookings.json'); // Updated to use unified bookings file
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
-const PROFILES_FILE = path.join(process.cwd(), 'data', 'user-profiles.json');
-
 interface BookingRequest {
   id: string;
   studioId: string;
@@ -51,42 +50,13 @@ interface BookingRequest {
   updatedAt: string;
 }
 
-// Helper functions to read/write unified bookings data
-function getBookings(): any[] {
-  try {
-    if (fs.existsSync(BOOKINGS_FILE)) {
-      const data = fs.readFileSync(BOOKINGS_FILE, 'utf8');
-      const parsed = JSON.parse(data);
-      return parsed.bookings || [];
-    }
-  } catch (error) {
-    console.error('Error reading bookings file:', error);
-  }
-  return [];
-}
-
-function saveBookings(bookings: any[]): void {
-  const dataDir = path.dirname(BOOKINGS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-  fs.writeFileSync(BOOKINGS_FILE, JSON.stringify({ bookings }, null, 2));
-}
-
 // Helper function to get user data with profile information
 function getUserData(userId: string): any {
   try {
-    // Read users file
-    const usersData = fs.readFileSync(USERS_FILE, 'utf8');
-    const usersJson = JSON.parse(usersData);
-    const user = usersJson.users?.find((u: any) => u.id === userId);
-    
+    const user = findById('users', userId);
     if (!user) return null;
     
-    // Read profiles file
-    const profilesData = fs.readFileSync(PROFILES_FILE, 'utf8');
-    const profilesJson = JSON.parse(profilesData);
-    const profile = profilesJson.profiles?.find((p: any) => p.id === userId); // FIXED: Use correct lookup
+    const profile = findById('profiles', userId);
     
     return {
       ...user,
@@ -100,21 +70,20 @@ function getUserData(userId: string): any {
   }
 }
 
-export async function GET(request: NextRequest) {
+export const GET = withTiming('GET /api/booking-requests', listBookingRequests);
+
+async function listBookingRequests(request: NextRequest) {
   try {
-    console.log('📥 [Booking-Requests] GET request received');
+    log.debug('📥 [Booking-Requests] GET request received');
     
     const { searchParams } = new URL(request.url);
     const studioId = searchParams.get('studioId');
     const userId = searchParams.get('userId');
 
-    const bookings = getBookings();
-
     if (studioId) {
       // Return pending booking requests for studio dashboard
-      const pendingBookings = bookings.filter(booking => 
-        booking.studioId === studioId && 
-        (booking.status === 'pending' || booking.status === 'PENDING')
+      const pendingBookings = findMany('bookings', 'studioId', studioId).filter(booking => 
+        booking.status === 'pending' || booking.status === 'PENDING'
       );
 
       // Enhance with artist data
@@ -129,20 +98,21 @@ export async function GET(request: NextRequest) {
         };
       });
 
-      console.log(`✅ [Booking-Requests] Returning ${enhancedBookings.length} pending bookings for studio ${studioId}`);
-      return NextResponse.json({ bookingRequests: enhancedBookings });
+      log.debug(`✅ [Booking-Requests] Returning ${enhancedBookings.length} pending bookings for studio ${studioId}`);
+      return timed('serialize', () => NextResponse.json({ bookingRequests: enhancedBookings }));
     }
 
     if (userId) {
       // Return user's booking requests
-      const userBookings = bookings.filter(booking => booking.userId === userId);
-      console.log(`✅ [Booking-Requests] Returning ${userBookings.length} bookings for user ${userId}`);
-      return NextResponse.json({ bookingRequests: userBookings });
+      const userBookings = findMany('bookings', 'userId', userId);
+      log.debug(`✅ [Booking-Requests] Returning ${userBookings.length} bookings for user ${userId}`);
+      return timed('serialize', () => NextResponse.json({ bookingRequests: userBookings }));
     }
 
     // Return all booking requests
-    console.log(`✅ [Booking-Requests] Returning ${bookings.length} total bookings`);
-    return NextResponse.json({ bookingRequests: bookings });
+    const bookings = getCollection('bookings');
+    log.debug(`✅ [Booking-Requests] Returning ${bookings.length} total bookings`);
+    return timed('serialize', () => NextResponse.json({ bookingRequests: bookings }));
 
   } catch (error) {
     console.error('❌ [Booking-Requests] Error in GET:', error);
@@ -154,8 +124,10 @@ export async function GET(request: NextRequest) {
 }
 
 export async function POST(request: NextRequest) {
+  // Held from the availability check until the booking is saved, so no other request can take the time meanwhile
+  let claim: { release: () => void } | null = null;
   try {
-    console.log('📝 [Booking-Requests] POST request received');
+    log.debug('📝 [Booking-Requests] POST request received');
     
     // First check if Stripe is properly configured
     if (!stripe || !calculateTotalWithFee || !dollarsToCents) {
@@ -167,7 +139,7 @@ export async function POST(request: NextRequest) {
     }
 
     const bookingData = await request.json();
-    console.log('📝 [Booking-Requests] Creating booking request:', {
+    log.debug('📝 [Booking-Requests] Creating booking request:', {
       studioId: bookingData.studioId,
       userId: bookingData.userId,
       date: bookingData.date,
@@ -186,6 +158,23 @@ export async function POST(request: NextRequest) {
       }
     }
 
+    if (!slotInterval(bookingData)) {
+      return NextResponse.json(
+        { error: 'Invalid date or time range' },
+        { status: 400 }
+      );
+    }
+
+    const bookingId = `booking_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+    claim = claimSlot(bookingData, bookingId);
+    if (!claim) {
+      log.debug(`⚠️ [Booking-Requests] Slot already booked: ${bookingData.roomId} ${bookingData.date} ${bookingData.startTime}-${bookingData.endTime}`);
+      return NextResponse.json(
+        { error: 'This time slot is already booked' },
+        { status: 409 }
+      );
+    }
+
     // Get user for Stripe customer ID
     const user = findUserById(bookingData.userId);
     if (!user) {
@@ -204,7 +193,7 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    console.log(`🔍 [Booking-Requests] Getting payment methods for customer: ${user.stripeCustomerId}`);
+    log.debug(`🔍 [Booking-Requests] Getting payment methods for customer: ${user.stripeCustomerId}`);
 
     // Get user's default payment method with error handling
     let paymentMethods;
@@ -230,13 +219,13 @@ export async function POST(request: NextRequest) {
     }
 
     const defaultPaymentMethod = paymentMethods.data[0];
-    console.log(`💳 [Booking-Requests] Using payment method: ${defaultPaymentMethod.id}`);
+    log.debug(`💳 [Booking-Requests] Using payment method: ${defaultPaymentMethod.id}`);
 
     // Calculate amounts with company fee
     const baseAmount = dollarsToCents(bookingData.totalCost);
     const amounts = calculateTotalWithFee(baseAmount);
 
-    console.log(`💰 [Booking-Requests] Payment calculation:`, {
+    log.debug(`💰 [Booking-Requests] Payment calculation:`, {
       baseAmount: amounts.baseAmount,
       companyFee: amounts.companyFee,
       totalAmount: amounts.totalAmount
@@ -272,7 +261,7 @@ export async function POST(request: NextRequest) {
 
     // Create booking with PENDING status in unified bookings file
     const bookingRequest: BookingRequest = {
-      id: `booking_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`,
+      id: bookingId,
       studioId: bookingData.studioId,
       studioName: bookingData.studioName,
       roomId: bookingData.roomId,
@@ -300,12 +289,11 @@ export async function POST(request: NextRequest) {
     };
 
     // Save to unified bookings file
-    const bookings = getBookings();
-    bookings.push(bookingRequest);
-    saveBookings(bookings);
+    await putRecords({ bookings: [bookingRequest] });
+    notifyBookingStatus(bookingRequest, bookingRequest.status);
 
-    console.log('💳 [Booking-Requests] PaymentIntent created:', paymentIntent.id);
-    console.log('✅ [Booking-Requests] Booking request created:', bookingRequest.id);
+    log.info('💳 [Booking-Requests] PaymentIntent created:', paymentIntent.id);
+    log.info('✅ [Booking-Requests] Booking request created:', bookingRequest.id);
 
     return NextResponse.json({
       success: true,
@@ -323,5 +311,7 @@ export async function POST(request: NextRequest) {
       { error: 'Failed to create booking request' },
       { status: 500 }
     );
+  } finally {
+    claim?.release();
   }
 } 
\ No newline at end of file
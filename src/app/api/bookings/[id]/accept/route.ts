@@ -1,47 +1,22 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const BOOKINGS_FILE = path.join(process.cwd(), 'data', 'bookings.json');
-
-// Helper functions to read/write data
-function getBookings(): any[] {
-  try {
-    if (fs.existsSync(BOOKINGS_FILE)) {
-      const data = fs.readFileSync(BOOKINGS_FILE, 'utf8');
-      const parsed = JSON.parse(data);
-      return parsed.bookings || [];
-    }
-  } catch (error) {
-    console.error('Error reading bookings file:', error);
-  }
-  return [];
-}
-
-function saveBookings(bookings: any[]): void {
-  const dataDir = path.dirname(BOOKINGS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-  fs.writeFileSync(BOOKINGS_FILE, JSON.stringify({ bookings }, null, 2));
-}
+import { findById, putRecords } from '@/lib/data-store';
+import { findConflicts } from '@/lib/bookings/availability';
+import { notifyBookingStatus } from '@/lib/realtime/notifications';
+import { log } from '@/lib/log';
 
 export async function PUT(request: NextRequest, { params }: { params: Promise<{ id: string }> }) {
   try {
     const { id } = await params;
     
-    const bookings = getBookings();
-    const bookingIndex = bookings.findIndex(booking => booking.id === id);
+    const booking = findById('bookings', id);
     
-    if (bookingIndex === -1) {
+    if (!booking) {
       return NextResponse.json(
         { error: 'Booking not found' },
         { status: 404 }
       );
     }
 
-    const booking = bookings[bookingIndex];
-    
     // Check if booking is in PENDING status
     if (booking.status !== 'pending' && booking.status !== 'PENDING') {
       return NextResponse.json(
@@ -50,21 +25,31 @@ export async function PUT(request: NextRequest, { params }: { params: Promise<{
       );
     }
 
+    // Another booking may have been confirmed for this time since the request was made.
+    // Nothing is awaited between this check and the write below, so no other confirm can slip in
+    if (findConflicts(booking, { ignoreId: id, confirmedOnly: true }).length > 0) {
+      return NextResponse.json(
+        { error: 'This time slot is already booked' },
+        { status: 409 }
+      );
+    }
+
     // Update booking status from PENDING to CONFIRMED
-    bookings[bookingIndex] = {
+    const acceptedBooking = {
       ...booking,
       status: 'CONFIRMED',
       confirmedAt: new Date().toISOString(),
       updatedAt: new Date().toISOString()
     };
     
-    saveBookings(bookings);
+    await putRecords({ bookings: [acceptedBooking] });
 
-    console.log('✅ Booking accepted:', id);
+    log.info('✅ Booking accepted:', id);
+    notifyBookingStatus(acceptedBooking, acceptedBooking.status);
 
     return NextResponse.json({
       success: true,
-      booking: bookings[bookingIndex],
+      booking: acceptedBooking,
       message: 'Booking accepted successfully'
     });
 
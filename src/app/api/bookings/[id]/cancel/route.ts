@@ -1,33 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const BOOKINGS_FILE = path.join(process.cwd(), 'data', 'bookings.json');
-
-// Helper function to read bookings
-function getBookings(): any[] {
-  try {
-    if (fs.existsSync(BOOKINGS_FILE)) {
-      const data = fs.readFileSync(BOOKINGS_FILE, 'utf8');
-      const parsed = JSON.parse(data);
-      return parsed.bookings || [];
-    }
-  } catch (error) {
-    console.error('Error reading bookings file:', error);
-  }
-  return [];
-}
-
-// Helper function to save bookings
-function saveBookings(bookings: any[]): void {
-  try {
-    const data = { bookings };
-    fs.writeFileSync(BOOKINGS_FILE, JSON.stringify(data, null, 2));
-  } catch (error) {
-    console.error('Error saving bookings file:', error);
-    throw error;
-  }
-}
+import { findById, putRecords } from '@/lib/data-store';
+import { notifyBookingStatus } from '@/lib/realtime/notifications';
+import { log } from '@/lib/log';
 
 export async function PATCH(
   request: NextRequest,
@@ -43,18 +17,15 @@ export async function PATCH(
       );
     }
 
-    const bookings = getBookings();
-    const bookingIndex = bookings.findIndex(b => b.id === bookingId);
+    const booking = findById('bookings', bookingId);
 
-    if (bookingIndex === -1) {
+    if (!booking) {
       return NextResponse.json(
         { error: 'Booking not found' },
         { status: 404 }
       );
     }
 
-    const booking = bookings[bookingIndex];
-
     // Check if booking can be cancelled
     if (booking.status === 'cancelled' || booking.status === 'CANCELLED') {
       return NextResponse.json(
@@ -71,7 +42,7 @@ export async function PATCH(
     }
 
     // Update booking status
-    bookings[bookingIndex] = {
+    const cancelledBooking = {
       ...booking,
       status: 'cancelled',
       cancelledAt: new Date().toISOString(),
@@ -79,9 +50,10 @@ export async function PATCH(
     };
 
     // Save updated bookings
-    saveBookings(bookings);
+    await putRecords({ bookings: [cancelledBooking] });
 
-    console.log(`✅ [Cancel Booking] Booking ${bookingId} cancelled successfully`);
+    log.info(`✅ [Cancel Booking] Booking ${bookingId} cancelled successfully`);
+    notifyBookingStatus(cancelledBooking, cancelledBooking.status);
 
     // TODO: In production, this would also handle Stripe refunds
     // if (booking.paymentIntentId && booking.paymentStatus === 'captured') {
@@ -92,7 +64,7 @@ export async function PATCH(
 
     return NextResponse.json({
       message: 'Booking cancelled successfully',
-      booking: bookings[bookingIndex]
+      booking: cancelledBooking
     });
 
   } catch (error) {
@@ -1,48 +1,22 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const BOOKINGS_FILE = path.join(process.cwd(), 'data', 'bookings.json');
-
-// Helper functions to read/write data
-function getBookings(): any[] {
-  try {
-    if (fs.existsSync(BOOKINGS_FILE)) {
-      const data = fs.readFileSync(BOOKINGS_FILE, 'utf8');
-      const parsed = JSON.parse(data);
-      return parsed.bookings || [];
-    }
-  } catch (error) {
-    console.error('Error reading bookings file:', error);
-  }
-  return [];
-}
-
-function saveBookings(bookings: any[]): void {
-  const dataDir = path.dirname(BOOKINGS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-  fs.writeFileSync(BOOKINGS_FILE, JSON.stringify({ bookings }, null, 2));
-}
+import { findById, putRecords } from '@/lib/data-store';
+import { notifyBookingStatus } from '@/lib/realtime/notifications';
+import { log } from '@/lib/log';
 
 export async function PUT(request: NextRequest, { params }: { params: Promise<{ id: string }> }) {
   try {
     const { id } = await params;
     const { reason } = await request.json();
     
-    const bookings = getBookings();
-    const bookingIndex = bookings.findIndex(booking => booking.id === id);
+    const booking = findById('bookings', id);
     
-    if (bookingIndex === -1) {
+    if (!booking) {
       return NextResponse.json(
         { error: 'Booking not found' },
         { status: 404 }
       );
     }
 
-    const booking = bookings[bookingIndex];
-    
     // Check if booking is in PENDING status
     if (booking.status !== 'pending' && booking.status !== 'PENDING') {
       return NextResponse.json(
@@ -52,7 +26,7 @@ export async function PUT(request: NextRequest, { params }: { params: Promise<{
     }
 
     // Update booking status from PENDING to CANCELED
-    bookings[bookingIndex] = {
+    const declinedBooking = {
       ...booking,
       status: 'CANCELED',
       rejectionReason: reason || 'No reason provided',
@@ -60,13 +34,14 @@ export async function PUT(request: NextRequest, { params }: { params: Promise<{
       updatedAt: new Date().toISOString()
     };
     
-    saveBookings(bookings);
+    await putRecords({ bookings: [declinedBooking] });
 
-    console.log('❌ Booking declined:', id);
+    log.info('❌ Booking declined:', id);
+    notifyBookingStatus(declinedBooking, declinedBooking.status);
 
     return NextResponse.json({
       success: true,
-      booking: bookings[bookingIndex],
+      booking: declinedBooking,
       message: 'Booking declined successfully'
     });
 
@@ -1,41 +1,15 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
 import { artistBriefSelect, type ArtistBrief } from '@/lib/bookings/activeBookings';
+import { findConflicts } from '@/lib/bookings/availability';
 import { filterValidBookings } from '@/lib/bookings/safetyGuards';
-
-const BOOKINGS_FILE = path.join(process.cwd(), 'data', 'bookings.json');
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
-const PROFILES_FILE = path.join(process.cwd(), 'data', 'user-profiles.json');
-const STUDIOS_FILE = path.join(process.cwd(), 'data', 'studios.json');
-
-// Ensure data directory exists
-function ensureDataDir() {
-  const dataDir = path.dirname(BOOKINGS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-}
+import { findById, findMany, getCollection, putRecords } from '@/lib/data-store';
+import { imageVariantUrl } from '@/lib/images/variants';
 
 // Helper function to get user info consistent with artistBriefSelect
 function getUserInfo(userId: string): ArtistBrief | null {
   try {
-    let user = null;
-    let profile = null;
-
-    // Get basic user info
-    if (fs.existsSync(USERS_FILE)) {
-      const usersData = fs.readFileSync(USERS_FILE, 'utf8');
-      const users = JSON.parse(usersData);
-      user = users.find((u: any) => u.id === userId);
-    }
-
-    // Get profile info for avatar
-    if (fs.existsSync(PROFILES_FILE)) {
-      const profilesData = fs.readFileSync(PROFILES_FILE, 'utf8');
-      const profiles = JSON.parse(profilesData);
-      profile = profiles.find((p: any) => p.id === userId);
-    }
+    const user = findById('users', userId);
+    const profile = findById('profiles', userId);
     
     // Return data consistent with artistBriefSelect format
     if (user || profile) {
@@ -43,7 +17,7 @@ function getUserInfo(userId: string): ArtistBrief | null {
         id: userId,
         displayName: user?.name || profile?.name || 'Unknown Artist',
         slug: user?.slug || profile?.slug || null,
-        avatarUrl: profile?.profileImage || null  // ABSOLUTELY ensure avatarUrl is present
+        avatarUrl: imageVariantUrl(profile?.profileImage, 'thumb') || null  // ABSOLUTELY ensure avatarUrl is present
       };
     }
   } catch (error) {
@@ -55,20 +29,14 @@ function getUserInfo(userId: string): ArtistBrief | null {
 // Helper function to get studio information
 function getStudioInfo(studioId: string): { id: string; name: string; slug: string; avatarUrl: string | null } | null {
   try {
-    if (fs.existsSync(STUDIOS_FILE)) {
-      const studiosData = fs.readFileSync(STUDIOS_FILE, 'utf8');
-      const studioDataObj = JSON.parse(studiosData);
-      const studios = studioDataObj.studios || [];
-      
-      const studio = studios.find((s: any) => s.id === studioId);
-      if (studio) {
-        return {
-          id: studio.id,
-          name: studio.name || 'Unknown Studio',
-          slug: studio.slug || studio.id,
-          avatarUrl: studio.profileImage || null
-        };
-      }
+    const studio = findById('studios', studioId);
+    if (studio) {
+      return {
+        id: studio.id,
+        name: studio.name || 'Unknown Studio',
+        slug: studio.slug || studio.id,
+        avatarUrl: imageVariantUrl(studio.profileImage, 'thumb') || null
+      };
     }
   } catch (error) {
     console.error('Error getting studio info:', error);
@@ -76,35 +44,10 @@ function getStudioInfo(studioId: string): { id: string; name: string; slug: stri
   return null;
 }
 
-// Read bookings from file with safety guards
+// Read bookings with safety guards
 function getBookings(): any[] {
-  ensureDataDir();
-  try {
-    if (!fs.existsSync(BOOKINGS_FILE)) {
-      fs.writeFileSync(BOOKINGS_FILE, JSON.stringify({ bookings: [] }, null, 2));
-      return [];
-    }
-    const data = fs.readFileSync(BOOKINGS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    const rawBookings = parsed.bookings || [];
-    
-    // Apply safety guards to filter out orphaned records
-    return filterValidBookings(rawBookings);
-  } catch (error) {
-    console.error('Error reading bookings file:', error);
-    return [];
-  }
-}
-
-// Write bookings to file
-function saveBookings(bookings: any[]): void {
-  ensureDataDir();
-  try {
-    fs.writeFileSync(BOOKINGS_FILE, JSON.stringify({ bookings }, null, 2));
-  } catch (error) {
-    console.error('Error saving bookings file:', error);
-    throw new Error('Failed to save booking data');
-  }
+  // Apply safety guards to filter out orphaned records
+  return filterValidBookings(getCollection('bookings'));
 }
 
 export async function GET(request: NextRequest) {
@@ -137,9 +80,8 @@ export async function GET(request: NextRequest) {
 
     if (userId) {
       // Artist view - only show confirmed bookings (not pending, cancelled, or rejected)
-      const bookings = getBookings();
+      const bookings = filterValidBookings(findMany('bookings', 'userId', userId));
       const filteredBookings = bookings.filter(booking => 
-        booking.userId === userId && 
         (booking.status === 'CONFIRMED' || booking.status === 'confirmed' || 
          booking.status === 'COMPLETED' || booking.status === 'completed')
       );
@@ -195,9 +137,13 @@ export async function GET(request: NextRequest) {
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json();
-    
-    // Get existing bookings
-    const bookings = getBookings();
+
+    if (body.studioId && findConflicts(body).length > 0) {
+      return NextResponse.json(
+        { error: 'This time slot is already booked' },
+        { status: 409 }
+      );
+    }
     
     // Generate booking ID
     const bookingId = `booking_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
@@ -211,8 +157,7 @@ export async function POST(request: NextRequest) {
     };
     
     // Add to bookings list
-    bookings.push(newBooking);
-    saveBookings(bookings);
+    await putRecords({ bookings: [newBooking] });
     
     return NextResponse.json(newBooking, { status: 201 });
   } catch (error) {
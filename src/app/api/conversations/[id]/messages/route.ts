@@ -1,10 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const MESSAGES_FILE = path.join(process.cwd(), 'data', 'messages.json');
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
-const PROFILES_FILE = path.join(process.cwd(), 'data', 'user-profiles.json');
+import { findById, findMany, findPage, putRecords, timelineKey } from '@/lib/data-store';
+import { createParticipantResolver } from '@/lib/messages/participants';
+import { notifyMessagesRead } from '@/lib/realtime/notifications';
 
 interface Message {
   id: string;
@@ -30,103 +27,13 @@ interface MessagesData {
   conversations: Conversation[];
 }
 
-interface User {
-  id: string;
-  email: string;
-  name: string;
-  role: string;
-  studioId?: string; // Added studioId for studio users
-}
-
-interface UserProfile {
-  id: string;
-  name: string;
-  profileImage?: string;
-}
-
-// Helper function to get user info with profile data
-function getUserInfo(userId: string): { id: string; name: string; email: string; role: string; profileImage?: string; slug?: string; type?: string } | null {
+// Writes only the given (new or changed) records; both collections commit together
+async function saveMessagesData(changes: Partial<MessagesData>): Promise<void> {
   try {
-    // Get basic user info
-    let users: User[] = [];
-    if (fs.existsSync(USERS_FILE)) {
-      const usersData = fs.readFileSync(USERS_FILE, 'utf8');
-      users = JSON.parse(usersData);
-    }
-    
-    const user = users.find(u => u.id === userId);
-    if (!user) return null;
-
-    // Get profile info for avatar
-    let profiles: UserProfile[] = [];
-    if (fs.existsSync(PROFILES_FILE)) {
-      const profilesData = fs.readFileSync(PROFILES_FILE, 'utf8');
-      profiles = JSON.parse(profilesData);
-    }
-    
-    const profile = profiles.find(p => p.id === userId);
-    
-    // If user is a studio, get studio information
-    if (user.role === 'studio' && user.studioId) {
-      try {
-        const STUDIOS_FILE = path.join(process.cwd(), 'data', 'studios.json');
-        if (fs.existsSync(STUDIOS_FILE)) {
-          const studiosData = fs.readFileSync(STUDIOS_FILE, 'utf8');
-          const studioDataObj = JSON.parse(studiosData);
-          const studios = studioDataObj.studios || [];
-          
-          const studio = studios.find((s: any) => s.id === user.studioId);
-          if (studio) {
-            return {
-              id: user.id,
-              name: studio.name || user.name,
-              email: user.email,
-              role: user.role,
-              profileImage: studio.profileImage || profile?.profileImage,
-              slug: studio.slug,
-              type: 'studio'
-            };
-          }
-        }
-      } catch (error) {
-        console.error('Error fetching studio info for user:', userId, error);
-      }
-    }
-    
-    return {
-      id: user.id,
-      name: user.name,
-      email: user.email,
-      role: user.role,
-      profileImage: profile?.profileImage,
-      type: user.role === 'studio' ? 'studio' : 'artist'
-    };
-  } catch (error) {
-    console.error('Error getting user info:', error);
-    return null;
-  }
-}
-
-function getMessagesData(): MessagesData {
-  try {
-    if (!fs.existsSync(MESSAGES_FILE)) {
-      const initialData: MessagesData = { messages: [], conversations: [] };
-      fs.writeFileSync(MESSAGES_FILE, JSON.stringify(initialData, null, 2));
-      return initialData;
-    }
-    const data = fs.readFileSync(MESSAGES_FILE, 'utf8');
-    return JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading messages:', error);
-    return { messages: [], conversations: [] };
-  }
-}
-
-function saveMessagesData(data: MessagesData): void {
-  try {
-    fs.writeFileSync(MESSAGES_FILE, JSON.stringify(data, null, 2));
+    await putRecords(changes);
   } catch (error) {
     console.error('Error saving messages:', error);
+    throw error;
   }
 }
 
@@ -139,7 +46,8 @@ export async function GET(
     const { id: conversationId } = await params;
     const { searchParams } = new URL(request.url);
     const userId = searchParams.get('userId');
-    const before = searchParams.get('before'); // ISO timestamp for cursor-based pagination
+    const before = searchParams.get('before'); // ISO timestamp of the oldest message already shown
+    const beforeId = searchParams.get('beforeId'); // Its id, so messages sharing that timestamp aren't skipped
     const limitParam = searchParams.get('limit');
     const limit = limitParam ? parseInt(limitParam, 10) : 20; // Default 20 messages
 
@@ -158,25 +66,18 @@ export async function GET(
       );
     }
 
-    const data = getMessagesData();
-    
     // Verify user is part of this conversation and it's not deleted
-    const conversation = data.conversations.find(conv => 
-      conv.id === conversationId && conv.participants.includes(userId) && !conv.deletedAt
-    );
+    const conversation: Conversation | null = findById('conversations', conversationId);
 
-    if (!conversation) {
+    if (!conversation || !conversation.participants.includes(userId) || conversation.deletedAt) {
       return NextResponse.json(
         { error: 'Conversation not found or access denied' },
         { status: 404 }
       );
     }
 
-    // Get all messages for this conversation
-    let filteredMessages = data.messages
-      .filter(msg => msg.conversationId === conversationId);
-
-    // Apply cursor-based pagination (before timestamp)
+    // Keyset pagination on (timestamp, id) over the conversation's sorted timeline
+    let cursor: string | null = null;
     if (before) {
       const beforeDate = new Date(before);
       if (isNaN(beforeDate.getTime())) {
@@ -185,55 +86,33 @@ export async function GET(
           { status: 400 }
         );
       }
-      filteredMessages = filteredMessages.filter(msg => 
-        new Date(msg.timestamp).getTime() < beforeDate.getTime()
-      );
+      cursor = timelineKey(before, beforeId);
     }
 
-    // Sort by timestamp descending (newest first for pagination), then take limit + 1 to check if there are more
-    const sortedMessages = filteredMessages
-      .sort((a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime())
-      .slice(0, limit + 1);
+    // Newest first; older pages are fetched with the cursor below
+    const { records: messages, hasMore } = findPage('messages', 'timeline', conversationId, {
+      before: cursor,
+      limit
+    }) as { records: Message[]; hasMore: boolean };
 
-    // Check if there are more messages (hasMore)
-    const hasMore = sortedMessages.length > limit;
-    const messages = hasMore ? sortedMessages.slice(0, limit) : sortedMessages;
+    // Resolve the participants and every sender on this page in one pass
+    const participants = createParticipantResolver();
+    participants.load([...conversation.participants, ...messages.map(message => message.senderId)]);
 
-    // Keep newest first order for UI
-    const finalMessages = messages
-      .map(message => {
-        const senderInfo = getUserInfo(message.senderId);
-        return {
-          ...message,
-          senderInfo: senderInfo || {
-            id: message.senderId,
-            name: 'Unknown User',
-            email: '',
-            role: 'artist',
-            profileImage: undefined
-          }
-        };
-      });
-
-    // Get participant info for the conversation
-    const participantsInfo = conversation.participants.map(participantId => {
-      const userInfo = getUserInfo(participantId);
-      return userInfo || {
-        id: participantId,
-        name: 'Unknown User',
-        email: '',
-        role: 'artist',
-        profileImage: undefined
-      };
-    });
+    const finalMessages = messages.map(message => ({
+      ...message,
+      senderInfo: participants.getOrUnknown(message.senderId)
+    }));
 
     const conversationWithInfo = {
       ...conversation,
-      participantsInfo
+      participantsInfo: conversation.participants.map(participantId => participants.getOrUnknown(participantId))
     };
 
-    // Cursor for next page (timestamp of oldest message in current page - last in array since newest first)
-    const nextCursor = finalMessages.length > 0 ? finalMessages[finalMessages.length - 1].timestamp : null;
+    // Cursor for next page: the oldest message in this page (last, since newest first)
+    const oldest = finalMessages.length > 0 ? finalMessages[finalMessages.length - 1] : null;
+    const nextCursor = oldest ? oldest.timestamp : null;
+    const nextCursorId = oldest ? oldest.id : null;
 
     return NextResponse.json({ 
       conversation: conversationWithInfo,
@@ -241,6 +120,7 @@ export async function GET(
       pagination: {
         hasMore,
         nextCursor,
+        nextCursorId,
         limit
       }
     }, { status: 200 });
@@ -271,29 +151,31 @@ export async function PUT(
       );
     }
 
-    const data = getMessagesData();
-    
     // Verify user is part of this conversation
-    const conversation = data.conversations.find(conv => 
-      conv.id === conversationId && conv.participants.includes(userId)
-    );
+    const conversation: Conversation | null = findById('conversations', conversationId);
 
-    if (!conversation) {
+    if (!conversation || !conversation.participants.includes(userId)) {
       return NextResponse.json(
         { error: 'Conversation not found or access denied' },
         { status: 404 }
       );
     }
 
-    // Mark messages as read
-    data.messages
-      .filter(msg => msg.conversationId === conversationId && msg.receiverId === userId)
-      .forEach(msg => msg.read = true);
+    // Mark messages as read; the cached records are only replaced once the copies are saved
+    const readMessages: Message[] = findMany('messages', 'unreadByConversation', `${userId}:${conversationId}`)
+      .map((msg: Message) => ({ ...msg, read: true }));
 
     // Update conversation unread count
-    conversation.unreadCount[userId] = 0;
+    const updatedConversation: Conversation = {
+      ...conversation,
+      unreadCount: { ...conversation.unreadCount, [userId]: 0 }
+    };
 
-    saveMessagesData(data);
+    await saveMessagesData({ messages: readMessages, conversations: [updatedConversation] });
+
+    if (readMessages.length > 0) {
+      notifyMessagesRead(updatedConversation, userId, readMessages.map(msg => msg.id));
+    }
 
     return NextResponse.json({ 
       message: 'Messages marked as read' 
@@ -1,10 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const MESSAGES_FILE = path.join(process.cwd(), 'data', 'messages.json');
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
-const PROFILES_FILE = path.join(process.cwd(), 'data', 'user-profiles.json');
+import { findById, getCollection, putRecords } from '@/lib/data-store';
 
 interface Message {
   id: string;
@@ -50,26 +45,20 @@ function generateId(): string {
 
 // Helper function to get messages data
 function getMessagesData(): MessagesData {
-  try {
-    if (!fs.existsSync(MESSAGES_FILE)) {
-      const initialData: MessagesData = { messages: [], conversations: [] };
-      fs.writeFileSync(MESSAGES_FILE, JSON.stringify(initialData, null, 2));
-      return initialData;
-    }
-    const data = fs.readFileSync(MESSAGES_FILE, 'utf8');
-    return JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading messages:', error);
-    return { messages: [], conversations: [] };
-  }
+  return {
+    messages: getCollection<Message>('messages'),
+    conversations: getCollection<Conversation>('conversations')
+  };
 }
 
-// Helper function to save messages data
-function saveMessagesData(data: MessagesData): void {
+// Helper function to save messages data; writes only the given new or changed
+// records, and both collections commit together
+async function saveMessagesData(changes: Partial<MessagesData>): Promise<void> {
   try {
-    fs.writeFileSync(MESSAGES_FILE, JSON.stringify(data, null, 2));
+    await putRecords(changes);
   } catch (error) {
     console.error('Error saving messages data:', error);
+    throw error;
   }
 }
 
@@ -92,10 +81,8 @@ export async function GET(
       );
     }
 
-    const data = getMessagesData();
-    
     // Find the conversation
-    const conversation = data.conversations.find(conv => conv.id === conversationId);
+    const conversation: Conversation | null = findById('conversations', conversationId);
     
     if (!conversation) {
       return NextResponse.json(
@@ -170,9 +157,7 @@ export async function DELETE(
     }
 
     // Soft delete by adding deletedAt timestamp
-    conversation.deletedAt = new Date().toISOString();
-    
-    saveMessagesData(data);
+    await saveMessagesData({ conversations: [{ ...conversation, deletedAt: new Date().toISOString() }] });
 
     return NextResponse.json({ 
       success: true,
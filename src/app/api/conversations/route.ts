@@ -1,10 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const MESSAGES_FILE = path.join(process.cwd(), 'data', 'messages.json');
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
-const PROFILES_FILE = path.join(process.cwd(), 'data', 'user-profiles.json');
+import { countOf, findMany, putRecords } from '@/lib/data-store';
+import { createParticipantResolver } from '@/lib/messages/participants';
+import { timed, withTiming } from '@/lib/timing';
 
 interface Message {
   id: string;
@@ -30,112 +27,24 @@ interface MessagesData {
   conversations: Conversation[];
 }
 
-interface User {
-  id: string;
-  email: string;
-  name: string;
-  role: string;
-  studioId?: string; // Added for studio users
-}
-
-interface UserProfile {
-  id: string;
-  name: string;
-  profileImage?: string;
-}
-
 function generateId(): string {
   return Date.now().toString() + Math.random().toString(36).substr(2, 9);
 }
 
-// Helper function to get user info with profile data
-function getUserInfo(userId: string): { id: string; name: string; email: string; role: string; profileImage?: string; slug?: string; type?: string } | null {
+// Writes only the given (new or changed) records; both collections commit together
+async function saveMessagesData(changes: Partial<MessagesData>): Promise<void> {
   try {
-    // Get basic user info
-    let users: User[] = [];
-    if (fs.existsSync(USERS_FILE)) {
-      const usersData = fs.readFileSync(USERS_FILE, 'utf8');
-      users = JSON.parse(usersData);
-    }
-    
-    const user = users.find(u => u.id === userId);
-    if (!user) return null;
-
-    // Get profile info for avatar
-    let profiles: UserProfile[] = [];
-    if (fs.existsSync(PROFILES_FILE)) {
-      const profilesData = fs.readFileSync(PROFILES_FILE, 'utf8');
-      profiles = JSON.parse(profilesData);
-    }
-    
-    const profile = profiles.find(p => p.id === userId);
-    
-    // If user is a studio, get studio information
-    if (user.role === 'studio' && user.studioId) {
-      try {
-        const STUDIOS_FILE = path.join(process.cwd(), 'data', 'studios.json');
-        if (fs.existsSync(STUDIOS_FILE)) {
-          const studiosData = fs.readFileSync(STUDIOS_FILE, 'utf8');
-          const studioDataObj = JSON.parse(studiosData);
-          const studios = studioDataObj.studios || [];
-          
-          const studio = studios.find((s: any) => s.id === user.studioId);
-          if (studio) {
-            return {
-              id: user.id,
-              name: studio.name || user.name,
-              email: user.email,
-              role: user.role,
-              profileImage: studio.profileImage || profile?.profileImage,
-              slug: studio.slug,
-              type: 'studio'
-            };
-          }
-        }
-      } catch (error) {
-        console.error('Error fetching studio info for user:', userId, error);
-      }
-    }
-    
-    return {
-      id: user.id,
-      name: user.name,
-      email: user.email,
-      role: user.role,
-      profileImage: profile?.profileImage,
-      type: user.role === 'studio' ? 'studio' : 'artist'
-    };
-  } catch (error) {
-    console.error('Error getting user info:', error);
-    return null;
-  }
-}
-
-function getMessagesData(): MessagesData {
-  try {
-    if (!fs.existsSync(MESSAGES_FILE)) {
-      const initialData: MessagesData = { messages: [], conversations: [] };
-      fs.writeFileSync(MESSAGES_FILE, JSON.stringify(initialData, null, 2));
-      return initialData;
-    }
-    const data = fs.readFileSync(MESSAGES_FILE, 'utf8');
-    return JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading messages:', error);
-    return { messages: [], conversations: [] };
-  }
-}
-
-function saveMessagesData(data: MessagesData): void {
-  try {
-    fs.writeFileSync(MESSAGES_FILE, JSON.stringify(data, null, 2));
+    await putRecords(changes);
   } catch (error) {
     console.error('Error saving messages:', error);
+    throw error;
   }
 }
 
 // GET /api/conversations?userId=xxx - Get all conversations for a user with participant info
-export async function GET(request: NextRequest) {
+export const GET = withTiming('GET /api/conversations', listConversations);
+
+async function listConversations(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url);
     const userId = searchParams.get('userId');
@@ -147,39 +56,35 @@ export async function GET(request: NextRequest) {
       );
     }
 
-    const data = getMessagesData();
-    
     // Get conversations where user is a participant and not deleted
-    const userConversations = data.conversations
-      .filter(conv => conv.participants.includes(userId) && !conv.deletedAt)
-      .sort((a, b) => new Date(b.updatedAt).getTime() - new Date(a.updatedAt).getTime())
-      .map(conv => {
-        // Get participant info for each conversation
-        const participantsInfo = conv.participants.map(participantId => {
-          const userInfo = getUserInfo(participantId);
-          return userInfo || {
-            id: participantId,
-            name: 'Unknown User',
-            email: '',
-            role: 'artist',
-            profileImage: undefined
-          };
-        });
-
-        // Find the other participant (not the current user)
-        const other = participantsInfo.find(p => p.id !== userId) || null;
-
-        return {
-          ...conv,
-          unreadCount: conv.unreadCount[userId] || 0,
-          participantsInfo,
-          other
-        };
-      });
+    const conversations = (findMany('conversations', 'userId', userId) as Conversation[])
+      .filter(conv => !conv.deletedAt)
+      .sort((a, b) => new Date(b.updatedAt).getTime() - new Date(a.updatedAt).getTime());
+
+    // Resolve every participant across all conversations in one pass
+    const participants = createParticipantResolver();
+    participants.load(conversations.flatMap(conv => conv.participants));
+
+    const userConversations = conversations.map(conv => {
+      const participantsInfo = conv.participants.map(participantId => participants.getOrUnknown(participantId));
+
+      // Find the other participant (not the current user)
+      const other = participantsInfo.find(p => p.id !== userId) || null;
+
+      return {
+        ...conv,
+        // Counted from the unread-message index rather than the stored counter
+        unreadCount: countOf('messages', 'unreadByConversation', `${userId}:${conv.id}`),
+        participantsInfo,
+        other
+      };
+    });
 
-    return NextResponse.json({ 
-      conversations: userConversations 
-    }, { status: 200 });
+    const totalUnread = countOf('messages', 'unreadByReceiver', userId);
+    return timed('serialize', () => NextResponse.json({
+      conversations: userConversations,
+      totalUnread
+    }, { status: 200 }));
 
   } catch (error) {
     console.error('GET conversations error:', error);
@@ -211,8 +116,10 @@ export async function POST(request: NextRequest) {
     }
 
     // Validate that both users exist
-    const senderInfo = getUserInfo(senderId);
-    const receiverInfo = getUserInfo(receiverId);
+    const participants = createParticipantResolver();
+    participants.load([senderId, receiverId]);
+    const senderInfo = participants.get(senderId);
+    const receiverInfo = participants.get(receiverId);
     
     if (!senderInfo || !receiverInfo) {
       return NextResponse.json(
@@ -221,11 +128,9 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    const data = getMessagesData();
-    
     // Check if conversation already exists
-    let conversation = data.conversations.find(conv => 
-      conv.participants.includes(senderId) && conv.participants.includes(receiverId)
+    let conversation: Conversation | undefined = findMany('conversations', 'userId', senderId).find(conv => 
+      conv.participants.includes(receiverId)
     );
 
     if (!conversation) {
@@ -236,8 +141,7 @@ export async function POST(request: NextRequest) {
         updatedAt: new Date().toISOString(),
         unreadCount: { [senderId]: 0, [receiverId]: 0 }
       };
-      data.conversations.push(conversation);
-      saveMessagesData(data);
+      await saveMessagesData({ conversations: [conversation] });
     }
 
     // Add participant info to response
@@ -0,0 +1,98 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { findById } from '@/lib/data-store';
+import { publish, subscribe } from '@/lib/realtime/event-hub';
+import { sessionUserId } from '@/lib/session-token';
+
+// GET /api/events?userId=xxx&token=yyy - Server-sent event stream of the caller's real-time events.
+// EventSource can't set headers, so the session token may come as a query parameter
+export async function GET(request: NextRequest) {
+  const { searchParams } = new URL(request.url);
+  const userId = searchParams.get('userId');
+
+  if (!userId) {
+    return NextResponse.json(
+      { error: 'User ID is required' },
+      { status: 400 }
+    );
+  }
+
+  const callerId = sessionUserId(request);
+  if (!callerId) {
+    return NextResponse.json(
+      { error: 'Authentication required' },
+      { status: 401 }
+    );
+  }
+  if (callerId !== userId) {
+    return NextResponse.json(
+      { error: 'Access denied' },
+      { status: 403 }
+    );
+  }
+
+  // EventSource sends Last-Event-ID on its own retries; our client passes it explicitly
+  const lastEventId = request.headers.get('last-event-id') || searchParams.get('lastEventId');
+  const stream = subscribe(userId, { lastEventId, signal: request.signal });
+
+  return new Response(stream, {
+    headers: {
+      'Content-Type': 'text/event-stream; charset=utf-8',
+      'Cache-Control': 'no-cache, no-transform',
+      'Connection': 'keep-alive',
+      // Stop reverse proxies from buffering the stream
+      'X-Accel-Buffering': 'no'
+    }
+  });
+}
+
+// POST /api/events - Relay a client event (typing indicators) to the other participants
+export async function POST(request: NextRequest) {
+  try {
+    const body = await request.json();
+    const { type, conversationId, userId, data } = body;
+
+    if (type !== 'user_typing') {
+      return NextResponse.json(
+        { error: 'Unsupported event type' },
+        { status: 400 }
+      );
+    }
+
+    if (!conversationId || !userId) {
+      return NextResponse.json(
+        { error: 'conversationId and userId are required' },
+        { status: 400 }
+      );
+    }
+
+    // Only the signed-in user can announce their own typing
+    if (sessionUserId(request) !== userId) {
+      return NextResponse.json(
+        { error: 'Access denied' },
+        { status: 403 }
+      );
+    }
+
+    const conversation = findById('conversations', conversationId);
+    if (!conversation || !conversation.participants.includes(userId) || conversation.deletedAt) {
+      return NextResponse.json(
+        { error: 'Conversation not found or access denied' },
+        { status: 404 }
+      );
+    }
+
+    publish(conversation.participants.filter((id: string) => id !== userId), {
+      type: 'user_typing',
+      conversationId,
+      data: { userId, isTyping: data?.isTyping !== false }
+    });
+
+    return NextResponse.json({ success: true }, { status: 202 });
+  } catch (error) {
+    console.error('POST events error:', error);
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    );
+  }
+}
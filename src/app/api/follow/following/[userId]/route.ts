@@ -1,49 +1,18 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const FOLLOWS_FILE = path.join(process.cwd(), 'data', 'follows.json');
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
-const STUDIOS_FILE = path.join(process.cwd(), 'data', 'studios.json');
-
-// Read follows from file
-function getFollows(): any {
-  try {
-    if (!fs.existsSync(FOLLOWS_FILE)) {
-      return { follows: [] };
-    }
-    const data = fs.readFileSync(FOLLOWS_FILE, 'utf8');
-    return JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading follows file:', error);
-    return { follows: [] };
-  }
-}
-
-// Read users from file
-function getUsers(): any[] {
-  try {
-    if (!fs.existsSync(USERS_FILE)) {
-      return [];
-    }
-    const data = fs.readFileSync(USERS_FILE, 'utf8');
-    return Array.isArray(data) ? data : JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading users file:', error);
-    return [];
-  }
-}
+import { findById } from '@/lib/data-store';
+import { followingIds } from '@/lib/follows/follow-graph';
+import { imageVariantUrl } from '@/lib/images/variants';
 
 // Enhanced function to get user info with studio data
-function getUserInfoWithStudio(userId: string, users: any[], studios: any[]): any {
+function getUserInfoWithStudio(userId: string): any {
   // First check if it's a studio directly
-  const studio = studios.find((s: any) => s.id === userId);
+  const studio = findById('studios', userId);
   if (studio) {
     return {
       id: studio.id,
       name: studio.name,
       type: 'studio',
-      profileImage: studio.profileImage,
+      profileImage: imageVariantUrl(studio.profileImage, 'thumb'),
       location: studio.location,
       rating: studio.rating,
       slug: studio.slug
@@ -51,17 +20,17 @@ function getUserInfoWithStudio(userId: string, users: any[], studios: any[]): an
   }
 
   // Then check if it's a user
-  const user = users.find((u: any) => u.id === userId);
+  const user = findById('users', userId);
   if (user) {
     // If user is a studio role, get studio information
     if (user.role === 'studio' && user.studioId) {
-      const userStudio = studios.find((s: any) => s.id === user.studioId);
+      const userStudio = findById('studios', user.studioId);
       if (userStudio) {
         return {
           id: user.id,
           name: userStudio.name || user.name,
           type: 'studio',
-          profileImage: userStudio.profileImage || user.profileImage,
+          profileImage: imageVariantUrl(userStudio.profileImage || user.profileImage, 'thumb'),
           location: userStudio.location || user.location,
           rating: userStudio.rating,
           slug: userStudio.slug || user.slug
@@ -74,7 +43,7 @@ function getUserInfoWithStudio(userId: string, users: any[], studios: any[]): an
       id: user.id,
       name: user.name,
       type: user.role === 'studio' ? 'studio' : 'user',
-      profileImage: user.profileImage,
+      profileImage: imageVariantUrl(user.profileImage, 'thumb'),
       location: user.location,
       slug: user.slug
     };
@@ -91,21 +60,6 @@ function getUserInfoWithStudio(userId: string, users: any[], studios: any[]): an
   };
 }
 
-// Read studios from file
-function getStudios(): any[] {
-  try {
-    if (!fs.existsSync(STUDIOS_FILE)) {
-      return [];
-    }
-    const data = fs.readFileSync(STUDIOS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    return parsed.studios || [];
-  } catch (error) {
-    console.error('Error reading studios file:', error);
-    return [];
-  }
-}
-
 export async function GET(
   request: NextRequest,
   { params }: { params: Promise<{ userId: string }> }
@@ -120,28 +74,8 @@ export async function GET(
       );
     }
 
-    const followsData = getFollows();
-    
-    // Handle both old and new data formats
-    let follows = followsData.follows || followsData || [];
-    
-    // If it's an array directly (new format), use it as is
-    if (Array.isArray(followsData)) {
-      follows = followsData;
-    }
-    
-    const users = getUsers();
-    const studios = getStudios();
-
     // Get all users/studios this user is following
-    const userFollows = follows.filter((follow: any) => follow.followerId === userId);
-
-    const following = userFollows.map((follow: any) => {
-      // Support both followedId and followingId property names
-      const targetId = follow.followingId || follow.followedId;
-      
-      return getUserInfoWithStudio(targetId, users, studios);
-    });
+    const following = followingIds(userId).map(getUserInfoWithStudio);
 
     return NextResponse.json({ following });
   } catch (error) {
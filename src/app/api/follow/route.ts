@@ -1,49 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const FOLLOWS_FILE = path.join(process.cwd(), 'data', 'follows.json');
-
-interface Follow {
-  followerId: string;
-  followingId: string;
-  createdAt: string;
-}
-
-// Ensure data directory exists
-function ensureDataDir() {
-  const dataDir = path.join(process.cwd(), 'data');
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-}
-
-// Read follows from file
-function getFollows(): Follow[] {
-  ensureDataDir();
-  try {
-    if (!fs.existsSync(FOLLOWS_FILE)) {
-      fs.writeFileSync(FOLLOWS_FILE, '[]');
-      return [];
-    }
-    const data = fs.readFileSync(FOLLOWS_FILE, 'utf8');
-    return JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading follows file:', error);
-    return [];
-  }
-}
-
-// Save follows to file
-function saveFollows(follows: Follow[]): void {
-  ensureDataDir();
-  try {
-    fs.writeFileSync(FOLLOWS_FILE, JSON.stringify(follows, null, 2));
-  } catch (error) {
-    console.error('Error saving follows file:', error);
-    throw new Error('Failed to save follows');
-  }
-}
+import { follow, followersCount, followingCount, isFollowing as checkFollowing, unfollow } from '@/lib/follows/follow-graph';
 
 // POST /api/follow - Toggle follow/unfollow
 export async function POST(request: NextRequest) {
@@ -68,47 +24,27 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    const follows = getFollows();
-    
-    // Check if already following
-    const existingFollowIndex = follows.findIndex(
-      f => f.followerId === followerId && f.followingId === followingId
-    );
-
     let action: string;
     let isFollowing: boolean;
 
-    if (existingFollowIndex !== -1) {
-      // Already following, so unfollow
-      follows.splice(existingFollowIndex, 1);
+    // Already following, so unfollow; otherwise follow
+    if (checkFollowing(followerId, followingId)) {
+      await unfollow(followerId, followingId);
       action = 'unfollowed';
       isFollowing = false;
     } else {
-      // Not following, so follow
-      const newFollow: Follow = {
-        followerId,
-        followingId,
-        createdAt: new Date().toISOString()
-      };
-      follows.push(newFollow);
+      await follow(followerId, followingId);
       action = 'followed';
       isFollowing = true;
     }
 
-    saveFollows(follows);
-
-    // Calculate updated follower counts
-    // followersCount: how many people follow the target (followingId)
-    // followingCount: how many people the target (followingId) follows
-    const followersCount = follows.filter(f => f.followingId === followingId).length;
-    const followingCount = follows.filter(f => f.followerId === followingId).length;
-
     return NextResponse.json({ 
       success: true,
       action,
       isFollowing,
-      followersCount,
-      followingCount
+      // How many people follow the target, and how many the target follows
+      followersCount: followersCount(followingId),
+      followingCount: followingCount(followingId)
     }, { status: 200 });
   } catch (error) {
     console.error('POST follow error:', error);
@@ -133,22 +69,14 @@ export async function DELETE(request: NextRequest) {
       );
     }
 
-    const follows = getFollows();
-    
-    // Find and remove the follow
-    const followIndex = follows.findIndex(
-      f => f.followerId === followerId && f.followingId === followingId
-    );
-
-    if (followIndex === -1) {
+    if (!checkFollowing(followerId, followingId)) {
       return NextResponse.json(
         { error: 'Follow relationship not found' },
         { status: 404 }
       );
     }
 
-    follows.splice(followIndex, 1);
-    saveFollows(follows);
+    await unfollow(followerId, followingId);
 
     return NextResponse.json({ success: true }, { status: 200 });
   } catch (error) {
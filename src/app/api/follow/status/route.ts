@@ -1,35 +1,31 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const FOLLOWS_FILE = path.join(process.cwd(), 'data', 'follows.json');
-
-interface Follow {
-  followerId: string;
-  followingId: string;
-  createdAt: string;
-}
-
-// Read follows from file
-function getFollows(): Follow[] {
-  try {
-    if (!fs.existsSync(FOLLOWS_FILE)) {
-      return [];
-    }
-    const data = fs.readFileSync(FOLLOWS_FILE, 'utf8');
-    return JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading follows file:', error);
-    return [];
-  }
-}
+import { followStatus, followStatuses, MAX_STATUS_BATCH } from '@/lib/follows/follow-graph';
+import { timed, withTiming } from '@/lib/timing';
 
 // GET /api/follow/status - Get follow status between two users
-export async function GET(request: NextRequest) {
+// With targetIds (comma-separated) instead of targetId, answers for every target
+// in one request: { statuses: { [targetId]: { isFollowing, followersCount, followingCount } } }
+export const GET = withTiming('GET /api/follow/status', getFollowStatus);
+
+async function getFollowStatus(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url);
     const followerId = searchParams.get('followerId');
     const targetId = searchParams.get('targetId');
+    const targetIds = searchParams.get('targetIds');
+
+    if (targetIds !== null) {
+      const ids = Array.from(new Set(targetIds.split(',').map(id => id.trim()).filter(Boolean)));
+      if (ids.length > MAX_STATUS_BATCH) {
+        return NextResponse.json(
+          { error: `At most ${MAX_STATUS_BATCH} targetIds can be requested at once` },
+          { status: 400 }
+        );
+      }
+
+      const statuses = followStatuses(followerId, ids);
+      return timed('serialize', () => NextResponse.json({ statuses }, { status: 200 }));
+    }
 
     if (!followerId || !targetId) {
       return NextResponse.json(
@@ -38,22 +34,8 @@ export async function GET(request: NextRequest) {
       );
     }
 
-    const follows = getFollows();
-    
-    // Check if followerId is following targetId
-    const isFollowing = follows.some(
-      f => f.followerId === followerId && f.followingId === targetId
-    );
-
-    // Get follower and following counts for targetId
-    const followersCount = follows.filter(f => f.followingId === targetId).length;
-    const followingCount = follows.filter(f => f.followerId === targetId).length;
-
-    return NextResponse.json({
-      isFollowing,
-      followersCount,
-      followingCount
-    }, { status: 200 });
+    const status = followStatus(followerId, targetId);
+    return timed('serialize', () => NextResponse.json(status, { status: 200 }));
   } catch (error) {
     console.error('GET follow status error:', error);
     return NextResponse.json(
@@ -61,4 +43,4 @@ export async function GET(request: NextRequest) {
       { status: 500 }
     );
   }
-} 
\ No newline at end of file
+}
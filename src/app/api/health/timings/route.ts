@@ -0,0 +1,31 @@
+import { NextResponse } from 'next/server';
+import { resetRouteTimings, routeTimings } from '@/lib/timing';
+
+// Route timings reveal traffic patterns, so production only serves them with ENABLE_TIMINGS_ENDPOINT=true
+function timingsEnabled(): boolean {
+  return process.env.NODE_ENV !== 'production' || process.env.ENABLE_TIMINGS_ENDPOINT === 'true';
+}
+
+function notFound() {
+  return NextResponse.json(
+    { error: 'Not found' },
+    { status: 404 }
+  );
+}
+
+// GET /api/health/timings - Latency histograms (ms) per timed route and phase since start or the last reset
+export async function GET() {
+  if (!timingsEnabled()) return notFound();
+
+  return NextResponse.json({ timings: routeTimings(), timestamp: new Date().toISOString() });
+}
+
+// POST /api/health/timings - Return the histograms and clear them (the load harness does this between scenarios)
+export async function POST() {
+  if (!timingsEnabled()) return notFound();
+
+  const timings = routeTimings();
+  resetRouteTimings();
+
+  return NextResponse.json({ timings, timestamp: new Date().toISOString() });
+}
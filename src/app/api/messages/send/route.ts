@@ -1,10 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const MESSAGES_FILE = path.join(process.cwd(), 'data', 'messages.json');
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
-const PROFILES_FILE = path.join(process.cwd(), 'data', 'user-profiles.json');
+import { findById, putRecords } from '@/lib/data-store';
+import { createParticipantResolver } from '@/lib/messages/participants';
+import { notifyMessageCreated } from '@/lib/realtime/notifications';
 
 interface Message {
   id: string;
@@ -32,106 +29,17 @@ interface MessagesData {
   conversations: Conversation[];
 }
 
-interface User {
-  id: string;
-  email: string;
-  name: string;
-  role: string;
-  studioId?: string; // Added for studio users
-}
-
-interface UserProfile {
-  id: string;
-  name: string;
-  profileImage?: string;
-}
-
 function generateId(): string {
   return Date.now().toString() + Math.random().toString(36).substr(2, 9);
 }
 
-// Helper function to get user info with profile data
-function getUserInfo(userId: string): { id: string; name: string; email: string; role: string; profileImage?: string; type?: string } | null {
-  try {
-    // Get basic user info
-    let users: User[] = [];
-    if (fs.existsSync(USERS_FILE)) {
-      const usersData = fs.readFileSync(USERS_FILE, 'utf8');
-      users = JSON.parse(usersData);
-    }
-    
-    const user = users.find(u => u.id === userId);
-    if (!user) return null;
-
-    // Get profile info for avatar
-    let profiles: UserProfile[] = [];
-    if (fs.existsSync(PROFILES_FILE)) {
-      const profilesData = fs.readFileSync(PROFILES_FILE, 'utf8');
-      profiles = JSON.parse(profilesData);
-    }
-    
-    const profile = profiles.find(p => p.id === userId);
-    
-    // If user is a studio, get studio information
-    if (user.role === 'studio' && user.studioId) {
-      try {
-        const STUDIOS_FILE = path.join(process.cwd(), 'data', 'studios.json');
-        if (fs.existsSync(STUDIOS_FILE)) {
-          const studiosData = fs.readFileSync(STUDIOS_FILE, 'utf8');
-          const studioDataObj = JSON.parse(studiosData);
-          const studios = studioDataObj.studios || [];
-          
-          const studio = studios.find((s: any) => s.id === user.studioId);
-          if (studio) {
-            return {
-              id: user.id,
-              name: studio.name || user.name,
-              email: user.email,
-              role: user.role,
-              profileImage: studio.profileImage || profile?.profileImage,
-              type: 'studio'
-            };
-          }
-        }
-      } catch (error) {
-        console.error('Error fetching studio info for user:', userId, error);
-      }
-    }
-    
-    return {
-      id: user.id,
-      name: user.name,
-      email: user.email,
-      role: user.role,
-      profileImage: profile?.profileImage,
-      type: user.role === 'studio' ? 'studio' : 'artist'
-    };
-  } catch (error) {
-    console.error('Error getting user info:', error);
-    return null;
-  }
-}
-
-function getMessagesData(): MessagesData {
-  try {
-    if (!fs.existsSync(MESSAGES_FILE)) {
-      const initialData: MessagesData = { messages: [], conversations: [] };
-      fs.writeFileSync(MESSAGES_FILE, JSON.stringify(initialData, null, 2));
-      return initialData;
-    }
-    const data = fs.readFileSync(MESSAGES_FILE, 'utf8');
-    return JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading messages:', error);
-    return { messages: [], conversations: [] };
-  }
-}
-
-function saveMessagesData(data: MessagesData): void {
+// Writes only the given (new or changed) records; both collections commit together
+async function saveMessagesData(changes: Partial<MessagesData>): Promise<void> {
   try {
-    fs.writeFileSync(MESSAGES_FILE, JSON.stringify(data, null, 2));
+    await putRecords(changes);
   } catch (error) {
     console.error('Error saving messages:', error);
+    throw error;
   }
 }
 
@@ -165,8 +73,11 @@ export async function POST(request: NextRequest) {
       );
     }
 
+    const participants = createParticipantResolver();
+    participants.load([senderId, receiverId]);
+
     // Validate that sender exists
-    const senderInfo = getUserInfo(senderId);
+    const senderInfo = participants.get(senderId);
     if (!senderInfo) {
       return NextResponse.json(
         { error: 'Sender not found' },
@@ -175,7 +86,7 @@ export async function POST(request: NextRequest) {
     }
 
     // Validate that receiver exists
-    const receiverInfo = getUserInfo(receiverId);
+    const receiverInfo = participants.get(receiverId);
     if (!receiverInfo) {
       return NextResponse.json(
         { error: 'Receiver not found' },
@@ -183,14 +94,10 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    const data = getMessagesData();
-    
     // Verify conversation exists and user is a participant
-    const conversation = data.conversations.find(conv => 
-      conv.id === conversationId && conv.participants.includes(senderId)
-    );
+    const conversation: Conversation | null = findById('conversations', conversationId);
 
-    if (!conversation) {
+    if (!conversation || !conversation.participants.includes(senderId)) {
       return NextResponse.json(
         { error: 'Conversation not found or access denied' },
         { status: 404 }
@@ -213,14 +120,15 @@ export async function POST(request: NextRequest) {
       })
     };
 
-    data.messages.push(newMessage);
-
     // Update conversation
-    conversation.lastMessage = newMessage;
-    conversation.updatedAt = newMessage.timestamp;
-    conversation.unreadCount[receiverId] = (conversation.unreadCount[receiverId] || 0) + 1;
+    const updatedConversation: Conversation = {
+      ...conversation,
+      lastMessage: newMessage,
+      updatedAt: newMessage.timestamp,
+      unreadCount: { ...conversation.unreadCount, [receiverId]: (conversation.unreadCount[receiverId] || 0) + 1 }
+    };
 
-    saveMessagesData(data);
+    await saveMessagesData({ messages: [newMessage], conversations: [updatedConversation] });
 
     // Return message with sender info for immediate UI update
     const messageWithSenderInfo = {
@@ -228,6 +136,9 @@ export async function POST(request: NextRequest) {
       senderInfo: senderInfo
     };
 
+    // Push the message to both participants' open inboxes
+    notifyMessageCreated(updatedConversation, messageWithSenderInfo);
+
     return NextResponse.json({
       message: 'Message sent successfully',
       data: messageWithSenderInfo
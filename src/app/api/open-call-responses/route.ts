@@ -1,8 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const OPEN_CALLS_FILE = path.join(process.cwd(), 'data', 'open-calls.json');
+import { getCollection } from '@/lib/data-store';
 
 // Type definitions
 interface OpenCallResponse {
@@ -18,31 +15,6 @@ interface OpenCallResponse {
   status: string;
 }
 
-// Ensure data directory exists
-function ensureDataDir() {
-  const dataDir = path.dirname(OPEN_CALLS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-}
-
-// Read open calls from file
-function getOpenCalls(): any[] {
-  ensureDataDir();
-  try {
-    if (!fs.existsSync(OPEN_CALLS_FILE)) {
-      fs.writeFileSync(OPEN_CALLS_FILE, JSON.stringify({ openCalls: [] }, null, 2));
-      return [];
-    }
-    const data = fs.readFileSync(OPEN_CALLS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    return parsed.openCalls || [];
-  } catch (error) {
-    console.error('Error reading open calls file:', error);
-    return [];
-  }
-}
-
 export async function GET(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url);
@@ -56,7 +28,7 @@ export async function GET(request: NextRequest) {
     }
 
     // Get all open calls
-    const openCalls = getOpenCalls();
+    const openCalls = getCollection('openCalls');
     
     // Filter open calls posted by this studio and collect all responses
     const studioOpenCalls = openCalls.filter(call => 
@@ -1,45 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
 import { findUserById } from '@/lib/user-store';
-
-const OPEN_CALLS_FILE = path.join(process.cwd(), 'data', 'open-calls.json');
-
-// Ensure data directory exists
-function ensureDataDir() {
-  const dataDir = path.dirname(OPEN_CALLS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-}
-
-// Read open calls from file
-function getOpenCalls(): any[] {
-  ensureDataDir();
-  try {
-    if (!fs.existsSync(OPEN_CALLS_FILE)) {
-      fs.writeFileSync(OPEN_CALLS_FILE, JSON.stringify({ openCalls: [] }, null, 2));
-      return [];
-    }
-    const data = fs.readFileSync(OPEN_CALLS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    return parsed.openCalls || [];
-  } catch (error) {
-    console.error('Error reading open calls file:', error);
-    return [];
-  }
-}
-
-// Write open calls to file
-function saveOpenCalls(openCalls: any[]): void {
-  ensureDataDir();
-  try {
-    fs.writeFileSync(OPEN_CALLS_FILE, JSON.stringify({ openCalls }, null, 2));
-  } catch (error) {
-    console.error('Error saving open calls file:', error);
-    throw new Error('Failed to save open calls data');
-  }
-}
+import { findById, putRecords } from '@/lib/data-store';
 
 export async function POST(
   request: NextRequest,
@@ -67,12 +28,9 @@ export async function POST(
       );
     }
 
-    // Get existing open calls
-    const openCalls = getOpenCalls();
-    
     // Find the specific open call
-    const callIndex = openCalls.findIndex(call => call.id === id);
-    if (callIndex === -1) {
+    const openCall = findById('openCalls', id);
+    if (!openCall) {
       return NextResponse.json(
         { error: 'Open call not found' },
         { status: 404 }
@@ -80,7 +38,7 @@ export async function POST(
     }
 
     // Check if user already applied
-    const existingApplication = openCalls[callIndex].applicants?.find(
+    const existingApplication = openCall.applicants?.find(
       (applicant: any) => applicant.userId === userId
     );
 
@@ -103,13 +61,9 @@ export async function POST(
     };
 
     // Add application to the open call
-    if (!openCalls[callIndex].applicants) {
-      openCalls[callIndex].applicants = [];
-    }
-    openCalls[callIndex].applicants.push(newApplication);
-
-    // Save updated open calls
-    saveOpenCalls(openCalls);
+    await putRecords({
+      openCalls: [{ ...openCall, applicants: [...(openCall.applicants || []), newApplication] }]
+    });
 
     return NextResponse.json({
       message: 'Application submitted successfully',
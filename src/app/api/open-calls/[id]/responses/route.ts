@@ -1,44 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const OPEN_CALLS_FILE = path.join(process.cwd(), 'data', 'open-calls.json');
-
-// Ensure data directory exists
-function ensureDataDir() {
-  const dataDir = path.dirname(OPEN_CALLS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-}
-
-// Read open calls from file
-function getOpenCalls(): any[] {
-  ensureDataDir();
-  try {
-    if (!fs.existsSync(OPEN_CALLS_FILE)) {
-      fs.writeFileSync(OPEN_CALLS_FILE, JSON.stringify({ openCalls: [] }, null, 2));
-      return [];
-    }
-    const data = fs.readFileSync(OPEN_CALLS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    return parsed.openCalls || [];
-  } catch (error) {
-    console.error('Error reading open calls file:', error);
-    return [];
-  }
-}
-
-// Write open calls to file
-function saveOpenCalls(openCalls: any[]): void {
-  ensureDataDir();
-  try {
-    fs.writeFileSync(OPEN_CALLS_FILE, JSON.stringify({ openCalls }, null, 2));
-  } catch (error) {
-    console.error('Error saving open calls file:', error);
-    throw new Error('Failed to save open calls data');
-  }
-}
+import { findById, putRecords } from '@/lib/data-store';
 
 export async function GET(
   request: NextRequest,
@@ -47,11 +8,8 @@ export async function GET(
   try {
     const { id } = await params;
     
-    // Get existing open calls
-    const openCalls = getOpenCalls();
-    
     // Find the specific open call
-    const openCall = openCalls.find(call => call.id === id);
+    const openCall = findById('openCalls', id);
     if (!openCall) {
       return NextResponse.json(
         { error: 'Open call not found' },
@@ -88,12 +46,9 @@ export async function POST(
       );
     }
 
-    // Get existing open calls
-    const openCalls = getOpenCalls();
-    
     // Find the specific open call
-    const callIndex = openCalls.findIndex(call => call.id === id);
-    if (callIndex === -1) {
+    const openCall = findById('openCalls', id);
+    if (!openCall) {
       return NextResponse.json(
         { error: 'Open call not found' },
         { status: 404 }
@@ -101,7 +56,7 @@ export async function POST(
     }
 
     // Check if user already responded
-    const existingResponse = openCalls[callIndex].applicants?.find(
+    const existingResponse = openCall.applicants?.find(
       (applicant: any) => applicant.userId === responderId
     );
 
@@ -123,13 +78,9 @@ export async function POST(
     };
 
     // Add response to the open call
-    if (!openCalls[callIndex].applicants) {
-      openCalls[callIndex].applicants = [];
-    }
-    openCalls[callIndex].applicants.push(newResponse);
-
-    // Save updated open calls
-    saveOpenCalls(openCalls);
+    await putRecords({
+      openCalls: [{ ...openCall, applicants: [...(openCall.applicants || []), newResponse] }]
+    });
 
     return NextResponse.json({
       message: 'Response submitted successfully',
@@ -1,40 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
 import { findUserById } from '@/lib/user-store';
-
-const OPEN_CALLS_FILE = path.join(process.cwd(), 'data', 'open-calls.json');
-
-// Ensure data directory exists
-function ensureDataDir() {
-  const dataDir = path.dirname(OPEN_CALLS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-}
-
-// Read open calls from file
-function getOpenCalls(): any[] {
-  ensureDataDir();
-  try {
-    if (!fs.existsSync(OPEN_CALLS_FILE)) {
-      fs.writeFileSync(OPEN_CALLS_FILE, JSON.stringify({ openCalls: [] }, null, 2));
-      return [];
-    }
-    const data = fs.readFileSync(OPEN_CALLS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    
-    // Handle both old format (direct array) and new format (object with openCalls property)
-    if (Array.isArray(parsed)) {
-      return parsed;
-    } else {
-      return parsed.openCalls || [];
-    }
-  } catch (error) {
-    console.error('Error reading open calls file:', error);
-    return [];
-  }
-}
+import { findMany } from '@/lib/data-store';
 
 export async function GET(request: NextRequest) {
   try {
@@ -48,11 +14,9 @@ export async function GET(request: NextRequest) {
       );
     }
 
-    const openCalls = getOpenCalls();
-    
     // Find open calls posted by this user that have applications
-    const userOpenCallsWithApplications = openCalls
-      .filter(call => call.createdBy === userId && call.applicants && call.applicants.length > 0)
+    const userOpenCallsWithApplications = findMany('openCalls', 'createdBy', userId)
+      .filter(call => call.applicants && call.applicants.length > 0)
       .map(call => {
         // Enhance applicants with actual user data
         const enhancedApplicants = (call.applicants || []).map((applicant: any) => {
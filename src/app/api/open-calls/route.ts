@@ -1,79 +1,15 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-import { findUserById, getUsers } from '@/lib/user-store';
-
-const OPEN_CALLS_FILE = path.join(process.cwd(), 'data', 'open-calls.json');
-const STUDIOS_FILE = path.join(process.cwd(), 'data', 'studios.json');
-
-// Ensure data directory exists
-function ensureDataDir() {
-  const dataDir = path.dirname(OPEN_CALLS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-}
-
-// Read studios from file
-function getStudios(): any[] {
-  try {
-    if (!fs.existsSync(STUDIOS_FILE)) {
-      return [];
-    }
-    const data = fs.readFileSync(STUDIOS_FILE, 'utf8');
-    return JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading studios file:', error);
-    return [];
-  }
-}
+import { findUserById } from '@/lib/user-store';
+import { findById, findOne, getCollection, putRecords } from '@/lib/data-store';
 
 // Find studio by ID
 function findStudioById(studioId: string): any | null {
-  const studios = getStudios();
-  return studios.find(studio => studio.id === studioId) || null;
-}
-
-// Read open calls from file
-function getOpenCalls(): any[] {
-  ensureDataDir();
-  try {
-    if (!fs.existsSync(OPEN_CALLS_FILE)) {
-      fs.writeFileSync(OPEN_CALLS_FILE, JSON.stringify({ openCalls: [] }, null, 2));
-      return [];
-    }
-    const data = fs.readFileSync(OPEN_CALLS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    
-    // Handle both old format (direct array) and new format (object with openCalls property)
-    if (Array.isArray(parsed)) {
-      // Old format - direct array
-      return parsed;
-    } else {
-      // New format - object with openCalls property
-      return parsed.openCalls || [];
-    }
-  } catch (error) {
-    console.error('Error reading open calls file:', error);
-    return [];
-  }
-}
-
-// Save open calls to file
-function saveOpenCalls(openCalls: any[]): void {
-  ensureDataDir();
-  try {
-    // Always save in the new format (object with openCalls property)
-    fs.writeFileSync(OPEN_CALLS_FILE, JSON.stringify({ openCalls }, null, 2));
-  } catch (error) {
-    console.error('Error saving open calls file:', error);
-    throw new Error('Failed to save open calls data');
-  }
+  return findById('studios', studioId);
 }
 
 export async function GET() {
   try {
-    const openCalls = getOpenCalls();
+    const openCalls = getCollection('openCalls');
     
     // Enhance open calls with actual names if missing
     const enhancedCalls = openCalls.map(call => {
@@ -151,8 +87,7 @@ export async function POST(request: NextRequest) {
       if (studio) {
         posterName = studio.name;
         // Try to find the user associated with this studio
-        const users = getUsers();
-        const studioUser = users.find(user => user.studioId === createdBy);
+        const studioUser = findOne('users', 'studioId', createdBy);
         if (studioUser) {
           actualUserId = studioUser.id;
         }
@@ -188,8 +123,6 @@ export async function POST(request: NextRequest) {
       posterName = user.name;
     }
 
-    const openCalls = getOpenCalls();
-    
     // Generate open call ID
     const openCallId = `open_call_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
     
@@ -206,8 +139,7 @@ export async function POST(request: NextRequest) {
     };
     
     // Add to open calls list
-    openCalls.push(newOpenCall);
-    saveOpenCalls(openCalls);
+    await putRecords({ openCalls: [newOpenCall] });
     
     return NextResponse.json(newOpenCall, { status: 201 });
   } catch (error) {
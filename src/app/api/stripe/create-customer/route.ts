@@ -1,10 +1,11 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { findUserById, updateUserStripeCustomerId } from '@/lib/user-store';
 import { stripe } from '@/lib/stripe';
+import { log } from '@/lib/log';
 
 export async function POST(request: NextRequest) {
   try {
-    console.log('🏪 [Create-Customer] POST request received');
+    log.debug('🏪 [Create-Customer] POST request received');
 
     const { userId } = await request.json();
 
@@ -16,7 +17,7 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    console.log(`🔍 [Create-Customer] Processing request for user: ${userId}`);
+    log.debug(`🔍 [Create-Customer] Processing request for user: ${userId}`);
 
     // Get user from database
     const user = findUserById(userId);
@@ -30,14 +31,14 @@ export async function POST(request: NextRequest) {
 
     // Check if user already has a Stripe customer ID
     if (user.stripeCustomerId) {
-      console.log(`✅ [Create-Customer] User ${userId} already has Stripe customer: ${user.stripeCustomerId}`);
+      log.debug(`✅ [Create-Customer] User ${userId} already has Stripe customer: ${user.stripeCustomerId}`);
       return NextResponse.json({
         success: true,
         customerId: user.stripeCustomerId
       });
     }
 
-    console.log(`🔧 [Create-Customer] Creating new Stripe customer for user: ${userId}`);
+    log.debug(`🔧 [Create-Customer] Creating new Stripe customer for user: ${userId}`);
 
     // Create Stripe customer with error handling
     let customer;
@@ -58,12 +59,12 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    console.log(`💳 [Create-Customer] Stripe customer created: ${customer.id}`);
+    log.info(`💳 [Create-Customer] Stripe customer created: ${customer.id}`);
 
     // Update user with Stripe customer ID
     try {
-      updateUserStripeCustomerId(userId, customer.id);
-      console.log(`✅ [Create-Customer] Updated user ${userId} with customer ID: ${customer.id}`);
+      await updateUserStripeCustomerId(userId, customer.id);
+      log.info(`✅ [Create-Customer] Updated user ${userId} with customer ID: ${customer.id}`);
     } catch (updateError) {
       console.error('❌ [Create-Customer] Error updating user with customer ID:', updateError);
       // Customer was created successfully, so return success even if local update failed
@@ -1,10 +1,11 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { findUserById } from '@/lib/user-store';
 import { stripe } from '@/lib/stripe';
+import { log } from '@/lib/log';
 
 export async function POST(request: NextRequest) {
   try {
-    console.log('🔧 [Setup-Intent] POST request received');
+    log.debug('🔧 [Setup-Intent] POST request received');
     
     const { userId } = await request.json();
 
@@ -17,7 +18,7 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    console.log(`🔍 [Setup-Intent] Processing request for user: ${userId}`);
+    log.debug(`🔍 [Setup-Intent] Processing request for user: ${userId}`);
 
     // 2️⃣ Fetch user and validate Stripe customer
     const user = findUserById(userId);
@@ -37,7 +38,7 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    console.log(`🔧 [Setup-Intent] Creating setup intent for customer: ${user.stripeCustomerId}`);
+    log.debug(`🔧 [Setup-Intent] Creating setup intent for customer: ${user.stripeCustomerId}`);
 
     // 3️⃣ Create Setup Intent
     const setupIntent = await stripe.setupIntents.create({
@@ -46,7 +47,7 @@ export async function POST(request: NextRequest) {
       usage: 'off_session',
     });
 
-    console.log(`✅ [Setup-Intent] Setup intent created: ${setupIntent.id}`);
+    log.info(`✅ [Setup-Intent] Setup intent created: ${setupIntent.id}`);
 
     return NextResponse.json(
       { clientSecret: setupIntent.client_secret },
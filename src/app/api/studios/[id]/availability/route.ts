@@ -0,0 +1,73 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { findById, findOne } from '@/lib/data-store';
+import { daySpan, isValidDate, MAX_AVAILABILITY_DAYS, roomAvailability } from '@/lib/bookings/availability';
+
+function findStudio(identifier: string): any | null {
+  return findOne('studios', 'slug', identifier) || findById('studios', identifier);
+}
+
+// GET /api/studios/[id]/availability?roomId=...&from=YYYY-MM-DD&to=YYYY-MM-DD
+// Free and booked time for one room on each day in the range
+export async function GET(request: NextRequest, { params }: { params: Promise<{ id: string }> }) {
+  try {
+    const { id } = await params;
+    const { searchParams } = new URL(request.url);
+    const roomId = searchParams.get('roomId');
+    const from = searchParams.get('from');
+    const to = searchParams.get('to') || from;
+
+    if (!isValidDate(from) || !isValidDate(to) || to < from) {
+      return NextResponse.json(
+        { error: 'from and to must be dates (YYYY-MM-DD), with to on or after from' },
+        { status: 400 }
+      );
+    }
+
+    if (daySpan(from, to) > MAX_AVAILABILITY_DAYS) {
+      return NextResponse.json(
+        { error: `Date range cannot exceed ${MAX_AVAILABILITY_DAYS} days` },
+        { status: 400 }
+      );
+    }
+
+    const studio = findStudio(id);
+    if (!studio) {
+      return NextResponse.json(
+        { error: 'Studio not found' },
+        { status: 404 }
+      );
+    }
+
+    const rooms: any[] = Array.isArray(studio.rooms) ? studio.rooms : [];
+    if (rooms.length > 0) {
+      if (!roomId) {
+        return NextResponse.json(
+          { error: 'roomId is required' },
+          { status: 400 }
+        );
+      }
+      if (!rooms.some(room => room?.id === roomId)) {
+        return NextResponse.json(
+          { error: 'Room not found' },
+          { status: 404 }
+        );
+      }
+    }
+
+    const days = roomAvailability(studio, roomId, from, to);
+
+    return NextResponse.json({
+      studioId: studio.id,
+      roomId,
+      from,
+      to,
+      days
+    });
+  } catch (error) {
+    console.error('GET studio availability error:', error);
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    );
+  }
+}
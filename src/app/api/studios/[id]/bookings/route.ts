@@ -1,58 +1,11 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const BOOKINGS_FILE = path.join(process.cwd(), 'data', 'bookings.json');
-const BOOKING_REQUESTS_FILE = path.join(process.cwd(), 'data', 'booking-requests.json');
-
-// Ensure data directory exists
-function ensureDataDir() {
-  const dataDir = path.dirname(BOOKINGS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-}
-
-// Read bookings from file
-function getBookings(): any[] {
-  ensureDataDir();
-  try {
-    if (!fs.existsSync(BOOKINGS_FILE)) {
-      fs.writeFileSync(BOOKINGS_FILE, JSON.stringify({ bookings: [] }, null, 2));
-      return [];
-    }
-    const data = fs.readFileSync(BOOKINGS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    return parsed.bookings || [];
-  } catch (error) {
-    console.error('Error reading bookings file:', error);
-    return [];
-  }
-}
-
-// Read booking requests from file
-function getBookingRequests(): any[] {
-  ensureDataDir();
-  try {
-    if (!fs.existsSync(BOOKING_REQUESTS_FILE)) {
-      fs.writeFileSync(BOOKING_REQUESTS_FILE, JSON.stringify({ bookingRequests: [] }, null, 2));
-      return [];
-    }
-    const data = fs.readFileSync(BOOKING_REQUESTS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    return parsed.bookingRequests || [];
-  } catch (error) {
-    console.error('Error reading booking requests file:', error);
-    return [];
-  }
-}
 
 export async function GET(
   request: NextRequest,
-  { params }: { params: Promise<{ studioId: string }> }
+  { params }: { params: Promise<{ id: string }> }
 ) {
   try {
-    const { studioId } = await params;
+    const { id: studioId } = await params;
     
     if (!studioId) {
       return NextResponse.json(
@@ -1,43 +1,31 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const STUDIOS_FILE = path.join(process.cwd(), 'data', 'studios.json');
-
-function getStudios(): any[] {
-  try {
-    if (fs.existsSync(STUDIOS_FILE)) {
-      const data = fs.readFileSync(STUDIOS_FILE, 'utf-8');
-      const parsed = JSON.parse(data);
-      return parsed.studios || [];
-    }
-    return [];
-  } catch (error) {
-    console.error('Error reading studios file:', error);
-    return [];
-  }
-}
+import { findById, findOne, putRecords, removeRecords } from '@/lib/data-store';
+import { externalizeInlineImages } from '@/lib/images/blob-store';
 
 function findStudioById(id: string): any | null {
-  const studios = getStudios();
-  return studios.find(studio => studio.id === id) || null;
+  return findById('studios', id);
 }
 
 function findStudioBySlug(slug: string): any | null {
-  const studios = getStudios();
-  return studios.find(studio => studio.slug === slug) || null;
+  return findOne('studios', 'slug', slug);
 }
 
-function saveStudios(studios: any[]): void {
+// Persist a single new or changed studio
+async function saveStudio(studio: any): Promise<void> {
   try {
-    const dataDir = path.dirname(STUDIOS_FILE);
-    if (!fs.existsSync(dataDir)) {
-      fs.mkdirSync(dataDir, { recursive: true });
-    }
-    const data = { studios };
-    fs.writeFileSync(STUDIOS_FILE, JSON.stringify(data, null, 2));
+    await putRecords({ studios: [studio] });
+  } catch (error) {
+    console.error('Error saving studios file:', error);
+    throw error;
+  }
+}
+
+async function deleteStudio(studio: any): Promise<void> {
+  try {
+    await removeRecords({ studios: [studio] });
   } catch (error) {
     console.error('Error saving studios file:', error);
+    throw error;
   }
 }
 
@@ -88,35 +76,33 @@ export async function PUT(request: NextRequest, { params }: { params: Promise<{
   try {
     const { id: identifier } = await params;
     const body = await request.json();
-    const studios = getStudios();
-    
     // Find studio by slug first, then by ID
-    let studioIndex = studios.findIndex(s => s.slug === identifier);
-    if (studioIndex === -1) {
-      studioIndex = studios.findIndex(s => s.id === identifier);
-    }
+    const studio = findStudioBySlug(identifier) || findStudioById(identifier);
     
-    if (studioIndex === -1) {
+    if (!studio) {
       return NextResponse.json(
         { error: 'Studio not found' },
         { status: 404 }
       );
     }
+
+    // Store pasted base64 images as blobs so only their URLs are saved
+    await externalizeInlineImages(body);
     
     // Update studio data, including firstName and lastName if provided
-    studios[studioIndex] = {
-      ...studios[studioIndex],
+    const updatedStudio = {
+      ...studio,
       ...body,
-      firstName: body.firstName ?? studios[studioIndex].firstName ?? undefined,
-      lastName: body.lastName ?? studios[studioIndex].lastName ?? undefined,
-      id: studios[studioIndex].id, // Preserve the original ID
-      slug: studios[studioIndex].slug, // Preserve the original slug
+      firstName: body.firstName ?? studio.firstName ?? undefined,
+      lastName: body.lastName ?? studio.lastName ?? undefined,
+      id: studio.id, // Preserve the original ID
+      slug: studio.slug, // Preserve the original slug
       updatedAt: new Date().toISOString()
     };
     
-    saveStudios(studios);
+    await saveStudio(updatedStudio);
     
-    return NextResponse.json(studios[studioIndex]);
+    return NextResponse.json(updatedStudio);
   } catch (error) {
     console.error('Error updating studio:', error);
     return NextResponse.json(
@@ -132,18 +118,16 @@ export async function DELETE(
 ) {
   try {
     const { id } = await params;
-    const studios = getStudios();
-    const studioIndex = studios.findIndex(s => s.id === id);
+    const studio = findStudioById(id);
     
-    if (studioIndex === -1) {
+    if (!studio) {
       return NextResponse.json(
         { error: 'Studio not found' },
         { status: 404 }
       );
     }
     
-    studios.splice(studioIndex, 1);
-    saveStudios(studios);
+    await deleteStudio(studio);
     
     return NextResponse.json({ message: 'Studio deleted successfully' }, { status: 200 });
   } catch (error) {
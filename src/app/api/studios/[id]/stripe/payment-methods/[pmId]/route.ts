@@ -1,9 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { stripe } from '@/lib/stripe';
-import fs from 'fs';
-import path from 'path';
-
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
+import { findMany } from '@/lib/data-store';
+import { log } from '@/lib/log';
 
 interface User {
   id: string;
@@ -14,22 +12,8 @@ interface User {
   stripeCustomerId?: string;
 }
 
-function getUsers(): User[] {
-  try {
-    if (fs.existsSync(USERS_FILE)) {
-      const data = fs.readFileSync(USERS_FILE, 'utf-8');
-      return JSON.parse(data);
-    }
-    return [];
-  } catch (error) {
-    console.error('❌ Error reading users file:', error);
-    return [];
-  }
-}
-
 function findStudioUser(studioId: string): User | null {
-  const users = getUsers();
-  return users.find(user => user.role === 'studio' && user.studioId === studioId) || null;
+  return findMany('users', 'studioId', studioId).find((user: User) => user.role === 'studio') || null;
 }
 
 // DELETE - Detach payment method from studio
@@ -38,12 +22,12 @@ export async function DELETE(
   { params }: { params: Promise<{ id: string; pmId: string }> }
 ) {
   try {
-    console.log('🎯 [Studio Payment Methods] Deleting payment method...');
+    log.debug('🎯 [Studio Payment Methods] Deleting payment method...');
     
     const { id: studioId, pmId } = await params;
     
     if (!studioId) {
-      console.log('❌ [Studio Payment Methods] Missing studioId');
+      log.debug('❌ [Studio Payment Methods] Missing studioId');
       return NextResponse.json(
         { error: 'missing_studioId', message: 'Studio ID is required' },
         { status: 422 }
@@ -51,7 +35,7 @@ export async function DELETE(
     }
 
     if (!pmId) {
-      console.log('❌ [Studio Payment Methods] Missing payment method ID');
+      log.debug('❌ [Studio Payment Methods] Missing payment method ID');
       return NextResponse.json(
         { error: 'missing_pmId', message: 'Payment method ID is required' },
         { status: 422 }
@@ -61,7 +45,7 @@ export async function DELETE(
     // Find the studio user
     const studioUser = findStudioUser(studioId);
     if (!studioUser) {
-      console.log('❌ [Studio Payment Methods] Studio user not found for ID:', studioId);
+      log.debug('❌ [Studio Payment Methods] Studio user not found for ID:', studioId);
       return NextResponse.json(
         { error: 'studio_not_found', message: 'Studio not found' },
         { status: 404 }
@@ -69,7 +53,7 @@ export async function DELETE(
     }
 
     if (!studioUser.stripeCustomerId) {
-      console.log('❌ [Studio Payment Methods] No Stripe customer ID for studio:', studioId);
+      log.debug('❌ [Studio Payment Methods] No Stripe customer ID for studio:', studioId);
       return NextResponse.json(
         { error: 'no_stripe_customer', message: 'No Stripe customer found' },
         { status: 404 }
@@ -81,14 +65,14 @@ export async function DELETE(
       const paymentMethod = await stripe.paymentMethods.retrieve(pmId);
       
       if (paymentMethod.customer !== studioUser.stripeCustomerId) {
-        console.log('❌ [Studio Payment Methods] Payment method does not belong to studio:', pmId, studioId);
+        log.debug('❌ [Studio Payment Methods] Payment method does not belong to studio:', pmId, studioId);
         return NextResponse.json(
           { error: 'payment_method_not_found', message: 'Payment method not found' },
           { status: 404 }
         );
       }
     } catch (error) {
-      console.log('❌ [Studio Payment Methods] Payment method not found:', pmId);
+      log.debug('❌ [Studio Payment Methods] Payment method not found:', pmId);
       return NextResponse.json(
         { error: 'payment_method_not_found', message: 'Payment method not found' },
         { status: 404 }
@@ -98,7 +82,7 @@ export async function DELETE(
     // Detach payment method from customer
     await stripe.paymentMethods.detach(pmId);
 
-    console.log('✅ [Studio Payment Methods] Payment method detached:', pmId);
+    log.info('✅ [Studio Payment Methods] Payment method detached:', pmId);
 
     return NextResponse.json({
       success: true,
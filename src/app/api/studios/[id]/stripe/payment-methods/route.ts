@@ -1,9 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { stripe } from '@/lib/stripe';
-import fs from 'fs';
-import path from 'path';
-
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
+import { findMany, putRecords } from '@/lib/data-store';
+import { log } from '@/lib/log';
 
 interface User {
   id: string;
@@ -14,34 +12,18 @@ interface User {
   stripeCustomerId?: string;
 }
 
-function getUsers(): User[] {
+// Persist the studio user's Stripe customer ID; only that record is written
+async function saveStripeCustomerId(user: User, stripeCustomerId: string): Promise<void> {
   try {
-    if (fs.existsSync(USERS_FILE)) {
-      const data = fs.readFileSync(USERS_FILE, 'utf-8');
-      return JSON.parse(data);
-    }
-    return [];
-  } catch (error) {
-    console.error('❌ Error reading users file:', error);
-    return [];
-  }
-}
-
-function saveUsers(users: User[]): void {
-  try {
-    const dataDir = path.dirname(USERS_FILE);
-    if (!fs.existsSync(dataDir)) {
-      fs.mkdirSync(dataDir, { recursive: true });
-    }
-    fs.writeFileSync(USERS_FILE, JSON.stringify(users, null, 2));
+    await putRecords({ users: [{ ...user, stripeCustomerId }] });
   } catch (error) {
     console.error('❌ Error saving users file:', error);
+    throw error;
   }
 }
 
 function findStudioUser(studioId: string): User | null {
-  const users = getUsers();
-  return users.find(user => user.role === 'studio' && user.studioId === studioId) || null;
+  return findMany('users', 'studioId', studioId).find((user: User) => user.role === 'studio') || null;
 }
 
 // POST - Create setup intent for adding payment method
@@ -50,12 +32,12 @@ export async function POST(
   { params }: { params: Promise<{ id: string }> }
 ) {
   try {
-    console.log('🎯 [Studio Payment Methods] Creating setup intent...');
+    log.debug('🎯 [Studio Payment Methods] Creating setup intent...');
     
     const { id: studioId } = await params;
     
     if (!studioId) {
-      console.log('❌ [Studio Payment Methods] Missing studioId');
+      log.debug('❌ [Studio Payment Methods] Missing studioId');
       return NextResponse.json(
         { error: 'missing_studioId', message: 'Studio ID is required' },
         { status: 422 }
@@ -65,7 +47,7 @@ export async function POST(
     // Find the studio user
     const studioUser = findStudioUser(studioId);
     if (!studioUser) {
-      console.log('❌ [Studio Payment Methods] Studio user not found for ID:', studioId);
+      log.debug('❌ [Studio Payment Methods] Studio user not found for ID:', studioId);
       return NextResponse.json(
         { error: 'studio_not_found', message: 'Studio not found' },
         { status: 404 }
@@ -76,7 +58,7 @@ export async function POST(
 
     // Create or validate Stripe customer
     if (!stripeCustomerId) {
-      console.log('🔄 [Studio Payment Methods] Creating Stripe customer for studio:', studioId);
+      log.debug('🔄 [Studio Payment Methods] Creating Stripe customer for studio:', studioId);
       
       const customer = await stripe.customers.create({
         email: studioUser.email,
@@ -90,20 +72,15 @@ export async function POST(
       stripeCustomerId = customer.id;
 
       // Update user with Stripe customer ID
-      const users = getUsers();
-      const userIndex = users.findIndex(u => u.id === studioUser.id);
-      if (userIndex !== -1) {
-        users[userIndex].stripeCustomerId = stripeCustomerId;
-        saveUsers(users);
-        console.log('✅ [Studio Payment Methods] Updated user with Stripe customer ID:', stripeCustomerId);
-      }
+      await saveStripeCustomerId(studioUser, stripeCustomerId);
+      log.info('✅ [Studio Payment Methods] Updated user with Stripe customer ID:', stripeCustomerId);
     } else {
       // Validate existing customer ID by attempting to retrieve it
       try {
         await stripe.customers.retrieve(stripeCustomerId);
       } catch (stripeError: any) {
         if (stripeError.code === 'resource_missing') {
-          console.log('🔄 [Studio Payment Methods] Invalid customer ID, creating new customer:', stripeCustomerId);
+          log.debug('🔄 [Studio Payment Methods] Invalid customer ID, creating new customer:', stripeCustomerId);
           
           // Create new Stripe customer
           const customer = await stripe.customers.create({
@@ -118,13 +95,8 @@ export async function POST(
           stripeCustomerId = customer.id;
 
           // Update user with new Stripe customer ID
-          const users = getUsers();
-          const userIndex = users.findIndex(u => u.id === studioUser.id);
-          if (userIndex !== -1) {
-            users[userIndex].stripeCustomerId = stripeCustomerId;
-            saveUsers(users);
-            console.log('✅ [Studio Payment Methods] Updated user with new Stripe customer ID:', stripeCustomerId);
-          }
+          await saveStripeCustomerId(studioUser, stripeCustomerId);
+          log.info('✅ [Studio Payment Methods] Updated user with new Stripe customer ID:', stripeCustomerId);
         } else {
           throw stripeError;
         }
@@ -138,7 +110,7 @@ export async function POST(
       usage: 'off_session'
     });
 
-    console.log('✅ [Studio Payment Methods] Setup intent created:', setupIntent.id);
+    log.info('✅ [Studio Payment Methods] Setup intent created:', setupIntent.id);
 
     return NextResponse.json({
       clientSecret: setupIntent.client_secret
@@ -159,12 +131,12 @@ export async function GET(
   { params }: { params: Promise<{ id: string }> }
 ) {
   try {
-    console.log('🎯 [Studio Payment Methods] Listing payment methods...');
+    log.debug('🎯 [Studio Payment Methods] Listing payment methods...');
     
     const { id: studioId } = await params;
     
     if (!studioId) {
-      console.log('❌ [Studio Payment Methods] Missing studioId');
+      log.debug('❌ [Studio Payment Methods] Missing studioId');
       return NextResponse.json(
         { error: 'missing_studioId', message: 'Studio ID is required' },
         { status: 422 }
@@ -174,7 +146,7 @@ export async function GET(
     // Find the studio user
     const studioUser = findStudioUser(studioId);
     if (!studioUser) {
-      console.log('❌ [Studio Payment Methods] Studio user not found for ID:', studioId);
+      log.debug('❌ [Studio Payment Methods] Studio user not found for ID:', studioId);
       return NextResponse.json(
         { error: 'studio_not_found', message: 'Studio not found' },
         { status: 404 }
@@ -184,7 +156,7 @@ export async function GET(
     let stripeCustomerId = studioUser.stripeCustomerId;
 
     if (!stripeCustomerId) {
-      console.log('📝 [Studio Payment Methods] No Stripe customer ID for studio:', studioId);
+      log.debug('📝 [Studio Payment Methods] No Stripe customer ID for studio:', studioId);
       return NextResponse.json({ paymentMethods: [] });
     }
 
@@ -198,7 +170,7 @@ export async function GET(
     } catch (stripeError: any) {
       // Handle invalid customer error
       if (stripeError.code === 'resource_missing' && stripeError.param === 'customer') {
-        console.log('🔄 [Studio Payment Methods] Invalid customer ID, creating new customer:', stripeCustomerId);
+        log.debug('🔄 [Studio Payment Methods] Invalid customer ID, creating new customer:', stripeCustomerId);
         
         // Create new Stripe customer
         const customer = await stripe.customers.create({
@@ -213,13 +185,8 @@ export async function GET(
         stripeCustomerId = customer.id;
 
         // Update user with new Stripe customer ID
-        const users = getUsers();
-        const userIndex = users.findIndex(u => u.id === studioUser.id);
-        if (userIndex !== -1) {
-          users[userIndex].stripeCustomerId = stripeCustomerId;
-          saveUsers(users);
-          console.log('✅ [Studio Payment Methods] Updated user with new Stripe customer ID:', stripeCustomerId);
-        }
+        await saveStripeCustomerId(studioUser, stripeCustomerId);
+        log.info('✅ [Studio Payment Methods] Updated user with new Stripe customer ID:', stripeCustomerId);
 
         // Return empty payment methods for new customer
         return NextResponse.json({ paymentMethods: [] });
@@ -238,7 +205,7 @@ export async function GET(
       expYear: pm.card?.exp_year || 0
     }));
 
-    console.log('✅ [Studio Payment Methods] Found', formattedPaymentMethods.length, 'payment methods');
+    log.debug('✅ [Studio Payment Methods] Found', formattedPaymentMethods.length, 'payment methods');
 
     return NextResponse.json({
       paymentMethods: formattedPaymentMethods
@@ -1,85 +1,154 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
 import { slugify } from '@/lib/utils';
+import { findOne, getCollection, putRecords } from '@/lib/data-store';
+import { externalizeInlineImages } from '@/lib/images/blob-store';
+import { decodeCursor, isCurrentStudio, searchStudios, STUDIO_SORTS, type StudioSort } from '@/lib/studios/search';
+import { timed, withTiming } from '@/lib/timing';
 
-const STUDIOS_FILE = path.join(process.cwd(), 'data', 'studios.json');
+// Any of these switches GET from the full studio list to a page of search results
+const SEARCH_PARAMS = ['q', 'location', 'amenities', 'minRate', 'maxRate', 'minRating', 'lat', 'lng', 'radiusKm', 'sort', 'cursor', 'limit'];
+const DEFAULT_PAGE_SIZE = 12;
+const MAX_PAGE_SIZE = 50;
 
-// Ensure data directory exists
-function ensureDataDir() {
-  const dataDir = path.dirname(STUDIOS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-}
+async function getStudios(): Promise<any[]> {
+  const studios = getCollection('studios');
 
-function getStudios(): any[] {
-  try {
-    ensureDataDir();
-    if (fs.existsSync(STUDIOS_FILE)) {
-      const data = fs.readFileSync(STUDIOS_FILE, 'utf-8');
-      const parsed = JSON.parse(data);
-      let studios = parsed.studios || [];
-      
-      // Add slugs to studios that don't have them
-      let needsSave = false;
-      studios = studios.map((studio: any) => {
-        if (!studio.slug && studio.name) {
-          const baseSlug = slugify(studio.name);
-          let finalSlug = baseSlug;
-          let counter = 1;
-          
-          // Ensure slug is unique
-          while (studios.some((s: any) => s.slug === finalSlug && s.id !== studio.id)) {
-            finalSlug = `${baseSlug}-${counter}`;
-            counter++;
-          }
-          
-          studio.slug = finalSlug;
-          needsSave = true;
-        }
-        return studio;
-      });
-      
-      // Save back if we added slugs
-      if (needsSave) {
-        saveStudios(studios);
+  // Add slugs to studios that don't have them
+  const assignedSlugs = new Set<string>();
+  const backfilled: any[] = [];
+  const result = studios.map((studio: any) => {
+    if (!studio.slug && studio.name) {
+      const baseSlug = slugify(studio.name);
+      let finalSlug = baseSlug;
+      let counter = 1;
+
+      // Ensure slug is unique
+      while (findOne('studios', 'slug', finalSlug) || assignedSlugs.has(finalSlug)) {
+        finalSlug = `${baseSlug}-${counter}`;
+        counter++;
       }
-      
-      return studios;
+
+      assignedSlugs.add(finalSlug);
+      const withSlug = { ...studio, slug: finalSlug };
+      backfilled.push(withSlug);
+      return withSlug;
+    }
+    return studio;
+  });
+
+  // Persist just the backfilled studios, once; later reads find the slugs and write nothing
+  if (backfilled.length > 0) {
+    try {
+      await saveStudios(backfilled);
+    } catch {
+      // The slugs are still returned; the next read tries to save them again
     }
-    return [];
-  } catch (error) {
-    console.error('Error reading studios file:', error);
-    return [];
   }
+
+  return result;
 }
 
-function saveStudios(studios: any[]): void {
+// Persist new or changed studios; only the given records are written
+async function saveStudios(studios: any[]): Promise<void> {
   try {
-    ensureDataDir();
-    const data = { studios };
-    fs.writeFileSync(STUDIOS_FILE, JSON.stringify(data, null, 2));
+    await putRecords({ studios });
   } catch (error) {
     console.error('Error saving studios file:', error);
+    throw error;
+  }
+}
+
+function numberParam(searchParams: URLSearchParams, name: string): number | null | undefined {
+  const value = searchParams.get(name);
+  if (value === null || value.trim() === '') return null;
+  const number = Number(value);
+  // undefined marks a value that was given but isn't a number
+  return Number.isFinite(number) ? number : undefined;
+}
+
+// GET /api/studios?q=&location=&amenities=&minRate=&maxRate=&minRating=&lat=&lng=&radiusKm=&sort=&cursor=&limit=
+// - Search studios, one page of cards at a time
+function searchResponse(searchParams: URLSearchParams) {
+  const sort = (searchParams.get('sort') || 'rating') as StudioSort;
+  if (!STUDIO_SORTS.includes(sort)) {
+    return NextResponse.json(
+      { error: `sort must be one of: ${STUDIO_SORTS.join(', ')}` },
+      { status: 400 }
+    );
+  }
+
+  const limit = numberParam(searchParams, 'limit') ?? DEFAULT_PAGE_SIZE;
+  if (limit === undefined || !Number.isInteger(limit) || limit < 1 || limit > MAX_PAGE_SIZE) {
+    return NextResponse.json(
+      { error: `Limit must be between 1 and ${MAX_PAGE_SIZE}` },
+      { status: 400 }
+    );
   }
+
+  const numbers: Record<string, number | null | undefined> = {};
+  for (const name of ['minRate', 'maxRate', 'minRating', 'lat', 'lng', 'radiusKm']) {
+    numbers[name] = numberParam(searchParams, name);
+    if (numbers[name] === undefined) {
+      return NextResponse.json(
+        { error: `${name} must be a number` },
+        { status: 400 }
+      );
+    }
+  }
+
+  if ((numbers.lat === null) !== (numbers.lng === null) || (sort === 'distance' && numbers.lat === null)) {
+    return NextResponse.json(
+      { error: 'lat and lng are required together (and for sort=distance)' },
+      { status: 400 }
+    );
+  }
+
+  const cursor = searchParams.get('cursor');
+  if (cursor && !decodeCursor(cursor, sort)) {
+    return NextResponse.json(
+      { error: 'Invalid cursor for this sort order' },
+      { status: 400 }
+    );
+  }
+
+  const amenities = searchParams.getAll('amenities')
+    .flatMap(value => value.split(','))
+    .map(amenity => amenity.trim())
+    .filter(Boolean);
+
+  const { studios, nextCursor, hasMore } = searchStudios({
+    q: searchParams.get('q'),
+    location: searchParams.get('location'),
+    amenities,
+    minRate: numbers.minRate,
+    maxRate: numbers.maxRate,
+    minRating: numbers.minRating,
+    lat: numbers.lat,
+    lng: numbers.lng,
+    radiusKm: numbers.radiusKm,
+    sort,
+    cursor,
+    limit
+  });
+
+  return timed('serialize', () => NextResponse.json({
+    studios,
+    pagination: { hasMore, nextCursor, limit }
+  }, { status: 200 }));
 }
 
-export async function GET(request: NextRequest) {
+export const GET = withTiming('GET /api/studios', listStudios);
+
+async function listStudios(request: NextRequest) {
   try {
-    const allStudios = getStudios();
-    
-    // Deduplicate studios by slug, keeping the most recently updated version
-    const studioMap = new Map();
-    for (const studio of allStudios) {
-      const existingStudio = studioMap.get(studio.slug);
-      if (!existingStudio || new Date(studio.updatedAt || studio.createdAt) > new Date(existingStudio.updatedAt || existingStudio.createdAt)) {
-        studioMap.set(studio.slug, studio);
-      }
+    const { searchParams } = new URL(request.url);
+    if (SEARCH_PARAMS.some(name => searchParams.has(name))) {
+      return searchResponse(searchParams);
     }
-    
-    const studios = Array.from(studioMap.values());
-    return NextResponse.json({ studios }, { status: 200 });
+
+    // Without search parameters: every listed studio, in full (dashboards look up their own studio here)
+    const studios = (await getStudios()).filter(isCurrentStudio);
+    return timed('serialize', () => NextResponse.json({ studios }, { status: 200 }));
   } catch (error) {
     console.error('GET studios error:', error);
     return NextResponse.json(
@@ -92,8 +161,8 @@ export async function GET(request: NextRequest) {
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json();
-    const studios = getStudios();
-    
+    // Store pasted base64 images as blobs so only their URLs are saved
+    await externalizeInlineImages(body);
     // Generate studio ID and slug
     const studioId = `studio_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
     const slug = body.name ? slugify(body.name) : slugify(`Studio ${Date.now()}`);
@@ -101,7 +170,7 @@ export async function POST(request: NextRequest) {
     // Ensure slug is unique
     let finalSlug = slug;
     let counter = 1;
-    while (studios.some(studio => studio.slug === finalSlug)) {
+    while (findOne('studios', 'slug', finalSlug)) {
       finalSlug = `${slug}-${counter}`;
       counter++;
     }
@@ -116,8 +185,7 @@ export async function POST(request: NextRequest) {
     };
     
     // Add to studios list
-    studios.push(newStudio);
-    saveStudios(studios);
+    await saveStudios([newStudio]);
     
     return NextResponse.json(newStudio, { status: 201 });
   } catch (error) {
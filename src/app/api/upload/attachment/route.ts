@@ -1,16 +1,14 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { writeFile, mkdir } from 'fs/promises';
-import { existsSync } from 'fs';
-import path from 'path';
+import { storeBlob, UploadTooLargeError } from '@/lib/images/blob-store';
+import { readUpload } from '@/lib/images/upload';
 
-const UPLOAD_DIR = path.join(process.cwd(), 'public', 'uploads', 'attachments');
+const MAX_ATTACHMENT_SIZE = 10 * 1024 * 1024;
 
 export async function POST(request: NextRequest) {
   try {
-    const formData = await request.formData();
-    const file = formData.get('file') as File;
+    const upload = await readUpload(request);
 
-    if (!file) {
+    if (!upload.body) {
       return NextResponse.json(
         { error: 'No file uploaded' },
         { status: 400 }
@@ -18,7 +16,7 @@ export async function POST(request: NextRequest) {
     }
 
     // Validate file size (10MB limit)
-    if (file.size > 10 * 1024 * 1024) {
+    if (upload.size !== null && upload.size > MAX_ATTACHMENT_SIZE) {
       return NextResponse.json(
         { error: 'File too large. Maximum size is 10MB.' },
         { status: 400 }
@@ -36,46 +34,39 @@ export async function POST(request: NextRequest) {
       'text/plain'
     ];
 
-    if (!allowedTypes.includes(file.type)) {
+    if (!allowedTypes.includes(upload.contentType)) {
       return NextResponse.json(
         { error: 'File type not allowed' },
         { status: 400 }
       );
     }
 
-    // Create upload directory if it doesn't exist
-    if (!existsSync(UPLOAD_DIR)) {
-      await mkdir(UPLOAD_DIR, { recursive: true });
-    }
-
-    // Generate unique filename
-    const timestamp = Date.now();
-    const randomString = Math.random().toString(36).substring(2, 15);
-    const fileExtension = path.extname(file.name);
-    const fileName = `attachment_${timestamp}_${randomString}${fileExtension}`;
-    const filePath = path.join(UPLOAD_DIR, fileName);
-
-    // Save file
-    const bytes = await file.arrayBuffer();
-    const buffer = Buffer.from(bytes);
-    await writeFile(filePath, buffer);
-
-    // Return public URL
-    const publicUrl = `/uploads/attachments/${fileName}`;
+    // Stream into the blob store; identical files are stored once
+    const stored = await storeBlob(upload.body, {
+      contentType: upload.contentType,
+      maxBytes: MAX_ATTACHMENT_SIZE
+    });
 
     return NextResponse.json({
       success: true,
-      url: publicUrl,
-      filename: file.name,
-      size: file.size,
-      type: file.type
+      url: stored.url,
+      variants: stored.variants,
+      filename: upload.fileName,
+      size: stored.size,
+      type: stored.contentType
     });
 
   } catch (error) {
+    if (error instanceof UploadTooLargeError) {
+      return NextResponse.json(
+        { error: error.message },
+        { status: 400 }
+      );
+    }
     console.error('Error uploading attachment:', error);
     return NextResponse.json(
       { error: 'Failed to upload file' },
       { status: 500 }
     );
   }
-} 
\ No newline at end of file
+} 
@@ -1,14 +1,13 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { writeFile, mkdir } from 'fs/promises';
-import path from 'path';
+import { storeBlob, UploadTooLargeError } from '@/lib/images/blob-store';
+import { readUpload } from '@/lib/images/upload';
 
 export async function POST(request: NextRequest) {
   try {
-    const formData = await request.formData();
-    const file = formData.get('file') as File;
-    const userId = formData.get('userId') as string;
+    const upload = await readUpload(request);
+    const userId = upload.field('userId');
 
-    if (!file) {
+    if (!upload.body) {
       return NextResponse.json({ error: 'No file uploaded' }, { status: 400 });
     }
 
@@ -18,47 +17,31 @@ export async function POST(request: NextRequest) {
 
     // Validate file type
     const allowedTypes = ['image/jpeg', 'image/png', 'image/gif', 'image/webp'];
-    if (!allowedTypes.includes(file.type)) {
+    if (!allowedTypes.includes(upload.contentType)) {
       return NextResponse.json({ error: 'Invalid file type. Only JPEG, PNG, GIF, and WebP are allowed.' }, { status: 400 });
     }
 
     // Validate file size (10MB limit for banners)
     const maxSize = 10 * 1024 * 1024; // 10MB
-    if (file.size > maxSize) {
+    if (upload.size !== null && upload.size > maxSize) {
       return NextResponse.json({ error: 'File too large. Maximum size is 10MB.' }, { status: 400 });
     }
 
-    const bytes = await file.arrayBuffer();
-    const buffer = Buffer.from(bytes);
-
-    // Create uploads directory if it doesn't exist
-    const uploadsDir = path.join(process.cwd(), 'public', 'uploads', 'banners');
-    try {
-      await mkdir(uploadsDir, { recursive: true });
-    } catch (error) {
-      // Directory might already exist
-    }
-
-    // Generate unique filename
-    const timestamp = Date.now();
-    const fileExtension = path.extname(file.name);
-    const filename = `banner_${userId}_${timestamp}${fileExtension}`;
-    const filepath = path.join(uploadsDir, filename);
-
-    // Write file
-    await writeFile(filepath, buffer);
-
-    // Return the public URL
-    const imageUrl = `/uploads/banners/${filename}`;
+    // Stream into the blob store; resized variants are generated once, here
+    const stored = await storeBlob(upload.body, { contentType: upload.contentType, maxBytes: maxSize });
 
     return NextResponse.json({ 
       success: true, 
-      imageUrl,
+      imageUrl: stored.variants?.full ?? stored.url,
+      imageUrls: stored.variants,
       message: 'Banner uploaded successfully' 
     });
 
   } catch (error) {
+    if (error instanceof UploadTooLargeError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
     console.error('Banner upload error:', error);
     return NextResponse.json({ error: 'Failed to upload banner' }, { status: 500 });
   }
-} 
\ No newline at end of file
+} 
@@ -1,27 +1,19 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const BOOKINGS_FILE = path.join(process.cwd(), 'data', 'bookings.json');
-const STUDIOS_FILE = path.join(process.cwd(), 'data', 'studios.json');
+import { findById, findMany } from '@/lib/data-store';
+import { imageVariantUrl } from '@/lib/images/variants';
+import { log } from '@/lib/log';
 
 // Helper function to get studio information
 function getStudioInfo(studioId: string): { id: string; name: string; slug: string; avatarUrl: string | null } | null {
   try {
-    if (fs.existsSync(STUDIOS_FILE)) {
-      const studiosData = fs.readFileSync(STUDIOS_FILE, 'utf8');
-      const studioDataObj = JSON.parse(studiosData);
-      const studios = studioDataObj.studios || [];
-      
-      const studio = studios.find((s: any) => s.id === studioId);
-      if (studio) {
-        return {
-          id: studio.id,
-          name: studio.name || 'Unknown Studio',
-          slug: studio.slug || studio.id,
-          avatarUrl: studio.profileImage || null
-        };
-      }
+    const studio = findById('studios', studioId);
+    if (studio) {
+      return {
+        id: studio.id,
+        name: studio.name || 'Unknown Studio',
+        slug: studio.slug || studio.id,
+        avatarUrl: imageVariantUrl(studio.profileImage, 'thumb') || null
+      };
     }
   } catch (error) {
     console.error('❌ [User Bookings] Error getting studio info:', error);
@@ -29,21 +21,6 @@ function getStudioInfo(studioId: string): { id: string; name: string; slug: stri
   return null;
 }
 
-// Read bookings from file
-function getBookings(): any[] {
-  try {
-    if (!fs.existsSync(BOOKINGS_FILE)) {
-      return [];
-    }
-    const data = fs.readFileSync(BOOKINGS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    return parsed.bookings || [];
-  } catch (error) {
-    console.error('❌ [User Bookings] Error reading bookings file:', error);
-    return [];
-  }
-}
-
 // GET /api/users/[id]/bookings - Get bookings for artist with studio information  
 export async function GET(
   request: NextRequest,
@@ -52,7 +29,7 @@ export async function GET(
   try {
     const { id: userId } = await params;
     
-    console.log(`🔍 [User Bookings] Fetching bookings for user: ${userId}`);
+    log.debug(`🔍 [User Bookings] Fetching bookings for user: ${userId}`);
     
     if (!userId) {
       return NextResponse.json(
@@ -62,14 +39,12 @@ export async function GET(
     }
 
     // Get all bookings for this artist - only confirmed/completed bookings
-    const allBookings = getBookings();
-    const artistBookings = allBookings.filter(booking => 
-      booking.userId === userId && 
+    const artistBookings = findMany('bookings', 'userId', userId).filter(booking => 
       (booking.status === 'CONFIRMED' || booking.status === 'confirmed' || 
        booking.status === 'COMPLETED' || booking.status === 'completed')
     );
 
-    console.log(`✅ [User Bookings] Found ${artistBookings.length} confirmed bookings for user ${userId}`);
+    log.debug(`✅ [User Bookings] Found ${artistBookings.length} confirmed bookings for user ${userId}`);
 
     // Enhance bookings with studio information
     const enhancedBookings = artistBookings.map(booking => {
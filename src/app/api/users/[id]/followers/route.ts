@@ -1,57 +1,11 @@
 import { NextRequest, NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-const FOLLOWS_FILE = path.join(process.cwd(), 'data', 'follows.json');
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
-const STUDIOS_FILE = path.join(process.cwd(), 'data', 'studios.json');
-
-// Read follows from file
-function getFollows(): any {
-  try {
-    if (!fs.existsSync(FOLLOWS_FILE)) {
-      return { follows: [] };
-    }
-    const data = fs.readFileSync(FOLLOWS_FILE, 'utf8');
-    return JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading follows file:', error);
-    return { follows: [] };
-  }
-}
-
-// Read users from file
-function getUsers(): any[] {
-  try {
-    if (!fs.existsSync(USERS_FILE)) {
-      return [];
-    }
-    const data = fs.readFileSync(USERS_FILE, 'utf8');
-    return Array.isArray(data) ? data : JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading users file:', error);
-    return [];
-  }
-}
-
-// Read studios from file
-function getStudios(): any[] {
-  try {
-    if (!fs.existsSync(STUDIOS_FILE)) {
-      return [];
-    }
-    const data = fs.readFileSync(STUDIOS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    return parsed.studios || [];
-  } catch (error) {
-    console.error('Error reading studios file:', error);
-    return [];
-  }
-}
+import { findById } from '@/lib/data-store';
+import { followerIds } from '@/lib/follows/follow-graph';
+import { imageVariantUrl } from '@/lib/images/variants';
 
 // Enhanced function to get user info with studio data
-function getUserInfoWithStudio(userId: string, users: any[], studios: any[]): any {
-  const user = users.find((u: any) => u.id === userId);
+function getUserInfoWithStudio(userId: string): any {
+  const user = findById('users', userId);
   if (!user) {
     return {
       id: userId,
@@ -65,13 +19,13 @@ function getUserInfoWithStudio(userId: string, users: any[], studios: any[]): an
 
   // If user is a studio, get studio information
   if (user.role === 'studio' && user.studioId) {
-    const studio = studios.find((s: any) => s.id === user.studioId);
+    const studio = findById('studios', user.studioId);
     if (studio) {
       return {
         id: user.id,
         name: studio.name || user.name,
         type: 'studio',
-        profileImage: studio.profileImage || user.profileImage,
+        profileImage: imageVariantUrl(studio.profileImage || user.profileImage, 'thumb'),
         location: studio.location || user.location,
         rating: studio.rating,
         slug: studio.slug || user.slug
@@ -84,7 +38,7 @@ function getUserInfoWithStudio(userId: string, users: any[], studios: any[]): an
     id: user.id,
     name: user.name,
     type: user.role === 'studio' ? 'studio' : 'user',
-    profileImage: user.profileImage,
+    profileImage: imageVariantUrl(user.profileImage, 'thumb'),
     location: user.location,
     slug: user.slug
   };
@@ -104,30 +58,8 @@ export async function GET(
       );
     }
 
-    const followsData = getFollows();
-    
-    // Handle both old and new data formats
-    let follows = followsData.follows || followsData || [];
-    
-    // If it's an array directly (new format), use it as is
-    if (Array.isArray(followsData)) {
-      follows = followsData;
-    }
-    
-    const users = getUsers();
-    const studios = getStudios();
-
     // Get all users who are following this user
-    const userFollowers = follows.filter((follow: any) => {
-      // Support both followedId and followingId property names
-      const targetId = follow.followingId || follow.followedId;
-      return targetId === userId;
-    });
-
-    const followers = userFollowers.map((follow: any) => {
-      const followerId = follow.followerId;
-      return getUserInfoWithStudio(followerId, users, studios);
-    });
+    const followers = followerIds(userId).map(getUserInfoWithStudio);
 
     return NextResponse.json({ followers });
   } catch (error) {
@@ -1,9 +1,9 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { getUsers, findUserByEmail, saveUsers } from '@/lib/user-store';
+import { findUserByEmail, saveUsers, type User } from '@/lib/user-store';
 import { slugify } from '@/lib/utils';
 import { getCompleteArtistProfile } from '@/lib/profile-utils';
-import fs from 'fs';
-import path from 'path';
+import { findById, putRecords } from '@/lib/data-store';
+import { externalizeInlineImages } from '@/lib/images/blob-store';
 
 interface UserProfile {
   id: string;
@@ -35,40 +35,10 @@ interface UserProfile {
   createdAt?: string;
 }
 
-// Helper function to get user profiles
-function getProfiles(): UserProfile[] {
+// Helper function to save new or changed user profiles
+async function saveProfiles(profiles: UserProfile[]): Promise<void> {
   try {
-    const profilesPath = path.join(process.cwd(), 'data', 'user-profiles.json');
-    
-    if (!fs.existsSync(profilesPath)) {
-      // Create empty profiles file if it doesn't exist
-      const dataDir = path.dirname(profilesPath);
-      if (!fs.existsSync(dataDir)) {
-        fs.mkdirSync(dataDir, { recursive: true });
-      }
-      fs.writeFileSync(profilesPath, JSON.stringify([]));
-      return [];
-    }
-    
-    const data = fs.readFileSync(profilesPath, 'utf8');
-    return JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading profiles:', error);
-    return [];
-  }
-}
-
-// Helper function to save user profiles
-function saveProfiles(profiles: UserProfile[]): void {
-  try {
-    const profilesPath = path.join(process.cwd(), 'data', 'user-profiles.json');
-    const dataDir = path.dirname(profilesPath);
-    
-    if (!fs.existsSync(dataDir)) {
-      fs.mkdirSync(dataDir, { recursive: true });
-    }
-    
-    fs.writeFileSync(profilesPath, JSON.stringify(profiles, null, 2));
+    await putRecords({ profiles });
   } catch (error) {
     console.error('Error saving profiles:', error);
     throw error;
@@ -86,8 +56,7 @@ export async function GET(request: NextRequest, { params }: { params: Promise<{
     }
     
     // Get basic user info
-    const users = getUsers();
-    const user = users.find(u => u.id === userId);
+    const user = findById('users', userId);
     
     if (!user) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 });
@@ -102,8 +71,7 @@ export async function GET(request: NextRequest, { params }: { params: Promise<{
     }
 
     // For non-artist users, use the existing logic
-    const profiles = getProfiles();
-    const profile = profiles.find(p => p.id === userId);
+    const profile: UserProfile | null = findById('profiles', userId);
 
     // Return combined data with generated slug
     const userData: UserProfile = {
@@ -131,44 +99,39 @@ export async function PUT(request: NextRequest, { params }: { params: Promise<{
     const body = await request.json();
 
     // Validate user exists
-    const users = getUsers();
-    const userIndex = users.findIndex(u => u.id === userId);
+    const user = findById('users', userId);
     
-    if (userIndex === -1) {
+    if (!user) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 });
     }
 
-    const user = users[userIndex];
-
-    // Update base user data if name or email changed
-    let baseUserUpdated = false;
+    // Collect base user changes; the cached record is only replaced once they are saved
+    const changes: Partial<User> = {};
     if (body.name && body.name !== user.name) {
-      users[userIndex].name = body.name;
+      changes.name = body.name;
       // Update slug when name changes
-      users[userIndex].slug = body.slug || slugify(body.name);
-      baseUserUpdated = true;
+      changes.slug = body.slug || slugify(body.name);
     }
     if (body.email && body.email !== user.email) {
       // Check if email is already taken by another user
-      const emailExists = users.some(u => u.id !== userId && u.email === body.email);
-      if (emailExists) {
+      const existingUser = findUserByEmail(body.email);
+      if (existingUser && existingUser.id !== userId) {
         return NextResponse.json({ error: 'Email already exists' }, { status: 409 });
       }
-      users[userIndex].email = body.email;
-      baseUserUpdated = true;
+      changes.email = body.email;
     }
 
-    // Save updated users if base data changed
-    if (baseUserUpdated) {
-      saveUsers(users);
-    }
+    // Store pasted base64 images as blobs so only their URLs are saved
+    await externalizeInlineImages(body);
 
-    // Get current profiles
-    const profiles = getProfiles();
-    const existingProfileIndex = profiles.findIndex(p => p.id === userId);
+    const updatedUser: User = { ...user, ...changes };
+
+    // Save updated user if base data changed
+    if (Object.keys(changes).length > 0) {
+      await saveUsers([updatedUser]);
+    }
 
     // Create updated profile with latest user data
-    const updatedUser = users[userIndex];
     const updatedProfile: UserProfile = {
       id: userId,
       name: updatedUser.name,
@@ -189,14 +152,7 @@ export async function PUT(request: NextRequest, { params }: { params: Promise<{
     };
 
     // Update or add profile
-    if (existingProfileIndex >= 0) {
-      profiles[existingProfileIndex] = updatedProfile;
-    } else {
-      profiles.push(updatedProfile);
-    }
-
-    // Save profiles
-    saveProfiles(profiles);
+    await saveProfiles([updatedProfile]);
 
     return NextResponse.json(updatedProfile);
 
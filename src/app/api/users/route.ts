@@ -14,7 +14,7 @@ export async function GET(request: NextRequest) {
     }
     
     // Add slugs to users that don't have them
-    let needsSave = false;
+    const backfilled: typeof users = [];
     const usersWithSlugs = users.map(user => {
       if (!user.slug && user.name) {
         const baseSlug = slugify(user.name);
@@ -27,16 +27,17 @@ export async function GET(request: NextRequest) {
           counter++;
         }
         
-        needsSave = true;
-        return { ...user, slug: finalSlug };
+        const withSlug = { ...user, slug: finalSlug };
+        backfilled.push(withSlug);
+        return withSlug;
       }
       return user;
     });
     
-    // Save back if we added slugs
-    if (needsSave) {
+    // Save just the users that got a slug; later reads write nothing
+    if (backfilled.length > 0) {
       try {
-        saveUsers(usersWithSlugs);
+        await saveUsers(backfilled);
       } catch (saveError) {
         console.error('Error saving users with slugs:', saveError);
         // Continue with the response even if saving fails
@@ -6,6 +6,7 @@ import { Calendar, Clock, MapPin, Music, DollarSign, CheckCircle, XCircle, Alert
 import { useAuth } from "@/lib/auth"
 import { useToast } from "@/hooks/use-toast"
 import { API_BASE_URL } from "@/lib/config"
+import { wsClient } from "@/lib/websocket"
 
 import { Button } from "@/components/ui/button"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
@@ -69,6 +70,19 @@ export default function BookingsPage() {
     }
   }, [user])
 
+  // Refetch when a booking changes status elsewhere (studio accepts, declines, etc.)
+  useEffect(() => {
+    if (!user?.id) return
+    const refresh = () => fetchBookings()
+    wsClient.on('booking_status_changed', refresh)
+    wsClient.on('resync', refresh)
+    wsClient.connect(user.id)
+    return () => {
+      wsClient.off('booking_status_changed', refresh)
+      wsClient.off('resync', refresh)
+    }
+  }, [user?.id])
+
   const fetchBookings = async () => {
     if (!user) return
 
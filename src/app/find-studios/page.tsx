@@ -1,6 +1,6 @@
 'use client'
 
-import { useState, useEffect } from "react"
+import { useState, useEffect, useRef } from "react"
 import { Search, Filter, Star, MapPin, Music, Clock, DollarSign, ArrowLeft } from "lucide-react"
 import { useRouter } from "next/navigation"
 import { API_BASE_URL } from "@/lib/config"
@@ -20,62 +20,57 @@ import { Skeleton } from "@/components/ui/skeleton"
 import { BookingDialog } from "@/components/ui/booking-dialog"
 import { FollowButton } from "@/components/ui/follow-button"
 
+// Card fields returned by the /api/studios search
 interface Studio {
   id: string
+  slug: string
   name: string
   location: string
-  address?: string
-  phone?: string
-  email?: string
-  website?: string
-  profileImage?: string
-  coverImage?: string
-  hourlyRate: number
-  minRoomRate?: number | null
-  maxRoomRate?: number | null
-  specialties: string[]
+  hourlyRate: number | null
   rating: number
   reviewCount: number
-  description: string
+  specialties: string[]
   amenities: string[]
-  images: string[]
-  gallery?: string[]
-  equipment: string[]
-  rooms?: Array<{
-    id: string
-    name: string
-    description: string
-    hourlyRate: number
-    capacity: number
-    images: string[]
-    equipment: string[]
-  }>
-  operatingHours?: Record<string, any>
-  staff?: Array<{
-    id: string
-    name: string
-    role: string
-    experience: string
-    profileImage: string
-  }>
-  createdAt: string
-  owner: string
+  description: string
+  image?: string
+  distanceKm?: number
+  createdAt?: string
+}
+
+const PAGE_SIZE = 12
+
+// Rate bounds are inclusive, so the upper tiers start just above the tier below
+const PRICE_RANGES: Record<string, { minRate?: number; maxRate?: number }> = {
+  all: {},
+  budget: { maxRate: 75 },
+  mid: { minRate: 75.01, maxRate: 150 },
+  premium: { minRate: 150.01 }
 }
 
 export default function FindStudiosPage() {
   const router = useRouter()
   const [studios, setStudios] = useState<Studio[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [error, setError] = useState<string | null>(null)
   const [searchTerm, setSearchTerm] = useState("")
+  const [debouncedSearchTerm, setDebouncedSearchTerm] = useState("")
   const [locationFilter, setLocationFilter] = useState("all")
   const [priceFilter, setPriceFilter] = useState("all")
   const [sortBy, setSortBy] = useState("rating")
+  // Only the latest search may update the list; earlier responses can arrive late
+  const latestRequest = useRef(0)
+
+  // Search once typing pauses rather than on every keystroke
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearchTerm(searchTerm.trim()), 300)
+    return () => clearTimeout(timer)
+  }, [searchTerm])
 
   useEffect(() => {
-    console.log('🚀 Component mounted, triggering fetchStudios...')
     fetchStudios()
-  }, [])
+  }, [debouncedSearchTerm, locationFilter, priceFilter, sortBy])
 
   // Add a simple connection test
   useEffect(() => {
@@ -90,38 +85,53 @@ export default function FindStudiosPage() {
       });
   }, [])
 
-  const fetchStudios = async () => {
+  const searchUrl = (cursor?: string | null) => {
+    const params = new URLSearchParams({ sort: sortBy, limit: String(PAGE_SIZE) })
+    if (debouncedSearchTerm) params.set('q', debouncedSearchTerm)
+    if (locationFilter !== "all") params.set('location', locationFilter)
+    const { minRate, maxRate } = PRICE_RANGES[priceFilter] || {}
+    if (minRate !== undefined) params.set('minRate', String(minRate))
+    if (maxRate !== undefined) params.set('maxRate', String(maxRate))
+    if (cursor) params.set('cursor', cursor)
+    return `/api/studios?${params}`
+  }
+
+  // Load the first page for the current search, or the next page after `cursor`
+  const fetchStudios = async (cursor?: string | null) => {
+    const requestId = ++latestRequest.current
     try {
       console.time('fetchFindStudios'); // added performance timing
-      console.log('🎯 Starting fetchStudios...')
-      setLoading(true)
-      setError(null)
-      
-      // Use relative path for better performance
-      const studiosUrl = '/api/studios'
-      console.log('🔗 Making request to:', studiosUrl)
-      const response = await fetch(studiosUrl)
-      console.log('📡 Response received:', response.status, response.ok)
-      
-      if (response.ok) {
-        console.log('✅ Response OK, parsing JSON...')
-        const data = await response.json()
-        console.log('📊 Data received:', data)
-        console.log('🏢 Studios count:', data.studios?.length || 0)
-        setStudios(data.studios || [])
-        console.log('✅ Studios set successfully')
+      if (cursor) {
+        setLoadingMore(true)
       } else {
+        setLoading(true)
+      }
+      setError(null)
+
+      const response = await fetch(searchUrl(cursor))
+      if (!response.ok) {
         console.error('❌ Response not OK:', response.status, response.statusText)
         throw new Error('Failed to fetch studios')
       }
+
+      const data = await response.json()
       console.timeEnd('fetchFindStudios'); // added performance timing
+      if (requestId !== latestRequest.current) return
+      const page: Studio[] = data.studios || []
+      setStudios(prev => cursor ? [...prev, ...page] : page)
+      setNextCursor(data.pagination?.nextCursor ?? null)
+      console.log('🏢 Studios loaded:', page.length)
     } catch (err) {
       console.error('🚨 Error fetching studios:', err)
-      setError('Failed to load studios. Please try again.')
+      if (requestId === latestRequest.current) {
+        setError('Failed to load studios. Please try again.')
+      }
       console.timeEnd('fetchFindStudios'); // added performance timing
     } finally {
-      console.log('🏁 Setting loading to false')
-      setLoading(false)
+      if (requestId === latestRequest.current) {
+        setLoading(false)
+        setLoadingMore(false)
+      }
     }
   }
 
@@ -130,52 +140,13 @@ export default function FindStudiosPage() {
   }
 
   const getStudioImage = (studio: Studio) => {
-    // Priority: profileImage -> coverImage -> first gallery image -> first image -> placeholder
-    return studio.profileImage || 
-           studio.coverImage || 
-           studio.gallery?.[0] || 
-           studio.images?.[0] || 
-           "/placeholder.svg?height=200&width=300"
+    return studio.image || "/placeholder.svg?height=200&width=300"
   }
 
   const isStudioVerified = (studio: Studio) => {
     return studio.rating >= 4.0
   }
 
-  const filteredAndSortedStudios = studios
-    .filter(studio => {
-      const matchesSearch = studio.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                          (studio.location || studio.address || '').toLowerCase().includes(searchTerm.toLowerCase()) ||
-                          studio.specialties.some(specialty => 
-                            specialty.toLowerCase().includes(searchTerm.toLowerCase())
-                          )
-      
-      const studioLocation = studio.location || studio.address || ''
-      const matchesLocation = locationFilter === "all" || 
-                            studioLocation.toLowerCase().includes(locationFilter.toLowerCase())
-      
-      const matchesPrice = priceFilter === "all" || 
-                         (priceFilter === "budget" && studio.hourlyRate <= 75) ||
-                         (priceFilter === "mid" && studio.hourlyRate > 75 && studio.hourlyRate <= 150) ||
-                         (priceFilter === "premium" && studio.hourlyRate > 150)
-      
-      return matchesSearch && matchesLocation && matchesPrice
-    })
-    .sort((a, b) => {
-      switch (sortBy) {
-        case "rating":
-          return b.rating - a.rating
-        case "price-low":
-          return a.hourlyRate - b.hourlyRate
-        case "price-high":
-          return b.hourlyRate - a.hourlyRate
-        case "newest":
-          return new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime()
-        default:
-          return 0
-      }
-    })
-
   const handleStudioClick = (studioId: string) => {
     router.push(`/studio/${studioId}`)
   }
@@ -262,7 +233,7 @@ export default function FindStudiosPage() {
           <Card className="mb-8">
             <CardContent className="p-6 text-center">
               <p className="text-destructive mb-4">{error}</p>
-              <Button onClick={fetchStudios}>Try Again</Button>
+              <Button onClick={() => fetchStudios()}>Try Again</Button>
             </CardContent>
           </Card>
         )}
@@ -288,12 +259,12 @@ export default function FindStudiosPage() {
           <div className="space-y-6">
             <div className="flex items-center justify-between">
               <p className="text-muted-foreground">
-                {filteredAndSortedStudios.length} studio{filteredAndSortedStudios.length !== 1 ? 's' : ''} found
+                {studios.length}{nextCursor ? '+' : ''} studio{studios.length !== 1 ? 's' : ''} found
               </p>
             </div>
 
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-              {filteredAndSortedStudios.map((studio) => (
+              {studios.map((studio) => (
                 <Card key={studio.id} className="overflow-hidden hover:shadow-lg transition-shadow cursor-pointer">
                   <div onClick={() => handleStudioClick(studio.id)}>
                     <div className="aspect-video relative overflow-hidden">
@@ -321,7 +292,10 @@ export default function FindStudiosPage() {
                         </h3>
                         <div className="flex items-center gap-2 text-sm text-muted-foreground">
                           <MapPin className="h-3 w-3" />
-                          <span>{studio.location || studio.address || ''}</span>
+                          <span>{studio.location}</span>
+                          {studio.distanceKm !== undefined && (
+                            <span>· {studio.distanceKm} km</span>
+                          )}
                         </div>
                       </div>
 
@@ -335,7 +309,9 @@ export default function FindStudiosPage() {
                         </div>
                         <div className="flex items-center gap-1">
                           <DollarSign className="h-4 w-4" />
-                          <span className="font-medium">${studio.hourlyRate}/hr</span>
+                          <span className="font-medium">
+                            {studio.hourlyRate !== null ? `$${studio.hourlyRate}/hr` : 'Rates on request'}
+                          </span>
                         </div>
                       </div>
 
@@ -359,7 +335,7 @@ export default function FindStudiosPage() {
                     </div>
 
                     <div className="flex gap-2 mt-4">
-                      <BookingDialog studio={studio}>
+                      <BookingDialog studio={{ ...studio, hourlyRate: studio.hourlyRate ?? 0, images: studio.image ? [studio.image] : [] }}>
                         <Button className="flex-1" size="sm">
                           <Music className="mr-1 h-3 w-3" />
                           Book Now
@@ -384,7 +360,19 @@ export default function FindStudiosPage() {
               ))}
             </div>
 
-            {filteredAndSortedStudios.length === 0 && !loading && (
+            {nextCursor && (
+              <div className="flex justify-center">
+                <Button
+                  variant="outline"
+                  onClick={() => fetchStudios(nextCursor)}
+                  disabled={loadingMore}
+                >
+                  {loadingMore ? 'Loading...' : 'Load more studios'}
+                </Button>
+              </div>
+            )}
+
+            {studios.length === 0 && !loading && (
               <Card>
                 <CardContent className="p-8 text-center">
                   <h3 className="text-lg font-semibold mb-2">No studios found</h3>
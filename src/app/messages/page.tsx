@@ -1,8 +1,9 @@
 'use client'
 
-import { useState, useEffect, Suspense } from 'react'
+import { useState, useEffect, useRef, Suspense } from 'react'
 import { useSearchParams, useRouter } from 'next/navigation'
 import { useAuth } from '@/lib/auth'
+import { wsClient, type MessageEvent as RealtimeEvent } from '@/lib/websocket'
 import { useToast } from '@/hooks/use-toast'
 import { InboxSidebar } from '@/components/messages/InboxSidebar'
 import { ChatPanel } from '@/components/messages/ChatPanel'
@@ -69,8 +70,18 @@ function MessagesPageContent() {
   const [userCache, setUserCache] = useState<{ [key: string]: UserInfo }>({})
   const [loading, setLoading] = useState(true)
   const [loadingMessages, setLoadingMessages] = useState(false)
+  // Keyset cursor for the next page of older messages, null when there are none
+  const [olderCursor, setOlderCursor] = useState<{ before: string; beforeId: string } | null>(null)
+  const [loadingOlder, setLoadingOlder] = useState(false)
   const [sending, setSending] = useState(false)
   const [showSidebar, setShowSidebar] = useState(true)
+  // conversationId -> ids of the other participants currently typing there
+  const [typingUsers, setTypingUsers] = useState<{ [conversationId: string]: string[] }>({})
+  // Real-time handlers are registered once, so they read the open conversation from a ref
+  const selectedConversationId = useRef<string | null>(null)
+  selectedConversationId.current = selectedConversation?.id ?? null
+  const loadedConversationIds = useRef<Set<string>>(new Set())
+  loadedConversationIds.current = new Set(conversations.map(conv => conv.id))
 
   // Handle URL parameters for direct messaging
   useEffect(() => {
@@ -87,6 +98,111 @@ function MessagesPageContent() {
     }
   }, [user?.id])
 
+  // Live updates: new messages, read receipts, typing and inbox changes
+  useEffect(() => {
+    if (!user?.id) return
+
+    const typingTimers = new Map<string, ReturnType<typeof setTimeout>>()
+
+    const onMessageCreated = (event: RealtimeEvent) => {
+      const message: Message = event.data
+      if (message.conversationId === selectedConversationId.current) {
+        // Newest first; our own sends may already be here from the POST response
+        setMessages(prev => prev.some(m => m.id === message.id) ? prev : [message, ...prev])
+        if (message.senderId !== user.id) {
+          markMessagesAsRead(message.conversationId)
+        }
+      }
+      clearTyping(message.conversationId, message.senderId)
+    }
+
+    const onConversationUpdated = (event: RealtimeEvent) => {
+      const update = event.data
+      if (!loadedConversationIds.current.has(update.id)) {
+        // A conversation we haven't loaded yet (first message from someone new)
+        fetchConversations()
+        return
+      }
+      setConversations(prev => prev
+        .map(conv => conv.id === update.id
+          ? {
+              ...conv,
+              lastMessage: update.lastMessage,
+              updatedAt: update.updatedAt,
+              unreadCount: update.id === selectedConversationId.current ? 0 : update.unreadCount
+            }
+          : conv)
+        .sort((a, b) => new Date(b.updatedAt).getTime() - new Date(a.updatedAt).getTime()))
+    }
+
+    const onMessageRead = (event: RealtimeEvent) => {
+      if (event.conversationId !== selectedConversationId.current) return
+      const readIds = new Set<string>(event.data.messageIds)
+      setMessages(prev => prev.map(m => readIds.has(m.id) ? { ...m, read: true } : m))
+    }
+
+    const clearTyping = (conversationId: string, typingUserId: string) => {
+      const key = `${conversationId}:${typingUserId}`
+      clearTimeout(typingTimers.get(key))
+      typingTimers.delete(key)
+      setTypingUsers(prev => {
+        const current = prev[conversationId] || []
+        if (!current.includes(typingUserId)) return prev
+        return { ...prev, [conversationId]: current.filter(id => id !== typingUserId) }
+      })
+    }
+
+    const onUserTyping = (event: RealtimeEvent) => {
+      const { userId: typingUserId, isTyping } = event.data
+      const conversationId = event.conversationId
+      if (!conversationId || typingUserId === user.id) return
+
+      if (!isTyping) {
+        clearTyping(conversationId, typingUserId)
+        return
+      }
+      setTypingUsers(prev => {
+        const current = prev[conversationId] || []
+        return current.includes(typingUserId) ? prev : { ...prev, [conversationId]: [...current, typingUserId] }
+      })
+      // Typing notices are resent while typing continues; expire if they stop arriving
+      const key = `${conversationId}:${typingUserId}`
+      clearTimeout(typingTimers.get(key))
+      typingTimers.set(key, setTimeout(() => clearTyping(conversationId, typingUserId), 5000))
+    }
+
+    const onResync = () => {
+      fetchConversations()
+      if (selectedConversationId.current) {
+        loadConversationMessages(selectedConversationId.current)
+      }
+    }
+
+    const subscriptions: Array<[string, (event: RealtimeEvent) => void]> = [
+      ['message_created', onMessageCreated],
+      ['conversation_updated', onConversationUpdated],
+      ['message_read', onMessageRead],
+      ['user_typing', onUserTyping],
+      ['resync', onResync]
+    ]
+    subscriptions.forEach(([type, handler]) => wsClient.on(type, handler))
+    wsClient.connect(user.id)
+
+    return () => {
+      subscriptions.forEach(([type, handler]) => wsClient.off(type, handler))
+      typingTimers.forEach(timer => clearTimeout(timer))
+    }
+  }, [user?.id])
+
+  const handleTyping = (isTyping: boolean) => {
+    if (!selectedConversation) return
+    wsClient.sendEvent({
+      type: 'user_typing',
+      conversationId: selectedConversation.id,
+      data: { isTyping }
+    })
+  }
+
   const fetchConversations = async () => {
     if (!user?.id) return
 
@@ -245,6 +361,9 @@ function MessagesPageContent() {
       if (response.ok) {
         const data = await response.json()
         setMessages(data.messages || [])
+        setOlderCursor(data.pagination?.hasMore
+          ? { before: data.pagination.nextCursor, beforeId: data.pagination.nextCursorId }
+          : null)
         
         // Update conversation with participantsInfo if received
         if (data.conversation?.participantsInfo) {
@@ -271,6 +390,32 @@ function MessagesPageContent() {
     }
   }
 
+  const loadOlderMessages = async () => {
+    if (!user?.id || !selectedConversation || !olderCursor || loadingOlder) return
+
+    setLoadingOlder(true)
+    try {
+      const params = new URLSearchParams({
+        userId: user.id,
+        before: olderCursor.before,
+        beforeId: olderCursor.beforeId
+      })
+      const response = await fetch(`/api/conversations/${selectedConversation.id}/messages?${params}`)
+      if (response.ok) {
+        const data = await response.json()
+        // Messages are kept newest first, so older pages go at the end
+        setMessages(prev => [...prev, ...(data.messages || [])])
+        setOlderCursor(data.pagination?.hasMore
+          ? { before: data.pagination.nextCursor, beforeId: data.pagination.nextCursorId }
+          : null)
+      }
+    } catch (error) {
+      console.error('Error loading older messages:', error)
+    } finally {
+      setLoadingOlder(false)
+    }
+  }
+
   const markMessagesAsRead = async (conversationId: string) => {
     if (!user?.id) return
 
@@ -326,8 +471,9 @@ function MessagesPageContent() {
       if (response.ok) {
         const data = await response.json()
         
-        // The new API returns the message with senderInfo
-        setMessages(prev => [...prev, data.data])
+        // The new API returns the message with senderInfo; newest first, and the
+        // real-time echo of it may have arrived before this response
+        setMessages(prev => prev.some(m => m.id === data.data.id) ? prev : [data.data, ...prev])
         
         // Update conversation in list
         setConversations(prev => prev.map(conv => 
@@ -358,6 +504,7 @@ function MessagesPageContent() {
     setShowSidebar(true)
     setSelectedConversation(null)
     setMessages([])
+    setOlderCursor(null)
   }
 
   const handleConversationDeleted = (conversationId: string) => {
@@ -438,9 +585,14 @@ function MessagesPageContent() {
             userCache={userCache}
             currentUserId={user.id}
             onSendMessage={handleSendMessage}
+            onTyping={handleTyping}
+            typingUserIds={selectedConversation ? typingUsers[selectedConversation.id] || [] : []}
             onBack={handleBack}
             loading={loadingMessages}
             sending={sending}
+            hasOlderMessages={!!olderCursor}
+            loadingOlder={loadingOlder}
+            onLoadOlder={loadOlderMessages}
             onConversationDeleted={handleConversationDeleted}
           />
         </div>
@@ -7,6 +7,7 @@ import { ArrowLeft, Calendar, Clock, User, DollarSign, Check, X, MessageSquare,
 import { useAuth } from "@/lib/auth"
 import { useToast } from "@/hooks/use-toast"
 import { API_BASE_URL } from "@/lib/config"
+import { wsClient } from "@/lib/websocket"
 import { buildArtistProfileHrefFromParams } from "@/lib/url-utils"
 
 import { Button } from "@/components/ui/button"
@@ -159,6 +160,19 @@ export default function BookingsPage() {
     fetchBookingRequests()
   }, [])
 
+  // Refetch when a booking is requested or changes status elsewhere
+  useEffect(() => {
+    if (!user?.id) return
+    const refresh = () => fetchBookingRequests()
+    wsClient.on('booking_status_changed', refresh)
+    wsClient.on('resync', refresh)
+    wsClient.connect(user.id)
+    return () => {
+      wsClient.off('booking_status_changed', refresh)
+      wsClient.off('resync', refresh)
+    }
+  }, [user?.id])
+
   const handleBookingAction = async (requestId: string, action: 'approve' | 'reject') => {
     try {
       console.log(`📋 [Bookings] ${action}ing booking request:`, requestId)
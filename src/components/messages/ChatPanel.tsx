@@ -69,6 +69,11 @@ interface ChatPanelProps {
   loading?: boolean;
   sending?: boolean;
   onConversationDeleted?: (conversationId: string) => void;
+  hasOlderMessages?: boolean;
+  loadingOlder?: boolean;
+  onLoadOlder?: () => void;
+  onTyping?: (isTyping: boolean) => void;
+  typingUserIds?: string[];
 }
 
 export function ChatPanel({
@@ -80,7 +85,12 @@ export function ChatPanel({
   onBack,
   loading = false,
   sending = false,
-  onConversationDeleted
+  onConversationDeleted,
+  hasOlderMessages = false,
+  loadingOlder = false,
+  onLoadOlder,
+  onTyping,
+  typingUserIds = []
 }: ChatPanelProps) {
   const messagesEndRef = useRef<HTMLDivElement>(null);
   const scrollContainerRef = useRef<HTMLDivElement>(null);
@@ -265,6 +275,13 @@ export function ChatPanel({
           </div>
         ) : (
           <>
+            {hasOlderMessages && onLoadOlder && (
+              <div className="flex justify-center mb-4">
+                <Button variant="ghost" size="sm" onClick={onLoadOlder} disabled={loadingOlder}>
+                  {loadingOlder ? 'Loading...' : 'Load earlier messages'}
+                </Button>
+              </div>
+            )}
             {displayMessages.map((message, index) => {
               const isFromCurrentUser = message.senderId === currentUserId;
               const previousMessage = index > 0 ? displayMessages[index - 1] : undefined;
@@ -314,6 +331,11 @@ export function ChatPanel({
                 </div>
               );
             })}
+            {typingUserIds.length > 0 && (
+              <div className="text-xs text-muted-foreground italic px-2 pb-2">
+                {typingUserIds.map(id => userCache[id]?.name || 'Someone').join(', ')} {typingUserIds.length > 1 ? 'are' : 'is'} typing...
+              </div>
+            )}
             <div ref={messagesEndRef} />
           </>
         )}
@@ -322,6 +344,7 @@ export function ChatPanel({
       {/* Message Input */}
       <MessageInput 
         onSendMessage={onSendMessage}
+        onTyping={onTyping}
         disabled={sending}
         placeholder={`Message ${otherParticipant?.name || 'user'}...`}
       />
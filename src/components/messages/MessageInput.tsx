@@ -18,12 +18,17 @@ interface MessageInputProps {
   onSendMessage: (text: string, attachment?: { type: 'attachment'; url: string; filename: string }) => Promise<void>;
   disabled?: boolean;
   placeholder?: string;
+  onTyping?: (isTyping: boolean) => void;
 }
 
+// Resend "typing" at most this often while the user keeps typing
+const TYPING_THROTTLE_MS = 3000
+
 export function MessageInput({
   onSendMessage,
   disabled = false,
-  placeholder = "Type a message..."
+  placeholder = "Type a message...",
+  onTyping
 }: MessageInputProps) {
   const [message, setMessage] = useState('')
   const [sending, setSending] = useState(false)
@@ -32,6 +37,20 @@ export function MessageInput({
   const fileInputRef = useRef<HTMLInputElement>(null)
   const textareaRef = useRef<HTMLTextAreaElement>(null)
   const { toast } = useToast()
+  const lastTypingSentAt = useRef(0)
+
+  const handleChange = (value: string) => {
+    setMessage(value)
+    if (!onTyping) return
+    const now = Date.now()
+    if (value && now - lastTypingSentAt.current > TYPING_THROTTLE_MS) {
+      lastTypingSentAt.current = now
+      onTyping(true)
+    } else if (!value && lastTypingSentAt.current) {
+      lastTypingSentAt.current = 0
+      onTyping(false)
+    }
+  }
 
   const handleSend = async (attachment?: { type: 'attachment'; url: string; filename: string }) => {
     const trimmedMessage = message.trim()
@@ -41,6 +60,8 @@ export function MessageInput({
     try {
       await onSendMessage(trimmedMessage || "📎 Attachment", attachment)
       setMessage('')
+      // The new message clears the indicator on the other side
+      lastTypingSentAt.current = 0
     } catch (error) {
       console.error('Failed to send message:', error)
     } finally {
@@ -86,12 +107,13 @@ export function MessageInput({
 
     setUploading(true)
     try {
-      const formData = new FormData()
-      formData.append('file', file)
-
       const response = await fetch('/api/upload/attachment', {
         method: 'POST',
-        body: formData
+        headers: {
+          'Content-Type': file.type || 'application/octet-stream',
+          'X-File-Name': encodeURIComponent(file.name)
+        },
+        body: file
       })
 
       if (response.ok) {
@@ -158,7 +180,7 @@ export function MessageInput({
           <Textarea
             ref={textareaRef}
             value={message}
-            onChange={(e) => setMessage(e.target.value)}
+            onChange={(e) => handleChange(e.target.value)}
             onKeyDown={handleKeyDown}
             placeholder={placeholder}
             disabled={disabled || sending}
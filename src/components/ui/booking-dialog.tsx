@@ -60,6 +60,18 @@ interface Studio {
   staff?: StaffMember[]
 }
 
+interface TimeRange {
+  startTime: string
+  endTime: string
+}
+
+interface DayAvailability {
+  date: string
+  open: TimeRange | null
+  booked: (TimeRange & { status: string })[]
+  free: TimeRange[]
+}
+
 interface PaymentMethod {
   id: string
   brand: string
@@ -94,6 +106,7 @@ export function BookingDialog({ studio, children }: BookingDialogProps) {
     endTime: "",
     message: ""
   })
+  const [availability, setAvailability] = useState<DayAvailability | null>(null)
 
   // Fetch room and staff data when dialog opens
   useEffect(() => {
@@ -103,6 +116,28 @@ export function BookingDialog({ studio, children }: BookingDialogProps) {
     }
   }, [isOpen, studio.id, user?.id])
 
+  // Free and booked times for the selected room on the selected date
+  useEffect(() => {
+    if (!isOpen || !selectedRoom?.id || !bookingData.date) {
+      setAvailability(null)
+      return
+    }
+
+    let cancelled = false
+    const params = new URLSearchParams({ roomId: selectedRoom.id, from: bookingData.date })
+    fetch(`${API_BASE_URL}/api/studios/${studio.id}/availability?${params}`)
+      .then(response => (response.ok ? response.json() : null))
+      .then(data => {
+        if (!cancelled) setAvailability(data?.days?.[0] ?? null)
+      })
+      .catch(error => {
+        console.error('Error fetching availability:', error)
+      })
+    return () => {
+      cancelled = true
+    }
+  }, [isOpen, studio.id, selectedRoom?.id, bookingData.date])
+
   const fetchStudioData = async () => {
     try {
       const response = await fetch(`${API_BASE_URL}/api/studios/${studio.id}`)
@@ -150,6 +185,10 @@ export function BookingDialog({ studio, children }: BookingDialogProps) {
 
   const totalCost = selectedRoom ? selectedRoom.hourlyRate * calculateDuration() : 0
 
+  // "HH:MM" strings compare in time order
+  const overlapsBooking = !!availability && !!bookingData.startTime && !!bookingData.endTime &&
+    availability.booked.some(range => range.startTime < bookingData.endTime && range.endTime > bookingData.startTime)
+
   const handleProceedToPayment = () => {
     if (!user) {
       toast({
@@ -187,6 +226,15 @@ export function BookingDialog({ studio, children }: BookingDialogProps) {
       return
     }
 
+    if (overlapsBooking) {
+      toast({
+        title: "Time Slot Unavailable",
+        description: "This time overlaps an existing booking. Please pick one of the available times.",
+        variant: "destructive"
+      })
+      return
+    }
+
     // Check for payment method
     if (!hasPaymentMethod || paymentMethods.length === 0) {
       const currentUrl = encodeURIComponent(window.location.href)
@@ -404,6 +452,34 @@ export function BookingDialog({ studio, children }: BookingDialogProps) {
                 </div>
               </div>
 
+              {availability && (
+                <div className="space-y-2">
+                  <Label>Available Times</Label>
+                  {availability.free.length === 0 ? (
+                    <p className="text-sm text-muted-foreground">
+                      {availability.open ? "This room is fully booked on this date." : "The studio is closed on this date."}
+                    </p>
+                  ) : (
+                    <div className="flex flex-wrap gap-2">
+                      {availability.free.map((range) => (
+                        <Button
+                          key={range.startTime}
+                          type="button"
+                          variant="outline"
+                          size="sm"
+                          onClick={() => setBookingData(prev => ({ ...prev, startTime: range.startTime, endTime: range.endTime }))}
+                        >
+                          {range.startTime} - {range.endTime}
+                        </Button>
+                      ))}
+                    </div>
+                  )}
+                  {overlapsBooking && (
+                    <p className="text-sm text-destructive">The selected time overlaps an existing booking.</p>
+                  )}
+                </div>
+              )}
+
               {staffMembers.length > 0 && (
                 <div className="space-y-2">
                   <Label htmlFor="staff">Producer/Engineer (Optional)</Label>
@@ -69,15 +69,15 @@ export function ImageUpload({
       setUploading(true)
       setError(null)
 
-      // Create FormData for proper file upload
-      const formData = new FormData()
-      formData.append('file', file)
-      formData.append('userId', userId)
-
+      // Send the file as the raw body so the server can stream it to storage
           const endpoint = type === 'banner' ? '/api/upload/banner' : '/api/upload/avatar'
-          const response = await fetch(`${API_BASE_URL}${endpoint}`, {
+          const response = await fetch(`${API_BASE_URL}${endpoint}?userId=${encodeURIComponent(userId)}`, {
             method: 'POST',
-        body: formData
+        headers: {
+          'Content-Type': file.type,
+          'X-File-Name': encodeURIComponent(file.name)
+        },
+        body: file
           })
 
           if (!response.ok) {
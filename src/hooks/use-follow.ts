@@ -18,6 +18,49 @@ interface FollowData {
   slug?: string
 }
 
+// Status lookups made in the same tick (a grid of FollowButtons mounting) share one request
+const MAX_STATUS_BATCH = 100
+
+interface PendingStatus {
+  targetId: string
+  resolve: (status: FollowStatus | null) => void
+}
+
+const pendingStatuses = new Map<string, PendingStatus[]>()
+
+async function flushStatuses(followerId: string) {
+  const pending = pendingStatuses.get(followerId) || []
+  pendingStatuses.delete(followerId)
+
+  for (let start = 0; start < pending.length; start += MAX_STATUS_BATCH) {
+    const batch = pending.slice(start, start + MAX_STATUS_BATCH)
+    const targetIds = Array.from(new Set(batch.map(entry => entry.targetId)))
+    let statuses: Record<string, FollowStatus> = {}
+    try {
+      const params = new URLSearchParams({ followerId, targetIds: targetIds.join(',') })
+      const response = await fetch(`/api/follow/status?${params}`)
+      if (response.ok) {
+        statuses = (await response.json()).statuses || {}
+      }
+    } catch (error) {
+      console.error('Failed to fetch follow status:', error)
+    }
+    batch.forEach(entry => entry.resolve(statuses[entry.targetId] || null))
+  }
+}
+
+function loadFollowStatus(followerId: string, targetId: string): Promise<FollowStatus | null> {
+  return new Promise(resolve => {
+    const pending = pendingStatuses.get(followerId)
+    if (pending) {
+      pending.push({ targetId, resolve })
+      return
+    }
+    pendingStatuses.set(followerId, [{ targetId, resolve }])
+    setTimeout(() => flushStatuses(followerId), 0)
+  })
+}
+
 export function useFollow(targetId: string) {
   const { user } = useAuth()
   const { toast } = useToast()
@@ -32,20 +75,13 @@ export function useFollow(targetId: string) {
   const fetchFollowStatus = useCallback(async () => {
     if (!user?.id || !targetId) return
 
-    try {
-      const response = await fetch(
-        `/api/users/${user.id}/follow-status/${targetId}`
-      )
-      if (response.ok) {
-        const data = await response.json()
-        setFollowStatus({
-          isFollowing: data.isFollowing,
-          followersCount: data.followersCount,
-          followingCount: data.followingCount
-        })
-      }
-    } catch (error) {
-      console.error('Failed to fetch follow status:', error)
+    const status = await loadFollowStatus(user.id, targetId)
+    if (status) {
+      setFollowStatus({
+        isFollowing: status.isFollowing,
+        followersCount: status.followersCount,
+        followingCount: status.followingCount
+      })
     }
   }, [user?.id, targetId])
 
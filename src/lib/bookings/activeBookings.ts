@@ -1,7 +1,6 @@
-import fs from 'fs';
-import path from 'path';
-
-const BOOKINGS_FILE = path.join(process.cwd(), 'data', 'bookings.json');
+import { findById, findMany, putRecords } from '@/lib/data-store';
+import { imageVariantUrl } from '@/lib/images/variants';
+import { log } from '@/lib/log';
 
 // Shared constant for consistent artist brief selection across all booking APIs
 export const artistBriefSelect = {
@@ -18,28 +17,12 @@ export interface ArtistBrief {
   slug: string | null;
   avatarUrl: string | null;
 }
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
-const PROFILES_FILE = path.join(process.cwd(), 'data', 'user-profiles.json');
 
 // Helper function to get user info consistent with artistBriefSelect
 function getUserInfo(userId: string): ArtistBrief | null {
   try {
-    let user = null;
-    let profile = null;
-
-    // Get basic user info
-    if (fs.existsSync(USERS_FILE)) {
-      const usersData = fs.readFileSync(USERS_FILE, 'utf8');
-      const users = JSON.parse(usersData);
-      user = users.find((u: any) => u.id === userId);
-    }
-
-    // Get profile info for avatar
-    if (fs.existsSync(PROFILES_FILE)) {
-      const profilesData = fs.readFileSync(PROFILES_FILE, 'utf8');
-      const profiles = JSON.parse(profilesData);
-      profile = profiles.find((p: any) => p.id === userId);
-    }
+    const user = findById('users', userId);
+    const profile = findById('profiles', userId);
 
     // Return data consistent with artistBriefSelect format
     if (user || profile) {
@@ -47,7 +30,7 @@ function getUserInfo(userId: string): ArtistBrief | null {
         id: userId,
         displayName: user?.name || profile?.name || 'Unknown Artist',
         slug: user?.slug || profile?.slug || null,
-        avatarUrl: profile?.profileImage || null  // ABSOLUTELY ensure avatarUrl is present
+        avatarUrl: imageVariantUrl(profile?.profileImage, 'thumb') || null  // ABSOLUTELY ensure avatarUrl is present
       };
     }
   } catch (error) {
@@ -56,13 +39,9 @@ function getUserInfo(userId: string): ArtistBrief | null {
   return null;
 }
 
-// Helper function to save bookings back to file
-function saveBookings(bookings: any[]): void {
-  const dataDir = path.dirname(BOOKINGS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-  fs.writeFileSync(BOOKINGS_FILE, JSON.stringify({ bookings }, null, 2));
+// Helper function to save new or changed bookings
+async function saveBookings(bookings: any[]): Promise<void> {
+  await putRecords({ bookings });
 }
 
 // Auto-completion logic: move CONFIRMED bookings to COMPLETED when endDateTime < now
@@ -92,25 +71,20 @@ function autoCompleteBookings(bookings: any[]): { updated: boolean, bookings: an
 
 export async function getActiveBookings(studioId: string) {
   try {
-    if (!fs.existsSync(BOOKINGS_FILE)) {
-      return [];
-    }
-    
-    const data = fs.readFileSync(BOOKINGS_FILE, 'utf8');
-    const parsed = JSON.parse(data);
-    let allBookings = parsed.bookings || [];
+    let studioBookings = findMany('bookings', 'studioId', studioId);
     
-    // Run auto-completion logic (nightly cron equivalent)
-    const { updated, bookings: updatedBookings } = autoCompleteBookings(allBookings);
+    // Run auto-completion logic (nightly cron equivalent) on this studio's bookings,
+    // writing only the ones that changed
+    const { updated, bookings: updatedBookings } = autoCompleteBookings(studioBookings);
     if (updated) {
-      console.log('🔄 Auto-completed expired bookings');
-      saveBookings(updatedBookings);
-      allBookings = updatedBookings;
+      const completed = updatedBookings.filter((booking: any, i: number) => booking !== studioBookings[i]);
+      log.info('🔄 Auto-completed expired bookings');
+      await saveBookings(completed);
+      studioBookings = updatedBookings;
     }
     
-    // Filter by studioId and return all non-canceled bookings (status in ['PENDING','CONFIRMED','COMPLETED'])
-    const filteredBookings = allBookings.filter((booking: any) => 
-      booking.studioId === studioId && 
+    // Return all non-canceled bookings (status in ['PENDING','CONFIRMED','COMPLETED'])
+    const filteredBookings = studioBookings.filter((booking: any) => 
       booking.status !== 'CANCELED' && 
       booking.status !== 'cancelled' &&
       booking.status !== 'rejected'  // Also exclude rejected bookings
@@ -0,0 +1,251 @@
+import { findRange } from '@/lib/data-store';
+import {
+  formatMinutes,
+  isConfirmedStatus,
+  MINUTES_PER_DAY,
+  roomKey,
+  slotKey,
+  toMinutes
+} from './slot-keys';
+
+/**
+ * A room's time on one day. Bookings made before studios had rooms have no
+ * roomId and are checked against each other.
+ */
+export interface Slot {
+  studioId: string;
+  roomId?: string | null;
+  date: string;
+  startTime: string;
+  endTime: string;
+}
+
+export interface TimeRange {
+  startTime: string;
+  endTime: string;
+}
+
+export interface DayAvailability {
+  date: string;
+  // Opening hours, or null when the studio is closed that day
+  open: TimeRange | null;
+  booked: (TimeRange & { status: string })[];
+  free: TimeRange[];
+}
+
+interface Interval {
+  start: number;
+  end: number;
+}
+
+// A slot claimed by a request that is still waiting on payment
+interface Hold extends Interval {
+  owner: string;
+  date: string;
+  confirmed: boolean;
+}
+
+// Longest date range the availability endpoint answers in one call
+export const MAX_AVAILABILITY_DAYS = 62;
+
+const DAY_NAMES = ['sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday'];
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// Collections holding bookings: requests awaiting the studio, and bookings proper
+const BOOKING_COLLECTIONS = ['bookings', 'bookingRequests'] as const;
+
+// Keep holds on globalThis so they survive Next.js dev-server module reloads
+const globalForHolds = globalThis as unknown as { __hitconnectorSlotHolds?: Map<string, Hold[]> };
+const holdsByRoom: Map<string, Hold[]> = globalForHolds.__hitconnectorSlotHolds ??= new Map();
+
+const DATE_PATTERN = /^\d{4}-\d{2}-\d{2}$/;
+
+export function isValidDate(date: unknown): date is string {
+  if (typeof date !== 'string' || !DATE_PATTERN.test(date)) return false;
+  const time = Date.parse(`${date}T00:00:00Z`);
+  // Date.parse rolls days past the end of the month over (2024-02-30 is March 1), so the date must survive a round trip
+  return !isNaN(time) && new Date(time).toISOString().slice(0, 10) === date;
+}
+
+/**
+ * The slot's start and end in minutes, or null if it isn't a valid range on a valid date
+ */
+export function slotInterval(slot: Slot): Interval | null {
+  const start = toMinutes(slot.startTime);
+  const end = toMinutes(slot.endTime);
+  if (!isValidDate(slot.date) || start === null || end === null || end <= start) return null;
+  return { start, end };
+}
+
+// Every booking holding the room whose start falls in [from, to), from both collections
+function bookingsStarting(room: string, from: string, to: string): any[] {
+  const seen = new Set<string>();
+  const bookings: any[] = [];
+  for (const name of BOOKING_COLLECTIONS) {
+    for (const booking of findRange(name, 'slots', room, { from, to }).records) {
+      // A confirmed request is copied into bookings under the same id
+      if (seen.has(booking.id)) continue;
+      seen.add(booking.id);
+      bookings.push(booking);
+    }
+  }
+  return bookings;
+}
+
+/**
+ * Bookings and in-flight claims that overlap the slot. Only bookings on the
+ * same day can overlap, so this reads the day's bookings that start before
+ * the slot ends straight off the room's sorted index.
+ *
+ * `ignoreId` leaves out the booking being checked; `confirmedOnly` ignores
+ * pending requests, for confirming one request among several for the same time.
+ */
+export function findConflicts(
+  slot: Slot,
+  options: { ignoreId?: string | null; confirmedOnly?: boolean } = {}
+): any[] {
+  const interval = slotInterval(slot);
+  if (!interval) return [];
+  const room = roomKey(slot.studioId, slot.roomId);
+
+  const conflicts = bookingsStarting(room, slotKey(slot.date, 0), slotKey(slot.date, interval.end))
+    .filter(booking =>
+      booking.id !== options.ignoreId &&
+      (toMinutes(booking.endTime) ?? 0) > interval.start &&
+      (!options.confirmedOnly || isConfirmedStatus(booking.status))
+    );
+
+  for (const hold of holdsByRoom.get(room) ?? []) {
+    if (
+      hold.owner !== options.ignoreId &&
+      hold.date === slot.date &&
+      hold.start < interval.end &&
+      hold.end > interval.start &&
+      (!options.confirmedOnly || hold.confirmed)
+    ) {
+      conflicts.push({ id: hold.owner, ...slot, status: hold.confirmed ? 'confirmed' : 'pending' });
+    }
+  }
+  return conflicts;
+}
+
+/**
+ * Check the slot is free and claim it for `owner` in one step, so a request
+ * that has to wait (on Stripe, say) before saving its booking can't be beaten
+ * to the same time by another. Returns null if the slot is taken; otherwise
+ * call `release` once the booking has been written, or abandoned.
+ */
+export function claimSlot(
+  slot: Slot,
+  owner: string,
+  options: { confirmed?: boolean } = {}
+): { release: () => void } | null {
+  const interval = slotInterval(slot);
+  if (!interval) return null;
+  if (findConflicts(slot, { ignoreId: owner, confirmedOnly: options.confirmed }).length > 0) return null;
+
+  const room = roomKey(slot.studioId, slot.roomId);
+  const hold: Hold = { ...interval, owner, date: slot.date, confirmed: !!options.confirmed };
+  const holds = holdsByRoom.get(room) ?? [];
+  holds.push(hold);
+  holdsByRoom.set(room, holds);
+
+  return {
+    release: () => {
+      const current = holdsByRoom.get(room);
+      const at = current ? current.indexOf(hold) : -1;
+      if (!current || at < 0) return;
+      current.splice(at, 1);
+      if (current.length === 0) holdsByRoom.delete(room);
+    }
+  };
+}
+
+/**
+ * Opening hours on a date from the studio's weekly `operatingHours`; studios
+ * that never set hours are open all day. Hours closing at or before they open
+ * run to midnight, since bookings don't span days.
+ */
+export function openingHours(studio: any, date: string): Interval | null {
+  const day = DAY_NAMES[new Date(`${date}T00:00:00Z`).getUTCDay()];
+  const hours = studio?.operatingHours?.[day];
+  if (!hours) return { start: 0, end: MINUTES_PER_DAY };
+  if (hours.closed) return null;
+  const start = toMinutes(hours.open) ?? 0;
+  let end = toMinutes(hours.close) ?? MINUTES_PER_DAY;
+  if (end <= start) end = MINUTES_PER_DAY;
+  return { start, end };
+}
+
+/**
+ * Number of dates from `from` to `to` inclusive, without listing them
+ */
+export function daySpan(from: string, to: string): number {
+  return Math.round((Date.parse(`${to}T00:00:00Z`) - Date.parse(`${from}T00:00:00Z`)) / DAY_MS) + 1;
+}
+
+/**
+ * Dates from `from` to `to` inclusive
+ */
+export function datesBetween(from: string, to: string): string[] {
+  const dates: string[] = [];
+  const last = Date.parse(`${to}T00:00:00Z`);
+  for (let time = Date.parse(`${from}T00:00:00Z`); time <= last; time += DAY_MS) {
+    dates.push(new Date(time).toISOString().slice(0, 10));
+  }
+  return dates;
+}
+
+const toRange = ({ start, end }: Interval): TimeRange => ({ startTime: formatMinutes(start), endTime: formatMinutes(end) });
+
+/**
+ * A room's bookings and free time for each day from `from` to `to`
+ * (inclusive), read with one range scan of the room's index
+ */
+export function roomAvailability(studio: any, roomId: string | null, from: string, to: string): DayAvailability[] {
+  const room = roomKey(studio.id, roomId);
+  const byDate = new Map<string, { interval: Interval; status: string }[]>();
+  const add = (date: string, interval: Interval, status: string) => {
+    const day = byDate.get(date) ?? [];
+    day.push({ interval, status });
+    byDate.set(date, day);
+  };
+
+  // "~" sorts after every time, so the range ends after the last booking on `to`
+  const bookings = bookingsStarting(room, slotKey(from, 0), `${to}T~`);
+  for (const booking of bookings) {
+    const interval = slotInterval(booking);
+    if (interval) add(booking.date, interval, String(booking.status).toLowerCase());
+  }
+  // Claims for bookings already written are shown as the booking
+  const written = new Set(bookings.map(booking => booking.id));
+  for (const hold of holdsByRoom.get(room) ?? []) {
+    if (hold.date >= from && hold.date <= to && !written.has(hold.owner)) {
+      add(hold.date, hold, hold.confirmed ? 'confirmed' : 'pending');
+    }
+  }
+
+  return datesBetween(from, to).map(date => {
+    const open = openingHours(studio, date);
+    const booked = (byDate.get(date) ?? []).sort((a, b) => a.interval.start - b.interval.start);
+
+    // Walk the day's bookings in start order, keeping the gaps between them inside opening hours
+    const free: TimeRange[] = [];
+    if (open) {
+      let cursor = open.start;
+      for (const { interval } of booked) {
+        if (interval.start > cursor) free.push(toRange({ start: cursor, end: Math.min(interval.start, open.end) }));
+        cursor = Math.max(cursor, interval.end);
+        if (cursor >= open.end) break;
+      }
+      if (cursor < open.end) free.push(toRange({ start: cursor, end: open.end }));
+    }
+
+    return {
+      date,
+      open: open && toRange(open),
+      booked: booked.map(({ interval, status }) => ({ ...toRange(interval), status })),
+      free
+    };
+  });
+}
@@ -1,5 +1,5 @@
-import fs from 'fs';
-import path from 'path';
+import { findById } from '@/lib/data-store';
+import { log } from '@/lib/log';
 
 interface Booking {
   id: string;
@@ -22,66 +22,6 @@ interface Booking {
   updatedAt?: string;
 }
 
-interface User {
-  id: string;
-  email: string;
-  name: string;
-  role: string;
-}
-
-interface Studio {
-  id: string;
-  name: string;
-  owner: string;
-}
-
-const DATA_DIR = process.cwd();
-const USERS_FILE = path.join(DATA_DIR, 'data', 'users.json');
-const STUDIOS_FILE = path.join(DATA_DIR, 'data', 'studios.json');
-
-// Cache for validation data
-let userCache: Set<string> | null = null;
-let studioCache: Set<string> | null = null;
-let cacheTimestamp = 0;
-const CACHE_TTL = 60000; // 1 minute
-
-/**
- * Load and cache user/studio IDs for validation
- */
-function loadValidationCache(): void {
-  const now = Date.now();
-  
-  // Only reload cache if it's expired or empty
-  if (userCache && studioCache && (now - cacheTimestamp) < CACHE_TTL) {
-    return;
-  }
-
-  try {
-    // Load users
-    const users: User[] = fs.existsSync(USERS_FILE) 
-      ? JSON.parse(fs.readFileSync(USERS_FILE, 'utf8'))
-      : [];
-    userCache = new Set(users.map(u => u.id));
-
-    // Load studios
-    const studiosData = fs.existsSync(STUDIOS_FILE) 
-      ? JSON.parse(fs.readFileSync(STUDIOS_FILE, 'utf8'))
-      : { studios: [] };
-    const studios: Studio[] = studiosData.studios || studiosData;
-    studioCache = new Set(studios.map(s => s.id));
-
-    cacheTimestamp = now;
-    
-    console.log(`🔒 [Safety Guards] Cache updated: ${userCache.size} users, ${studioCache.size} studios`);
-  } catch (error) {
-    console.error('❌ [Safety Guards] Error loading validation cache:', error);
-    // Initialize empty caches to prevent repeated errors
-    userCache = new Set();
-    studioCache = new Set();
-    cacheTimestamp = now;
-  }
-}
-
 /**
  * Validate booking data integrity
  * Used as a safety guard in booking fetchers
@@ -92,17 +32,14 @@ export function validateBookingIntegrity(booking: Booking): boolean {
     return false;
   }
 
-  // Ensure cache is loaded
-  loadValidationCache();
-
   // Check user exists
-  if (!booking.userId || !userCache!.has(booking.userId)) {
+  if (!booking.userId || !findById('users', booking.userId)) {
     console.warn(`⚠️ [Safety Guards] Invalid booking ${booking.id}: user ${booking.userId} not found`);
     return false;
   }
 
   // Check studio exists
-  if (!booking.studioId || !studioCache!.has(booking.studioId)) {
+  if (!booking.studioId || !findById('studios', booking.studioId)) {
     console.warn(`⚠️ [Safety Guards] Invalid booking ${booking.id}: studio ${booking.studioId} not found`);
     return false;
   }
@@ -136,18 +73,8 @@ export function filterValidBookings(bookings: Booking[]): Booking[] {
   
   const filteredCount = bookings.length - validBookings.length;
   if (filteredCount > 0) {
-    console.log(`🧹 [Safety Guards] Filtered out ${filteredCount} invalid bookings`);
+    log.debug(`🧹 [Safety Guards] Filtered out ${filteredCount} invalid bookings`);
   }
   
   return validBookings;
 }
-
-/**
- * Force cache refresh (useful for testing or after data updates)
- */
-export function refreshValidationCache(): void {
-  userCache = null;
-  studioCache = null;
-  cacheTimestamp = 0;
-  loadValidationCache();
-} 
\ No newline at end of file
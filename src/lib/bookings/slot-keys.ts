@@ -0,0 +1,68 @@
+/**
+ * Index keys for room availability. The data store files every booking that
+ * holds a room's time under the room (see the bookings and bookingRequests
+ * `slots` indexes in data-store.ts), sorted by when it starts, and the
+ * availability module builds the same keys to read a room's day as a range.
+ */
+
+// Statuses that keep a room's time; cancelled, rejected and completed bookings free it
+const HOLDING_STATUSES = new Set(['pending', 'confirmed']);
+
+export const MINUTES_PER_DAY = 24 * 60;
+
+/**
+ * Minutes since midnight for "HH:MM" (or "HH:MM:SS"), or null if it isn't a time
+ */
+export function toMinutes(time: unknown): number | null {
+  if (typeof time !== 'string') return null;
+  const match = /^(\d{1,2}):(\d{2})(?::\d{2})?$/.exec(time.trim());
+  if (!match) return null;
+  const minutes = Number(match[1]) * 60 + Number(match[2]);
+  return Number(match[2]) < 60 && minutes <= MINUTES_PER_DAY ? minutes : null;
+}
+
+export function formatMinutes(minutes: number): string {
+  const hours = Math.floor(minutes / 60);
+  return `${String(hours).padStart(2, '0')}:${String(minutes % 60).padStart(2, '0')}`;
+}
+
+export function isHoldingStatus(status: unknown): boolean {
+  return typeof status === 'string' && HOLDING_STATUSES.has(status.toLowerCase());
+}
+
+export function isConfirmedStatus(status: unknown): boolean {
+  return typeof status === 'string' && status.toLowerCase() === 'confirmed';
+}
+
+/**
+ * Bucket for a room's bookings. Bookings made before studios had rooms are
+ * filed under the studio with an empty room.
+ */
+export function roomKey(studioId: string, roomId?: string | null): string {
+  return `${studioId}/${roomId ?? ''}`;
+}
+
+/**
+ * Sort key for a time on a date. Without an id it sorts before every booking
+ * starting at that time.
+ */
+export function slotKey(date: string, minutes: number, id?: string): string {
+  const key = `${date}T${formatMinutes(minutes)}`;
+  return id === undefined ? key : `${key}|${id}`;
+}
+
+/**
+ * The room a booking is holding time in, or null when it holds none
+ * (inactive, or missing a date or a valid time range)
+ */
+export function heldRoom(booking: any): string | null {
+  if (!booking?.studioId || !booking.date || !isHoldingStatus(booking.status)) return null;
+  const start = toMinutes(booking.startTime);
+  const end = toMinutes(booking.endTime);
+  if (start === null || end === null || end <= start) return null;
+  return roomKey(booking.studioId, booking.roomId);
+}
+
+export function slotStartKey(booking: any): string {
+  return slotKey(String(booking?.date ?? ''), toMinutes(booking?.startTime) ?? 0, booking?.id ?? '');
+}
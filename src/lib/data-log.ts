@@ -0,0 +1,168 @@
+import fs from 'fs';
+import path from 'path';
+
+/**
+ * A single change to a collection. Puts are keyed by the record's primary key,
+ * so replaying an op more than once is harmless.
+ */
+export type LogOp =
+  | { collection: string; op: 'put'; record: any }
+  | { collection: string; op: 'delete'; key: string };
+
+/**
+ * The log grew past the end this process last wrote: another process appended
+ * to it. Re-read the log before appending again.
+ */
+export class LogConflictError extends Error {
+  constructor(logPath: string) {
+    super(`${logPath} was appended to by another process`);
+  }
+}
+
+export interface LogContents {
+  // Committed batches, oldest first; each batch was written as one line
+  batches: LogOp[][];
+  // Byte length of the valid prefix of the log
+  bytes: number;
+}
+
+/**
+ * Identity of a file on disk, or null when it is missing or cannot be stat'ed
+ */
+export function fileSignature(fullPath: string): string | null {
+  try {
+    const stats = fs.statSync(fullPath);
+    return `${stats.mtimeMs}:${stats.size}:${stats.ino}`;
+  } catch {
+    return null;
+  }
+}
+
+function fsyncDirectory(dir: string): void {
+  // Persists the rename itself; not supported on every platform, so best effort
+  try {
+    const fd = fs.openSync(dir, 'r');
+    try {
+      fs.fsyncSync(fd);
+    } finally {
+      fs.closeSync(fd);
+    }
+  } catch {
+    // ignore
+  }
+}
+
+/**
+ * Replace a file without ever exposing a partially written version: write a
+ * temp file next to it, fsync, then rename over the original.
+ */
+export function writeFileAtomic(fullPath: string, contents: string): void {
+  const tmpPath = `${fullPath}.${process.pid}.${Date.now()}.tmp`;
+  try {
+    const fd = fs.openSync(tmpPath, 'w');
+    try {
+      fs.writeSync(fd, contents);
+      fs.fsyncSync(fd);
+    } finally {
+      fs.closeSync(fd);
+    }
+    fs.renameSync(tmpPath, fullPath);
+  } catch (error) {
+    try {
+      fs.rmSync(tmpPath, { force: true });
+    } catch {
+      // ignore
+    }
+    throw error;
+  }
+  fsyncDirectory(path.dirname(fullPath));
+}
+
+function headerLine(baseSignature: string): string {
+  return JSON.stringify({ base: baseSignature }) + '\n';
+}
+
+function batchLine(ops: LogOp[]): string {
+  return JSON.stringify({ ops }) + '\n';
+}
+
+/**
+ * Read the committed batches of a log. The first line records which version of
+ * the base file the log applies to; a log written against a different base
+ * (the file was compacted or rewritten out of band) is ignored. A torn final
+ * line from a crash mid-append is dropped.
+ */
+export function readLog(logPath: string, baseSignature: string): LogContents | null {
+  let contents: string;
+  try {
+    contents = fs.readFileSync(logPath, 'utf8');
+  } catch {
+    return null;
+  }
+
+  const lines = contents.split('\n');
+  let header: any;
+  try {
+    header = JSON.parse(lines[0]);
+  } catch {
+    return null;
+  }
+  if (header?.base !== baseSignature) return null;
+
+  const batches: LogOp[][] = [];
+  let bytes = Buffer.byteLength(lines[0]) + 1;
+  // The last element is whatever follows the final newline: empty or torn
+  for (const line of lines.slice(1, -1)) {
+    let entry: any;
+    try {
+      entry = JSON.parse(line);
+    } catch {
+      break;
+    }
+    if (!Array.isArray(entry?.ops)) break;
+    batches.push(entry.ops);
+    bytes += Buffer.byteLength(line) + 1;
+  }
+  return { batches, bytes };
+}
+
+/**
+ * Start a fresh log for the given base file version, optionally seeded with batches
+ */
+export function resetLog(logPath: string, baseSignature: string, batches: LogOp[][] = []): number {
+  const contents = headerLine(baseSignature) + batches.map(batchLine).join('');
+  writeFileAtomic(logPath, contents);
+  return Buffer.byteLength(contents);
+}
+
+/**
+ * Append batches to a log with a single write and fsync (group commit).
+ * `validBytes` is the length of the log's valid prefix. A torn line past it
+ * from an earlier crash is cut off first; complete lines past it were written
+ * by another process, so nothing is written and LogConflictError is thrown.
+ */
+export function appendLog(logPath: string, validBytes: number, batches: LogOp[][]): number {
+  const contents = batches.map(batchLine).join('');
+  const fd = fs.openSync(logPath, 'r+');
+  try {
+    const size = fs.fstatSync(fd).size;
+    if (size !== validBytes) {
+      if (size < validBytes || hasCompleteLine(fd, validBytes, size)) {
+        throw new LogConflictError(logPath);
+      }
+      fs.ftruncateSync(fd, validBytes);
+    }
+    fs.writeSync(fd, contents, validBytes);
+    fs.fsyncSync(fd);
+  } finally {
+    fs.closeSync(fd);
+  }
+  return validBytes + Buffer.byteLength(contents);
+}
+
+// Whether the bytes from `start` to `end` hold a newline, i.e. at least one whole batch
+function hasCompleteLine(fd: number, start: number, end: number): boolean {
+  const tail = Buffer.alloc(end - start);
+  fs.readSync(fd, tail, 0, tail.length, start);
+  return tail.includes(0x0a);
+}
@@ -0,0 +1,917 @@
+import fs from 'fs';
+import path from 'path';
+import { appendLog, fileSignature, LogConflictError, readLog, resetLog, writeFileAtomic, type LogOp } from './data-log';
+import { heldRoom, slotStartKey } from './bookings/slot-keys';
+import { sortKeys, studioGeoCell, studioSearchKeys } from './studios/search-keys';
+import { timed } from './timing';
+
+interface IndexDef {
+  // Fields read in order; legacy records may use an older property name
+  fields: string[];
+  // Lowercase keys on both insert and lookup (emails, owners)
+  caseInsensitive?: boolean;
+  // Computes the key(s) from the whole record instead of reading `fields`;
+  // null or undefined leaves the record out of the index
+  derive?: (record: any) => unknown;
+  // Keeps each bucket sorted ascending by this key instead of insertion order
+  sortKey?: (record: any) => string;
+}
+
+interface CollectionSpec {
+  file: string;
+  // Top-level key the records live under, or null when the file is a bare array
+  key: string | null;
+  // Identifies a record for log replay; puts with the same key replace each other
+  primaryKey: (record: any) => unknown;
+  indexes: Record<string, IndexDef>;
+}
+
+const byField = (...fields: string[]): IndexDef => ({ fields });
+const byLowerField = (...fields: string[]): IndexDef => ({ fields, caseInsensitive: true });
+const byDerived = (derive: (record: any) => unknown): IndexDef => ({ fields: [], derive });
+const byId = (record: any) => record?.id;
+
+// Key of the single bucket in whole-collection sorted indexes
+export const ALL = 'all';
+// Every record in one bucket, kept in sort order for range scans
+const sortedBy = (sortKey: (record: any) => string): IndexDef => ({ fields: [], derive: () => ALL, sortKey });
+
+/**
+ * Sort key for records ordered by timestamp, ties broken by id. Also builds
+ * keyset cursors: a key without an id sorts before every record sharing the
+ * timestamp, so paging "before" it skips that whole instant.
+ */
+export function timelineKey(timestamp: string | null | undefined, id?: string | null): string {
+  const time = timestamp ? Date.parse(timestamp) : NaN;
+  const instant = isNaN(time) ? '' : new Date(time).toISOString();
+  return id ? `${instant}|${id}` : instant;
+}
+
+// A follower can follow a given user only once, so the pair identifies a follow
+// (follows have no id; legacy records use followedId)
+export function followKey(followerId: string | null | undefined, followingId: string | null | undefined): string | undefined {
+  return followerId && followingId ? `${followerId}:${followingId}` : undefined;
+}
+
+const followPair = (follow: any) => followKey(follow?.followerId, follow?.followingId ?? follow?.followedId);
+
+// Unread messages are filed under their receiver, so counts never scan history
+const unreadReceiver = (message: any) => (message?.read ? null : message?.receiverId);
+
+// Every JSON collection used by the API routes, with the secondary indexes we query by
+const COLLECTIONS = {
+  users: {
+    file: 'users.json',
+    key: null,
+    primaryKey: byId,
+    indexes: { id: byField('id'), email: byLowerField('email'), slug: byField('slug'), studioId: byField('studioId') }
+  },
+  profiles: {
+    file: 'user-profiles.json',
+    key: null,
+    primaryKey: byId,
+    indexes: { id: byField('id'), email: byLowerField('email'), slug: byField('slug') }
+  },
+  studios: {
+    file: 'studios.json',
+    key: 'studios',
+    primaryKey: byId,
+    indexes: {
+      id: byField('id'),
+      slug: byField('slug'),
+      owner: byLowerField('owner'),
+      // Inverted index of word prefixes in name, location, address, amenities and specialties
+      search: byDerived(studioSearchKeys),
+      geoCell: byDerived(studioGeoCell),
+      rating: sortedBy(sortKeys.rating),
+      priceLow: sortedBy(sortKeys['price-low']),
+      priceHigh: sortedBy(sortKeys['price-high']),
+      newest: sortedBy(sortKeys.newest)
+    }
+  },
+  bookings: {
+    file: 'bookings.json',
+    key: 'bookings',
+    primaryKey: byId,
+    indexes: {
+      id: byField('id'),
+      studioId: byField('studioId'),
+      userId: byField('userId'),
+      // Pending and confirmed bookings per room, in start order
+      slots: { fields: [], derive: heldRoom, sortKey: slotStartKey }
+    }
+  },
+  bookingRequests: {
+    file: 'booking-requests.json',
+    key: 'bookingRequests',
+    primaryKey: byId,
+    indexes: {
+      id: byField('id'),
+      studioId: byField('studioId'),
+      userId: byField('userId'),
+      // Pending and confirmed bookings per room, in start order
+      slots: { fields: [], derive: heldRoom, sortKey: slotStartKey }
+    }
+  },
+  messages: {
+    file: 'messages.json',
+    key: 'messages',
+    primaryKey: byId,
+    indexes: {
+      id: byField('id'),
+      conversationId: byField('conversationId'),
+      timeline: { fields: ['conversationId'], sortKey: (message: any) => timelineKey(message?.timestamp, message?.id) },
+      unreadByReceiver: byDerived(unreadReceiver),
+      unreadByConversation: byDerived(message => {
+        const receiverId = unreadReceiver(message);
+        return receiverId && message.conversationId ? `${receiverId}:${message.conversationId}` : null;
+      })
+    }
+  },
+  conversations: {
+    file: 'messages.json',
+    key: 'conversations',
+    primaryKey: byId,
+    indexes: { id: byField('id'), userId: byField('participants') }
+  },
+  follows: {
+    file: 'follows.json',
+    key: null,
+    primaryKey: followPair,
+    // Forward and reverse adjacency, and membership of a single edge
+    indexes: { followerId: byField('followerId'), followingId: byField('followingId', 'followedId'), pair: byDerived(followPair) }
+  },
+  openCalls: {
+    file: 'open-calls.json',
+    key: 'openCalls',
+    primaryKey: byId,
+    indexes: { id: byField('id'), createdBy: byField('createdBy') }
+  }
+} satisfies Record<string, CollectionSpec>;
+
+export type CollectionName = keyof typeof COLLECTIONS;
+export type IndexName<C extends CollectionName> = keyof (typeof COLLECTIONS)[C]['indexes'] & string;
+
+// Compact a file once its log outgrows the file itself (and this floor), so a
+// write costs roughly the size of the change while replay on load stays bounded
+const COMPACT_MIN_LOG_BYTES = 256 * 1024;
+
+// Times to re-read a log that another process (a script) keeps appending to before giving up
+const MAX_APPEND_ATTEMPTS = 3;
+
+interface BuiltIndex {
+  buckets: Map<string, any[]>;
+  // Keys each record was filed under, so updates can move records made in place
+  keysByRecord: Map<string, string[]>;
+}
+
+interface CollectionState {
+  // Records by primary key, in file order
+  records: Map<string, any>;
+  // Changes whenever a record is written or the collection is reloaded
+  version: number;
+  list: any[] | null;
+  indexes: Map<string, BuiltIndex>;
+}
+
+interface PendingBatch {
+  ops: LogOp[];
+  resolve: () => void;
+  reject: (error: unknown) => void;
+}
+
+interface FileState {
+  file: string;
+  fullPath: string;
+  logPath: string;
+  // Identity of the file and its log when they were read; a null signature
+  // means the file could not be stat'ed, so it is neither cached nor logged
+  signature: string | null;
+  logSignature: string | null;
+  // Parsed document, kept for any top-level keys that are not collections
+  doc: any;
+  baseBytes: number;
+  // Length of the log's valid prefix, or 0 when there is no usable log yet
+  logBytes: number;
+  collections: Map<CollectionName, CollectionState>;
+  // Commits applied in memory but not yet appended to the log
+  pending: PendingBatch[];
+  flushScheduled: boolean;
+}
+
+interface StoreState {
+  files: Map<string, FileState>;
+  // Last collection version handed out; kept with the cache so versions are never reused
+  lastVersion: number;
+}
+
+// Keep the cache on globalThis so it survives Next.js dev-server module reloads
+const globalForStore = globalThis as unknown as { __hitconnectorDataStore?: StoreState };
+const store: StoreState = globalForStore.__hitconnectorDataStore ??= {
+  files: new Map(),
+  lastVersion: 0
+};
+
+// Files already checked against disk inside the current readSnapshot call
+const verifiedFiles = new Set<string>();
+let snapshotDepth = 0;
+
+function markVerified(file: string): void {
+  if (snapshotDepth > 0) verifiedFiles.add(file);
+}
+
+// Resolved per call so the store follows process.cwd() (scripts and tests chdir)
+function dataDir(): string {
+  return path.join(process.cwd(), 'data');
+}
+
+function filePath(file: string): string {
+  return path.join(dataDir(), file);
+}
+
+function collectionsIn(file: string): CollectionName[] {
+  return (Object.keys(COLLECTIONS) as CollectionName[]).filter(name => COLLECTIONS[name].file === file);
+}
+
+function recordsFrom(name: CollectionName, data: any): any[] {
+  const { key } = COLLECTIONS[name];
+  // Older files stored wrapped collections as a bare array; accept both
+  const records = key && !Array.isArray(data) ? data?.[key] : data;
+  return Array.isArray(records) ? records : [];
+}
+
+function recordKey(name: CollectionName, record: any): string | null {
+  const key = COLLECTIONS[name].primaryKey(record);
+  return key === undefined || key === null || key === '' ? null : String(key);
+}
+
+function createCollectionState(name: CollectionName, records: any[]): CollectionState {
+  const state: CollectionState = { records: new Map(), version: ++store.lastVersion, list: null, indexes: new Map() };
+  records.forEach((record, position) => {
+    // Records without a key can still be read, they just can't be targeted by ops
+    state.records.set(recordKey(name, record) ?? `#${position}`, record);
+  });
+  return state;
+}
+
+function indexDef(name: CollectionName, indexName: string): IndexDef {
+  const def = (COLLECTIONS[name].indexes as Record<string, IndexDef>)[indexName];
+  if (!def) {
+    throw new Error(`Unknown index "${indexName}" on collection "${name}"`);
+  }
+  return def;
+}
+
+function indexKey(def: IndexDef, value: unknown): string | null {
+  if (value === null || value === undefined || value === '') return null;
+  const key = String(value);
+  return def.caseInsensitive ? key.toLowerCase() : key;
+}
+
+function indexKeysFor(def: IndexDef, record: any): string[] {
+  let values: unknown;
+  if (def.derive) {
+    values = def.derive(record);
+  } else {
+    const field = def.fields.find(name => record?.[name] !== undefined && record?.[name] !== null);
+    values = field ? record[field] : undefined;
+  }
+  const keys: string[] = [];
+  // Array fields (conversation participants) index the record under every element
+  for (const value of Array.isArray(values) ? values : [values]) {
+    const key = indexKey(def, value);
+    if (key !== null && !keys.includes(key)) keys.push(key);
+  }
+  return keys;
+}
+
+// First position in a sorted bucket whose sort key is >= (or > when `after`) the given key
+function searchBucket(bucket: any[], sortKey: (record: any) => string, key: string, after = false): number {
+  let low = 0;
+  let high = bucket.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    const midKey = sortKey(bucket[mid]);
+    if (midKey < key || (after && midKey === key)) {
+      low = mid + 1;
+    } else {
+      high = mid;
+    }
+  }
+  return low;
+}
+
+function addToBucket(index: BuiltIndex, def: IndexDef, key: string, record: any): void {
+  const bucket = index.buckets.get(key);
+  if (!bucket) {
+    index.buckets.set(key, [record]);
+  } else if (def.sortKey) {
+    bucket.splice(searchBucket(bucket, def.sortKey, def.sortKey(record), true), 0, record);
+  } else {
+    bucket.push(record);
+  }
+}
+
+function removeFromBucket(index: BuiltIndex, def: IndexDef, key: string, record: any): void {
+  const bucket = index.buckets.get(key);
+  if (!bucket) return;
+  let at = -1;
+  if (def.sortKey) {
+    // Records edited in place may no longer sit where their key says; fall back to a scan
+    const sortKey = def.sortKey(record);
+    for (let i = searchBucket(bucket, def.sortKey, sortKey); i < bucket.length && def.sortKey(bucket[i]) === sortKey; i++) {
+      if (bucket[i] === record) {
+        at = i;
+        break;
+      }
+    }
+  }
+  if (at < 0) at = bucket.indexOf(record);
+  if (at >= 0) bucket.splice(at, 1);
+  if (bucket.length === 0) index.buckets.delete(key);
+}
+
+function buildIndex(state: CollectionState, def: IndexDef): BuiltIndex {
+  const index: BuiltIndex = { buckets: new Map(), keysByRecord: new Map() };
+  for (const [primaryKey, record] of state.records) {
+    const keys = indexKeysFor(def, record);
+    index.keysByRecord.set(primaryKey, keys);
+    for (const key of keys) {
+      const bucket = index.buckets.get(key);
+      if (bucket) {
+        bucket.push(record);
+      } else {
+        index.buckets.set(key, [record]);
+      }
+    }
+  }
+  if (def.sortKey) {
+    const sortKey = def.sortKey;
+    for (const bucket of index.buckets.values()) {
+      const keyed = bucket.map(record => ({ record, key: sortKey(record) }));
+      keyed.sort((a, b) => (a.key < b.key ? -1 : a.key > b.key ? 1 : 0));
+      keyed.forEach((entry, i) => { bucket[i] = entry.record; });
+    }
+  }
+  return index;
+}
+
+function putRecord(name: CollectionName, state: CollectionState, primaryKey: string, record: any): void {
+  const previous = state.records.get(primaryKey);
+  // Map.set keeps the original position for replaced records
+  state.records.set(primaryKey, record);
+  state.version = ++store.lastVersion;
+  state.list = null;
+
+  for (const [indexName, index] of state.indexes) {
+    const def = indexDef(name, indexName);
+    const oldKeys = index.keysByRecord.get(primaryKey) ?? [];
+    const newKeys = indexKeysFor(def, record);
+    for (const key of oldKeys) {
+      if (newKeys.includes(key) && !def.sortKey) {
+        const bucket = index.buckets.get(key);
+        const at = bucket ? bucket.indexOf(previous) : -1;
+        if (bucket && at >= 0) bucket[at] = record;
+      } else {
+        // Sorted buckets re-file the record in case its sort key moved
+        removeFromBucket(index, def, key, previous);
+      }
+    }
+    for (const key of newKeys) {
+      if (!oldKeys.includes(key) || def.sortKey) addToBucket(index, def, key, record);
+    }
+    index.keysByRecord.set(primaryKey, newKeys);
+  }
+}
+
+function deleteRecord(name: CollectionName, state: CollectionState, primaryKey: string): void {
+  const previous = state.records.get(primaryKey);
+  if (previous === undefined) return;
+  state.records.delete(primaryKey);
+  state.version = ++store.lastVersion;
+  state.list = null;
+
+  for (const [indexName, index] of state.indexes) {
+    const def = indexDef(name, indexName);
+    for (const key of index.keysByRecord.get(primaryKey) ?? []) {
+      removeFromBucket(index, def, key, previous);
+    }
+    index.keysByRecord.delete(primaryKey);
+  }
+}
+
+function applyOp(fileState: FileState, op: LogOp): void {
+  const name = op.collection as CollectionName;
+  const state = fileState.collections.get(name);
+  if (!state) return;
+  if (op.op === 'put') {
+    const primaryKey = recordKey(name, op.record);
+    if (primaryKey !== null) putRecord(name, state, primaryKey, op.record);
+  } else {
+    deleteRecord(name, state, op.key);
+  }
+}
+
+function readFileState(file: string, fullPath: string, logPath: string): FileState {
+  const fileState: FileState = {
+    file,
+    fullPath,
+    logPath,
+    signature: null,
+    logSignature: null,
+    doc: null,
+    baseBytes: 0,
+    logBytes: 0,
+    collections: new Map(),
+    pending: [],
+    flushScheduled: false
+  };
+
+  if (fs.existsSync(fullPath)) {
+    try {
+      fileState.signature = timed('io', () => fileSignature(fullPath));
+      const contents = timed('io', () => fs.readFileSync(fullPath, 'utf8'));
+      fileState.doc = timed('parse', () => JSON.parse(contents));
+      fileState.baseBytes = Buffer.byteLength(contents);
+    } catch (error) {
+      console.error(`Error reading ${file}:`, error);
+      fileState.signature = null;
+      fileState.doc = null;
+    }
+  }
+
+  for (const name of collectionsIn(file)) {
+    fileState.collections.set(name, createCollectionState(name, recordsFrom(name, fileState.doc)));
+  }
+
+  // Replay changes committed since the file was last compacted
+  if (fileState.signature !== null) {
+    const log = timed('io', () => readLog(logPath, fileState.signature!));
+    if (log) {
+      for (const batch of log.batches) {
+        batch.forEach(op => applyOp(fileState, op));
+      }
+      fileState.logBytes = log.bytes;
+    }
+    fileState.logSignature = timed('io', () => fileSignature(logPath));
+  }
+
+  return fileState;
+}
+
+/**
+ * Load a data file and its operation log, re-reading only when either changed
+ * on disk since the last read
+ */
+function loadFile(file: string): FileState {
+  const fullPath = filePath(file);
+  const logPath = `${fullPath}.log`;
+  const cached = store.files.get(file);
+
+  if (cached && cached.fullPath === fullPath) {
+    // Our own unflushed commits are newer than anything on disk
+    if (cached.pending.length > 0) return cached;
+    if (snapshotDepth > 0 && verifiedFiles.has(file)) return cached;
+    if (
+      cached.signature !== null &&
+      cached.signature === timed('io', () => fileSignature(fullPath)) &&
+      cached.logSignature === timed('io', () => fileSignature(logPath))
+    ) {
+      markVerified(file);
+      return cached;
+    }
+  }
+
+  const fileState = readFileState(file, fullPath, logPath);
+  // Without a signature we cannot tell when the file changes, so don't cache it
+  if (fileState.signature !== null) {
+    store.files.set(file, fileState);
+    markVerified(file);
+  } else {
+    store.files.delete(file);
+  }
+  return fileState;
+}
+
+function getState(name: CollectionName): CollectionState {
+  return loadFile(COLLECTIONS[name].file).collections.get(name)!;
+}
+
+function getIndex(name: CollectionName, indexName: string): Map<string, any[]> {
+  const state = getState(name);
+  let index = state.indexes.get(indexName);
+  if (!index) {
+    index = buildIndex(state, indexDef(name, indexName));
+    state.indexes.set(indexName, index);
+  }
+  return index.buckets;
+}
+
+function lookup(name: CollectionName, indexName: string, value: string | null | undefined): any[] | undefined {
+  return timed('lookup', () => {
+    const key = indexKey(indexDef(name, indexName), value);
+    if (key === null) return undefined;
+    return getIndex(name, indexName).get(key);
+  });
+}
+
+function listOf(state: CollectionState): any[] {
+  state.list ??= Array.from(state.records.values());
+  return state.list;
+}
+
+/**
+ * Run `read` with each data file checked against disk at most once, so a
+ * loop of lookups costs no file system calls after the first and sees one
+ * version of each file. Changes made outside this process during the call
+ * are picked up by the next read after it.
+ */
+export function readSnapshot<T>(read: () => T): T {
+  snapshotDepth++;
+  try {
+    return read();
+  } finally {
+    if (--snapshotDepth === 0) verifiedFiles.clear();
+  }
+}
+
+/**
+ * A number that changes whenever the collection does (a record written, or
+ * the file reloaded after changing on disk), for caches derived from it
+ */
+export function collectionVersion(name: CollectionName): number {
+  return getState(name).version;
+}
+
+/**
+ * Get a mutable copy of a collection. Records are shared with the cache, so
+ * changes must be persisted with putRecords or saveCollection to keep indexes
+ * consistent.
+ */
+export function getCollection<T = any>(name: CollectionName): T[] {
+  return timed('lookup', () => listOf(getState(name)).slice() as T[]);
+}
+
+/**
+ * Find the first record whose index key matches the value
+ */
+export function findOne<C extends CollectionName>(
+  name: C,
+  indexName: IndexName<C>,
+  value: string | null | undefined
+): any | null {
+  const bucket = lookup(name, indexName, value);
+  return bucket?.[0] ?? null;
+}
+
+/**
+ * Find all records whose index key matches the value, in insertion order (or
+ * sort order for sorted indexes)
+ */
+export function findMany<C extends CollectionName>(
+  name: C,
+  indexName: IndexName<C>,
+  value: string | null | undefined
+): any[] {
+  const bucket = lookup(name, indexName, value);
+  return bucket ? bucket.slice() : [];
+}
+
+/**
+ * Count the records whose index key matches the value without copying them
+ */
+export function countOf<C extends CollectionName>(
+  name: C,
+  indexName: IndexName<C>,
+  value: string | null | undefined
+): number {
+  return lookup(name, indexName, value)?.length ?? 0;
+}
+
+/**
+ * Keyset pagination over a sorted index: up to `limit` records whose sort key
+ * is below `before` (all of them when omitted), highest key first
+ */
+export function findPage<C extends CollectionName>(
+  name: C,
+  indexName: IndexName<C>,
+  value: string | null | undefined,
+  options: { before?: string | null; limit: number }
+): { records: any[]; hasMore: boolean } {
+  const { sortKey } = indexDef(name, indexName);
+  if (!sortKey) {
+    throw new Error(`Index "${indexName}" on collection "${name}" is not sorted`);
+  }
+
+  const bucket = lookup(name, indexName, value) ?? [];
+  const end = options.before ? searchBucket(bucket, sortKey, options.before) : bucket.length;
+  const start = Math.max(0, end - options.limit);
+  return {
+    records: bucket.slice(start, end).reverse(),
+    hasMore: start > 0
+  };
+}
+
+/**
+ * Range scan over a sorted index: up to `limit` records (all of them when
+ * omitted) whose sort key is at least `from`, or above `after`, and below
+ * `to`, lowest key first
+ */
+export function findRange<C extends CollectionName>(
+  name: C,
+  indexName: IndexName<C>,
+  value: string | null | undefined,
+  options: { from?: string | null; after?: string | null; to?: string | null; limit?: number }
+): { records: any[]; hasMore: boolean } {
+  const { sortKey } = indexDef(name, indexName);
+  if (!sortKey) {
+    throw new Error(`Index "${indexName}" on collection "${name}" is not sorted`);
+  }
+
+  const bucket = lookup(name, indexName, value) ?? [];
+  let start = options.from ? searchBucket(bucket, sortKey, options.from) : 0;
+  if (options.after) start = Math.max(start, searchBucket(bucket, sortKey, options.after, true));
+  const end = options.to ? searchBucket(bucket, sortKey, options.to) : bucket.length;
+  const stop = options.limit === undefined ? end : Math.min(end, start + options.limit);
+  return {
+    records: start < stop ? bucket.slice(start, stop) : [],
+    hasMore: stop < end
+  };
+}
+
+/**
+ * Find a record by its primary id
+ */
+export function findById(
+  name: Exclude<CollectionName, 'follows'>,
+  id: string | null | undefined
+): any | null {
+  const bucket = lookup(name, 'id', id);
+  return bucket?.[0] ?? null;
+}
+
+function documentFor(fileState: FileState): any {
+  const names = collectionsIn(fileState.file);
+  const { key } = COLLECTIONS[names[0]];
+  if (key === null) {
+    return listOf(fileState.collections.get(names[0])!);
+  }
+
+  const doc = fileState.doc && !Array.isArray(fileState.doc) ? { ...fileState.doc } : {};
+  for (const name of names) {
+    doc[COLLECTIONS[name].key as string] = listOf(fileState.collections.get(name)!);
+  }
+  return doc;
+}
+
+function settlePending(batches: PendingBatch[], error?: unknown): void {
+  for (const batch of batches) {
+    if (error === undefined) {
+      batch.resolve();
+    } else {
+      batch.reject(error);
+    }
+  }
+}
+
+function dropFileState(fileState: FileState): void {
+  if (store.files.get(fileState.file) === fileState) {
+    store.files.delete(fileState.file);
+  }
+}
+
+/**
+ * Rewrite the whole file from memory (atomically) and start an empty log.
+ * Anything still pending is included in the snapshot, so it is settled too.
+ */
+function writeSnapshot(fileState: FileState): void {
+  const pending = fileState.pending.splice(0);
+  try {
+    const dir = path.dirname(fileState.fullPath);
+    if (!fs.existsSync(dir)) {
+      fs.mkdirSync(dir, { recursive: true });
+    }
+
+    const doc = documentFor(fileState);
+    const contents = JSON.stringify(doc, null, 2);
+    writeFileAtomic(fileState.fullPath, contents);
+    fileState.doc = doc;
+    fileState.baseBytes = Buffer.byteLength(contents);
+    fileState.signature = fileSignature(fileState.fullPath);
+
+    if (fileState.signature !== null) {
+      // The old log names the previous file version, so it is already void
+      fileState.logBytes = resetLog(fileState.logPath, fileState.signature);
+      fileState.logSignature = fileSignature(fileState.logPath);
+    } else {
+      dropFileState(fileState);
+    }
+  } catch (error) {
+    // Memory holds changes that never reached disk; reload from disk next time
+    dropFileState(fileState);
+    settlePending(pending, error);
+    throw error;
+  }
+  settlePending(pending);
+}
+
+/**
+ * Write batches to a file's log. If another process appended to the log since
+ * it was read, reload the file with its changes, apply ours on top and retry.
+ * Returns the state now cached for the file.
+ */
+function appendBatches(fileState: FileState, batches: LogOp[][]): FileState {
+  for (let attempt = 1; ; attempt++) {
+    try {
+      if (fileState.logBytes === 0) {
+        fileState.logBytes = resetLog(fileState.logPath, fileState.signature as string, batches);
+      } else {
+        fileState.logBytes = appendLog(fileState.logPath, fileState.logBytes, batches);
+      }
+      fileState.logSignature = fileSignature(fileState.logPath);
+      return fileState;
+    } catch (error) {
+      if (!(error instanceof LogConflictError) || attempt >= MAX_APPEND_ATTEMPTS) throw error;
+
+      const reloaded = readFileState(fileState.file, fileState.fullPath, fileState.logPath);
+      if (reloaded.signature === null) throw error;
+      batches.forEach(batch => batch.forEach(op => applyOp(reloaded, op)));
+      store.files.set(fileState.file, reloaded);
+      fileState = reloaded;
+    }
+  }
+}
+
+/**
+ * Append every pending commit for a file to its log in one write (group commit)
+ */
+function flushFile(fileState: FileState): void {
+  fileState.flushScheduled = false;
+  if (fileState.pending.length === 0) return;
+
+  const pending = fileState.pending.splice(0);
+  const batches = pending.map(batch => batch.ops);
+  try {
+    fileState = appendBatches(fileState, batches);
+  } catch (error) {
+    console.error(`Error appending to ${fileState.file} log:`, error);
+    dropFileState(fileState);
+    settlePending(pending, error);
+    return;
+  }
+  settlePending(pending);
+
+  if (fileState.logBytes > Math.max(COMPACT_MIN_LOG_BYTES, fileState.baseBytes)) {
+    try {
+      writeSnapshot(fileState);
+    } catch (error) {
+      // The log is still intact, so nothing is lost; try again after the next commit
+      console.error(`Error compacting ${fileState.file}:`, error);
+    }
+  }
+}
+
+function scheduleFlush(fileState: FileState): void {
+  if (fileState.flushScheduled) return;
+  fileState.flushScheduled = true;
+  // Commits made by other requests before the timer fires share the same write
+  setTimeout(() => flushFile(fileState), 0);
+}
+
+function commit(ops: LogOp[]): Promise<void> {
+  const byFile = new Map<string, LogOp[]>();
+  for (const op of ops) {
+    const { file } = COLLECTIONS[op.collection as CollectionName];
+    byFile.set(file, [...(byFile.get(file) ?? []), op]);
+  }
+
+  const commits: Promise<void>[] = [];
+  for (const [file, fileOps] of byFile) {
+    const fileState = loadFile(file);
+    // Log a copy so later in-place edits to the live records can't leak into this commit
+    const logged = JSON.parse(JSON.stringify(fileOps)) as LogOp[];
+    fileOps.forEach(op => applyOp(fileState, op));
+
+    if (fileState.signature === null) {
+      // Nothing to append to (new or unreadable file): write it out whole
+      commits.push(new Promise(resolve => {
+        writeSnapshot(fileState);
+        resolve();
+      }));
+      continue;
+    }
+
+    commits.push(new Promise((resolve, reject) => {
+      fileState.pending.push({ ops: logged, resolve, reject });
+    }));
+    scheduleFlush(fileState);
+  }
+  return Promise.all(commits).then(() => undefined);
+}
+
+function opsFor(
+  records: Partial<Record<CollectionName, any[]>>,
+  toOp: (name: CollectionName, record: any, key: string) => LogOp
+): LogOp[] {
+  const ops: LogOp[] = [];
+  for (const [name, list] of Object.entries(records) as [CollectionName, any[]][]) {
+    for (const record of list) {
+      const key = recordKey(name, record);
+      if (key === null) {
+        throw new Error(`Cannot write a record without a primary key to "${name}"`);
+      }
+      ops.push(toOp(name, record, key));
+    }
+  }
+  return ops;
+}
+
+/**
+ * Insert or replace records, matched by primary key. Reads see the change
+ * immediately; the returned promise resolves once it is durable on disk.
+ * Changes to collections that share a file (messages and conversations) are
+ * committed atomically, and concurrent commits are batched into one write.
+ */
+export function putRecords(updates: Partial<Record<CollectionName, any[]>>): Promise<void> {
+  return commit(opsFor(updates, (name, record) => ({ collection: name, op: 'put', record })));
+}
+
+/**
+ * Delete records, matched by primary key
+ */
+export function removeRecords(removals: Partial<Record<CollectionName, any[]>>): Promise<void> {
+  return commit(opsFor(removals, (name, _record, key) => ({ collection: name, op: 'delete', key })));
+}
+
+/**
+ * Replace several collections wholesale. Collections that share a file
+ * (messages and conversations) are written together; each file is rewritten
+ * atomically. Prefer putRecords for changes to individual records.
+ */
+export function saveCollections(updates: Partial<Record<CollectionName, any[]>>): void {
+  const byFile = new Map<string, FileState>();
+
+  for (const [name, records] of Object.entries(updates) as [CollectionName, any[]][]) {
+    const { file } = COLLECTIONS[name];
+    let fileState = byFile.get(file);
+    if (!fileState) {
+      fileState = loadFile(file);
+      byFile.set(file, fileState);
+    }
+    fileState.collections.set(name, createCollectionState(name, records));
+  }
+
+  for (const fileState of byFile.values()) {
+    writeSnapshot(fileState);
+  }
+}
+
+/**
+ * Replace a single collection wholesale
+ */
+export function saveCollection(name: CollectionName, records: any[]): void {
+  saveCollections({ [name]: records });
+}
+
+/**
+ * Write any commits still waiting for the group-commit timer
+ */
+export function flushPendingWrites(): void {
+  for (const fileState of Array.from(store.files.values())) {
+    flushFile(fileState);
+  }
+}
+
+/**
+ * Fold a collection's log back into its JSON file, e.g. before a script reads
+ * the file directly
+ */
+export function compactCollection(name: CollectionName): void {
+  const fileState = loadFile(COLLECTIONS[name].file);
+  // Nothing logged (or nothing on disk at all): the file is already current
+  if (fileState.logBytes === 0 && fileState.pending.length === 0) return;
+  writeSnapshot(fileState);
+}
+
+function invalidateFile(file: string): void {
+  const fileState = store.files.get(file);
+  if (fileState) {
+    flushFile(fileState);
+  }
+  store.files.delete(file);
+  verifiedFiles.delete(file);
+}
+
+/**
+ * Drop cached data (useful for testing or after out-of-band file edits).
+ * Pending commits are flushed first so nothing is lost.
+ */
+export function invalidateCollection(name?: CollectionName): void {
+  if (!name) {
+    flushPendingWrites();
+    store.files.clear();
+    verifiedFiles.clear();
+    return;
+  }
+  invalidateFile(COLLECTIONS[name].file);
+}
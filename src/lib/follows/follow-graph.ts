@@ -0,0 +1,217 @@
+import {
+  ALL,
+  collectionVersion,
+  countOf,
+  findById,
+  findMany,
+  findOne,
+  findRange,
+  followKey,
+  getCollection,
+  putRecords,
+  removeRecords
+} from '@/lib/data-store';
+import { sortKeys } from '@/lib/studios/search-keys';
+
+/**
+ * The follow graph. Edges live in the data store, which indexes them both
+ * ways (who a user follows, and who follows them) and by pair, so follower
+ * counts are bucket sizes kept current by every follow and unfollow, and a
+ * follow check is a single lookup.
+ *
+ * The most-followed studios are kept in a leaderboard that follow and
+ * unfollow update in place; it is only rebuilt when follows change some other
+ * way (another process editing follows.json).
+ */
+
+export interface Follow {
+  followerId: string;
+  followingId: string;
+  createdAt: string;
+}
+
+export interface FollowStatus {
+  isFollowing: boolean;
+  followersCount: number;
+  followingCount: number;
+}
+
+interface Leaderboard {
+  // Collection versions the ranking was last brought up to date with
+  followsVersion: number;
+  studiosVersion: number;
+  // Ids of listed studios with at least one follower, most followed first
+  ranking: string[];
+}
+
+// Most targets a batch status lookup answers at once
+export const MAX_STATUS_BATCH = 100;
+
+// Keep the leaderboard on globalThis so it survives Next.js dev-server module reloads
+const globalForGraph = globalThis as unknown as { __hitconnectorLeaderboard?: Leaderboard };
+
+export function followTarget(edge: any): string {
+  return edge.followingId ?? edge.followedId;
+}
+
+export function isFollowing(followerId: string, targetId: string): boolean {
+  return countOf('follows', 'pair', followKey(followerId, targetId)) > 0;
+}
+
+export function followersCount(userId: string): number {
+  return countOf('follows', 'followingId', userId);
+}
+
+export function followingCount(userId: string): number {
+  return countOf('follows', 'followerId', userId);
+}
+
+/**
+ * Ids of the users following `userId`
+ */
+export function followerIds(userId: string): string[] {
+  return findMany('follows', 'followingId', userId).map(edge => edge.followerId);
+}
+
+/**
+ * Ids of the users and studios `userId` follows
+ */
+export function followingIds(userId: string): string[] {
+  return findMany('follows', 'followerId', userId).map(followTarget);
+}
+
+/**
+ * Whether `followerId` follows the target, and the target's own counts
+ */
+export function followStatus(followerId: string | null, targetId: string): FollowStatus {
+  return {
+    isFollowing: followerId ? isFollowing(followerId, targetId) : false,
+    followersCount: followersCount(targetId),
+    followingCount: followingCount(targetId)
+  };
+}
+
+/**
+ * Follow statuses for many targets at once, keyed by target id
+ */
+export function followStatuses(followerId: string | null, targetIds: string[]): Record<string, FollowStatus> {
+  const statuses: Record<string, FollowStatus> = {};
+  for (const targetId of targetIds) {
+    statuses[targetId] = followStatus(followerId, targetId);
+  }
+  return statuses;
+}
+
+export async function follow(followerId: string, targetId: string): Promise<void> {
+  const newFollow: Follow = { followerId, followingId: targetId, createdAt: new Date().toISOString() };
+  await updateGraph(targetId, () => putRecords({ follows: [newFollow] }));
+}
+
+export async function unfollow(followerId: string, targetId: string): Promise<void> {
+  const existing = findOne('follows', 'pair', followKey(followerId, targetId));
+  if (!existing) return;
+  await updateGraph(targetId, () => removeRecords({ follows: [existing] }));
+}
+
+// Only studios with a name and location are listed
+function isListed(studio: any): boolean {
+  return !!(studio?.name && studio.location);
+}
+
+function updatedTime(studio: any): number {
+  const time = Date.parse(studio.updatedAt || studio.createdAt || '');
+  return isNaN(time) ? 0 : time;
+}
+
+// Most followers first, then highest rated, then most recently updated
+function compareStudios(a: string, b: string): number {
+  const followers = followersCount(b) - followersCount(a);
+  if (followers !== 0) return followers;
+  const studioA = findById('studios', a);
+  const studioB = findById('studios', b);
+  const rating = (studioB?.rating || 0) - (studioA?.rating || 0);
+  if (rating !== 0) return rating;
+  return updatedTime(studioB ?? {}) - updatedTime(studioA ?? {});
+}
+
+function sortRanking(ids: string[]): string[] {
+  return ids.filter(id => isListed(findById('studios', id)) && followersCount(id) > 0).sort(compareStudios);
+}
+
+// Recount from every follow: used when follows changed outside follow/unfollow, or studios changed
+function buildLeaderboard(): Leaderboard {
+  const targets = new Set<string>(getCollection('follows').map(followTarget));
+  return {
+    followsVersion: collectionVersion('follows'),
+    studiosVersion: collectionVersion('studios'),
+    ranking: sortRanking(Array.from(targets))
+  };
+}
+
+function currentLeaderboard(): Leaderboard {
+  let leaderboard = globalForGraph.__hitconnectorLeaderboard;
+  // A studio edit can list a followed studio that was left out before, so it rebuilds from every follow target too
+  if (
+    !leaderboard ||
+    leaderboard.followsVersion !== collectionVersion('follows') ||
+    leaderboard.studiosVersion !== collectionVersion('studios')
+  ) {
+    leaderboard = buildLeaderboard();
+  }
+  globalForGraph.__hitconnectorLeaderboard = leaderboard;
+  return leaderboard;
+}
+
+/**
+ * Apply a follow change and move its target to its new place in the
+ * leaderboard. Every other studio keeps its count, so the rest of the
+ * ranking is still in order and the target is re-inserted by binary search.
+ */
+async function updateGraph(targetId: string, write: () => Promise<void>): Promise<void> {
+  const leaderboard = currentLeaderboard();
+  // The store applies the change in memory before the write is flushed
+  const written = write();
+
+  const ranking = leaderboard.ranking.filter(id => id !== targetId);
+  if (isListed(findById('studios', targetId)) && followersCount(targetId) > 0) {
+    let low = 0;
+    let high = ranking.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (compareStudios(ranking[mid], targetId) <= 0) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    ranking.splice(low, 0, targetId);
+  }
+  globalForGraph.__hitconnectorLeaderboard = {
+    ...leaderboard,
+    followsVersion: collectionVersion('follows'),
+    ranking
+  };
+
+  await written;
+}
+
+/**
+ * Ids of the `limit` most-followed studios. When fewer studios than that
+ * have followers, the highest-rated of the rest fill the list.
+ */
+export function topFollowedStudioIds(limit: number): string[] {
+  const top = currentLeaderboard().ranking.slice(0, limit);
+  if (top.length >= limit) return top;
+
+  const ranked = new Set(top);
+  let after: string | null = null;
+  for (;;) {
+    const batch = findRange('studios', 'rating', ALL, { after, limit: limit * 2 });
+    for (const studio of batch.records) {
+      if (top.length === limit) return top;
+      if (!ranked.has(studio.id) && isListed(studio)) top.push(studio.id);
+    }
+    if (!batch.hasMore || batch.records.length === 0) return top;
+    after = sortKeys.rating(batch.records[batch.records.length - 1]);
+  }
+}
@@ -0,0 +1,253 @@
+import crypto from 'crypto';
+import fs from 'fs';
+import { copyFile, mkdir, readdir, rename, rm, stat } from 'fs/promises';
+import path from 'path';
+import { Readable, Transform } from 'stream';
+import { pipeline } from 'stream/promises';
+import { blobUrl, IMAGE_VARIANTS, type ImageVariant } from './variants';
+
+// Cache-Control for blob responses; content-addressed URLs never change
+export const IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable';
+
+const EXTENSIONS: Record<string, string> = {
+  'image/jpeg': 'jpg',
+  'image/jpg': 'jpg',
+  'image/png': 'png',
+  'image/gif': 'gif',
+  'image/webp': 'webp',
+  'audio/mpeg': 'mp3',
+  'audio/mp3': 'mp3',
+  'audio/wav': 'wav',
+  'video/mp4': 'mp4',
+  'video/quicktime': 'mov',
+  'application/pdf': 'pdf',
+  'application/msword': 'doc',
+  'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+  'text/plain': 'txt'
+};
+
+const CONTENT_TYPES: Record<string, string> = {
+  ...Object.fromEntries(Object.entries(EXTENSIONS).map(([type, ext]) => [ext, type])),
+  jpg: 'image/jpeg',
+  mp3: 'audio/mpeg',
+  bin: 'application/octet-stream'
+};
+
+const HASH_PATTERN = /^[a-f0-9]{64}$/;
+const RESIZABLE_TYPES = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp'];
+
+export class UploadTooLargeError extends Error {
+  constructor(maxBytes: number) {
+    super(`File too large. Maximum size is ${Math.round(maxBytes / 1024 / 1024)}MB.`);
+  }
+}
+
+export interface StoredBlob {
+  hash: string;
+  size: number;
+  contentType: string;
+  // URL of the bytes exactly as uploaded
+  url: string;
+  // Resized variants, for images only
+  variants?: Record<ImageVariant, string>;
+}
+
+export interface BlobFile {
+  path: string;
+  size: number;
+  contentType: string;
+}
+
+// Resolved per call so the store follows process.cwd() (scripts and tests chdir)
+function blobRoot(): string {
+  return path.join(process.cwd(), 'data', 'blobs');
+}
+
+function blobFolder(hash: string): string {
+  return path.join(blobRoot(), hash.slice(0, 2), hash);
+}
+
+function tempPath(): string {
+  return path.join(blobRoot(), 'tmp', `${Date.now()}_${crypto.randomBytes(6).toString('hex')}`);
+}
+
+async function findVariantFile(folder: string, variant: string): Promise<string | null> {
+  try {
+    const entries = await readdir(folder);
+    const name = entries.find(entry => entry.startsWith(`${variant}.`));
+    return name ? path.join(folder, name) : null;
+  } catch {
+    return null;
+  }
+}
+
+// sharp ships with Next.js as an optional dependency; without it every variant is the original
+let sharpLoader: Promise<any | null> | undefined;
+function loadSharp(): Promise<any | null> {
+  sharpLoader ??= import('sharp')
+    .then(module => module.default ?? module)
+    .catch(() => {
+      console.warn('⚠️ [Blob Store] sharp is not installed; image variants will be stored at original size');
+      return null;
+    });
+  return sharpLoader;
+}
+
+async function writeVariants(folder: string, originalPath: string, contentType: string): Promise<void> {
+  const sharp = await loadSharp();
+  const originalExt = path.extname(originalPath);
+
+  for (const [variant, size] of Object.entries(IMAGE_VARIANTS)) {
+    if (await findVariantFile(folder, variant)) continue;
+
+    const tmp = tempPath();
+    try {
+      if (sharp) {
+        await sharp(originalPath, { animated: contentType === 'image/gif' })
+          .rotate()
+          .resize({ width: size, height: size, fit: 'inside', withoutEnlargement: true })
+          .webp({ quality: 80 })
+          .toFile(tmp);
+        await rename(tmp, path.join(folder, `${variant}.webp`));
+      } else {
+        await copyFile(originalPath, tmp);
+        await rename(tmp, path.join(folder, `${variant}${originalExt}`));
+      }
+    } catch (error) {
+      await rm(tmp, { force: true });
+      throw error;
+    }
+  }
+}
+
+function limitAndHash(hash: crypto.Hash, maxBytes: number, counter: { bytes: number }): Transform {
+  return new Transform({
+    transform(chunk: Buffer, _encoding, callback) {
+      counter.bytes += chunk.length;
+      if (counter.bytes > maxBytes) {
+        callback(new UploadTooLargeError(maxBytes));
+        return;
+      }
+      hash.update(chunk);
+      callback(null, chunk);
+    }
+  });
+}
+
+/**
+ * Stream a blob to disk, hashing it on the way, and file it under its SHA-256.
+ * Identical content is stored once. Images also get thumb/card/full variants,
+ * generated here so reads never have to resize anything.
+ */
+export async function storeBlob(
+  body: ReadableStream<Uint8Array> | Readable,
+  options: { contentType: string; maxBytes?: number }
+): Promise<StoredBlob> {
+  const contentType = options.contentType.toLowerCase();
+  const ext = EXTENSIONS[contentType] || 'bin';
+  const tmp = tempPath();
+  const hash = crypto.createHash('sha256');
+  const counter = { bytes: 0 };
+
+  await mkdir(path.dirname(tmp), { recursive: true });
+  const source = body instanceof Readable ? body : Readable.fromWeb(body as any);
+
+  try {
+    await pipeline(source, limitAndHash(hash, options.maxBytes ?? Infinity, counter), fs.createWriteStream(tmp));
+  } catch (error) {
+    await rm(tmp, { force: true });
+    throw error;
+  }
+
+  const digest = hash.digest('hex');
+  const folder = blobFolder(digest);
+  let originalPath = await findVariantFile(folder, 'original');
+  if (originalPath) {
+    // Already stored
+    await rm(tmp, { force: true });
+  } else {
+    await mkdir(folder, { recursive: true });
+    originalPath = path.join(folder, `original.${ext}`);
+    await rename(tmp, originalPath);
+  }
+
+  const stored: StoredBlob = {
+    hash: digest,
+    size: counter.bytes,
+    contentType,
+    url: blobUrl(digest, 'original')
+  };
+
+  if (RESIZABLE_TYPES.includes(contentType)) {
+    await writeVariants(folder, originalPath, contentType);
+    stored.variants = {
+      thumb: blobUrl(digest, 'thumb'),
+      card: blobUrl(digest, 'card'),
+      full: blobUrl(digest, 'full')
+    };
+  }
+
+  return stored;
+}
+
+/**
+ * Locate a stored blob file for serving
+ */
+export async function findBlobFile(hash: string, variant: string): Promise<BlobFile | null> {
+  if (!HASH_PATTERN.test(hash) || !(variant === 'original' || variant in IMAGE_VARIANTS)) {
+    return null;
+  }
+
+  const filePath = await findVariantFile(blobFolder(hash), variant);
+  if (!filePath) return null;
+
+  const stats = await stat(filePath);
+  const ext = path.extname(filePath).slice(1);
+  return {
+    path: filePath,
+    size: stats.size,
+    contentType: CONTENT_TYPES[ext] || 'application/octet-stream'
+  };
+}
+
+const INLINE_IMAGE_PATTERN = /^data:(image\/[a-z0-9.+-]+);base64,/i;
+
+/**
+ * Replace every inline base64 image (`data:image/...`) found anywhere in a
+ * record with the URL of its stored full-size variant. Returns the number of
+ * images moved out.
+ */
+export async function externalizeInlineImages(record: any, seen = new Map<string, string>()): Promise<number> {
+  let moved = 0;
+
+  const visit = async (value: any): Promise<any> => {
+    if (typeof value === 'string') {
+      const match = value.match(INLINE_IMAGE_PATTERN);
+      if (!match) return value;
+
+      let url = seen.get(value);
+      if (!url) {
+        const bytes = Buffer.from(value.slice(match[0].length), 'base64');
+        const stored = await storeBlob(Readable.from([bytes]), { contentType: match[1] });
+        url = stored.variants?.full ?? stored.url;
+        seen.set(value, url);
+      }
+      moved++;
+      return url;
+    }
+
+    if (Array.isArray(value)) {
+      for (let i = 0; i < value.length; i++) {
+        value[i] = await visit(value[i]);
+      }
+    } else if (value && typeof value === 'object') {
+      for (const key of Object.keys(value)) {
+        value[key] = await visit(value[key]);
+      }
+    }
+    return value;
+  };
+
+  await visit(record);
+  return moved;
+}
@@ -0,0 +1,53 @@
+import type { NextRequest } from 'next/server';
+
+export interface UploadRequest {
+  body: ReadableStream<Uint8Array> | null;
+  contentType: string;
+  fileName: string;
+  // Declared size in bytes, when the client sent one
+  size: number | null;
+  field(name: string): string | null;
+}
+
+/**
+ * Read an upload from either a raw body or a multipart form.
+ *
+ * Raw uploads stream straight through to the blob store: the file is the
+ * request body, its type is the Content-Type header, its name is the
+ * URI-encoded X-File-Name header and other fields (userId) come from the
+ * query string. Multipart forms are still accepted for older clients, but the
+ * platform buffers the whole form before handing it over.
+ */
+export async function readUpload(request: NextRequest): Promise<UploadRequest> {
+  const requestType = request.headers.get('content-type') || '';
+  const searchParams = request.nextUrl.searchParams;
+
+  if (requestType.startsWith('multipart/form-data')) {
+    const formData = await request.formData();
+    const file = formData.get('file') as File | null;
+    return {
+      body: file ? file.stream() : null,
+      contentType: file?.type || '',
+      fileName: file?.name || '',
+      size: file ? file.size : null,
+      field: name => (formData.get(name) as string | null) ?? searchParams.get(name)
+    };
+  }
+
+  const declaredLength = request.headers.get('content-length');
+  const rawName = request.headers.get('x-file-name') || '';
+  let fileName = rawName;
+  try {
+    fileName = decodeURIComponent(rawName);
+  } catch {
+    // Keep the name as sent
+  }
+
+  return {
+    body: request.body,
+    contentType: requestType.split(';')[0].trim().toLowerCase(),
+    fileName,
+    size: declaredLength ? Number(declaredLength) : null,
+    field: name => searchParams.get(name)
+  };
+}
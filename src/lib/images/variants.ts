@@ -0,0 +1,29 @@
+// Longest edge, in pixels, of each stored image variant
+export const IMAGE_VARIANTS = {
+  thumb: 160,
+  card: 640,
+  full: 1600
+} as const;
+
+export type ImageVariant = keyof typeof IMAGE_VARIANTS;
+
+const BLOB_URL_PATTERN = /^\/api\/blobs\/([a-f0-9]{64})\/(thumb|card|full|original)$/;
+
+/**
+ * Public URL of a stored blob. Blobs are content-addressed, so the URL never
+ * changes meaning and can be cached forever.
+ */
+export function blobUrl(hash: string, variant: ImageVariant | 'original'): string {
+  return `/api/blobs/${hash}/${variant}`;
+}
+
+/**
+ * Point an image URL at another size. URLs that are not from the blob store
+ * (legacy uploads, external links) are returned unchanged.
+ */
+export function imageVariantUrl(url: string | null | undefined, variant: ImageVariant): string | undefined {
+  if (!url) return undefined;
+  const match = url.match(BLOB_URL_PATTERN);
+  if (!match || match[2] === 'original') return url;
+  return blobUrl(match[1], variant);
+}
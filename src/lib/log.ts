@@ -0,0 +1,33 @@
+/**
+ * Leveled console logging. Per-request chatter ("request received",
+ * "returning N bookings") goes through `log.debug` and is hidden unless
+ * LOG_LEVEL=debug; the default level is info.
+ */
+
+export type LogLevel = 'debug' | 'info' | 'warn' | 'error' | 'silent';
+
+const LEVELS: Record<LogLevel, number> = { debug: 10, info: 20, warn: 30, error: 40, silent: 50 };
+
+function threshold(): number {
+  const level = (process.env.LOG_LEVEL || '').toLowerCase() as LogLevel;
+  return LEVELS[level] ?? LEVELS.info;
+}
+
+export function isLogEnabled(level: Exclude<LogLevel, 'silent'>): boolean {
+  return LEVELS[level] >= threshold();
+}
+
+export const log = {
+  debug: (...args: any[]) => {
+    if (isLogEnabled('debug')) console.log(...args);
+  },
+  info: (...args: any[]) => {
+    if (isLogEnabled('info')) console.log(...args);
+  },
+  warn: (...args: any[]) => {
+    if (isLogEnabled('warn')) console.warn(...args);
+  },
+  error: (...args: any[]) => {
+    if (isLogEnabled('error')) console.error(...args);
+  }
+};
@@ -0,0 +1,107 @@
+import { findById } from '@/lib/data-store';
+import { imageVariantUrl } from '@/lib/images/variants';
+
+export interface ParticipantInfo {
+  id: string;
+  name: string;
+  email: string;
+  role: string;
+  profileImage?: string;
+  slug?: string;
+  type?: string;
+}
+
+export interface ParticipantResolver {
+  // Resolve every id not seen yet in a single pass over users, profiles and studios
+  load(userIds: Iterable<string>): void;
+  // Resolved participant, or null when the user does not exist
+  get(userId: string): ParticipantInfo | null;
+  // Resolved participant, or a placeholder for deleted users
+  getOrUnknown(userId: string): ParticipantInfo;
+}
+
+function unknownParticipant(userId: string): ParticipantInfo {
+  return {
+    id: userId,
+    name: 'Unknown User',
+    email: '',
+    role: 'artist',
+    profileImage: undefined
+  };
+}
+
+/**
+ * Request-scoped lookup of conversation participants. Collect every user id a
+ * response needs, load them once, then read from the resolver: each user,
+ * profile and studio is looked up at most once per request no matter how many
+ * conversations or messages mention it.
+ */
+export function createParticipantResolver(): ParticipantResolver {
+  const resolved = new Map<string, ParticipantInfo | null>();
+
+  const load = (userIds: Iterable<string>) => {
+    const missing = new Set<string>();
+    for (const userId of userIds) {
+      if (userId && !resolved.has(userId)) missing.add(userId);
+    }
+    if (missing.size === 0) return;
+
+    // Dedupe studio lookups too: a studio's staff share one studio record
+    const studios = new Map<string, any>();
+    for (const userId of missing) {
+      try {
+        const user = findById('users', userId);
+        if (!user) {
+          resolved.set(userId, null);
+          continue;
+        }
+
+        // Get profile info for avatar
+        const profile = findById('profiles', userId);
+
+        // If user is a studio, get studio information
+        if (user.role === 'studio' && user.studioId) {
+          if (!studios.has(user.studioId)) {
+            studios.set(user.studioId, findById('studios', user.studioId));
+          }
+          const studio = studios.get(user.studioId);
+          if (studio) {
+            resolved.set(userId, {
+              id: user.id,
+              name: studio.name || user.name,
+              email: user.email,
+              role: user.role,
+              profileImage: imageVariantUrl(studio.profileImage || profile?.profileImage, 'thumb'),
+              slug: studio.slug,
+              type: 'studio'
+            });
+            continue;
+          }
+        }
+
+        resolved.set(userId, {
+          id: user.id,
+          name: user.name,
+          email: user.email,
+          role: user.role,
+          profileImage: imageVariantUrl(profile?.profileImage, 'thumb'),
+          type: user.role === 'studio' ? 'studio' : 'artist'
+        });
+      } catch (error) {
+        console.error('Error getting user info:', userId, error);
+        resolved.set(userId, null);
+      }
+    }
+  };
+
+  const get = (userId: string) => {
+    if (!resolved.has(userId)) load([userId]);
+    return resolved.get(userId) ?? null;
+  };
+
+  return {
+    load,
+    get,
+    getOrUnknown: userId => get(userId) ?? unknownParticipant(userId)
+  };
+}
@@ -1,10 +1,6 @@
-import fs from 'fs';
-import path from 'path';
 import { Artist } from './types';
 import { slugify } from './utils';
-
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
-const PROFILES_FILE = path.join(process.cwd(), 'data', 'user-profiles.json');
+import { findById, findMany, getCollection } from './data-store';
 
 interface BasicUser {
   id: string;
@@ -48,45 +44,7 @@ interface ExtendedProfile {
 }
 
 function getUsers(): BasicUser[] {
-  try {
-    if (fs.existsSync(USERS_FILE)) {
-      const data = fs.readFileSync(USERS_FILE, 'utf8');
-      const users = JSON.parse(data);
-      
-      // Validate that users is an array
-      if (!Array.isArray(users)) {
-        console.error('Users data is not an array, returning empty array');
-        return [];
-      }
-      
-      return users;
-    }
-    return [];
-  } catch (error) {
-    console.error('Error reading users file:', error);
-    return [];
-  }
-}
-
-function getProfiles(): ExtendedProfile[] {
-  try {
-    if (fs.existsSync(PROFILES_FILE)) {
-      const data = fs.readFileSync(PROFILES_FILE, 'utf8');
-      const profiles = JSON.parse(data);
-      
-      // Validate that profiles is an array
-      if (!Array.isArray(profiles)) {
-        console.error('Profiles data is not an array, returning empty array');
-        return [];
-      }
-      
-      return profiles;
-    }
-    return [];
-  } catch (error) {
-    console.error('Error reading profiles file:', error);
-    return [];
-  }
+  return getCollection<BasicUser>('users');
 }
 
 /**
@@ -139,10 +97,7 @@ export function getCompleteArtistProfile(userId: string): Artist | null {
       return null;
     }
 
-    const users = getUsers();
-    const profiles = getProfiles();
-    
-    const user = users.find(u => u.id === userId);
+    const user: BasicUser | null = findById('users', userId);
     if (!user) {
       console.warn('User not found:', userId);
       return null;
@@ -153,10 +108,10 @@ export function getCompleteArtistProfile(userId: string): Artist | null {
       return null;
     }
     
-    const profile = profiles.find(p => p.id === userId);
+    const profile: ExtendedProfile | null = findById('profiles', userId);
     
-    // Generate fallback slug if needed
-    const slug = generateFallbackSlug(user, users);
+    // Generate fallback slug if needed (only scans all users when the slug is missing)
+    const slug = generateFallbackSlug(user, isValidIdentifier(user.slug || '') ? [] : getUsers());
     
     // Combine user and profile data with safeguards
     const completeProfile: Artist = {
@@ -197,8 +152,7 @@ export function getCompleteArtistProfileBySlug(slug: string): Artist | null {
       return null;
     }
 
-    const users = getUsers();
-    const user = users.find(u => u.slug === slug && u.role === 'rapper');
+    const user = findMany('users', 'slug', slug).find((u: BasicUser) => u.role === 'rapper');
     
     if (!user) {
       console.warn('Artist not found by slug:', slug);
@@ -0,0 +1,193 @@
+import crypto from 'crypto';
+
+export type RealtimeEventType =
+  | 'message_created'
+  | 'message_read'
+  | 'user_typing'
+  | 'conversation_updated'
+  | 'booking_status_changed'
+  // Sent when events were missed and the client should refetch
+  | 'resync';
+
+export interface RealtimeEvent {
+  type: RealtimeEventType;
+  conversationId?: string;
+  data: any;
+}
+
+// Keeps idle connections open through proxies and lets clients detect dead ones
+export const HEARTBEAT_INTERVAL_MS = 25_000;
+// Recent events kept per user so a reconnecting client can catch up
+const REPLAY_BUFFER_SIZE = 100;
+// Bytes queued for a slow client before it stops getting typing notices
+const LAGGING_BYTES = 64 * 1024;
+// Bytes queued before a slow client is cut off and told to resync
+const MAX_QUEUED_BYTES = 512 * 1024;
+
+// Events that are only useful live; dropped rather than queued for slow clients
+const EPHEMERAL_EVENTS: RealtimeEventType[] = ['user_typing'];
+
+interface BufferedEvent {
+  seq: number;
+  frame: Uint8Array;
+}
+
+interface Subscriber {
+  send(frame: Uint8Array, ephemeral: boolean): void;
+  close(): void;
+}
+
+interface UserChannel {
+  seq: number;
+  recent: BufferedEvent[];
+  subscribers: Set<Subscriber>;
+}
+
+interface HubState {
+  // Changes on every server start, so stale cursors from a previous process are detected
+  epoch: string;
+  channels: Map<string, UserChannel>;
+}
+
+// Keep the hub on globalThis so route modules reloaded in development share it
+const globalForHub = globalThis as unknown as { __hitconnectorEventHub?: HubState };
+const hub: HubState = globalForHub.__hitconnectorEventHub ??= {
+  epoch: crypto.randomBytes(4).toString('hex'),
+  channels: new Map()
+};
+
+const encoder = new TextEncoder();
+
+function channelFor(userId: string): UserChannel {
+  let channel = hub.channels.get(userId);
+  if (!channel) {
+    channel = { seq: 0, recent: [], subscribers: new Set() };
+    hub.channels.set(userId, channel);
+  }
+  return channel;
+}
+
+function frameFor(event: RealtimeEvent, id?: string): Uint8Array {
+  const lines = id ? [`id: ${id}`] : [];
+  lines.push(`event: ${event.type}`, `data: ${JSON.stringify(event)}`);
+  return encoder.encode(lines.join('\n') + '\n\n');
+}
+
+/**
+ * Send an event to every open connection of each user. Each user gets it
+ * once, however many times they appear in `userIds`.
+ */
+export function publish(userIds: Iterable<string | null | undefined>, event: RealtimeEvent): void {
+  const ephemeral = EPHEMERAL_EVENTS.includes(event.type);
+  for (const userId of new Set(userIds)) {
+    if (!userId) continue;
+    const channel = hub.channels.get(userId);
+    // Nobody has connected as this user since the server started; nothing to replay to
+    if (!channel) continue;
+
+    let frame: Uint8Array;
+    if (ephemeral) {
+      // No id: ephemeral events are never replayed, so they don't move the client's cursor
+      frame = frameFor(event);
+    } else {
+      const seq = ++channel.seq;
+      frame = frameFor(event, `${hub.epoch}:${seq}`);
+      channel.recent.push({ seq, frame });
+      if (channel.recent.length > REPLAY_BUFFER_SIZE) channel.recent.shift();
+    }
+    for (const subscriber of channel.subscribers) {
+      subscriber.send(frame, ephemeral);
+    }
+  }
+}
+
+// Events after the client's cursor, or null when the cursor can't be served
+function eventsSince(channel: UserChannel, lastEventId: string): BufferedEvent[] | null {
+  const [epoch, seqText] = lastEventId.split(':');
+  const seq = Number(seqText);
+  if (epoch !== hub.epoch || !Number.isInteger(seq) || seq > channel.seq) return null;
+  const oldest = channel.recent[0]?.seq ?? channel.seq + 1;
+  // Events between the cursor and our oldest buffered one have been dropped
+  if (seq + 1 < oldest) return null;
+  return channel.recent.filter(event => event.seq > seq);
+}
+
+/**
+ * Open a server-sent event stream for one user. Events published for the
+ * user since `lastEventId` are replayed first; if they are no longer buffered
+ * the client is sent a `resync` event instead and should refetch.
+ *
+ * The stream is paced by the client: when it stops reading, typing notices
+ * are dropped first, and a connection that falls too far behind is closed
+ * with a `resync` so it can reconnect and catch up.
+ */
+export function subscribe(userId: string, options: { lastEventId?: string | null; signal?: AbortSignal } = {}): ReadableStream<Uint8Array> {
+  const channel = channelFor(userId);
+  let subscriber: Subscriber | null = null;
+  let heartbeat: ReturnType<typeof setInterval> | undefined;
+
+  const cleanup = () => {
+    if (heartbeat) clearInterval(heartbeat);
+    if (subscriber) channel.subscribers.delete(subscriber);
+    subscriber = null;
+  };
+
+  return new ReadableStream<Uint8Array>({
+    start(controller) {
+      let closed = false;
+
+      const close = () => {
+        if (closed) return;
+        closed = true;
+        cleanup();
+        try {
+          controller.close();
+        } catch {
+          // Already closed by the client
+        }
+      };
+
+      const send = (frame: Uint8Array, ephemeral: boolean) => {
+        if (closed) return;
+        const queued = -(controller.desiredSize ?? 0) + MAX_QUEUED_BYTES;
+        if (ephemeral && queued > LAGGING_BYTES) return;
+        if (queued + frame.byteLength > MAX_QUEUED_BYTES) {
+          controller.enqueue(frameFor({ type: 'resync', data: { reason: 'backlog' } }));
+          close();
+          return;
+        }
+        controller.enqueue(frame);
+      };
+
+      subscriber = { send, close };
+      channel.subscribers.add(subscriber);
+
+      // Retry hint for EventSource, then anything the client missed
+      controller.enqueue(encoder.encode(`retry: 1000\n\n`));
+      if (options.lastEventId) {
+        const missed = eventsSince(channel, options.lastEventId);
+        if (missed) {
+          missed.forEach(event => send(event.frame, false));
+        } else {
+          send(frameFor({ type: 'resync', data: { reason: 'missed_events' } }), false);
+        }
+      }
+
+      heartbeat = setInterval(() => {
+        send(encoder.encode(`event: heartbeat\ndata: ${Date.now()}\n\n`), true);
+      }, HEARTBEAT_INTERVAL_MS);
+
+      options.signal?.addEventListener('abort', close);
+    },
+    cancel() {
+      cleanup();
+    }
+  }, new ByteLengthQueuingStrategy({ highWaterMark: MAX_QUEUED_BYTES }));
+}
+
+/**
+ * Number of open connections for a user (for health checks and tests)
+ */
+export function connectionCount(userId: string): number {
+  return hub.channels.get(userId)?.subscribers.size ?? 0;
+}
@@ -0,0 +1,62 @@
+import { countOf, findMany } from '@/lib/data-store';
+import { publish } from './event-hub';
+
+/**
+ * Push a new message to everyone in the conversation (the sender too, for
+ * their other tabs), plus each participant's updated inbox entry
+ */
+export function notifyMessageCreated(conversation: any, message: any): void {
+  publish(conversation.participants, {
+    type: 'message_created',
+    conversationId: conversation.id,
+    data: message
+  });
+  notifyConversationUpdated(conversation);
+}
+
+/**
+ * Push a conversation's inbox entry to each participant with their own unread count
+ */
+export function notifyConversationUpdated(conversation: any): void {
+  for (const userId of conversation.participants) {
+    publish([userId], {
+      type: 'conversation_updated',
+      conversationId: conversation.id,
+      data: {
+        id: conversation.id,
+        lastMessage: conversation.lastMessage,
+        updatedAt: conversation.updatedAt,
+        unreadCount: countOf('messages', 'unreadByConversation', `${userId}:${conversation.id}`)
+      }
+    });
+  }
+}
+
+/**
+ * Tell the other participants which of their messages were just read
+ */
+export function notifyMessagesRead(conversation: any, readerId: string, messageIds: string[]): void {
+  publish(conversation.participants.filter((id: string) => id !== readerId), {
+    type: 'message_read',
+    conversationId: conversation.id,
+    data: { readerId, messageIds, readAt: new Date().toISOString() }
+  });
+  notifyConversationUpdated(conversation);
+}
+
+/**
+ * Tell the artist and the studio's users that a booking changed status
+ */
+export function notifyBookingStatus(booking: any, status: string): void {
+  const studioUsers = booking.studioId ? findMany('users', 'studioId', booking.studioId) : [];
+  publish([booking.userId, ...studioUsers.map((user: any) => user.id)], {
+    type: 'booking_status_changed',
+    data: {
+      id: booking.id,
+      studioId: booking.studioId,
+      userId: booking.userId,
+      status,
+      updatedAt: booking.updatedAt
+    }
+  });
+}
@@ -0,0 +1,70 @@
+import crypto from 'crypto';
+
+/**
+ * Signed session tokens, issued at login/signup and checked by routes that
+ * must know who is calling (the real-time event stream). A token is
+ * `<base64url payload>.<base64url HMAC-SHA256>`, so it can't be forged or
+ * pointed at another user without SESSION_SECRET.
+ */
+
+// Tokens older than this are rejected and the user has to log in again
+const SESSION_TTL_MS = 30 * 24 * 60 * 60 * 1000;
+
+const DEV_SECRET = 'hitconnector-dev-session-secret';
+
+function secret(): string {
+  const configured = process.env.SESSION_SECRET;
+  if (configured) return configured;
+  if (process.env.NODE_ENV === 'production') {
+    throw new Error('SESSION_SECRET environment variable is required in production');
+  }
+  return DEV_SECRET;
+}
+
+/**
+ * Fail at server start, rather than on every login, when production has no SESSION_SECRET
+ */
+export function assertSessionSecret(): void {
+  secret();
+}
+
+function sign(payload: string): string {
+  return crypto.createHmac('sha256', secret()).update(payload).digest('base64url');
+}
+
+export function createSessionToken(userId: string, issuedAt: number = Date.now()): string {
+  const payload = Buffer.from(JSON.stringify({ userId, issuedAt })).toString('base64url');
+  return `${payload}.${sign(payload)}`;
+}
+
+/**
+ * The user a token was issued to, or null if it is malformed, forged or expired
+ */
+export function verifySessionToken(token: string | null | undefined): string | null {
+  if (!token) return null;
+  const [payload, signature, ...rest] = token.split('.');
+  if (!payload || !signature || rest.length > 0) return null;
+
+  const expected = Buffer.from(sign(payload));
+  const actual = Buffer.from(signature);
+  if (actual.length !== expected.length || !crypto.timingSafeEqual(actual, expected)) return null;
+
+  try {
+    const { userId, issuedAt } = JSON.parse(Buffer.from(payload, 'base64url').toString('utf8'));
+    if (typeof userId !== 'string' || typeof issuedAt !== 'number') return null;
+    if (Date.now() - issuedAt > SESSION_TTL_MS) return null;
+    return userId;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * The user behind a request's `Authorization: Bearer` header, or its `token`
+ * query parameter for clients that can't set headers (EventSource)
+ */
+export function sessionUserId(request: Request): string | null {
+  const header = request.headers.get('authorization');
+  const bearer = header?.startsWith('Bearer ') ? header.slice(7) : null;
+  return verifySessionToken(bearer || new URL(request.url).searchParams.get('token'));
+}
@@ -0,0 +1,222 @@
+/**
+ * Index keys for studio search. The data store files studios under these
+ * keys (see the studios indexes in data-store.ts), and the search module
+ * builds the same keys from query parameters to look them up.
+ */
+
+// Size of a spatial grid cell in degrees (roughly 28km north-south)
+export const GEO_CELL_DEGREES = 0.25;
+// Shortest token prefix indexed, so typing "na" already finds "Nashville"
+const MIN_PREFIX_LENGTH = 2;
+// Longer tokens are indexed by this many leading characters only
+const MAX_PREFIX_LENGTH = 20;
+
+// Sort keys for unpriced studios start with this, placing them after every priced one
+const UNPRICED = '~';
+// Values are stored as MAX - value in descending indexes so every scan runs ascending
+const MAX_RATE = 1e9;
+const MAX_RATING = 1e3;
+const MAX_TIME = 9e15;
+
+/**
+ * Lowercase words with accents stripped: "Café Sound" -> ["cafe", "sound"]
+ */
+export function tokenize(text: unknown): string[] {
+  if (typeof text !== 'string') return [];
+  return text
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase()
+    .split(/[^a-z0-9]+/)
+    .filter(Boolean);
+}
+
+function prefixesOf(token: string): string[] {
+  const prefixes: string[] = [];
+  const longest = Math.min(token.length, MAX_PREFIX_LENGTH);
+  for (let length = Math.min(MIN_PREFIX_LENGTH, longest); length <= longest; length++) {
+    prefixes.push(token.slice(0, length));
+  }
+  return prefixes;
+}
+
+/**
+ * Index key matching every studio with a word starting with `token`, in any
+ * searchable field
+ */
+export function textKey(token: string): string {
+  return `t:${token.slice(0, MAX_PREFIX_LENGTH)}`;
+}
+
+/**
+ * Index key matching every studio whose location or address has a word
+ * starting with `token`
+ */
+export function locationKey(token: string): string {
+  return `l:${token.slice(0, MAX_PREFIX_LENGTH)}`;
+}
+
+/**
+ * Index key for a whole amenity, e.g. "Vocal Booth" -> "a:vocal booth"
+ */
+export function amenityKey(amenity: string): string {
+  return `a:${tokenize(amenity).join(' ')}`;
+}
+
+export interface StudioTokens {
+  // Words from every searchable field
+  text: string[];
+  // Words from the location and address
+  place: string[];
+  // Whole amenities, normalized the same way as amenityKey
+  amenities: string[];
+}
+
+export function studioTokens(studio: any): StudioTokens {
+  const amenities: unknown[] = Array.isArray(studio?.amenities) ? studio.amenities : [];
+  const specialties: unknown[] = Array.isArray(studio?.specialties) ? studio.specialties : [];
+  const place = [...tokenize(studio?.location), ...tokenize(studio?.address)];
+  return {
+    text: [
+      ...tokenize(studio?.name),
+      ...place,
+      ...amenities.flatMap(tokenize),
+      ...specialties.flatMap(tokenize)
+    ],
+    place,
+    amenities: amenities
+      .map(amenity => tokenize(amenity).join(' '))
+      .filter(Boolean)
+  };
+}
+
+/**
+ * Every inverted-index key a studio is filed under
+ */
+export function studioSearchKeys(studio: any): string[] {
+  if (!studio) return [];
+  const { text, place, amenities } = studioTokens(studio);
+  const keys = new Set<string>();
+  text.forEach(token => prefixesOf(token).forEach(prefix => keys.add(textKey(prefix))));
+  place.forEach(token => prefixesOf(token).forEach(prefix => keys.add(locationKey(prefix))));
+  amenities.forEach(amenity => keys.add(`a:${amenity}`));
+  return Array.from(keys);
+}
+
+/**
+ * Whether a studio with these tokens is filed under `key`, without building
+ * all of its keys
+ */
+export function tokensHaveKey(tokens: StudioTokens, key: string): boolean {
+  const value = key.slice(2);
+  if (key.startsWith('t:')) return tokens.text.some(token => token.startsWith(value));
+  if (key.startsWith('l:')) return tokens.place.some(token => token.startsWith(value));
+  if (key.startsWith('a:')) return tokens.amenities.includes(value);
+  return false;
+}
+
+function toNumber(value: unknown): number | null {
+  const number = typeof value === 'string' && value.trim() !== '' ? Number(value) : value;
+  return typeof number === 'number' && Number.isFinite(number) ? number : null;
+}
+
+/**
+ * Hourly rate shown on the studio's card: its own rate, else its cheapest room's
+ */
+export function studioRate(studio: any): number | null {
+  const rate = toNumber(studio?.hourlyRate);
+  if (rate !== null) return rate;
+  const roomRates = (Array.isArray(studio?.rooms) ? studio.rooms : [])
+    .map((room: any) => toNumber(room?.hourlyRate))
+    .filter((roomRate: number | null): roomRate is number => roomRate !== null);
+  return roomRates.length > 0 ? Math.min(...roomRates) : null;
+}
+
+export function studioRating(studio: any): number {
+  return toNumber(studio?.rating) ?? 0;
+}
+
+export function studioCoordinates(studio: any): { lat: number; lng: number } | null {
+  const lat = toNumber(studio?.latitude ?? studio?.lat);
+  const lng = toNumber(studio?.longitude ?? studio?.lng);
+  if (lat === null || lng === null || Math.abs(lat) > 90 || Math.abs(lng) > 180) return null;
+  return { lat, lng };
+}
+
+/**
+ * Grid cell containing a point
+ */
+export function geoCellKey(lat: number, lng: number): string {
+  return `${Math.floor(lat / GEO_CELL_DEGREES)}:${Math.floor(lng / GEO_CELL_DEGREES)}`;
+}
+
+export function studioGeoCell(studio: any): string | null {
+  const point = studioCoordinates(studio);
+  return point ? geoCellKey(point.lat, point.lng) : null;
+}
+
+function padded(value: number, width: number): string {
+  return Math.max(0, value).toFixed(2).padStart(width, '0');
+}
+
+/**
+ * Sort key for a value in an ascending index. Without an id it sorts before
+ * every studio with that value; `upTo` sorts after all of them.
+ */
+export function ascendingKey(value: number, id?: string): string {
+  return id === undefined ? padded(value, 13) : `${padded(value, 13)}|${id}`;
+}
+
+export function upTo(key: string): string {
+  return `${key}~`;
+}
+
+// Sort keys for each sort order; studios that can't be placed go last
+export const sortKeys = {
+  'price-low': (studio: any) => {
+    const rate = studioRate(studio);
+    return rate === null ? `${UNPRICED}|${studio?.id}` : ascendingKey(rate, studio?.id);
+  },
+  'price-high': (studio: any) => {
+    const rate = studioRate(studio);
+    return rate === null ? `${UNPRICED}|${studio?.id}` : ascendingKey(MAX_RATE - rate, studio?.id);
+  },
+  rating: (studio: any) => ascendingKey(MAX_RATING - studioRating(studio), studio?.id),
+  newest: (studio: any) => {
+    const time = Date.parse(studio?.createdAt ?? '');
+    return `${padded(MAX_TIME - (isNaN(time) ? 0 : time), 19)}|${studio?.id}`;
+  }
+};
+
+export type StudioSortKey = keyof typeof sortKeys;
+
+export interface KeyRange {
+  // Inclusive lower bound, or null for the start of the index
+  from: string | null;
+  // Exclusive upper bound, or null for the end of the index
+  to: string | null;
+}
+
+/**
+ * Key range holding studios priced between `min` and `max` (inclusive) in
+ * the price-low or price-high index. Unpriced studios are never in range.
+ */
+export function priceRange(order: 'price-low' | 'price-high', min: number | null, max: number | null): KeyRange {
+  if (order === 'price-low') {
+    return {
+      from: min === null ? null : ascendingKey(min),
+      to: max === null ? UNPRICED : upTo(ascendingKey(max))
+    };
+  }
+  return {
+    from: max === null ? null : ascendingKey(MAX_RATE - max),
+    to: min === null ? UNPRICED : upTo(ascendingKey(MAX_RATE - min))
+  };
+}
+
+/**
+ * Key range holding studios rated at least `minRating` in the rating index
+ */
+export function ratingRange(minRating: number): KeyRange {
+  return { from: null, to: upTo(ascendingKey(MAX_RATING - minRating)) };
+}
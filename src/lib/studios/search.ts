@@ -0,0 +1,281 @@
+import { ALL, countOf, findMany, findRange, readSnapshot } from '@/lib/data-store';
+import { imageVariantUrl } from '@/lib/images/variants';
+import {
+  amenityKey,
+  ascendingKey,
+  GEO_CELL_DEGREES,
+  geoCellKey,
+  locationKey,
+  priceRange,
+  ratingRange,
+  sortKeys,
+  studioCoordinates,
+  studioRate,
+  studioRating,
+  studioTokens,
+  textKey,
+  tokenize,
+  tokensHaveKey,
+  type KeyRange,
+  type StudioSortKey
+} from './search-keys';
+
+export type StudioSort = StudioSortKey | 'distance';
+
+export const STUDIO_SORTS: StudioSort[] = ['rating', 'price-low', 'price-high', 'newest', 'distance'];
+
+export interface StudioSearchParams {
+  q?: string | null;
+  location?: string | null;
+  amenities?: string[];
+  minRate?: number | null;
+  maxRate?: number | null;
+  minRating?: number | null;
+  // Center and radius for a nearby search
+  lat?: number | null;
+  lng?: number | null;
+  radiusKm?: number | null;
+  sort: StudioSort;
+  cursor?: string | null;
+  limit: number;
+}
+
+/**
+ * What a search result card needs; the full studio comes from /api/studios/[id]
+ */
+export interface StudioCard {
+  id: string;
+  slug: string;
+  name: string;
+  location: string;
+  hourlyRate: number | null;
+  rating: number;
+  reviewCount: number;
+  specialties: string[];
+  amenities: string[];
+  description: string;
+  image?: string;
+  latitude?: number;
+  longitude?: number;
+  distanceKm?: number;
+  createdAt?: string;
+}
+
+export interface StudioSearchResult {
+  studios: StudioCard[];
+  nextCursor: string | null;
+  hasMore: boolean;
+}
+
+export const DEFAULT_RADIUS_KM = 50;
+export const MAX_RADIUS_KM = 500;
+// Studios read from a sorted index per round while filling a page
+const SCAN_BATCH = 50;
+const DESCRIPTION_LENGTH = 160;
+const CARD_AMENITIES = 6;
+const EARTH_RADIUS_KM = 6371;
+
+const SORT_INDEXES = {
+  rating: 'rating',
+  'price-low': 'priceLow',
+  'price-high': 'priceHigh',
+  newest: 'newest'
+} as const;
+
+/**
+ * Whether this is the version of the studio to list. Older copies saved
+ * under the same slug lose to the most recently updated one.
+ */
+export function isCurrentStudio(studio: any): boolean {
+  if (!studio?.slug || countOf('studios', 'slug', studio.slug) <= 1) return true;
+
+  let current: any = null;
+  for (const version of findMany('studios', 'slug', studio.slug)) {
+    if (!current || Date.parse(version.updatedAt || version.createdAt) > Date.parse(current.updatedAt || current.createdAt)) {
+      current = version;
+    }
+  }
+  return current?.id === studio.id;
+}
+
+function distanceKm(from: { lat: number; lng: number }, to: { lat: number; lng: number }): number {
+  const toRadians = (degrees: number) => (degrees * Math.PI) / 180;
+  const dLat = toRadians(to.lat - from.lat);
+  const dLng = toRadians(to.lng - from.lng);
+  const a = Math.sin(dLat / 2) ** 2 +
+    Math.cos(toRadians(from.lat)) * Math.cos(toRadians(to.lat)) * Math.sin(dLng / 2) ** 2;
+  return 2 * EARTH_RADIUS_KM * Math.asin(Math.sqrt(a));
+}
+
+export function toStudioCard(studio: any, distance?: number): StudioCard {
+  const description: string = studio.description || '';
+  const point = studioCoordinates(studio);
+  return {
+    id: studio.id,
+    slug: studio.slug,
+    name: studio.name || '',
+    location: studio.location || studio.address || '',
+    hourlyRate: studioRate(studio),
+    rating: studioRating(studio),
+    reviewCount: studio.reviewCount || 0,
+    specialties: Array.isArray(studio.specialties) ? studio.specialties : [],
+    amenities: Array.isArray(studio.amenities) ? studio.amenities.slice(0, CARD_AMENITIES) : [],
+    description: description.length > DESCRIPTION_LENGTH
+      ? `${description.slice(0, DESCRIPTION_LENGTH - 1).trimEnd()}…`
+      : description,
+    image: imageVariantUrl(studio.profileImage || studio.coverImage || studio.gallery?.[0] || studio.images?.[0], 'card'),
+    ...(point && { latitude: point.lat, longitude: point.lng }),
+    ...(distance !== undefined && { distanceKm: Math.round(distance * 10) / 10 }),
+    createdAt: studio.createdAt
+  };
+}
+
+/**
+ * Cursors are the last card's sort key, tagged with the sort so a cursor
+ * from one order can't be replayed against another
+ */
+function encodeCursor(sort: StudioSort, key: string): string {
+  return Buffer.from(`${sort}\n${key}`).toString('base64url');
+}
+
+/**
+ * The sort key a cursor continues after, or null if it isn't a cursor for this sort
+ */
+export function decodeCursor(cursor: string, sort: StudioSort): string | null {
+  const [cursorSort, key] = Buffer.from(cursor, 'base64url').toString().split('\n');
+  return cursorSort === sort && key ? key : null;
+}
+
+// Grid cells overlapping the search circle's bounding box
+function cellsAround(center: { lat: number; lng: number }, radiusKm: number): string[] {
+  const latSpan = radiusKm / 111.32;
+  const lngSpan = radiusKm / (111.32 * Math.max(Math.cos((center.lat * Math.PI) / 180), 0.01));
+  const cells = new Set<string>();
+  for (let lat = center.lat - latSpan; lat < center.lat + latSpan + GEO_CELL_DEGREES; lat += GEO_CELL_DEGREES) {
+    for (let lng = center.lng - lngSpan; lng < center.lng + lngSpan + GEO_CELL_DEGREES; lng += GEO_CELL_DEGREES) {
+      cells.add(geoCellKey(Math.min(lat, center.lat + latSpan), Math.min(lng, center.lng + lngSpan)));
+    }
+  }
+  return Array.from(cells);
+}
+
+/**
+ * Search listed studios. With text, location, amenity, area or range filters
+ * the matching studios are collected from their indexes and sorted; otherwise
+ * the page is read straight off the index for the sort order, so the cost of
+ * a page doesn't grow with the number of studios.
+ */
+export function searchStudios(params: StudioSearchParams): StudioSearchResult {
+  // Candidates are checked against the store one by one; stat the file once for all of them
+  return readSnapshot(() => runSearch(params));
+}
+
+function runSearch(params: StudioSearchParams): StudioSearchResult {
+  const { sort, limit } = params;
+  const minRate = params.minRate ?? null;
+  const maxRate = params.maxRate ?? null;
+  const minRating = params.minRating ?? null;
+  const center = params.lat != null && params.lng != null ? { lat: params.lat, lng: params.lng } : null;
+  const radiusKm = Math.min(params.radiusKm ?? DEFAULT_RADIUS_KM, MAX_RADIUS_KM);
+  const after = params.cursor ? decodeCursor(params.cursor, sort) : null;
+
+  // Inverted-index keys every match must have
+  const requiredKeys = [
+    ...tokenize(params.q).filter(token => token.length >= 2).map(textKey),
+    ...tokenize(params.location).filter(token => token.length >= 2).map(locationKey),
+    ...(params.amenities ?? []).filter(amenity => tokenize(amenity).length > 0).map(amenityKey)
+  ];
+
+  const distances = new Map<string, number>();
+  const matches = (studio: any): boolean => {
+    if (!isCurrentStudio(studio)) return false;
+    if (requiredKeys.length > 0) {
+      const tokens = studioTokens(studio);
+      if (!requiredKeys.every(key => tokensHaveKey(tokens, key))) return false;
+    }
+    if (minRate !== null || maxRate !== null) {
+      const rate = studioRate(studio);
+      if (rate === null || (minRate !== null && rate < minRate) || (maxRate !== null && rate > maxRate)) return false;
+    }
+    if (minRating !== null && studioRating(studio) < minRating) return false;
+    if (center) {
+      const point = studioCoordinates(studio);
+      if (!point) return false;
+      const distance = distanceKm(center, point);
+      if (distance > radiusKm) return false;
+      distances.set(studio.id, distance);
+    }
+    return true;
+  };
+
+  const sortKeyOf = (studio: any): string => sort === 'distance'
+    ? ascendingKey(distances.get(studio.id) ?? MAX_RADIUS_KM, studio.id)
+    : sortKeys[sort](studio);
+
+  let page: any[];
+  let hasMore: boolean;
+  const candidates = candidateStudios();
+  if (candidates) {
+    const sorted = candidates
+      .filter(matches)
+      .map(studio => ({ studio, key: sortKeyOf(studio) }))
+      .filter(entry => !after || entry.key > after)
+      .sort((a, b) => (a.key < b.key ? -1 : a.key > b.key ? 1 : 0));
+    page = sorted.slice(0, limit).map(entry => entry.studio);
+    hasMore = sorted.length > limit;
+  } else {
+    ({ page, hasMore } = scanSortIndex());
+  }
+
+  const last = page[page.length - 1];
+  return {
+    studios: page.map(studio => toStudioCard(studio, distances.get(studio.id))),
+    nextCursor: hasMore && last ? encodeCursor(sort, sortKeyOf(last)) : null,
+    hasMore
+  };
+
+  // The smallest set of studios known to contain every match, or null to scan the sort index
+  function candidateStudios(): any[] | null {
+    if (requiredKeys.length > 0) {
+      const rarest = requiredKeys.reduce((best, key) =>
+        countOf('studios', 'search', key) < countOf('studios', 'search', best) ? key : best);
+      return findMany('studios', 'search', rarest);
+    }
+    if (center) {
+      return cellsAround(center, radiusKm).flatMap(cell => findMany('studios', 'geoCell', cell));
+    }
+    if (sort === 'distance') return [];
+    const pricedByOrder = sort === 'price-low' || sort === 'price-high';
+    if ((minRate !== null || maxRate !== null) && !pricedByOrder) {
+      return findRange('studios', 'priceLow', ALL, priceRange('price-low', minRate, maxRate)).records;
+    }
+    if (minRating !== null && sort !== 'rating' && !pricedByOrder) {
+      return findRange('studios', 'rating', ALL, ratingRange(minRating)).records;
+    }
+    return null;
+  }
+
+  // Read the sort order's index from the cursor on, skipping non-matches, until the page is full
+  function scanSortIndex(): { page: any[]; hasMore: boolean } {
+    const order = sort as StudioSortKey;
+    let range: KeyRange = { from: null, to: null };
+    if ((order === 'price-low' || order === 'price-high') && (minRate !== null || maxRate !== null)) {
+      range = priceRange(order, minRate, maxRate);
+    } else if (order === 'rating' && minRating !== null) {
+      range = ratingRange(minRating);
+    }
+
+    const found: any[] = [];
+    let scanAfter = after;
+    for (;;) {
+      const batch = findRange('studios', SORT_INDEXES[order], ALL, { ...range, after: scanAfter, limit: SCAN_BATCH });
+      for (const studio of batch.records) {
+        if (!matches(studio)) continue;
+        if (found.length === limit) return { page: found, hasMore: true };
+        found.push(studio);
+      }
+      if (!batch.hasMore || batch.records.length === 0) return { page: found, hasMore: false };
+      scanAfter = sortKeys[order](batch.records[batch.records.length - 1]);
+    }
+  }
+}
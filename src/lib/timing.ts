@@ -0,0 +1,170 @@
+import { AsyncLocalStorage } from 'async_hooks';
+
+/**
+ * Per-route request timing. Route handlers wrapped with `withTiming` record
+ * how long each request spent in each phase:
+ *
+ * - io: reading data files and their operation logs
+ * - parse: JSON.parse of data files
+ * - lookup: data store index reads
+ * - serialize: building the JSON response (wrap NextResponse.json in `timed`)
+ *
+ * The phases are sent back in a Server-Timing header (shown by browser dev
+ * tools and read by scripts/loadTest.ts) and added to per-route histograms,
+ * served by GET /api/health/timings.
+ */
+
+export type Phase = 'io' | 'parse' | 'lookup' | 'serialize';
+
+export const PHASES: Phase[] = ['io', 'parse', 'lookup', 'serialize'];
+
+export interface HistogramSummary {
+  count: number;
+  mean: number;
+  p50: number;
+  p95: number;
+  p99: number;
+  max: number;
+}
+
+interface RequestTimings {
+  phases: Record<Phase, number>;
+  // Time spent in phases nested inside the one running now, so each phase counts only its own time
+  nested: number;
+}
+
+interface Histogram {
+  count: number;
+  sum: number;
+  max: number;
+  // counts[i] is the number of samples at or below BUCKET_BOUNDS[i] and above the bound before it
+  counts: number[];
+}
+
+type RouteHistograms = Record<Phase | 'total', Histogram>;
+
+// Bucket upper bounds in milliseconds; the last bucket takes everything slower
+const BUCKET_BOUNDS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, Infinity];
+
+const requestTimings = new AsyncLocalStorage<RequestTimings>();
+
+// Keep histograms on globalThis so they survive Next.js dev-server module reloads
+const globalForTiming = globalThis as unknown as { __hitconnectorRouteTimings?: Map<string, RouteHistograms> };
+const histograms: Map<string, RouteHistograms> = globalForTiming.__hitconnectorRouteTimings ??= new Map();
+
+function emptyHistogram(): Histogram {
+  return { count: 0, sum: 0, max: 0, counts: BUCKET_BOUNDS.map(() => 0) };
+}
+
+function observe(histogram: Histogram, ms: number): void {
+  histogram.count++;
+  histogram.sum += ms;
+  histogram.max = Math.max(histogram.max, ms);
+  histogram.counts[BUCKET_BOUNDS.findIndex(bound => ms <= bound)]++;
+}
+
+// The upper bound of the bucket holding the q-th sample, capped at the slowest seen
+function quantile(histogram: Histogram, q: number): number {
+  const rank = Math.ceil(q * histogram.count);
+  let seen = 0;
+  for (let i = 0; i < BUCKET_BOUNDS.length; i++) {
+    seen += histogram.counts[i];
+    if (seen >= rank) return Math.min(BUCKET_BOUNDS[i], histogram.max);
+  }
+  return histogram.max;
+}
+
+const round = (ms: number) => Math.round(ms * 1000) / 1000;
+
+function summarize(histogram: Histogram): HistogramSummary {
+  if (histogram.count === 0) return { count: 0, mean: 0, p50: 0, p95: 0, p99: 0, max: 0 };
+  return {
+    count: histogram.count,
+    mean: round(histogram.sum / histogram.count),
+    p50: round(quantile(histogram, 0.5)),
+    p95: round(quantile(histogram, 0.95)),
+    p99: round(quantile(histogram, 0.99)),
+    max: round(histogram.max)
+  };
+}
+
+/**
+ * Run synchronous `work`, charging its time to `phase` of the current
+ * request. Outside a timed request this just runs `work`.
+ */
+export function timed<T>(phase: Phase, work: () => T): T {
+  const timings = requestTimings.getStore();
+  if (!timings) return work();
+
+  const outerNested = timings.nested;
+  timings.nested = 0;
+  const start = performance.now();
+  try {
+    return work();
+  } finally {
+    const elapsed = performance.now() - start;
+    timings.phases[phase] += elapsed - timings.nested;
+    timings.nested = outerNested + elapsed;
+  }
+}
+
+export function serverTimingHeader(phases: Record<Phase, number>, total: number): string {
+  return [...PHASES.map(phase => `${phase};dur=${round(phases[phase])}`), `total;dur=${round(total)}`].join(', ');
+}
+
+function record(route: string, phases: Record<Phase, number>, total: number): void {
+  let routeHistograms = histograms.get(route);
+  if (!routeHistograms) {
+    routeHistograms = {
+      io: emptyHistogram(),
+      parse: emptyHistogram(),
+      lookup: emptyHistogram(),
+      serialize: emptyHistogram(),
+      total: emptyHistogram()
+    };
+    histograms.set(route, routeHistograms);
+  }
+  for (const phase of PHASES) observe(routeHistograms[phase], phases[phase]);
+  observe(routeHistograms.total, total);
+}
+
+/**
+ * Wrap a route handler so each request's phases are recorded under `route`
+ * (e.g. 'GET /api/studios') and returned in a Server-Timing header
+ */
+export function withTiming<A extends any[], R extends Response>(
+  route: string,
+  handler: (...args: A) => Promise<R>
+): (...args: A) => Promise<R> {
+  return async (...args: A) => {
+    const timings: RequestTimings = { phases: { io: 0, parse: 0, lookup: 0, serialize: 0 }, nested: 0 };
+    const start = performance.now();
+    const response = await requestTimings.run(timings, () => handler(...args));
+    const total = performance.now() - start;
+
+    record(route, timings.phases, total);
+    response.headers.set('Server-Timing', serverTimingHeader(timings.phases, total));
+    return response;
+  };
+}
+
+/**
+ * Latency summaries (milliseconds) for every timed route, by phase
+ */
+export function routeTimings(): Record<string, Record<Phase | 'total', HistogramSummary>> {
+  const report: Record<string, Record<Phase | 'total', HistogramSummary>> = {};
+  for (const [route, routeHistograms] of histograms) {
+    report[route] = {
+      io: summarize(routeHistograms.io),
+      parse: summarize(routeHistograms.parse),
+      lookup: summarize(routeHistograms.lookup),
+      serialize: summarize(routeHistograms.serialize),
+      total: summarize(routeHistograms.total)
+    };
+  }
+  return report;
+}
+
+export function resetRouteTimings(): void {
+  histograms.clear();
+}
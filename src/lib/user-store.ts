@@ -1,7 +1,6 @@
-import fs from 'fs';
-import path from 'path';
 import bcrypt from 'bcrypt';
 import { slugify } from './utils';
+import { findById, findOne, getCollection, putRecords } from './data-store';
 
 export interface User {
   id: string;
@@ -23,38 +22,17 @@ export interface UserCreateData {
   studioName?: string;
 }
 
-const USERS_FILE = path.join(process.cwd(), 'data', 'users.json');
 const SALT_ROUNDS = 12;
 
-// Ensure data directory exists
-function ensureDataDir() {
-  const dataDir = path.dirname(USERS_FILE);
-  if (!fs.existsSync(dataDir)) {
-    fs.mkdirSync(dataDir, { recursive: true });
-  }
-}
-
-// Read users from file
+// Read users from the shared data store
 export function getUsers(): User[] {
-  ensureDataDir();
-  try {
-    if (!fs.existsSync(USERS_FILE)) {
-      fs.writeFileSync(USERS_FILE, '[]');
-      return [];
-    }
-    const data = fs.readFileSync(USERS_FILE, 'utf8');
-    return JSON.parse(data);
-  } catch (error) {
-    console.error('Error reading users file:', error);
-    return [];
-  }
+  return getCollection<User>('users');
 }
 
-// Write users to file
-export function saveUsers(users: User[]): void {
-  ensureDataDir();
+// Write new or changed users; only the given records are persisted
+export async function saveUsers(users: User[]): Promise<void> {
   try {
-    fs.writeFileSync(USERS_FILE, JSON.stringify(users, null, 2));
+    await putRecords({ users });
   } catch (error) {
     console.error('Error saving users file:', error);
     throw new Error('Failed to save user data');
@@ -63,14 +41,11 @@ export function saveUsers(users: User[]): void {
 
 // Find user by email
 export function findUserByEmail(email: string): User | null {
-  const users = getUsers();
-  return users.find(user => user.email.toLowerCase() === email.toLowerCase()) || null;
+  return findOne('users', 'email', email);
 }
 
 // Create new user
 export async function createUser(userData: UserCreateData): Promise<User> {
-  const users = getUsers();
-  
   // Check if user already exists
   const existingUser = findUserByEmail(userData.email);
   if (existingUser) {
@@ -79,6 +54,11 @@ export async function createUser(userData: UserCreateData): Promise<User> {
 
   // Hash password
   const passwordHash = await bcrypt.hash(userData.password, SALT_ROUNDS);
+
+  // Check again: another signup for this email may have committed during the hash
+  if (findUserByEmail(userData.email)) {
+    throw new Error('User already exists');
+  }
   
   // Generate user ID and slug
   const userId = `user_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
@@ -87,7 +67,7 @@ export async function createUser(userData: UserCreateData): Promise<User> {
   // Ensure slug is unique
   let finalSlug = baseSlug;
   let counter = 1;
-  while (users.some(user => user.slug === finalSlug)) {
+  while (findOne('users', 'slug', finalSlug)) {
     finalSlug = `${baseSlug}-${counter}`;
     counter++;
   }
@@ -108,9 +88,8 @@ export async function createUser(userData: UserCreateData): Promise<User> {
     newUser.studioId = `studio_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
   }
 
-  // Add user to list and save
-  users.push(newUser);
-  saveUsers(users);
+  // Add user and save
+  await saveUsers([newUser]);
 
   return newUser;
 }
@@ -137,20 +116,17 @@ export function getUserSafe(user: User): Omit<User, 'passwordHash'> {
 }
 
 // Update user with Stripe customer ID
-export function updateUserStripeCustomerId(userId: string, stripeCustomerId: string): void {
-  const users = getUsers();
-  const userIndex = users.findIndex(user => user.id === userId);
+export async function updateUserStripeCustomerId(userId: string, stripeCustomerId: string): Promise<void> {
+  const user = findUserById(userId);
   
-  if (userIndex === -1) {
+  if (!user) {
     throw new Error('User not found');
   }
   
-  users[userIndex].stripeCustomerId = stripeCustomerId;
-  saveUsers(users);
+  await saveUsers([{ ...user, stripeCustomerId }]);
 }
 
 // Get user by ID
 export function findUserById(userId: string): User | null {
-  const users = getUsers();
-  return users.find(user => user.id === userId) || null;
+  return findById('users', userId);
 } 
\ No newline at end of file
@@ -1,11 +1,26 @@
 /**
- * WebSocket client for real-time messaging
- * This is a foundation that can be extended for full real-time support
+ * Real-time client for messaging and booking updates.
+ *
+ * Events arrive over a server-sent event stream (`/api/events`), one channel
+ * per user; the few events a client sends (typing indicators) are posted
+ * back to the same endpoint. The class keeps its WebSocket-era name and API
+ * so callers don't care which transport is underneath.
  */
 
+import { API_BASE_URL } from './config';
+
+type RealtimeEventType =
+  | 'message_created'
+  | 'message_read'
+  | 'user_typing'
+  | 'conversation_updated'
+  | 'booking_status_changed'
+  // Events may have been missed (reconnect, slow connection): refetch
+  | 'resync';
+
 interface MessageEvent {
-  type: 'message_created' | 'message_read' | 'user_typing' | 'conversation_updated';
-  conversationId: string;
+  type: RealtimeEventType;
+  conversationId?: string;
   data: any;
 }
 
@@ -13,36 +28,102 @@ interface WebSocketEventHandler {
   (event: MessageEvent): void;
 }
 
+const EVENT_TYPES: RealtimeEventType[] = [
+  'message_created',
+  'message_read',
+  'user_typing',
+  'conversation_updated',
+  'booking_status_changed',
+  'resync'
+];
+
+// The server sends a heartbeat every 25 seconds; two missed ones means the connection is dead
+const HEARTBEAT_TIMEOUT_MS = 60_000;
+
+// Reconnect backoff stops growing here; the client keeps retrying at this interval for good
+const MAX_RECONNECT_DELAY_MS = 30_000;
+
+// The signed session token from login; the event stream only serves its owner
+function sessionToken(): string | null {
+  return typeof localStorage !== 'undefined' ? localStorage.getItem('auth_token') : null;
+}
+
 class WebSocketClient {
-  private ws: WebSocket | null = null;
+  private ws: EventSource | null = null;
   private handlers: Map<string, WebSocketEventHandler[]> = new Map();
   private reconnectAttempts = 0;
-  private maxReconnectAttempts = 5;
   private reconnectDelay = 1000; // Start with 1 second
+  private reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+  private heartbeatTimer: ReturnType<typeof setTimeout> | null = null;
+  private lastEventId: string | null = null;
   private userId: string | null = null;
-
-  constructor() {
-    // In development, we would connect to a WebSocket server
-    // For now, this is a foundation for future implementation
-  }
+  private listeningForWake = false;
 
   connect(userId: string): void {
+    if (typeof window === 'undefined' || typeof EventSource === 'undefined') return;
+    this.listenForWake();
+    // Already connected (or connecting) as this user
+    if (this.userId === userId && this.ws) return;
+
+    if (this.userId !== userId) {
+      // A different user's cursor means nothing here
+      this.lastEventId = null;
+      this.reconnectAttempts = 0;
+    }
     this.userId = userId;
-    
-    // TODO: In production, implement actual WebSocket connection
-    // Example: this.ws = new WebSocket(`${WS_URL}/chat/${userId}`);
-    
-    console.log('WebSocket foundation initialized for user:', userId);
-    console.log('Note: Full WebSocket implementation pending');
+    this.closeConnection();
+
+    const params = new URLSearchParams({ userId });
+    const token = sessionToken();
+    if (token) params.set('token', token);
+    if (this.lastEventId) params.set('lastEventId', this.lastEventId);
+    const source = new EventSource(`${API_BASE_URL}/api/events?${params}`);
+    this.ws = source;
+
+    source.onopen = () => {
+      const reconnected = this.reconnectAttempts > 0;
+      this.reconnectAttempts = 0;
+      this.resetHeartbeat();
+      // Without a cursor there was nothing to replay, so whatever happened while we were away is unknown
+      if (reconnected && !this.lastEventId) {
+        this.handleMessage({ type: 'resync', data: { reason: 'reconnected' } });
+      }
+    };
+
+    source.onerror = () => {
+      // Take over from EventSource's own fixed-interval retry so backoff applies
+      if (this.ws === source) {
+        this.closeConnection();
+        this.reconnect();
+      }
+    };
+
+    source.addEventListener('heartbeat', () => this.resetHeartbeat());
+    EVENT_TYPES.forEach(type => {
+      source.addEventListener(type, (event: Event) => {
+        const { data, lastEventId } = event as globalThis.MessageEvent<string>;
+        if (lastEventId) this.lastEventId = lastEventId;
+        this.resetHeartbeat();
+        try {
+          this.handleMessage(JSON.parse(data));
+        } catch (error) {
+          console.error('Invalid real-time event:', error);
+        }
+      });
+    });
   }
 
   disconnect(): void {
-    if (this.ws) {
-      this.ws.close();
-      this.ws = null;
+    this.closeConnection();
+    if (this.reconnectTimer) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
     }
     this.handlers.clear();
+    this.stopListeningForWake();
     this.userId = null;
+    this.lastEventId = null;
+    this.reconnectAttempts = 0;
   }
 
   // Subscribe to specific events
@@ -64,43 +145,96 @@ class WebSocketClient {
     }
   }
 
-  // Send message event (for future WebSocket implementation)
+  // Send a client event (typing indicators) to the other participants
   sendEvent(event: MessageEvent): void {
-    if (this.ws && this.ws.readyState === WebSocket.OPEN) {
-      this.ws.send(JSON.stringify(event));
-    } else {
-      console.warn('WebSocket not connected, event not sent:', event);
+    if (!this.userId) {
+      console.warn('Real-time client not connected, event not sent:', event);
+      return;
     }
+
+    const token = sessionToken();
+    fetch(`${API_BASE_URL}/api/events`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        ...(token && { Authorization: `Bearer ${token}` })
+      },
+      body: JSON.stringify({ ...event, userId: this.userId })
+    }).catch(error => {
+      console.warn('Failed to send real-time event:', error);
+    });
   }
 
   // Simulate real-time event for testing (can be removed in production)
   simulateEvent(event: MessageEvent): void {
-    const handlers = this.handlers.get(event.type);
-    if (handlers) {
-      handlers.forEach(handler => handler(event));
-    }
+    this.handleMessage(event);
   }
 
   private handleMessage(event: MessageEvent): void {
     const handlers = this.handlers.get(event.type);
     if (handlers) {
-      handlers.forEach(handler => handler(event));
+      handlers.slice().forEach(handler => handler(event));
     }
   }
 
-  private reconnect(): void {
-    if (this.reconnectAttempts >= this.maxReconnectAttempts) {
-      console.error('Max WebSocket reconnection attempts reached');
-      return;
+  private closeConnection(): void {
+    if (this.heartbeatTimer) {
+      clearTimeout(this.heartbeatTimer);
+      this.heartbeatTimer = null;
     }
+    if (this.ws) {
+      this.ws.close();
+      this.ws = null;
+    }
+  }
 
-    setTimeout(() => {
+  private resetHeartbeat(): void {
+    if (this.heartbeatTimer) clearTimeout(this.heartbeatTimer);
+    this.heartbeatTimer = setTimeout(() => {
+      console.warn('Real-time connection went quiet, reconnecting');
+      this.closeConnection();
+      this.reconnect();
+    }, HEARTBEAT_TIMEOUT_MS);
+  }
+
+  private reconnect(): void {
+    if (this.reconnectTimer) return;
+
+    // Exponential backoff, capped so a long outage is retried every 30 seconds rather than given up on
+    const delay = Math.min(MAX_RECONNECT_DELAY_MS, this.reconnectDelay * Math.pow(2, this.reconnectAttempts));
+    this.reconnectTimer = setTimeout(() => {
+      this.reconnectTimer = null;
       console.log(`WebSocket reconnection attempt ${this.reconnectAttempts + 1}`);
       this.reconnectAttempts++;
       if (this.userId) {
         this.connect(this.userId);
       }
-    }, this.reconnectDelay * Math.pow(2, this.reconnectAttempts)); // Exponential backoff
+    }, delay);
+  }
+
+  // The network came back or the tab was brought forward: retry now instead of waiting out the backoff
+  private handleWake = (): void => {
+    if (!this.userId || this.ws || document.visibilityState === 'hidden') return;
+    if (this.reconnectTimer) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
+    }
+    this.reconnectAttempts++;
+    this.connect(this.userId);
+  };
+
+  private listenForWake(): void {
+    if (this.listeningForWake) return;
+    this.listeningForWake = true;
+    window.addEventListener('online', this.handleWake);
+    document.addEventListener('visibilitychange', this.handleWake);
+  }
+
+  private stopListeningForWake(): void {
+    if (!this.listeningForWake) return;
+    this.listeningForWake = false;
+    window.removeEventListener('online', this.handleWake);
+    document.removeEventListener('visibilitychange', this.handleWake);
   }
 }
 
@@ -109,8 +243,9 @@ export const wsClient = new WebSocketClient();
 
 // Hook for React components
 export function useWebSocket(userId: string | null) {
+  // Safe to call repeatedly: it does nothing while a connection for this user is open or opening
   const connect = () => {
-    if (userId && userId !== wsClient['userId']) {
+    if (userId) {
       wsClient.connect(userId);
     }
   };
@@ -121,7 +256,7 @@ export function useWebSocket(userId: string | null) {
 
   const subscribe = (eventType: string, handler: WebSocketEventHandler) => {
     wsClient.on(eventType, handler);
-    
+
     // Return cleanup function
     return () => {
       wsClient.off(eventType, handler);
@@ -137,4 +272,4 @@ export function useWebSocket(userId: string | null) {
   };
 }
 
-export type { MessageEvent, WebSocketEventHandler }; 
\ No newline at end of file
+export type { MessageEvent, RealtimeEventType, WebSocketEventHandler };
@@ -0,0 +1,40 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { invalidateCollection } from '@/lib/data-store';
+
+export interface TempDataDir {
+  // Full path of a file in the temporary data/ directory
+  path(file: string): string;
+  write(file: string, data: unknown): void;
+  read(file: string): any;
+}
+
+/**
+ * Point the data store at an empty temporary data/ directory for each test in
+ * the enclosing describe block, and remove it afterwards. Call it before the
+ * block's own beforeEach, so fixtures are written into the fresh directory.
+ */
+export function useTempDataDir(prefix: string): TempDataDir {
+  let tmpDir = '';
+
+  beforeEach(() => {
+    tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), `${prefix}-`));
+    fs.mkdirSync(path.join(tmpDir, 'data'));
+    jest.spyOn(process, 'cwd').mockReturnValue(tmpDir);
+    invalidateCollection();
+  });
+
+  afterEach(() => {
+    invalidateCollection();
+    jest.restoreAllMocks();
+    fs.rmSync(tmpDir, { recursive: true, force: true });
+  });
+
+  const dataPath = (file: string) => path.join(tmpDir, 'data', file);
+  return {
+    path: dataPath,
+    write: (file, data) => fs.writeFileSync(dataPath(file), JSON.stringify(data, null, 2)),
+    read: file => JSON.parse(fs.readFileSync(dataPath(file), 'utf8'))
+  };
+}